@@ -0,0 +1,153 @@
+"""Compare the accuracy and latency of detector configurations.
+
+Runs detector configurations (``evealert.tools.accuracy``) over a labeled
+corpus and prints precision, recall and latency side by side. Without
+``--corpus`` a synthetic corpus of local member lists with noise, JPEG
+artefacts, occlusion, UI scaling and scrolling is generated.
+
+With ``--max-recall-drop`` the script exits with status 1 if a detector
+finds fewer labels or alarm frames than the first (baseline) detector, so
+an optimisation can be gated on its accuracy.
+
+Usage::
+
+    python benchmarks/bench_accuracy.py [--detectors baseline,downsample]
+        [--corpus recorded/] [--save-corpus corpus/] [--output result.json]
+        [--max-recall-drop 0.0]
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+from dataclasses import replace
+from pathlib import Path
+from typing import Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# pylint: disable=wrong-import-position
+from evealert import __version__  # noqa: E402
+from evealert.tools.accuracy import (  # noqa: E402
+    AccuracyResult,
+    DetectorConfig,
+    compare,
+    load_corpus,
+    save_corpus,
+    synthetic_corpus,
+)
+from evealert.tools.synthetic import LocalListConfig  # noqa: E402
+
+DETECTORS: Dict[str, DetectorConfig] = {
+    "baseline": DetectorConfig("baseline"),
+    "threshold80": DetectorConfig("threshold80", threshold=80),
+    "downsample": DetectorConfig("downsample", downsample=0.5),
+    "grayscale": DetectorConfig("grayscale", grayscale=True),
+    "roi": DetectorConfig("roi", roi=(0, 0, 32, 100000)),
+}
+
+# Appearances of the synthetic corpus, every one is generated with each seed
+CORPUS_CONFIGS = [
+    LocalListConfig(rows=25, hostiles=0),
+    LocalListConfig(rows=25, hostiles=3),
+    LocalListConfig(rows=25, hostiles=3, factions=2),
+    LocalListConfig(rows=25, hostiles=3, noise=4.0),
+    LocalListConfig(rows=25, hostiles=3, jpeg_quality=75),
+    LocalListConfig(rows=25, hostiles=3, occlusion=0.3),
+    LocalListConfig(rows=25, hostiles=3, scale=1.25),
+    LocalListConfig(rows=50, hostiles=8, visible_rows=20, scroll_step=7),
+]
+
+
+def parse_names(value: str) -> List[str]:
+    """Parse a comma separated list of detector names."""
+    names = [name for name in value.split(",") if name]
+    unknown = [name for name in names if name not in DETECTORS]
+    if unknown:
+        raise argparse.ArgumentTypeError(
+            f"unknown detectors {', '.join(unknown)} "
+            f"(choose from {', '.join(DETECTORS)})"
+        )
+    return names
+
+
+def print_table(results: List[AccuracyResult]) -> None:
+    """Print the results side by side."""
+    print(
+        f"{'detector':<14}{'precision':>10}{'recall':>8}{'frame P':>9}"
+        f"{'frame R':>9}{'FP':>5}{'FN':>5}{'p50 ms':>9}{'p95 ms':>9}"
+    )
+    for result in results:
+        latency = result.latency_ms()
+        print(
+            f"{result.name:<14}{result.precision:>10.3f}{result.recall:>8.3f}"
+            f"{result.frame_precision:>9.3f}{result.frame_recall:>9.3f}"
+            f"{result.false_positives:>5}{result.false_negatives:>5}"
+            f"{latency.get('p50', 0):>9.2f}{latency.get('p95', 0):>9.2f}"
+        )
+
+
+def recall_regressions(results: List[AccuracyResult], max_drop: float) -> List[str]:
+    """Detectors finding fewer labels or alarm frames than the first one."""
+    baseline = results[0]
+    return [
+        result.name
+        for result in results[1:]
+        if result.recall < baseline.recall - max_drop
+        or result.frame_recall < baseline.frame_recall - max_drop
+    ]
+
+
+def main() -> None:
+    """Run the detectors and report their accuracy."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--detectors", type=parse_names, default=list(DETECTORS), help="names"
+    )
+    parser.add_argument("--corpus", help="folder with frames and labels.json")
+    parser.add_argument("--seeds", type=int, default=3, help="synthetic seeds")
+    parser.add_argument("--frames", type=int, default=2, help="frames per seed")
+    parser.add_argument("--save-corpus", help="write the corpus to a folder")
+    parser.add_argument("--max-recall-drop", type=float, help="accuracy gate")
+    parser.add_argument("--output", help="JSON file")
+    args = parser.parse_args()
+
+    if args.corpus:
+        corpus = load_corpus(args.corpus)
+    else:
+        configs = [
+            replace(config, seed=seed)
+            for config in CORPUS_CONFIGS
+            for seed in range(args.seeds)
+        ]
+        corpus = synthetic_corpus(configs, args.frames)
+    if args.save_corpus:
+        save_corpus(corpus, args.save_corpus)
+
+    results = compare([DETECTORS[name] for name in args.detectors], corpus)
+    print(f"{len(corpus)} frames, {sum(len(f.labels) for f in corpus)} labels")
+    print_table(results)
+
+    if args.output:
+        report = {
+            "version": __version__,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "corpus": args.corpus or "synthetic",
+            "results": [result.to_dict() for result in results],
+        }
+        Path(args.output).write_text(
+            json.dumps(report, indent=2) + "\n", encoding="utf-8"
+        )
+
+    if args.max_recall_drop is not None:
+        regressions = recall_regressions(results, args.max_recall_drop)
+        if regressions:
+            print(f"Recall dropped below {results[0].name}: {', '.join(regressions)}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
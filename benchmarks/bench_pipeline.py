@@ -0,0 +1,316 @@
+"""Benchmark the detection pipeline and write the results as JSON.
+
+Runs three benchmarks on synthetic local member lists
+(``evealert.tools.synthetic``):
+
+- ``vision``: ``Vision.vision_process`` for every combination of list
+  rows, hostile count and template count, with the normalize and match
+  stages timed separately
+- ``capture``: ``WindowCapture`` grabbing a screen region (skipped without
+  a display)
+- ``agent``: ``AlertAgent.check_regions`` with every region replayed from
+  a synthetic frame (``ReplayCapture``), timing the capture, region check
+  and tick
+
+Every result has the frames per second, latency percentiles in
+milliseconds and the peak traced memory of a separate tracemalloc pass.
+Compare two releases by running the benchmark on both and diffing the
+JSON files.
+
+Usage::
+
+    python benchmarks/bench_pipeline.py [--frames 20] [--output result.json]
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import replace
+from pathlib import Path
+from typing import Callable, Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# pylint: disable=wrong-import-position
+from evealert import __version__  # noqa: E402
+from evealert.constants import ALERT_IMAGE_PREFIX, IMG_FOLDER  # noqa: E402
+from evealert.manager.sink import NullSink  # noqa: E402
+from evealert.settings.helper import get_resource_path  # noqa: E402
+from evealert.tools.synthetic import (  # noqa: E402
+    LocalListConfig,
+    LocalListGenerator,
+)
+from evealert.tools.templates import TemplateIndex  # noqa: E402
+from evealert.tools.vision import (  # noqa: E402
+    Vision,
+    match_template,
+    normalize_haystack,
+)
+
+IMG_FOLDER_PATH = get_resource_path(IMG_FOLDER)
+THRESHOLD = 90
+MEMORY_FRAMES = 5  # Frames of the tracemalloc pass
+
+
+def summarize(durations: List[float]) -> Dict[str, float]:
+    """Latency percentiles in milliseconds."""
+    values = sorted(duration * 1000 for duration in durations)
+    return {
+        "mean": round(statistics.fmean(values), 3),
+        "p50": round(values[len(values) // 2], 3),
+        "p95": round(values[min(int(len(values) * 0.95), len(values) - 1)], 3),
+        "max": round(values[-1], 3),
+    }
+
+
+def peak_memory(run: Callable[[], object], frames: int = MEMORY_FRAMES) -> int:
+    """Peak traced memory in bytes while running a few frames."""
+    tracemalloc.start()
+    try:
+        for _ in range(frames):
+            run()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def bench_vision(
+    index: TemplateIndex, rows: int, hostiles: int, template_count: int, frames: int
+) -> dict:
+    """Benchmark Vision.vision_process on one list configuration."""
+    paths = index.files(ALERT_IMAGE_PREFIX)[:template_count]
+    vision = Vision(paths, threshold=THRESHOLD, loader=index.load)
+    frame = (
+        LocalListGenerator(paths, [])
+        .frame(LocalListConfig(rows=rows, hostiles=hostiles))
+        .image
+    )
+
+    normalize, match, total = [], [], []
+    points = 0
+    for _ in range(frames):
+        start = time.perf_counter()
+        normalized = normalize_haystack(frame)
+        normalize.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        for needle in vision.needle_imgs:
+            match_template(normalized, needle, vision.method, THRESHOLD)
+        match.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        points = len(vision.vision_process(frame, THRESHOLD)[0])
+        total.append(time.perf_counter() - start)
+
+    return {
+        "benchmark": "vision",
+        "rows": rows,
+        "hostiles": hostiles,
+        "templates": len(paths),
+        "frame_shape": list(frame.shape),
+        "frames": frames,
+        "matches": points,
+        "fps": round(frames / sum(total), 2),
+        "latency_ms": summarize(total),
+        "stages_ms": {"normalize": summarize(normalize), "match": summarize(match)},
+        "peak_memory_bytes": peak_memory(
+            lambda: vision.vision_process(frame, THRESHOLD)
+        ),
+    }
+
+
+def bench_capture(width: int, height: int, frames: int) -> dict:
+    """Benchmark WindowCapture on a screen region."""
+    # pylint: disable=import-outside-toplevel
+    from evealert.tools.windowscapture import WindowCapture
+
+    capture = WindowCapture()
+    result = {"benchmark": "capture", "frame_shape": [height, width, 3]}
+    durations = []
+    try:
+        for _ in range(frames):
+            start = time.perf_counter()
+            screenshot, _ = capture.get_screenshot_value(0, 0, width, height)
+            durations.append(time.perf_counter() - start)
+            if screenshot is None:
+                raise RuntimeError("capture returned no frame")
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        result["skipped"] = f"{type(e).__name__}: {e}"
+        return result
+    result.update(
+        {
+            "frames": frames,
+            "fps": round(frames / sum(durations), 2),
+            "latency_ms": summarize(durations),
+            "peak_memory_bytes": peak_memory(
+                lambda: capture.get_screenshot_value(0, 0, width, height)
+            ),
+        }
+    )
+    return result
+
+
+def bench_agent(
+    index: TemplateIndex, regions: int, rows: int, hostiles: int, frames: int
+) -> dict:
+    """Benchmark AlertAgent.check_regions with synthetic region frames."""
+    # pylint: disable=import-outside-toplevel
+    from evealert.manager.alertmanager import AlertAgent
+    from evealert.manager.regions import AlertRegion
+    from evealert.settings.store import DEFAULT_SETTINGS, SettingsStore
+    from evealert.tools.windowscapture import ReplayCapture
+
+    paths = index.files(ALERT_IMAGE_PREFIX)
+    generator = LocalListGenerator(paths, [])
+    config = LocalListConfig(rows=rows, hostiles=hostiles)
+    entries = [
+        AlertRegion(
+            name=f"Client {number + 1}",
+            x1=number * config.width,
+            x2=(number + 1) * config.width,
+            y2=rows * config.row_height,
+            detection=THRESHOLD,
+        )
+        for number in range(regions)
+    ]
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "settings.json"
+        path.write_text(json.dumps(DEFAULT_SETTINGS), encoding="utf-8")
+
+        # The agent runs its coroutines on the current event loop
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        agent = AlertAgent(NullSink(), SettingsStore(path))
+        try:
+            # Only the benchmark regions are checked
+            agent.set_regions(entries)
+            capture = ReplayCapture(
+                {
+                    entry.region: [generator.frame(replace(config, seed=number)).image]
+                    for number, entry in enumerate(entries)
+                }
+            )
+            captures: List[float] = []
+            get_screenshot_value = capture.get_screenshot_value
+
+            def timed_capture(*args):
+                start = time.perf_counter()
+                try:
+                    return get_screenshot_value(*args)
+                finally:
+                    captures.append(time.perf_counter() - start)
+
+            capture.get_screenshot_value = timed_capture
+            agent.wincap = capture
+            checks: List[float] = []
+            check_region = agent.check_region
+
+            def timed_check(region):
+                start = time.perf_counter()
+                try:
+                    return check_region(region)
+                finally:
+                    checks.append(time.perf_counter() - start)
+
+            agent.check_region = timed_check
+
+            async def ticks(count: int) -> List[float]:
+                durations = []
+                for _ in range(count):
+                    start = time.perf_counter()
+                    await agent.check_regions()
+                    durations.append(time.perf_counter() - start)
+                return durations
+
+            durations = loop.run_until_complete(ticks(frames))
+            memory = peak_memory(lambda: loop.run_until_complete(ticks(1)))
+            return {
+                "benchmark": "agent",
+                "regions": len(agent.active_regions),
+                "rows": rows,
+                "hostiles": hostiles,
+                "templates": len(paths),
+                "frames": frames,
+                "detected": agent.enemy,
+                "fps": round(frames / sum(durations), 2),
+                "latency_ms": summarize(durations),
+                "stages_ms": {
+                    "capture": summarize(captures),
+                    "region_check": summarize(checks),
+                },
+                "peak_memory_bytes": memory,
+            }
+        finally:
+            agent.statistics.close()
+            agent.executor.shutdown(wait=True)
+            agent.renderer.stop()
+            asyncio.set_event_loop(None)
+            loop.close()
+
+
+def parse_counts(value: str) -> List[int]:
+    """Parse a comma separated list of counts."""
+    return [int(count) for count in value.split(",") if count]
+
+
+def main() -> None:
+    """Run the benchmarks and write the JSON report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=20, help="frames per result")
+    parser.add_argument("--rows", type=parse_counts, default=[25, 100, 500])
+    parser.add_argument("--hostiles", type=parse_counts, default=[0, 5, 50])
+    parser.add_argument("--templates", type=parse_counts, default=[1, 3, 6])
+    parser.add_argument("--regions", type=parse_counts, default=[1, 4])
+    parser.add_argument("--no-capture", action="store_true", help="skip capture")
+    parser.add_argument("--output", help="JSON file (default: stdout)")
+    args = parser.parse_args()
+
+    results = []
+    with tempfile.TemporaryDirectory() as cache_dir:
+        index = TemplateIndex(IMG_FOLDER_PATH, cache_dir=cache_dir)
+        index.scan()
+        for rows in args.rows:
+            for hostiles in args.hostiles:
+                for template_count in args.templates:
+                    results.append(
+                        bench_vision(index, rows, hostiles, template_count, args.frames)
+                    )
+        if not args.no_capture:
+            results.append(
+                bench_capture(
+                    LocalListConfig.width,
+                    max(args.rows) * LocalListConfig.row_height,
+                    args.frames,
+                )
+            )
+        for regions in args.regions:
+            results.append(
+                bench_agent(
+                    index, regions, args.rows[0], args.hostiles[-1], args.frames
+                )
+            )
+
+    report = {
+        "version": __version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "results": results,
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""Benchmark the vision backends with a growing number of regions.
+
+Matches the bundled enemy templates in 1 to 16 synthetic regions per tick,
+once with the thread backend (``Vision.find`` in a thread pool) and once
+with the process backend (``ProcessMatcher``), and prints the time per tick.
+
+Usage::
+
+    python benchmarks/bench_regions.py [--ticks 10] [--workers 0]
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# pylint: disable=wrong-import-position
+from evealert.constants import ALERT_IMAGE_PREFIX, IMG_FOLDER  # noqa: E402
+from evealert.settings.helper import get_resource_path  # noqa: E402
+from evealert.tools.matchpool import ProcessMatcher  # noqa: E402
+from evealert.tools.templates import TemplateIndex  # noqa: E402
+from evealert.tools.vision import Vision  # noqa: E402
+
+REGION_COUNTS = (1, 2, 4, 8, 16)
+FRAME_SHAPE = (400, 300, 3)
+THRESHOLD = 90
+IMG_FOLDER_PATH = get_resource_path(IMG_FOLDER)
+
+
+def make_frames(count: int, template: np.ndarray) -> list:
+    """Create synthetic region frames with one pasted template each."""
+    rng = np.random.default_rng(0)
+    frames = []
+    for _ in range(count):
+        frame = rng.integers(40, 60, FRAME_SHAPE, dtype=np.uint8)
+        height, width = template.shape[:2]
+        y = int(rng.integers(0, FRAME_SHAPE[0] - height))
+        x = int(rng.integers(0, FRAME_SHAPE[1] - width))
+        frame[y : y + height, x : x + width] = template
+        frames.append(frame)
+    return frames
+
+
+def bench_threads(index: TemplateIndex, frames: list, ticks: int) -> float:
+    """Seconds per tick of the thread backend."""
+    paths = index.files(ALERT_IMAGE_PREFIX)
+    visions = [Vision(paths, threshold=THRESHOLD, loader=index.load) for _ in frames]
+    with ThreadPoolExecutor(len(frames)) as executor:
+        start = time.perf_counter()
+        for _ in range(ticks):
+            list(executor.map(lambda args: args[0].find(args[1]), zip(visions, frames)))
+        return (time.perf_counter() - start) / ticks
+
+
+def bench_processes(
+    index: TemplateIndex, frames: list, ticks: int, workers: int, cache_dir: str
+) -> float:
+    """Seconds per tick of the process backend (without the pool startup)."""
+    template_sets = {ALERT_IMAGE_PREFIX: index.files(ALERT_IMAGE_PREFIX)}
+    matcher = ProcessMatcher(
+        IMG_FOLDER_PATH, template_sets, cache_dir=cache_dir, workers=workers
+    )
+    try:
+        names = [f"Region {number}" for number in range(len(frames))]
+
+        def match(args):
+            return matcher.match(args[0], args[1], ALERT_IMAGE_PREFIX, THRESHOLD)
+
+        with ThreadPoolExecutor(len(frames)) as executor:
+            # Warm up, so every worker has loaded the templates
+            list(executor.map(match, zip(names, frames)))
+            start = time.perf_counter()
+            for _ in range(ticks):
+                list(executor.map(match, zip(names, frames)))
+            return (time.perf_counter() - start) / ticks
+    finally:
+        matcher.close()
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ticks", type=int, default=10)
+    parser.add_argument(
+        "--workers", type=int, default=0, help="worker processes (0 = CPUs)"
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        index = TemplateIndex(IMG_FOLDER_PATH, cache_dir=cache_dir)
+        index.scan()
+        template = index.load(index.files(ALERT_IMAGE_PREFIX)[0])
+
+        print(f"{'regions':>8} {'threads ms':>12} {'processes ms':>14} {'speedup':>8}")
+        for count in REGION_COUNTS:
+            frames = make_frames(count, template)
+            threads = bench_threads(index, frames, args.ticks)
+            processes = bench_processes(
+                index, frames, args.ticks, args.workers, cache_dir
+            )
+            print(
+                f"{count:>8} {threads * 1000:>12.1f} {processes * 1000:>14.1f} "
+                f"{threads / processes:>7.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
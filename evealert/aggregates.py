@@ -0,0 +1,271 @@
+"""Time bucketed alarm counters for EVE Alert.
+
+``AlarmAggregates`` keeps rolling per-minute, per-hour and per-day alarm
+counts per alarm type in fixed size ring buffers, plus an hour of day
+histogram. Adding an alarm and the queries ("alarms in the last hour",
+"busiest hour of day", "spike above baseline") take constant time and
+never scan the alarm history.
+"""
+
+import time
+from array import array
+from typing import TYPE_CHECKING, Dict, Iterable, Optional, Tuple
+
+from evealert.constants import (
+    AGGREGATE_DAYS,
+    SPIKE_FACTOR,
+    SPIKE_MIN_ALARMS,
+    SPIKE_WINDOW_MINUTES,
+)
+
+if TYPE_CHECKING:
+    from evealert.history import AlarmHistoryStore
+
+MINUTE = 60
+HOUR = 60 * MINUTE
+DAY = 24 * HOUR
+
+
+class RollingCounter:
+    """Ring buffer of event counts in fixed width time buckets.
+
+    The buffer covers the last ``size`` buckets up to the newest one seen.
+    Moving forward in time only clears the buckets that fell out of the
+    window, the running total is kept up to date on the way.
+
+    Attributes:
+        width: Bucket width in seconds
+        size: Number of buckets
+        total: Events in the covered buckets
+    """
+
+    def __init__(self, width: int, size: int) -> None:
+        """Initialize the counter.
+
+        Args:
+            width: Bucket width in seconds
+            size: Number of buckets
+        """
+        self.width = width
+        self.size = size
+        self.counts = array("L", bytes(array("L").itemsize * size))
+        self.total = 0
+        # Absolute index (timestamp // width) of the newest bucket
+        self.head: Optional[int] = None
+
+    def _advance(self, bucket: int) -> None:
+        """Move the newest bucket forward, clearing the expired ones."""
+        if self.head is None or bucket - self.head >= self.size:
+            for index in range(self.size):
+                self.counts[index] = 0
+            self.total = 0
+        else:
+            for expired in range(self.head + 1, bucket + 1):
+                index = expired % self.size
+                self.total -= self.counts[index]
+                self.counts[index] = 0
+        self.head = bucket
+
+    def add(self, timestamp: float, count: int = 1) -> None:
+        """Count events at a timestamp.
+
+        Events older than the window are ignored.
+
+        Args:
+            timestamp: Unix timestamp of the events
+            count: Number of events
+        """
+        bucket = int(timestamp // self.width)
+        if self.head is None or bucket > self.head:
+            self._advance(bucket)
+        elif bucket <= self.head - self.size:
+            return
+        self.counts[bucket % self.size] += count
+        self.total += count
+
+    def sum(self, now: float, buckets: Optional[int] = None) -> int:
+        """Count the events in the newest buckets up to now.
+
+        Args:
+            now: Current Unix timestamp
+            buckets: Number of buckets to count (default: all)
+
+        Returns:
+            Number of events
+        """
+        self.add(now, 0)
+        if buckets is None or buckets >= self.size:
+            return self.total
+        return sum(
+            self.counts[(self.head - offset) % self.size] for offset in range(buckets)
+        )
+
+
+class TypeAggregates:
+    """Rolling counters and hour of day histogram of one alarm type."""
+
+    def __init__(self, days: int = AGGREGATE_DAYS) -> None:
+        """Initialize the counters.
+
+        Args:
+            days: Days covered by the per-day counter
+        """
+        self.minutes = RollingCounter(MINUTE, 60)
+        self.hours = RollingCounter(HOUR, 24)
+        self.days = RollingCounter(DAY, days)
+        self.hour_of_day = array("L", bytes(array("L").itemsize * 24))
+
+    def add(self, timestamp: float, count: int = 1) -> None:
+        """Count alarms at a timestamp."""
+        self.minutes.add(timestamp, count)
+        self.hours.add(timestamp, count)
+        self.days.add(timestamp, count)
+        self.hour_of_day[time.localtime(timestamp).tm_hour] += count
+
+
+class AlarmAggregates:
+    """Per alarm type rolling alarm counts with constant time queries.
+
+    All queries take an optional ``alarm_type``; without one they combine
+    all alarm types.
+
+    Attributes:
+        days: Days covered by the per-day counters
+        by_type: Counters per alarm type
+    """
+
+    def __init__(self, days: int = AGGREGATE_DAYS) -> None:
+        """Initialize the aggregates.
+
+        Args:
+            days: Days covered by the per-day counters
+        """
+        self.days = days
+        self.by_type: Dict[str, TypeAggregates] = {}
+
+    def _types(self, alarm_type: Optional[str]) -> Iterable[TypeAggregates]:
+        """Get the counters of one or all alarm types."""
+        if alarm_type is None:
+            return self.by_type.values()
+        counters = self.by_type.get(alarm_type)
+        return [counters] if counters is not None else []
+
+    def add(self, alarm_type: str, timestamp: float, count: int = 1) -> None:
+        """Count alarms of a type at a timestamp.
+
+        Args:
+            alarm_type: Type of alarm ('Enemy' or 'Faction')
+            timestamp: Unix timestamp of the alarms
+            count: Number of alarms
+        """
+        counters = self.by_type.get(alarm_type)
+        if counters is None:
+            counters = self.by_type[alarm_type] = TypeAggregates(self.days)
+        counters.add(timestamp, count)
+
+    def load(self, store: "AlarmHistoryStore", now: Optional[float] = None) -> None:
+        """Fill the counters from the stored history.
+
+        Only the covered days are read, grouped by the database.
+
+        Args:
+            store: Alarm history store
+            now: Current Unix timestamp (default: time.time())
+        """
+        now = time.time() if now is None else now
+        start = (int(now // DAY) - self.days + 1) * DAY
+        for timestamp, alarm_type, count in store.bucket_counts(MINUTE, start):
+            self.add(alarm_type, timestamp, count)
+
+    def last_hour(
+        self, alarm_type: Optional[str] = None, now: Optional[float] = None
+    ) -> int:
+        """Count the alarms in the last 60 minutes.
+
+        Args:
+            alarm_type: Only this alarm type
+            now: Current Unix timestamp (default: time.time())
+
+        Returns:
+            Number of alarms
+        """
+        now = time.time() if now is None else now
+        return sum(c.minutes.sum(now) for c in self._types(alarm_type))
+
+    def last_day(
+        self, alarm_type: Optional[str] = None, now: Optional[float] = None
+    ) -> int:
+        """Count the alarms in the last 24 hours.
+
+        Args:
+            alarm_type: Only this alarm type
+            now: Current Unix timestamp (default: time.time())
+
+        Returns:
+            Number of alarms
+        """
+        now = time.time() if now is None else now
+        return sum(c.hours.sum(now) for c in self._types(alarm_type))
+
+    def last_days(
+        self, alarm_type: Optional[str] = None, now: Optional[float] = None
+    ) -> int:
+        """Count the alarms in the covered days.
+
+        Args:
+            alarm_type: Only this alarm type
+            now: Current Unix timestamp (default: time.time())
+
+        Returns:
+            Number of alarms
+        """
+        now = time.time() if now is None else now
+        return sum(c.days.sum(now) for c in self._types(alarm_type))
+
+    def busiest_hour(self, alarm_type: Optional[str] = None) -> Optional[int]:
+        """Get the local hour of day with the most alarms.
+
+        Args:
+            alarm_type: Only this alarm type
+
+        Returns:
+            Hour of day (0-23), or None without alarms
+        """
+        counts = [0] * 24
+        for counters in self._types(alarm_type):
+            for hour, count in enumerate(counters.hour_of_day):
+                counts[hour] += count
+        best = max(range(24), key=counts.__getitem__)
+        return best if counts[best] else None
+
+    def spike(
+        self,
+        alarm_type: Optional[str] = None,
+        now: Optional[float] = None,
+        window: int = SPIKE_WINDOW_MINUTES,
+        factor: float = SPIKE_FACTOR,
+        min_alarms: int = SPIKE_MIN_ALARMS,
+    ) -> Tuple[bool, int, float]:
+        """Check if the recent alarm rate is above the baseline.
+
+        The baseline is the average rate of the last 24 hours scaled to
+        the window.
+
+        Args:
+            alarm_type: Only this alarm type
+            now: Current Unix timestamp (default: time.time())
+            window: Recent minutes compared to the baseline
+            factor: Times the baseline the recent alarms must exceed
+            min_alarms: Minimum recent alarms for a spike
+
+        Returns:
+            Tuple of (is spike, recent alarms, expected alarms)
+        """
+        now = time.time() if now is None else now
+        recent = 0
+        day = 0
+        for counters in self._types(alarm_type):
+            recent += counters.minutes.sum(now, window)
+            day += counters.hours.sum(now)
+        expected = day * window * MINUTE / DAY
+        return recent >= min_alarms and recent > factor * expected, recent, expected
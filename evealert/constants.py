@@ -9,16 +9,32 @@ DETECTION_SCALE_MAX = 100  # Maximum detection scale percentage
 DETECTION_THRESHOLD_MIN = 0.1  # Minimum threshold for template matching
 DETECTION_THRESHOLD_MAX = 1.0  # Maximum threshold for template matching
 
+# Detection Filter
+DETECTION_CONFIRM_FRAMES = 2  # Matching frames needed to confirm a detection
+DETECTION_WINDOW_FRAMES = 3  # Last frames the matching frames are counted in
+DETECTION_WINDOW_FRAMES_MAX = 100
+DETECTION_CLEAR_DELAY = 3.0  # Seconds without a match before a detection clears
+DETECTION_HYSTERESIS = 5.0  # Percent below the threshold that keeps a detection
+
 # Alarm & Cooldown
 MAX_SOUND_TRIGGERS = 3  # Maximum sound triggers before cooldown
 DEFAULT_COOLDOWN_TIMER = 60  # Default cooldown time in seconds
 WEBHOOK_COOLDOWN = 5  # Webhook cooldown time in seconds
+WEBHOOK_URL_PREFIX = "https://discord.com/api/webhooks/"
+WEBHOOK_USERNAME = "Gneuten"
+WEBHOOK_AVATAR_URL = "https://cdn.discordapp.com/avatars/990582360103870495/410d536127874481b9771b9eb9aa8104.png"
+WEBHOOK_PLACEHOLDER = "Enter a Webhook URL"
 
 # UI
 WINDOW_WIDTH = 500
 WINDOW_HEIGHT = 350
 UI_UPDATE_INTERVAL = 100  # Mouse position update interval (ms)
+DISPLAY_CHECK_INTERVAL = 5000  # Display change check interval (ms)
+MONITOR_CACHE_MAX_AGE = 60.0  # Seconds until the monitors are enumerated again
 STATUS_CHECK_INTERVAL = 1000  # Status check interval (ms)
+LOG_VIEW_MAX_LINES = 500  # Lines kept in the main window log
+LOG_VIEW_FLUSH_INTERVAL = 250  # Log view batch flush interval (ms)
+UI_QUEUE_INTERVAL = 100  # Alert Agent message queue drain interval (ms)
 
 # Audio
 AUDIO_CHANNELS = 2  # Stereo output
@@ -33,17 +49,77 @@ FACTION_SOUND_FILE = "faction.wav"
 ALERT_IMAGE_PREFIX = "image_"
 FACTION_IMAGE_PREFIX = "faction_"
 
+# Regions
+REGION_ALERT = "alert"  # Region matched against the enemy templates
+REGION_FACTION = "faction"  # Region matched against the faction templates
+LEGACY_ALERT_REGION = "Alert"  # Name of the region from alert_region_1/2
+LEGACY_FACTION_REGION = "Faction"  # Name of the region from faction_region_1/2
+VISION_MAX_WORKERS = 4  # Worker threads for region capture and matching
+VISION_BACKEND_THREAD = "thread"  # Match in the vision worker threads
+VISION_BACKEND_PROCESS = "process"  # Match in a pool of worker processes
+VISION_PROCESS_WORKERS = 0  # Worker processes for matching (0 = CPU count)
+MATCH_POOL_TIMEOUT = 10.0  # Maximum time for a match in a worker process (seconds)
+
+# Templates
+TEMPLATE_CACHE_FOLDER = "cache/templates"  # Preprocessed template cache
+TEMPLATE_CACHE_VERSION = 1  # Bump when template preprocessing changes
+TEMPLATE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp")
+TEMPLATE_POLL_INTERVAL = 5.0  # Template folder scan interval (seconds)
+
+# Alarm History
+HISTORY_DB_FILE = "alarm_history.db"  # Stored next to settings.json
+HISTORY_BATCH_SIZE = 500  # Maximum events written in one transaction
+HISTORY_FLUSH_INTERVAL = 1.0  # Seconds the writer collects events before writing
+HISTORY_FLUSH_TIMEOUT = 2.0  # Seconds to wait for queued events to be written
+HISTORY_CHUNK_SIZE = 1000  # Events loaded per chunk when streaming the history
+HISTORY_RECENT_EVENTS = 50  # Recent events kept in memory
+HISTORY_VIEW_LINES = 10  # Recent events shown in the statistics window
+EXPORT_POLL_INTERVAL = 100  # History export progress update interval (ms)
+AGGREGATE_DAYS = 30  # Days covered by the per-day alarm counters
+SPIKE_WINDOW_MINUTES = 5  # Recent minutes compared to the alarm baseline
+SPIKE_FACTOR = 3.0  # Recent alarms above this times the baseline are a spike
+SPIKE_MIN_ALARMS = 3  # Minimum alarms in the window for a spike
+
 # Logging
 LOG_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 LOG_FORMAT_STRING = "%(asctime)s [%(levelname)-8s] %(name)-12s %(funcName)-20s:%(lineno)-4d - %(message)s"
 LOG_MAX_BYTES = 5 * 1024 * 1024  # 5 MB per log file
 LOG_BACKUP_COUNT = 3  # Keep 3 backup files
 LOG_DEFAULT_LEVEL = "INFO"
+LOG_FLUSH_TIMEOUT = 2.0  # Seconds to wait for the log listener to write
+
+# Profiling
+PROFILE_TICKS = 50  # Vision ticks profiled per capture
+PROFILE_TICKS_MAX = 10000
+PROFILE_TOP = 25  # Functions and allocations listed in the profile summary
+PROFILE_FRAMES = 10  # Traceback frames stored per traced allocation
+PROFILE_PREFIX = "profile"  # File name prefix of the profiles in logs/
+
+# Metrics
+METRICS_HOST = "127.0.0.1"  # The metrics endpoint is only served locally
+METRICS_ENABLED = False  # The metrics endpoint is off by default
+METRICS_PORT = 9464  # Default metrics endpoint port
+MATCH_TIME_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+WEBHOOK_LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+AUDIO_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+LOOP_LAG_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+# Watchdog
+WATCHDOG_INTERVAL = 1.0  # Seconds between two event loop lag and task checks
+WATCHDOG_LAG_WARNING = 0.5  # Event loop lag in seconds logged as a stall
+WATCHDOG_VISION_STALL = 10.0  # Seconds without a vision tick before a stall
+WATCHDOG_ALERT_STALL = 30.0  # Seconds without an alert loop tick before a stall
+WATCHDOG_MAX_RESTARTS = 5  # Restarts of a crashed task within the window
+WATCHDOG_RESTART_WINDOW = 60.0  # Seconds the task restarts are counted over
 
 # OpenCV
 CV_RECTANGLE_THICKNESS = 2
 CV_LINE_TYPE = 4  # cv.LINE_4
 CV_DETECTION_COLOR = (0, 255, 0)  # Green for detection boxes
+CV_MATCH_METHOD = 5  # cv.TM_CCOEFF_NORMED
+DEBUG_RENDER_FPS = 10  # Maximum debug window frames per second
+DEBUG_RENDER_FPS_MAX = 60
+VISION_LOG_INTERVAL = 5.0  # Seconds between two vision debug summaries per region
 
 # Template Matching
 GROUP_RECTANGLES_THRESHOLD = 1
@@ -0,0 +1,101 @@
+"""Headless EVE Alert daemon.
+
+Runs the Alert Agent without the GUI: detection, alarm sounds and webhooks
+are driven by a settings file and messages go to the console and the log
+files. Use the desktop application (or edit settings.json) to set up the
+regions first.
+
+Usage:
+    eve-alert-daemon --settings path/to/settings.json [--verbose]
+"""
+
+import argparse
+import signal
+import sys
+from typing import List, Optional
+
+from evealert import __version__
+from evealert.manager.alertmanager import AlertAgent
+from evealert.manager.sink import ConsoleSink
+from evealert.settings.helper import get_resource_path
+from evealert.settings.logger import logging
+from evealert.settings.store import SettingsStore
+
+logger = logging.getLogger("main")
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse the command line arguments.
+
+    Args:
+        argv: Arguments without the program name (defaults to sys.argv)
+
+    Returns:
+        Parsed arguments
+    """
+    parser = argparse.ArgumentParser(
+        prog="eve-alert-daemon",
+        description="Run EVE Alert without the GUI.",
+    )
+    parser.add_argument(
+        "--settings",
+        default=get_resource_path("settings.json"),
+        help="Path to the settings file (default: %(default)s)",
+    )
+    parser.add_argument(
+        "-v",
+        "--verbose",
+        action="store_true",
+        help="Also print status messages like the next check time",
+    )
+    parser.add_argument(
+        "--version", action="version", version=f"%(prog)s {__version__}"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the Alert Agent until it is stopped.
+
+    SIGINT and SIGTERM stop the agent gracefully.
+
+    Args:
+        argv: Arguments without the program name (defaults to sys.argv)
+
+    Returns:
+        Exit code (0 on a clean stop, 1 if the agent couldn't start)
+    """
+    args = parse_args(argv)
+    sink = ConsoleSink(verbose=args.verbose)
+    store = SettingsStore(args.settings)
+    agent = AlertAgent(sink, store)
+
+    def request_stop(signum, _frame) -> None:
+        logger.info("Received signal %s, stopping.", signum)
+        # Stop on the agent loop, not inside the signal handler
+        loop = agent.loop
+        if loop is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(agent.stop)
+
+    previous_handler = signal.signal(signal.SIGTERM, request_stop)
+
+    sink.write_message(f"System: EVE Alert {__version__} daemon starting.", "green")
+    try:
+        started = agent.start()
+    except KeyboardInterrupt:
+        started = True
+    finally:
+        signal.signal(signal.SIGTERM, previous_handler)
+        if agent.is_running:
+            agent.stop()
+        agent.shutdown()
+
+    if not started:
+        sink.write_message("System: EVE Alert could not start.", "red")
+        return 1
+    sink.write_message("System: EVE Alert stopped.", "green")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,304 @@
+"""Streaming alarm history export for EVE Alert.
+
+``HistoryExporter`` writes the alarm history to a file on a background
+thread. Events are read from the history store in chunks and written as
+they arrive, so exporting millions of alarms neither loads them into
+memory nor blocks the Tk thread. The window polls ``written``/``total``
+for the progress.
+
+Formats (chosen by file extension):
+
+- ``.csv``: one row per alarm
+- ``.ndjson``/``.jsonl``: one JSON object per alarm and line
+- ``.json``: the statistics summary and the alarms in one JSON document
+- ``.columns.jsonl``: one JSON object per chunk with one array per column
+"""
+
+import csv
+import json
+import logging
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import IO, Iterable, Iterator, List, Optional, Union
+
+from evealert.constants import HISTORY_CHUNK_SIZE
+from evealert.statistics import AlarmEvent, AlarmStatistics
+
+logger = logging.getLogger("alert")
+
+FORMAT_CSV = "csv"
+FORMAT_JSON = "json"
+FORMAT_NDJSON = "ndjson"
+FORMAT_COLUMNS = "columns"
+EXPORT_FORMATS = (FORMAT_CSV, FORMAT_JSON, FORMAT_NDJSON, FORMAT_COLUMNS)
+
+
+def format_from_path(path: Union[str, Path]) -> str:
+    """Get the export format from a file name.
+
+    Args:
+        path: Export file
+
+    Returns:
+        Export format, CSV for unknown extensions
+    """
+    name = str(path).lower()
+    if name.endswith(".columns.jsonl"):
+        return FORMAT_COLUMNS
+    if name.endswith((".ndjson", ".jsonl")):
+        return FORMAT_NDJSON
+    if name.endswith(".json"):
+        return FORMAT_JSON
+    return FORMAT_CSV
+
+
+def iter_history(
+    stats: AlarmStatistics,
+    start: Optional[float] = None,
+    end: Optional[float] = None,
+    types: Optional[Iterable[str]] = None,
+    chunk_size: int = HISTORY_CHUNK_SIZE,
+) -> Iterator[List[AlarmEvent]]:
+    """Stream the alarm history in chunks, oldest first.
+
+    Uses the history store if there is one, otherwise the in-memory
+    recent history.
+
+    Args:
+        stats: Alarm statistics
+        start: Only events at or after this Unix timestamp
+        end: Only events before this Unix timestamp
+        types: Only these alarm types
+        chunk_size: Events per chunk
+
+    Yields:
+        Lists of up to chunk_size events
+    """
+    if stats.store is not None:
+        stats.store.flush()
+        yield from stats.store.iter_events(start, end, types, chunk_size)
+        return
+    types = None if types is None else set(types)
+    events = [
+        event
+        for event in list(stats.alarm_history)
+        if (start is None or event.timestamp >= start)
+        and (end is None or event.timestamp < end)
+        and (types is None or event.alarm_type in types)
+    ]
+    for index in range(0, len(events), chunk_size):
+        yield events[index : index + chunk_size]
+
+
+def count_history(
+    stats: AlarmStatistics,
+    start: Optional[float] = None,
+    end: Optional[float] = None,
+    types: Optional[Iterable[str]] = None,
+) -> int:
+    """Count the alarms iter_history() yields.
+
+    Args:
+        stats: Alarm statistics
+        start: Only events at or after this Unix timestamp
+        end: Only events before this Unix timestamp
+        types: Only these alarm types
+
+    Returns:
+        Number of alarms
+    """
+    if stats.store is not None:
+        stats.store.flush()
+        return stats.store.count(start, end, types)
+    return sum(len(chunk) for chunk in iter_history(stats, start, end, types))
+
+
+class HistoryExporter:
+    """Exports the alarm history to a file on a background thread.
+
+    The file is written next to the target and only replaces it once the
+    export is complete.
+
+    Attributes:
+        path: Export file
+        export_format: One of EXPORT_FORMATS
+        written: Alarms written so far
+        total: Alarms to write
+        error: Error message if the export failed
+    """
+
+    def __init__(
+        self,
+        stats: AlarmStatistics,
+        path: Union[str, Path],
+        export_format: Optional[str] = None,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        types: Optional[Iterable[str]] = None,
+        chunk_size: int = HISTORY_CHUNK_SIZE,
+    ) -> None:
+        """Initialize the exporter.
+
+        Args:
+            stats: Alarm statistics
+            path: Export file
+            export_format: One of EXPORT_FORMATS (default: from the extension)
+            start: Only events at or after this Unix timestamp
+            end: Only events before this Unix timestamp
+            types: Only these alarm types
+            chunk_size: Events read and written per chunk
+        """
+        self.stats = stats
+        self.path = Path(path)
+        self.export_format = export_format or format_from_path(path)
+        if self.export_format not in EXPORT_FORMATS:
+            raise ValueError(f"Unknown export format: {self.export_format}")
+        self.start = start
+        self.end = end
+        self.types = None if types is None else list(types)
+        self.chunk_size = chunk_size
+        self.written = 0
+        self.total = 0
+        self.error: Optional[str] = None
+        self._cancel = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def is_running(self) -> bool:
+        """Returns True while the export thread is running."""
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def cancelled(self) -> bool:
+        """Returns True if the export was cancelled."""
+        return self._cancel.is_set()
+
+    @property
+    def progress(self) -> float:
+        """Share of the alarms written, from 0.0 to 1.0."""
+        if not self.total:
+            return 0.0 if self.is_running else 1.0
+        return min(self.written / self.total, 1.0)
+
+    def start_export(self) -> None:
+        """Start the export thread."""
+        self._thread = threading.Thread(
+            target=self.run, name="history-export", daemon=True
+        )
+        self._thread.start()
+
+    def cancel(self) -> None:
+        """Stop the export, the target file is left untouched."""
+        self._cancel.set()
+
+    def join(self, timeout: Optional[float] = None) -> None:
+        """Wait for the export thread.
+
+        Args:
+            timeout: Maximum seconds to wait
+        """
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def run(self) -> bool:
+        """Export the history, on the calling thread.
+
+        Returns:
+            True if the export completed
+        """
+        tmp_path = None
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(
+                dir=self.path.parent, prefix=f".{self.path.name}.", suffix=".tmp"
+            )
+            self.total = count_history(self.stats, self.start, self.end, self.types)
+            newline = "" if self.export_format == FORMAT_CSV else None
+            with os.fdopen(fd, "w", encoding="utf-8", newline=newline) as file:
+                self._write(file)
+            if self._cancel.is_set():
+                os.remove(tmp_path)
+                return False
+            os.replace(tmp_path, self.path)
+            return True
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.error("History export failed: %s", e, exc_info=True)
+            self.error = str(e)
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return False
+
+    def _chunks(self) -> Iterator[List[AlarmEvent]]:
+        """Stream the selected events until the export is cancelled."""
+        for chunk in iter_history(
+            self.stats, self.start, self.end, self.types, self.chunk_size
+        ):
+            if self._cancel.is_set():
+                return
+            yield chunk
+            self.written += len(chunk)
+
+    def _write(self, file: IO[str]) -> None:
+        """Write the selected events in the export format."""
+        if self.export_format == FORMAT_CSV:
+            writer = csv.writer(file)
+            writer.writerow(["Timestamp", "Alarm Type"])
+            for chunk in self._chunks():
+                writer.writerows(
+                    [event.formatted_time(), event.alarm_type] for event in chunk
+                )
+        elif self.export_format == FORMAT_NDJSON:
+            for chunk in self._chunks():
+                file.writelines(
+                    json.dumps(
+                        {
+                            "timestamp": event.formatted_time(),
+                            "unix_time": event.timestamp,
+                            "alarm_type": event.alarm_type,
+                        }
+                    )
+                    + "\n"
+                    for event in chunk
+                )
+        elif self.export_format == FORMAT_COLUMNS:
+            for chunk in self._chunks():
+                file.write(
+                    json.dumps(
+                        {
+                            "rows": len(chunk),
+                            "unix_time": [event.timestamp for event in chunk],
+                            "alarm_type": [event.alarm_type for event in chunk],
+                        }
+                    )
+                    + "\n"
+                )
+        else:
+            self._write_json(file)
+
+    def _write_json(self, file: IO[str]) -> None:
+        """Write the statistics summary and the events as one JSON document."""
+        stats = self.stats
+        export_info = {
+            "total_alarms": stats.total_alarms,
+            "session_alarms": stats.session_alarms,
+            "session_duration": stats.get_session_duration(),
+            "total_by_type": stats.total_by_type.copy(),
+            "session_by_type": stats.session_by_type.copy(),
+        }
+        file.write('{"export_info": ' + json.dumps(export_info) + ', "history": [')
+        separator = "\n"
+        for chunk in self._chunks():
+            for event in chunk:
+                file.write(
+                    separator
+                    + json.dumps(
+                        {
+                            "timestamp": event.formatted_time(),
+                            "alarm_type": event.alarm_type,
+                        }
+                    )
+                )
+                separator = ",\n"
+        file.write("\n]}\n")
@@ -0,0 +1,337 @@
+"""Persistent alarm history for EVE Alert.
+
+``AlarmHistoryStore`` keeps every alarm event in a SQLite database in WAL
+mode. Events are appended to a queue and written in batches by a
+background thread, so recording an alarm never waits on the disk. The
+totals per alarm type are kept in their own table and updated in the same
+transaction, so loading them at startup doesn't depend on the number of
+events. Reads (recent events, counts, streaming iteration) only load the
+rows they need.
+"""
+
+import logging
+import queue
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from evealert.constants import (
+    HISTORY_BATCH_SIZE,
+    HISTORY_CHUNK_SIZE,
+    HISTORY_FLUSH_INTERVAL,
+    HISTORY_FLUSH_TIMEOUT,
+)
+from evealert.statistics import AlarmEvent
+
+logger = logging.getLogger("alert")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY,
+    timestamp REAL NOT NULL,
+    alarm_type TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS events_timestamp ON events (timestamp);
+CREATE TABLE IF NOT EXISTS totals (
+    alarm_type TEXT PRIMARY KEY,
+    count INTEGER NOT NULL
+);
+"""
+
+
+class _FlushRequest:
+    """Queue entry the writer answers once all earlier events are stored."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+
+
+class AlarmHistoryStore:
+    """SQLite backed alarm event history with batched writes.
+
+    The writer thread starts with the first appended event and stops on
+    ``close()``; the store can be used again after closing.
+
+    Attributes:
+        path: Database file
+        batch_size: Maximum events written in one transaction
+        flush_interval: Seconds the writer collects events before writing
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        batch_size: int = HISTORY_BATCH_SIZE,
+        flush_interval: float = HISTORY_FLUSH_INTERVAL,
+    ) -> None:
+        """Open the database and create the tables if needed.
+
+        Args:
+            path: Database file
+            batch_size: Maximum events written in one transaction
+            flush_interval: Seconds the writer collects events before writing
+        """
+        self.path = Path(path)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue: "queue.SimpleQueue" = queue.SimpleQueue()
+        self._writer: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._read_lock = threading.Lock()
+        self._reader: Optional[sqlite3.Connection] = None
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as connection:
+            connection.executescript(SCHEMA)
+        connection.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection in WAL mode."""
+        connection = sqlite3.connect(self.path, check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        return connection
+
+    def _read(self, sql: str, params: Iterable = ()) -> List[Tuple]:
+        """Run a query on the shared read connection."""
+        with self._read_lock:
+            if self._reader is None:
+                self._reader = self._connect()
+            return self._reader.execute(sql, tuple(params)).fetchall()
+
+    # Writing
+    def append(self, event: AlarmEvent) -> None:
+        """Queue an event, it is written with the next batch.
+
+        Args:
+            event: Alarm event to store
+        """
+        self._queue.put((event.timestamp, event.alarm_type))
+        if self._writer is None:
+            with self._lock:
+                if self._writer is None:
+                    self._writer = threading.Thread(
+                        target=self._write_loop, name="alarm-history", daemon=True
+                    )
+                    self._writer.start()
+
+    def _next_batch(self) -> Tuple[List[Tuple[float, str]], List, bool]:
+        """Collect queued events for up to flush_interval seconds.
+
+        Returns:
+            Tuple of (events, flush requests, stop requested)
+        """
+        events: List[Tuple[float, str]] = []
+        requests: List[_FlushRequest] = []
+        item = self._queue.get()
+        deadline = time.monotonic() + self.flush_interval
+        while True:
+            if item is None:
+                return events, requests, True
+            if isinstance(item, _FlushRequest):
+                # Write what we have right away
+                requests.append(item)
+                deadline = 0.0
+            else:
+                events.append(item)
+            if len(events) >= self.batch_size:
+                return events, requests, False
+            try:
+                item = self._queue.get(timeout=max(deadline - time.monotonic(), 0))
+            except queue.Empty:
+                return events, requests, False
+
+    def _write_loop(self) -> None:
+        """Writer thread: store the queued events in batches."""
+        try:
+            connection = self._connect()
+        except sqlite3.Error as e:
+            # Keep answering flush requests, the events are dropped
+            logger.error("Alarm History Open Error: %s", e)
+            connection = None
+        try:
+            while True:
+                events, requests, stop = self._next_batch()
+                if events and connection is not None:
+                    self._write(connection, events)
+                for request in requests:
+                    request.done.set()
+                if stop:
+                    return
+        finally:
+            if connection is not None:
+                connection.close()
+
+    @staticmethod
+    def _write(connection: sqlite3.Connection, events: List[Tuple[float, str]]):
+        """Write a batch of events and update the totals in one transaction."""
+        counts: Dict[str, int] = {}
+        for _, alarm_type in events:
+            counts[alarm_type] = counts.get(alarm_type, 0) + 1
+        try:
+            with connection:
+                connection.executemany(
+                    "INSERT INTO events (timestamp, alarm_type) VALUES (?, ?)",
+                    events,
+                )
+                connection.executemany(
+                    "INSERT INTO totals (alarm_type, count) VALUES (?, ?) "
+                    "ON CONFLICT (alarm_type) DO UPDATE "
+                    "SET count = count + excluded.count",
+                    counts.items(),
+                )
+        except sqlite3.Error as e:
+            logger.error("Alarm History Write Error: %s", e, exc_info=True)
+
+    def flush(self, timeout: float = HISTORY_FLUSH_TIMEOUT) -> bool:
+        """Wait until the queued events are written.
+
+        Args:
+            timeout: Maximum seconds to wait
+
+        Returns:
+            True if all events were written in time
+        """
+        if self._writer is None:
+            return True
+        request = _FlushRequest()
+        self._queue.put(request)
+        return request.done.wait(timeout)
+
+    def close(self, timeout: float = HISTORY_FLUSH_TIMEOUT) -> None:
+        """Write the queued events, stop the writer and close the database.
+
+        Args:
+            timeout: Maximum seconds to wait for the writer
+        """
+        with self._lock:
+            writer, self._writer = self._writer, None
+            if writer is not None:
+                self._queue.put(None)
+                writer.join(timeout)
+        with self._read_lock:
+            if self._reader is not None:
+                self._reader.close()
+                self._reader = None
+
+    # Reading
+    def totals(self) -> Dict[str, int]:
+        """Get the total alarm count per alarm type."""
+        return dict(self._read("SELECT alarm_type, count FROM totals"))
+
+    def recent(self, count: int) -> List[AlarmEvent]:
+        """Get the most recent events.
+
+        Args:
+            count: Maximum number of events
+
+        Returns:
+            Events, oldest first
+        """
+        rows = self._read(
+            "SELECT alarm_type, timestamp FROM events ORDER BY id DESC LIMIT ?",
+            (count,),
+        )
+        return [AlarmEvent(alarm_type, timestamp) for alarm_type, timestamp in rows][
+            ::-1
+        ]
+
+    @staticmethod
+    def _where(
+        start: Optional[float], end: Optional[float], types: Optional[Iterable[str]]
+    ) -> Tuple[str, List]:
+        """Build the WHERE clause for a time range and alarm types."""
+        clauses = []
+        params: List = []
+        if start is not None:
+            clauses.append("timestamp >= ?")
+            params.append(start)
+        if end is not None:
+            clauses.append("timestamp < ?")
+            params.append(end)
+        if types is not None:
+            types = list(types)
+            clauses.append(f"alarm_type IN ({', '.join('?' * len(types))})")
+            params.extend(types)
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+    def count(
+        self,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        types: Optional[Iterable[str]] = None,
+    ) -> int:
+        """Count the stored events.
+
+        Args:
+            start: Only events at or after this Unix timestamp
+            end: Only events before this Unix timestamp
+            types: Only these alarm types
+
+        Returns:
+            Number of matching events
+        """
+        where, params = self._where(start, end, types)
+        return self._read(f"SELECT COUNT(*) FROM events{where}", params)[0][0]
+
+    def bucket_counts(
+        self, width: int, start: Optional[float] = None
+    ) -> List[Tuple[float, str, int]]:
+        """Count the stored events per time bucket and alarm type.
+
+        Args:
+            width: Bucket width in seconds
+            start: Only events at or after this Unix timestamp
+
+        Returns:
+            List of (bucket start timestamp, alarm type, count), oldest first
+        """
+        where, params = self._where(start, None, None)
+        rows = self._read(
+            f"SELECT CAST(timestamp / ? AS INTEGER) AS bucket, alarm_type, COUNT(*) "
+            f"FROM events{where} GROUP BY bucket, alarm_type ORDER BY bucket",
+            [width, *params],
+        )
+        return [
+            (bucket * width, alarm_type, count) for bucket, alarm_type, count in rows
+        ]
+
+    def iter_events(
+        self,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        types: Optional[Iterable[str]] = None,
+        chunk_size: int = HISTORY_CHUNK_SIZE,
+    ) -> Iterator[List[AlarmEvent]]:
+        """Stream the stored events in chunks, oldest first.
+
+        Only one chunk is loaded at a time, on its own connection, so the
+        iteration may run on another thread while events are written.
+
+        Args:
+            start: Only events at or after this Unix timestamp
+            end: Only events before this Unix timestamp
+            types: Only these alarm types
+            chunk_size: Events per chunk
+
+        Yields:
+            Lists of up to chunk_size events
+        """
+        where, params = self._where(start, end, types)
+        connection = self._connect()
+        try:
+            cursor = connection.execute(
+                f"SELECT alarm_type, timestamp FROM events{where} ORDER BY id",
+                params,
+            )
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    return
+                yield [
+                    AlarmEvent(alarm_type, timestamp) for alarm_type, timestamp in rows
+                ]
+        finally:
+            connection.close()
@@ -1,53 +1,74 @@
 import asyncio
 import logging
-import os
 import random
+import threading
 import time
-from typing import TYPE_CHECKING
-
-import numpy as np
-import sounddevice as sd
-import soundfile as sf
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional
 
 from evealert.constants import (
     ALARM_SOUND_FILE,
-    ALERT_IMAGE_PREFIX,
     AUDIO_CHANNELS,
     DEFAULT_COOLDOWN_TIMER,
-    FACTION_IMAGE_PREFIX,
     FACTION_SOUND_FILE,
+    HISTORY_DB_FILE,
     IMG_FOLDER,
+    LEGACY_ALERT_REGION,
+    LEGACY_FACTION_REGION,
     MAIN_CHECK_SLEEP_MAX,
     MAIN_CHECK_SLEEP_MIN,
     MAX_SOUND_TRIGGERS,
+    PROFILE_TICKS,
     SOUND_FOLDER,
+    SPIKE_WINDOW_MINUTES,
+    TEMPLATE_CACHE_FOLDER,
+    VISION_BACKEND_PROCESS,
+    VISION_BACKEND_THREAD,
+    VISION_LOG_INTERVAL,
+    VISION_MAX_WORKERS,
+    VISION_PROCESS_WORKERS,
     VISION_SLEEP_INTERVAL,
+    WATCHDOG_ALERT_STALL,
+    WATCHDOG_VISION_STALL,
     WEBHOOK_COOLDOWN,
 )
-from evealert.settings.helper import get_resource_path
+from evealert.history import AlarmHistoryStore
+from evealert.manager.detection import DetectionFilter
+from evealert.manager.regions import (
+    REGION_PREFIXES,
+    AlertRegion,
+    regions_from_settings,
+)
+from evealert.manager.sink import AlertSink
+from evealert.manager.watchdog import TaskWatchdog
+from evealert.manager.webhook import create_webhook
+from evealert.metrics import AgentMetrics, MetricsServer
+from evealert.settings.helper import get_resource_path, lazy_import
+from evealert.settings.logger import LOG_PATH, flush_logs
+from evealert.settings.store import SettingsChangedEvent, SettingsStore
 from evealert.settings.validator import ConfigValidator
 from evealert.statistics import AlarmStatistics
+from evealert.tools.debugview import DebugRenderer
+from evealert.tools.matchpool import ProcessMatcher
+from evealert.tools.templates import TemplateIndex
+from evealert.tools.tickprofile import TickProfiler
 from evealert.tools.vision import Vision
 from evealert.tools.windowscapture import WindowCapture
 
 if TYPE_CHECKING:
-    from evealert.menu.main import MainMenu
+    from dhooks_lite import Webhook
+
+# Audio libraries are only loaded when the first sound is played
+np = lazy_import("numpy")
+sd = lazy_import("sounddevice")
+sf = lazy_import("soundfile")
 
 # Sound file paths
 ALARM_SOUND = get_resource_path(f"{SOUND_FOLDER}/{ALARM_SOUND_FILE}")
 FACTION_SOUND = get_resource_path(f"{SOUND_FOLDER}/{FACTION_SOUND_FILE}")
 IMG_FOLDER_PATH = get_resource_path(IMG_FOLDER)
 
-ALERT_FILES = [
-    os.path.join(IMG_FOLDER_PATH, filename)
-    for filename in os.listdir(IMG_FOLDER_PATH)
-    if filename.startswith(ALERT_IMAGE_PREFIX)
-]
-FACTION_FILES = [
-    os.path.join(IMG_FOLDER_PATH, filename)
-    for filename in os.listdir(IMG_FOLDER_PATH)
-    if filename.startswith(FACTION_IMAGE_PREFIX)
-]
 
 logger = logging.getLogger("alert")
 
@@ -56,24 +77,64 @@ class AlertAgent:
     """Alert Agent for EVE Online local chat monitoring.
 
     This class manages the complete alert system including:
-    - Screenshot capture and analysis
+    - Screenshot capture and analysis of any number of named regions
     - Enemy and faction detection via template matching
     - Audio alerts with cooldown management
     - Discord webhook notifications
     - Vision debug windows
+
+    The agent doesn't depend on the GUI: it reads its settings from a
+    SettingsStore and reports through an AlertSink, which is the MainMenu
+    in the desktop application and a ConsoleSink in the headless daemon.
     """
 
-    def __init__(self, main: "MainMenu"):
+    def __init__(self, sink: AlertSink, store: SettingsStore):
         """Initialize the Alert Agent.
 
         Args:
-            main: Reference to the MainMenu instance
+            sink: Receiver for messages, errors and vision debug state
+            store: Settings store to read the settings from
         """
-        self.main = main
-        self.loop = asyncio.get_event_loop()
-        self.wincap = WindowCapture(self.main)
-        self.alert_vision = Vision(ALERT_FILES)
-        self.alert_vision_faction = Vision(FACTION_FILES)
+        self.sink = sink
+        self.store = store
+        # Every run gets its own event loop, see start()
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.stopped: Optional[asyncio.Event] = None
+        self.run_lock = threading.Lock()
+        self.wincap = WindowCapture()
+
+        # Template images are indexed once, shared by all regions and
+        # polled for changes at runtime
+        self.templates = TemplateIndex(
+            IMG_FOLDER_PATH, cache_dir=get_resource_path(TEMPLATE_CACHE_FOLDER)
+        )
+        self.templates.scan()
+
+        # Regions are captured and matched on a shared worker pool
+        self.executor = ThreadPoolExecutor(
+            max_workers=VISION_MAX_WORKERS, thread_name_prefix="vision"
+        )
+        # Optional process pool for the matching (vision_backend setting)
+        self.vision_backend = VISION_BACKEND_THREAD
+        self.matcher: Optional[ProcessMatcher] = None
+        # The vision workers start the matcher, only one of them may
+        self.matcher_lock = threading.Lock()
+        # Debug windows are shown on the renderer thread
+        self.renderer = DebugRenderer()
+        self.vision_log_interval = VISION_LOG_INTERVAL
+        # On-demand cProfile/tracemalloc captures of the vision ticks
+        self.profiler = TickProfiler(LOG_PATH, on_done=self.on_profile_written)
+        self.profile_ticks = 0
+        # Restarts crashed tasks and reports event loop and task stalls
+        self.watchdog = TaskWatchdog(
+            self.sink,
+            metrics=lambda: self.metrics,
+            on_give_up=self.on_task_failed,
+        )
+        # N-of-M confirmation, clear delay and hysteresis of the detections
+        self.detection_filter = DetectionFilter()
+        self.regions: List[AlertRegion] = []
+        self.set_regions(regions_from_settings(self.store.defaults))
 
         # Main Settings
         self.running = False
@@ -81,10 +142,10 @@ class AlertAgent:
 
         # Main lock for alarm processing - prevents multiple simultaneous alarm checks
         self.lock = asyncio.Lock()
-        # Note: Vision threads don't need separate locks as they only write to
-        # self.enemy and self.faction flags, which are atomic operations in Python
+        # Note: Vision workers don't need separate locks as they only write to
+        # the region detected flags, which are atomic operations in Python
 
-        # Vision Settings
+        # Vision Settings (any alert / faction region detected)
         self.enemy = False
         self.faction = False
 
@@ -96,8 +157,12 @@ class AlertAgent:
         self.volume = 1.0  # Default volume: 100% (0.0 to 1.0)
 
         # Webhook Settings
+        self.webhook: Optional["Webhook"] = None
+        self.webhook_url = ""
         self.webhook_cooldown_timer = 0
         self.webhook_sent = False
+        self.webhook_systems = ""
+        self.system_name = ""
 
         # Sound Settings
         self.p = sd
@@ -105,8 +170,19 @@ class AlertAgent:
         self.max_sound_triggers = MAX_SOUND_TRIGGERS
         self.currently_playing_sounds = {}
 
-        # Statistics
-        self.statistics = AlarmStatistics()
+        # Statistics, the history is stored next to the settings
+        self.alarm_spikes: Dict[str, bool] = {}
+        self.statistics = AlarmStatistics(
+            store=AlarmHistoryStore(Path(self.store.path).parent / HISTORY_DB_FILE)
+        )
+
+        # Optional Prometheus endpoint (metrics setting), None when disabled
+        self.metrics: Optional[AgentMetrics] = None
+        self.metrics_server: Optional[MetricsServer] = None
+
+        # Settings are reloaded by the alert loop once a change event arrived
+        self.settings_changed = False
+        self.store.subscribe(self.on_settings_changed)
 
         self.load_settings()
         self._validate_audio_files()
@@ -122,11 +198,11 @@ class AlertAgent:
 
         if not valid_alarm:
             logger.warning(error_alarm)
-            self.main.write_message(f"Warning: {error_alarm}", "red")
+            self.sink.write_message(f"Warning: {error_alarm}", "red")
 
         if not valid_faction:
             logger.warning(error_faction)
-            self.main.write_message(f"Warning: {error_faction}", "red")
+            self.sink.write_message(f"Warning: {error_faction}", "red")
 
     @property
     def is_running(self) -> bool:
@@ -144,6 +220,30 @@ class AlertAgent:
     def is_faction(self) -> bool:
         return self.faction
 
+    @property
+    def alert_vision(self) -> Vision:
+        """Vision handler of the legacy alert region."""
+        return self.get_region(LEGACY_ALERT_REGION).vision
+
+    @property
+    def alert_vision_faction(self) -> Vision:
+        """Vision handler of the legacy faction region."""
+        return self.get_region(LEGACY_FACTION_REGION).vision
+
+    def get_region(self, name: str) -> Optional[AlertRegion]:
+        """Get a monitored region by name.
+
+        Args:
+            name: Region name
+
+        Returns:
+            The region or None if there is no region with this name
+        """
+        for region in self.regions:
+            if region.name == name:
+                return region
+        return None
+
     def get_statistics(self) -> AlarmStatistics:
         """Get alarm statistics tracker.
 
@@ -154,38 +254,131 @@ class AlertAgent:
 
     def clean_up(self) -> None:
         self.stop()
-        self.main.write_message("System: EVE Alert stopped.", "green")
+        self.shutdown()
+        self.sink.write_message("System: EVE Alert stopped.", "green")
+
+    def shutdown(self) -> None:
+        """Release the resources kept between runs.
+
+        Stops the metrics server, the matching processes and the debug
+        renderer and closes the alarm history. Call it once the agent
+        won't be started again.
+        """
+        self.set_metrics(False)
+        self.close_matcher()
+        self.renderer.stop()
+        self.statistics.close()
 
     def start(self) -> bool:
-        self.loop.run_until_complete(self.vision_check())
-        if self.check is True:
+        """Run the agent on a new event loop until it is stopped.
+
+        Blocks the calling thread. A second call waits until the previous
+        run has been torn down.
 
-            self.vison_t = self.loop.create_task(self.vision_thread())
-            self.vision_faction_t = self.loop.create_task(self.vision_faction_thread())
+        Returns:
+            False if the regions couldn't be captured, True after a run
+        """
+        with self.run_lock:
+            loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(loop)
+            self.stopped = asyncio.Event()
+            self.loop = loop
+            try:
+                return loop.run_until_complete(self.main())
+            finally:
+                self.close_loop(loop)
+                # Write the queued alarm events and log records of the run
+                # here, stop() is called from the UI thread
+                self.statistics.flush()
+                flush_logs()
 
-            # Start the Alarm
-            self.alert_t = self.loop.create_task(self.run())
+    async def main(self) -> bool:
+        """Start the agent tasks and wait until the agent is stopped.
 
-            self.running = True
-            self.main.write_message("System: EVE Alert started.", "green")
-            self.loop.run_forever()
-            logger.debug("Alle Tasks wurden gestartet")
-            return True
-        return False
+        Returns:
+            False if the regions couldn't be captured, True after a run
+        """
+        await self.vision_check()
+        if self.check is not True or self.stopped.is_set():
+            return False
+
+        # The alarm lock belongs to the loop of the run
+        self.lock = asyncio.Lock()
+        self.vision_t = self.watchdog.watch(
+            "vision", self.vision_thread, WATCHDOG_VISION_STALL
+        )
+
+        # Start the Alarm
+        self.alert_t = self.watchdog.watch("alert", self.run, WATCHDOG_ALERT_STALL)
+        self.watchdog_t = asyncio.create_task(self.watchdog.run(), name="watchdog")
+
+        self.running = True
+        self.sink.write_message("System: EVE Alert started.", "green")
+        if self.profile_ticks:
+            self.request_profile(self.profile_ticks)
+        await self.stopped.wait()
+        return True
+
+    def close_loop(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Cancel the tasks of a run and close its event loop.
+
+        Args:
+            loop: Event loop of the run
+        """
+        try:
+            self.watchdog.cancel()
+            tasks = asyncio.all_tasks(loop)
+            for task in tasks:
+                task.cancel()
+            loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.run_until_complete(loop.shutdown_default_executor())
+        finally:
+            asyncio.set_event_loop(None)
+            loop.close()
+            logger.debug("Event loop closed")
 
     def stop(self) -> None:
-        self.loop.stop()
+        """Stop the running agent, from any thread.
+
+        The tasks are cancelled and the event loop is closed on the agent
+        thread once it picked up the stop.
+        """
+        loop, stopped = self.loop, self.stopped
+        if loop is not None and stopped is not None:
+            try:
+                loop.call_soon_threadsafe(stopped.set)
+            except RuntimeError:
+                # The run already ended and closed its loop
+                pass
         self.running = False
         self.currently_playing_sounds = {}
         self.alarm_trigger_counts = {}
         self.cooldown_timers = {}
-        self.alert_vision.debug_mode = False
-        self.alert_vision_faction.debug_mode_faction = False
-        self.main.update_alert_button()
-        self.main.update_faction_button()
+        for region in self.regions:
+            region.vision.clean_up()
+            region.detected = False
+            region.state.reset()
+        self.sink.update_alert_button()
+        self.sink.update_faction_button()
+        self.profiler.cancel()
+
+    def on_settings_changed(self, event: SettingsChangedEvent) -> None:
+        """Flag the alert loop to reload the changed settings.
 
-    def load_settings(self) -> None:
-        settings = self.main.menu.setting.load_settings()
+        Args:
+            event: Change event published by the settings store
+        """
+        logger.debug("Settings changed: %s", ", ".join(sorted(event.changed_keys)))
+        self.settings_changed = True
+
+    def load_settings(self, reload_vision: bool = False) -> None:
+        """Read the settings and apply them to the agent.
+
+        Args:
+            reload_vision: Rebuild the Vision handlers for changed settings
+        """
+        settings = self.store.load()
 
         if settings:
             # Validate settings
@@ -193,102 +386,395 @@ class AlertAgent:
             if not is_valid:
                 error_msg = "Configuration validation failed:\n" + "\n".join(errors)
                 logger.error(error_msg)
-                self.main.write_message(
+                self.sink.write_message(
                     "Settings validation failed. Check logs.", "red"
                 )
                 for error in errors:
-                    self.main.write_message(f"  - {error}", "red")
+                    self.sink.write_message(f"  - {error}", "red")
+                return
+            try:
+                regions = regions_from_settings(settings)
+            except ValueError as e:
+                logger.error("Invalid regions: %s", e)
+                self.sink.write_message(f"Settings: {e}", "red")
                 return
-            self.x1 = int(settings["alert_region_1"]["x"])
-            self.y1 = int(settings["alert_region_1"]["y"])
-            self.x2 = int(settings["alert_region_2"]["x"])
-            self.y2 = int(settings["alert_region_2"]["y"])
-            self.x1_faction = int(settings["faction_region_1"]["x"])
-            self.y1_faction = int(settings["faction_region_1"]["y"])
-            self.x2_faction = int(settings["faction_region_2"]["x"])
-            self.y2_faction = int(settings["faction_region_2"]["y"])
-            self.detection = int(settings["detectionscale"]["value"])
-            self.detection_faction = int(settings["faction_scale"]["value"])
             self.cooldowntimer = int(settings["cooldown_timer"]["value"])
             self.volume = (
                 settings.get("volume", {}).get("value", 100) / 100.0
             )  # Convert to 0.0-1.0
             self.mute = settings["server"]["mute"]
-            if self.main.menu.setting.is_changed:
-                vision_opened = False
-                factiom_vision_opened = False
-                if self.alert_vision.is_vision_open:
-                    vision_opened = True
-                if self.alert_vision_faction.is_faction_vision_open:
-                    factiom_vision_opened = True
-                # Reload the Vision
-                self.alert_vision = Vision(ALERT_FILES)
-                self.alert_vision_faction = Vision(FACTION_FILES)
-                if vision_opened:
-                    self.set_vision()
-                if factiom_vision_opened:
-                    self.set_vision_faction()
-                self.main.write_message("Settings: Loaded.", "green")
+            self.system_name = settings["server"]["system"]
+            self.set_webhook(settings["server"]["name"])
+            self.vision_backend = settings["vision_backend"]["value"]
+            if self.vision_backend != VISION_BACKEND_PROCESS:
+                # Release the worker processes and shared memory blocks
+                self.close_matcher()
+            self.renderer.fps = settings["debug_fps"]["value"]
+            self.vision_log_interval = float(settings["vision_log_interval"]["value"])
+            self.detection_filter = DetectionFilter.from_settings(
+                settings["detection_filter"]
+            )
+            self.set_metrics(
+                settings["metrics"]["enabled"], int(settings["metrics"]["port"])
+            )
+            profile_ticks = int(settings["profiling"]["ticks"])
+            if profile_ticks != self.profile_ticks:
+                self.profile_ticks = profile_ticks
+                if profile_ticks and self.running:
+                    self.request_profile(profile_ticks)
+            if reload_vision:
+                self.templates.scan()
+            self.set_regions(regions)
+            if reload_vision:
+                self.sink.write_message("Settings: Loaded.", "green")
+
+    def request_profile(self, ticks: Optional[int] = None) -> bool:
+        """Profile the next vision ticks of the running agent.
+
+        The profile, allocation snapshot and summary are written to the
+        logs folder once the ticks are done.
+
+        Args:
+            ticks: Ticks to profile (default: the profiling setting or
+                PROFILE_TICKS)
+
+        Returns:
+            True if the capture was requested
+        """
+        if not self.running:
+            self.sink.write_message("System: EVE Alert is not running.")
+            return False
+        ticks = ticks or self.profile_ticks or PROFILE_TICKS
+        if not self.profiler.request(ticks):
+            self.sink.write_message("System: Profiling is already running.", "yellow")
+            return False
+        self.sink.write_message(f"System: Profiling the next {ticks} ticks.")
+        return True
+
+    def on_profile_written(self, path: Path) -> None:
+        """Report a written profile.
+
+        Args:
+            path: Summary file of the profile
+        """
+        self.sink.write_message(f"System: Profile written to {path}.", "green")
+
+    def set_metrics(self, enabled: bool, port: int = 0) -> None:
+        """Start or stop the metrics endpoint.
+
+        The endpoint is only restarted when the port changed.
+
+        Args:
+            enabled: Serve the metrics
+            port: Local TCP port
+        """
+        server = self.metrics_server
+        if server is not None and (not enabled or server.requested_port != port):
+            server.stop()
+            self.metrics_server = None
+            self.metrics = None
+            logger.info("Metrics endpoint stopped")
+        if not enabled or self.metrics_server is not None:
+            return
+        metrics = AgentMetrics(self.statistics)
+        server = MetricsServer(metrics, port)
+        try:
+            server.start()
+        except OSError as e:
+            logger.error("Metrics endpoint could not be started: %s", e)
+            self.sink.write_message(f"Metrics: Port {port} is not available.", "red")
+            return
+        self.metrics_server = server
+        self.metrics = metrics
+
+    def set_webhook(self, url: str) -> None:
+        """Activate the Discord webhook for a URL.
+
+        The webhook is only rebuilt when the URL changed.
+
+        Args:
+            url: Webhook URL, empty or the placeholder to disable it
+        """
+        if url == self.webhook_url:
+            return
+        self.webhook_url = url
+        self.webhook = create_webhook(url)
+        self.webhook_sent = False
+
+    def set_regions(self, regions: List[AlertRegion]) -> None:
+        """Replace the monitored regions.
+
+        Regions that keep their name keep their Vision handler, which is
+        reconfigured in place with its cached templates and debug window.
+
+        Args:
+            regions: New regions
+        """
+        current = {region.name: region for region in self.regions}
+        for region in regions:
+            previous = current.get(region.name)
+            if previous is not None and previous.kind == region.kind:
+                region.vision = previous.vision
+                region.detected = previous.detected
+                region.state = previous.state
+            else:
+                region.vision = Vision(
+                    self.templates.files(region.prefix),
+                    loader=self.templates.load,
+                    renderer=self.renderer,
+                )
+        self.regions = regions
+        self.configure_vision()
+
+    def template_sets(self) -> Dict[str, List[str]]:
+        """Get the template paths of every region kind."""
+        return {
+            prefix: self.templates.files(prefix) for prefix in REGION_PREFIXES.values()
+        }
+
+    def get_matcher(self) -> ProcessMatcher:
+        """Get the process pool matcher, starting it on first use.
+
+        Called from the vision worker threads, the matcher is only started
+        once.
+        """
+        matcher = self.matcher
+        if matcher is not None:
+            return matcher
+        with self.matcher_lock:
+            if self.matcher is None:
+                self.matcher = ProcessMatcher(
+                    IMG_FOLDER_PATH,
+                    self.template_sets(),
+                    cache_dir=get_resource_path(TEMPLATE_CACHE_FOLDER),
+                    workers=VISION_PROCESS_WORKERS,
+                )
+                logger.info("Started %d matching processes", self.matcher.workers)
+            return self.matcher
+
+    def close_matcher(self) -> None:
+        """Stop the matching processes if they are running."""
+        with self.matcher_lock:
+            matcher, self.matcher = self.matcher, None
+        if matcher is not None:
+            matcher.close()
+
+    def configure_vision(self, reload_templates: bool = False) -> None:
+        """Apply the region settings to the Vision handlers in place.
+
+        The handlers keep their cached templates and open debug windows.
+
+        Args:
+            reload_templates: Re-scan the template index and load only new
+                or modified templates
+        """
+        if reload_templates:
+            self.templates.scan()
+            if self.matcher is not None:
+                self.matcher.set_templates(self.template_sets())
+
+        for region in self.regions:
+            region.vision.configure(
+                threshold=region.detection,
+                region=region.region,
+                needle_img_paths=self.templates.files(region.prefix),
+                name=region.name,
+                log_interval=self.vision_log_interval,
+            )
+            region.state.configure(self.detection_filter)
 
     def set_vision(self) -> None:
         if self.is_running:
             self.alert_vision.debug_mode = not self.alert_vision.debug_mode
-            self.main.update_alert_button()
+            self.sink.update_alert_button()
 
     def set_vision_faction(self) -> None:
         if self.is_running:
             self.alert_vision_faction.debug_mode_faction = (
                 not self.alert_vision_faction.debug_mode_faction
             )
-            self.main.update_faction_button()
+            self.sink.update_faction_button()
+
+    @property
+    def active_regions(self) -> List[AlertRegion]:
+        """Enabled regions."""
+        return [region for region in self.regions if region.enabled]
+
+    def detected_regions(self, faction: bool = False) -> List[AlertRegion]:
+        """Get the alert or faction regions with a detection.
+
+        Args:
+            faction: Return faction instead of alert regions
+
+        Returns:
+            Regions whose last check found a match
+        """
+        return [
+            region
+            for region in self.active_regions
+            if region.detected and region.is_faction == faction
+        ]
 
     async def vision_check(self) -> None:
-        """Validate that screenshot capture works for configured alert region."""
+        """Validate that screenshot capture works for all alert regions."""
         self.load_settings()
+        for region in self.active_regions:
+            if region.is_faction:
+                continue
+            screenshot, _ = self.wincap.get_screenshot_value(
+                region.y1, region.x1, region.x2, region.y2
+            )
+            if screenshot is None:
+                self.sink.write_message(f"Wrong Alert Settings ({region.name}).", "red")
+                self.check = False
+                return
+        self.check = True
+
+    def check_region(self, region: AlertRegion) -> Optional[bool]:
+        """Capture and match a single region.
+
+        Runs on a worker thread of the vision pool. With the process
+        backend the matching is passed on to a worker process, unless the
+        region's debug window is open, as it needs the match rectangles.
+
+        Args:
+            region: Region to check
+
+        The best match score of the frame is stored in ``region.score``.
+
+        Returns:
+            True if a template matched, None if the capture failed
+        """
+        region.score = None
         screenshot, _ = self.wincap.get_screenshot_value(
-            self.y1, self.x1, self.x2, self.y2
+            region.y1, region.x1, region.x2, region.y2
         )
-        if screenshot is not None:
-            self.check = True
+        if screenshot is None:
+            return None
+        started = time.perf_counter()
+        vision = region.vision
+        if self.vision_backend == VISION_BACKEND_PROCESS and not (
+            vision.debug_mode or vision.debug_mode_faction
+        ):
+            matcher = self.get_matcher()
+            detected = bool(
+                matcher.match(region.name, screenshot, region.prefix, vision.threshold)
+            )
+            region.score = matcher.scores.get(region.name)
         else:
-            self.main.write_message("Wrong Alert Settings.", "red")
-            self.check = False
+            if region.is_faction:
+                detected = bool(vision.find_faction(screenshot))
+            else:
+                detected = bool(vision.find(screenshot))
+            region.score = vision.last_score
+        metrics = self.metrics
+        if metrics is not None:
+            metrics.frame(region.name, time.perf_counter() - started)
+        return detected
+
+    async def check_regions(self) -> None:
+        """Check all regions once and update the detection state.
+
+        Each region is captured and matched on the shared worker pool,
+        debug windows are shown by the renderer thread. The frame results
+        pass the detection state machine of the region, so a single noisy
+        or missed frame doesn't change the detection.
+        """
+        loop = asyncio.get_running_loop()
+        regions = self.active_regions
+        check_region = self.profiler.wrap(self.check_region)
+        checks = [
+            loop.run_in_executor(self.executor, check_region, region)
+            for region in regions
+        ]
+        results = await asyncio.gather(*checks, return_exceptions=True)
+        for region, result in zip(regions, results):
+            if isinstance(result, Exception):
+                logger.error("Region %s check failed: %s", region.name, result)
+                if self.metrics is not None:
+                    self.metrics.frame_skipped(region.name, "error")
+                result = False
+            if result is None:
+                if self.metrics is not None:
+                    self.metrics.frame_skipped(region.name, "capture")
+                if not region.is_faction:
+                    # Only the run ends, the metrics stay available
+                    self.sink.write_message(
+                        f"Wrong Alert Settings ({region.name}).", "red"
+                    )
+                    self.stop()
+                    self.sink.write_message("System: EVE Alert stopped.", "red")
+                    break
+            self.update_detection(region, bool(result))
+
+        self.enemy = bool(self.detected_regions())
+        self.faction = bool(self.detected_regions(faction=True))
+
+    def update_detection(self, region: AlertRegion, matched: bool) -> None:
+        """Pass the result of a region check to its detection state.
+
+        Args:
+            region: Checked region, with the score of the check
+            matched: A template matched in the frame
+        """
+        detected = region.state.update(matched, region.score, region.vision.threshold)
+        if detected != region.detected:
+            logger.debug(
+                "Region %s %s (score %s)",
+                region.name,
+                "detected" if detected else "cleared",
+                "-" if region.score is None else f"{region.score:.1f}",
+            )
+            region.detected = detected
 
     async def vision_thread(self) -> None:
-        """Continuously check for enemy detection in the alert region."""
+        """Continuously check all regions for enemies and faction spawns."""
         while True:
-            screenshot, _ = self.wincap.get_screenshot_value(
-                self.y1, self.x1, self.x2, self.y2
-            )
-            if screenshot is not None:
-                enemy = self.alert_vision.find(screenshot, self.detection)
-                if enemy == "Error":
-                    self.clean_up()
-                if enemy:
-                    self.enemy = True
-                else:
-                    self.enemy = False
-            else:
-                self.main.write_message("Wrong Alert Settings.", "red")
-                self.clean_up()
+            with self.profiler.tick():
+                await self.check_regions()
+            self.watchdog.beat("vision")
             await asyncio.sleep(VISION_SLEEP_INTERVAL)
 
-    async def vision_faction_thread(self) -> None:
-        """Continuously check for faction detection in the faction region."""
-        while True:
-            screenshot_faction, _ = self.wincap.get_screenshot_value(
-                self.y1_faction, self.x1_faction, self.x2_faction, self.y2_faction
-            )
-            if screenshot_faction is not None:
-                faction = self.alert_vision_faction.find_faction(
-                    screenshot_faction, self.detection_faction
-                )
+    def on_task_failed(self, name: str) -> None:
+        """Stop the agent when a task keeps crashing.
 
-                if faction:
-                    self.faction = True
-                else:
-                    self.faction = False
-            await asyncio.sleep(VISION_SLEEP_INTERVAL)
+        Args:
+            name: Name of the crashed task
+        """
+        logger.error("Task %s keeps crashing, stopping EVE Alert", name)
+        self.stop()
+
+    def alarm_systems(self) -> str:
+        """Get the system names of the alert regions with a detection.
+
+        Returns:
+            Comma separated system names, or the configured system name if
+            no region has its own
+        """
+        systems = []
+        for region in self.detected_regions():
+            if region.system and region.system not in systems:
+                systems.append(region.system)
+        return ", ".join(systems) or self.system_name
+
+    def alarm_text(self, text: str, faction: bool = False) -> str:
+        """Add the detected region names to an alarm message.
+
+        The names are only added when more than one region of the kind
+        is monitored.
+
+        Args:
+            text: Alarm message
+            faction: Use the faction instead of the alert regions
+
+        Returns:
+            Alarm message with the region names
+        """
+        monitored = [r for r in self.active_regions if r.is_faction == faction]
+        if len(monitored) <= 1:
+            return text
+        names = ", ".join(region.name for region in self.detected_regions(faction))
+        return f"{text} ({names})"
 
     async def reset_alarm(self, alarm_type: str) -> None:
         """Reset alarm counters and cooldown for the given alarm type."""
@@ -296,26 +782,40 @@ class AlertAgent:
             self.alarm_trigger_counts[alarm_type] = 0
             self.cooldown_timers[alarm_type] = 0
 
-        if self.main.webhook and alarm_type == "Enemy":
+        if self.webhook and alarm_type == "Enemy":
             if self.webhook_sent is True:
-                self.main.webhook.execute(
-                    f"Alarm Reset: {self.main.menu.setting.system_name.get()}!"
-                )
+                self.webhook.execute(f"Alarm Reset: {self.webhook_systems}!")
             self.webhook_sent = False
 
     async def alarm_detection(
         self, alarm_text: str, sound: str = ALARM_SOUND, alarm_type: str = "Enemy"
     ) -> None:
         """Trigger an alarm with text message, sound, and webhook notification."""
-        self.main.write_message(
+        self.sink.write_message(
             f"{alarm_text}",
             "red",
         )
         # Track alarm in statistics
         self.statistics.add_alarm(alarm_type)
+        self.check_alarm_spike(alarm_type)
         await self.play_sound(sound, alarm_type)
         await self.send_webhook_message(alarm_type)
 
+    def check_alarm_spike(self, alarm_type: str) -> None:
+        """Report once when the alarm rate rises above its baseline.
+
+        Args:
+            alarm_type: Type of the recorded alarm
+        """
+        spike, recent, _ = self.statistics.aggregates.spike(alarm_type)
+        if spike and not self.alarm_spikes.get(alarm_type):
+            self.sink.write_message(
+                f"System: {alarm_type} alarm spike, {recent} alarms in the last "
+                f"{SPIKE_WINDOW_MINUTES} minutes.",
+                "yellow",
+            )
+        self.alarm_spikes[alarm_type] = spike
+
     async def send_webhook_message(self, alarm_type: str) -> None:
         """Send webhook notification for enemy alarms with cooldown."""
         current_time = time.time()
@@ -324,16 +824,23 @@ class AlertAgent:
             logger.info("Webhook is in cooldown period. Message not sent.")
             return
 
-        if self.main.webhook and alarm_type == "Enemy" and self.webhook_sent is False:
+        if self.webhook and alarm_type == "Enemy" and self.webhook_sent is False:
             # Send the webhook message
+            started = time.perf_counter()
             try:
-                msg = f"Enemy Appears in {self.main.menu.setting.system_name.get()}!"
-                self.main.webhook.execute(msg)
+                self.webhook_systems = self.alarm_systems()
+                msg = f"Enemy Appears in {self.webhook_systems}!"
+                self.webhook.execute(msg)
                 self.webhook_cooldown_timer = current_time + WEBHOOK_COOLDOWN
                 self.webhook_sent = True
 
             except Exception as e:
                 logger.error("Error sending webhook: %s", e)
+                if self.metrics is not None:
+                    self.metrics.webhook(time.perf_counter() - started, failed=True)
+                return
+            if self.metrics is not None:
+                self.metrics.webhook(time.perf_counter() - started)
 
     async def play_sound(self, sound: str, alarm_type: str) -> None:
         """Play alarm sound with trigger limits and cooldown management."""
@@ -349,7 +856,7 @@ class AlertAgent:
         # Check cooldown timer
         current_time = time.time()
         if current_time < self.cooldown_timers[alarm_type]:
-            self.main.write_message(
+            self.sink.write_message(
                 f"{alarm_type} Sound is in cooldown period.", "yellow"
             )
             return
@@ -361,7 +868,7 @@ class AlertAgent:
         if self.alarm_trigger_counts[alarm_type] > self.max_sound_triggers:
             self.cooldown_timers[alarm_type] = current_time + self.cooldowntimer
             self.alarm_trigger_counts[alarm_type] = 0
-            self.main.write_message(
+            self.sink.write_message(
                 f"{alarm_type} Sound is now in cooldown for {self.cooldowntimer} seconds.",
                 "yellow",
             )
@@ -369,6 +876,7 @@ class AlertAgent:
 
         if alarm_type not in self.currently_playing_sounds:
             self.currently_playing_sounds[alarm_type] = True
+            started = time.perf_counter()
             try:
                 # Read audio data with soundfile
                 data, samplerate = sf.read(sound, dtype="int16")
@@ -386,12 +894,16 @@ class AlertAgent:
 
                 # Play the audio data
                 sd.play(data_with_volume, samplerate)
+                if self.metrics is not None:
+                    self.metrics.audio_start_seconds.observe(
+                        time.perf_counter() - started
+                    )
                 await asyncio.sleep(
                     len(data) / samplerate
                 )  # Wait for the sound to finish
             except Exception as e:
                 if self.alarm_trigger_counts[alarm_type] <= 1:
-                    self.main.open_error_window(
+                    self.sink.open_error_window(
                         "Error Playing Sound. Check Logs for more information."
                     )
                 logger.exception("Error Playing Sound: %s", e)
@@ -403,9 +915,13 @@ class AlertAgent:
         async with self.lock:
             while True:
                 # Reload settings if changed
-                if self.main.menu.setting.is_changed:
-                    self.load_settings()
-                    self.main.menu.setting.changed = False
+                self.store.reload_if_changed()
+                if self.settings_changed:
+                    self.settings_changed = False
+                    self.load_settings(reload_vision=True)
+                elif self.templates.poll():
+                    self.configure_vision(reload_templates=True)
+                    self.sink.write_message("Templates: Reloaded.", "green")
 
                 # Reset alarm status
                 self.alarm_detected = False
@@ -414,17 +930,19 @@ class AlertAgent:
                     if self.faction:
                         self.alarm_detected = True
                         await self.alarm_detection(
-                            "Faction Spawn!", FACTION_SOUND, "Faction"
+                            self.alarm_text("Faction Spawn!", faction=True),
+                            FACTION_SOUND,
+                            "Faction",
                         )
                     if self.enemy:
                         self.alarm_detected = True
                         await self.alarm_detection(
-                            "Enemy Appears!", ALARM_SOUND, "Enemy"
+                            self.alarm_text("Enemy Appears!"), ALARM_SOUND, "Enemy"
                         )
                 except ValueError as e:
                     logger.error("Alert System Error: %s", e)
                     self.stop()
-                    self.main.write_message("Something went wrong.", "red")
+                    self.sink.write_message("Something went wrong.", "red")
                     return
 
                 # Check if any of the images was detected
@@ -433,8 +951,9 @@ class AlertAgent:
                 if not self.enemy:
                     await self.reset_alarm("Enemy")
 
+                self.watchdog.beat("alert")
                 sleep_time = random.uniform(MAIN_CHECK_SLEEP_MIN, MAIN_CHECK_SLEEP_MAX)
-                self.main.write_message(
+                self.sink.write_message(
                     f"Next check in {sleep_time:.2f} seconds...",
                 )
                 await asyncio.sleep(sleep_time)
@@ -0,0 +1,149 @@
+"""Debounced detection state of a monitored region.
+
+A single noisy frame shouldn't raise an alarm and a single missed frame
+shouldn't reset it. ``DetectionState`` turns the per-frame match results
+of a region into a stable detection:
+
+- A detection is confirmed when ``confirm_frames`` of the last
+  ``window_frames`` frames matched (N-of-M).
+- A confirmed detection holds while the best match score stays within
+  ``hysteresis`` percent below the region threshold, so a score hovering
+  around the threshold doesn't flap.
+- It clears once no frame matched for ``clear_delay`` seconds.
+
+The states are CLEAR, PENDING (matching frames, not yet confirmed),
+DETECTED and CLEARING (confirmed, waiting for the clear delay).
+"""
+
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Optional
+
+from evealert.constants import (
+    DETECTION_CLEAR_DELAY,
+    DETECTION_CONFIRM_FRAMES,
+    DETECTION_HYSTERESIS,
+    DETECTION_WINDOW_FRAMES,
+)
+
+STATE_CLEAR = "clear"
+STATE_PENDING = "pending"
+STATE_DETECTED = "detected"
+STATE_CLEARING = "clearing"
+
+
+@dataclass(frozen=True)
+class DetectionFilter:
+    """Settings of the detection state machine.
+
+    Attributes:
+        confirm_frames: Matching frames needed to confirm a detection
+        window_frames: Last frames the matching frames are counted in
+        clear_delay: Seconds without a matching frame before a detection
+            clears
+        hysteresis: Percent below the threshold a detected region keeps
+            matching
+    """
+
+    confirm_frames: int = DETECTION_CONFIRM_FRAMES
+    window_frames: int = DETECTION_WINDOW_FRAMES
+    clear_delay: float = DETECTION_CLEAR_DELAY
+    hysteresis: float = DETECTION_HYSTERESIS
+
+    @classmethod
+    def from_settings(cls, settings: dict) -> "DetectionFilter":
+        """Create the filter from the ``detection_filter`` setting.
+
+        Args:
+            settings: Validated ``detection_filter`` settings entry
+
+        Returns:
+            New filter
+        """
+        return cls(
+            confirm_frames=int(settings["confirm_frames"]),
+            window_frames=int(settings["window_frames"]),
+            clear_delay=float(settings["clear_delay"]),
+            hysteresis=float(settings["hysteresis"]),
+        )
+
+
+class DetectionState:
+    """Detection state machine of one region.
+
+    Attributes:
+        filter: Confirmation, clear delay and hysteresis settings
+        detected: The detection is confirmed (DETECTED or CLEARING)
+    """
+
+    def __init__(self, detection_filter: Optional[DetectionFilter] = None) -> None:
+        """Initialize a cleared state.
+
+        Args:
+            detection_filter: Settings, defaults to the DETECTION_* constants
+        """
+        self.filter = detection_filter or DetectionFilter()
+        self.detected = False
+        self._hits: Deque[bool] = deque(maxlen=self.filter.window_frames)
+        self._last_hit = 0.0
+
+    @property
+    def state(self) -> str:
+        """Current state name (STATE_CLEAR, STATE_PENDING, ...)."""
+        if self.detected:
+            return STATE_DETECTED if self._hits and self._hits[-1] else STATE_CLEARING
+        return STATE_PENDING if any(self._hits) else STATE_CLEAR
+
+    def configure(self, detection_filter: DetectionFilter) -> None:
+        """Change the settings, keeping the current detection.
+
+        Args:
+            detection_filter: New settings
+        """
+        if detection_filter == self.filter:
+            return
+        self.filter = detection_filter
+        self._hits = deque(self._hits, maxlen=detection_filter.window_frames)
+
+    def reset(self) -> None:
+        """Clear the detection and the frame history."""
+        self.detected = False
+        self._hits.clear()
+
+    def update(
+        self,
+        matched: bool,
+        score: Optional[float],
+        threshold: float,
+        now: Optional[float] = None,
+    ) -> bool:
+        """Add the result of a frame.
+
+        Args:
+            matched: A template matched at the threshold
+            score: Best match score of the frame in percent, None if unknown
+            threshold: Detection threshold of the region in percent
+            now: Monotonic time of the frame (default: now)
+
+        Returns:
+            True while the detection is confirmed
+        """
+        if now is None:
+            now = time.monotonic()
+        hit = matched or (
+            self.detected
+            and score is not None
+            and score >= threshold - self.filter.hysteresis
+        )
+        self._hits.append(hit)
+        if hit:
+            self._last_hit = now
+
+        if not self.detected:
+            if sum(self._hits) >= self.filter.confirm_frames:
+                self.detected = True
+        elif not hit and now - self._last_hit >= self.filter.clear_delay:
+            self.detected = False
+            self._hits.clear()
+        return self.detected
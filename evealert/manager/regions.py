@@ -0,0 +1,199 @@
+"""Named monitoring regions for the Alert Agent.
+
+A region is a screen rectangle that is matched against the enemy or the
+faction templates with its own threshold and system name. The regions come
+from the ``regions`` settings list; the legacy ``alert_region_1/2`` and
+``faction_region_1/2`` settings are converted to the regions "Alert" and
+"Faction", so existing settings files keep working.
+
+Example ``regions`` entry::
+
+    {"name": "Client 2", "kind": "alert", "x1": 0, "y1": 0, "x2": 200,
+     "y2": 400, "detection": 90, "system": "Jita", "enabled": true}
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from evealert.constants import (
+    ALERT_IMAGE_PREFIX,
+    FACTION_IMAGE_PREFIX,
+    LEGACY_ALERT_REGION,
+    LEGACY_FACTION_REGION,
+    REGION_ALERT,
+    REGION_FACTION,
+)
+from evealert.manager.detection import DetectionState
+from evealert.tools.vision import Vision
+
+# Template prefix matched by each region kind
+REGION_PREFIXES = {
+    REGION_ALERT: ALERT_IMAGE_PREFIX,
+    REGION_FACTION: FACTION_IMAGE_PREFIX,
+}
+
+DEFAULT_REGION = {
+    "name": "",
+    "kind": REGION_ALERT,
+    "x1": 0,
+    "y1": 0,
+    "x2": 0,
+    "y2": 0,
+    "detection": 90,
+    "system": "",
+    "enabled": True,
+}
+
+
+@dataclass
+class AlertRegion:
+    """A named screen region monitored by the Alert Agent.
+
+    Attributes:
+        name: Unique region name, used in alarm messages
+        kind: REGION_ALERT or REGION_FACTION
+        x1: Left coordinate
+        y1: Top coordinate
+        x2: Right coordinate (exclusive)
+        y2: Bottom coordinate (exclusive)
+        detection: Detection threshold in percent
+        system: Solar system name used in webhook messages
+        enabled: Whether the region is monitored
+        vision: Vision handler of the region (set by the agent)
+        detected: Confirmed detection of the region (see ``state``)
+        score: Best match score of the last check in percent, None if unknown
+        state: Debounced detection state fed with every check
+    """
+
+    name: str
+    kind: str = REGION_ALERT
+    x1: int = 0
+    y1: int = 0
+    x2: int = 0
+    y2: int = 0
+    detection: int = 90
+    system: str = ""
+    enabled: bool = True
+    vision: Optional[Vision] = field(default=None, repr=False, compare=False)
+    detected: bool = field(default=False, compare=False)
+    score: Optional[float] = field(default=None, compare=False)
+    state: DetectionState = field(
+        default_factory=DetectionState, repr=False, compare=False
+    )
+
+    @property
+    def region(self) -> Tuple[int, int, int, int]:
+        """Screen region as (x1, y1, x2, y2)."""
+        return (self.x1, self.y1, self.x2, self.y2)
+
+    @property
+    def prefix(self) -> str:
+        """Template prefix matched in this region."""
+        return REGION_PREFIXES[self.kind]
+
+    @property
+    def is_faction(self) -> bool:
+        """Returns True for faction regions."""
+        return self.kind == REGION_FACTION
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "AlertRegion":
+        """Create a region from a ``regions`` settings entry.
+
+        Missing keys are filled with the defaults.
+
+        Args:
+            data: Settings entry
+
+        Returns:
+            New region
+
+        Raises:
+            ValueError: If a value has the wrong type or the kind is unknown
+        """
+        values = {**DEFAULT_REGION, **data}
+        kind = str(values["kind"]).lower()
+        if kind not in REGION_PREFIXES:
+            raise ValueError(f"Unknown region kind: {values['kind']}")
+        try:
+            return cls(
+                name=str(values["name"]),
+                kind=kind,
+                x1=int(values["x1"]),
+                y1=int(values["y1"]),
+                x2=int(values["x2"]),
+                y2=int(values["y2"]),
+                detection=int(values["detection"]),
+                system=str(values["system"]),
+                enabled=bool(values["enabled"]),
+            )
+        except TypeError as e:
+            raise ValueError(str(e)) from e
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the region to a ``regions`` settings entry."""
+        return {key: getattr(self, key) for key in DEFAULT_REGION}
+
+
+def legacy_regions(settings: Dict[str, Any]) -> List[AlertRegion]:
+    """Convert the legacy alert and faction region settings.
+
+    Args:
+        settings: Complete settings dictionary
+
+    Returns:
+        The regions "Alert" and "Faction"
+    """
+    system = settings["server"]["system"]
+    return [
+        AlertRegion(
+            name=LEGACY_ALERT_REGION,
+            kind=REGION_ALERT,
+            x1=int(settings["alert_region_1"]["x"]),
+            y1=int(settings["alert_region_1"]["y"]),
+            x2=int(settings["alert_region_2"]["x"]),
+            y2=int(settings["alert_region_2"]["y"]),
+            detection=int(settings["detectionscale"]["value"]),
+            system=system,
+        ),
+        AlertRegion(
+            name=LEGACY_FACTION_REGION,
+            kind=REGION_FACTION,
+            x1=int(settings["faction_region_1"]["x"]),
+            y1=int(settings["faction_region_1"]["y"]),
+            x2=int(settings["faction_region_2"]["x"]),
+            y2=int(settings["faction_region_2"]["y"]),
+            detection=int(settings["faction_scale"]["value"]),
+            system=system,
+        ),
+    ]
+
+
+def regions_from_settings(settings: Dict[str, Any]) -> List[AlertRegion]:
+    """Get all monitored regions from the settings.
+
+    The legacy regions "Alert" and "Faction" come first, followed by the
+    entries of the ``regions`` list. Entries without a name are named
+    after their position.
+
+    Args:
+        settings: Complete settings dictionary
+
+    Returns:
+        List of regions
+
+    Raises:
+        ValueError: If a region entry is invalid or a name is used twice
+    """
+    regions = legacy_regions(settings)
+    for index, data in enumerate(settings.get("regions", [])):
+        region = AlertRegion.from_dict(data)
+        if not region.name:
+            region.name = f"Region {index + 1}"
+        regions.append(region)
+
+    names = [region.name for region in regions]
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        raise ValueError(f"Duplicate region names: {', '.join(duplicates)}")
+    return regions
@@ -0,0 +1,218 @@
+"""Output sinks for the Alert Agent.
+
+The AlertAgent reports messages, errors and vision debug state through a
+sink instead of talking to the GUI directly. The MainMenu is the sink of
+the desktop application, ConsoleSink is used by the headless daemon.
+QueueSink hands the calls of the agent thread over to the UI thread and
+NullSink discards everything (tests and benchmarks).
+"""
+
+import logging
+import queue
+import sys
+from datetime import datetime
+from typing import List, Optional, Protocol, TextIO, Tuple
+
+logger = logging.getLogger("alert")
+
+# Message colors mapped to log levels
+COLOR_LEVELS = {
+    "normal": logging.DEBUG,
+    "green": logging.INFO,
+    "yellow": logging.WARNING,
+    "red": logging.WARNING,
+}
+
+
+class AlertSink(Protocol):
+    """Interface the AlertAgent uses to report to the user."""
+
+    def write_message(self, text: str, color: str = "normal") -> None:
+        """Show a status or alarm message.
+
+        Args:
+            text: Message text
+            color: Message color (normal, green, yellow, red)
+        """
+
+    def open_error_window(self, message: str) -> None:
+        """Show an error that needs the user's attention.
+
+        Args:
+            message: Error message
+        """
+
+    def update_alert_button(self) -> None:
+        """Refresh the alert vision debug state."""
+
+    def update_faction_button(self) -> None:
+        """Refresh the faction vision debug state."""
+
+
+class ConsoleSink:
+    """Sink writing timestamped messages to a text stream.
+
+    Every message is also logged to the alert logger. Status messages
+    (color "normal") are only printed in verbose mode.
+
+    Attributes:
+        stream: Output stream for the messages
+        verbose: Also print status messages
+    """
+
+    def __init__(self, stream: Optional[TextIO] = None, verbose: bool = False) -> None:
+        """Initialize the console sink.
+
+        Args:
+            stream: Output stream (defaults to sys.stdout)
+            verbose: Also print status messages
+        """
+        self.stream = stream or sys.stdout
+        self.verbose = verbose
+
+    def write_message(self, text: str, color: str = "normal") -> None:
+        """Print and log a timestamped message.
+
+        Args:
+            text: Message text
+            color: Message color (normal, green, yellow, red)
+        """
+        logger.log(COLOR_LEVELS.get(color, logging.INFO), text)
+        if color == "normal" and not self.verbose:
+            return
+        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        print(f"[{now}] {text}", file=self.stream, flush=True)
+
+    def open_error_window(self, message: str) -> None:
+        """Print and log an error.
+
+        Args:
+            message: Error message
+        """
+        logger.error(message)
+        print(f"Error: {message}", file=sys.stderr, flush=True)
+
+    def update_alert_button(self) -> None:
+        """No buttons to update on the console."""
+
+    def update_faction_button(self) -> None:
+        """No buttons to update on the console."""
+
+
+class NullSink:
+    """Sink discarding all calls, so repeated runs don't keep any."""
+
+    def write_message(self, text: str, color: str = "normal") -> None:
+        """Discard a message.
+
+        Args:
+            text: Message text
+            color: Message color (normal, green, yellow, red)
+        """
+
+    def open_error_window(self, message: str) -> None:
+        """Discard an error.
+
+        Args:
+            message: Error message
+        """
+
+    def update_alert_button(self) -> None:
+        """Ignore the button update."""
+
+    def update_faction_button(self) -> None:
+        """Ignore the button update."""
+
+
+class QueueSink:
+    """Sink passing the agent's calls to another sink on the UI thread.
+
+    The agent thread only puts the calls into a ``queue.SimpleQueue``, so it
+    never touches Tk or waits on it. The UI thread calls ``drain()`` from a
+    timer to forward the queued calls to the target sink. Per drain:
+
+    - Only the last status message (color "normal") is shown, older ones
+      are superseded by it
+    - Repeated messages are shown once
+    - Each button update and error message is forwarded once
+
+    Attributes:
+        target: Sink receiving the calls on the UI thread
+        queue: Queued (method name, arguments) calls
+    """
+
+    def __init__(self, target: AlertSink) -> None:
+        """Initialize the queue sink.
+
+        Args:
+            target: Sink receiving the calls on the UI thread
+        """
+        self.target = target
+        self.queue: "queue.SimpleQueue[Tuple[str, tuple]]" = queue.SimpleQueue()
+
+    def write_message(self, text: str, color: str = "normal") -> None:
+        """Queue a message.
+
+        Args:
+            text: Message text
+            color: Message color (normal, green, yellow, red)
+        """
+        self.queue.put(("write_message", (text, color)))
+
+    def open_error_window(self, message: str) -> None:
+        """Queue an error.
+
+        Args:
+            message: Error message
+        """
+        self.queue.put(("open_error_window", (message,)))
+
+    def update_alert_button(self) -> None:
+        """Queue an alert button update."""
+        self.queue.put(("update_alert_button", ()))
+
+    def update_faction_button(self) -> None:
+        """Queue a faction button update."""
+        self.queue.put(("update_faction_button", ()))
+
+    def _take(self) -> List[Tuple[str, tuple]]:
+        """Remove all queued calls."""
+        calls = []
+        while True:
+            try:
+                calls.append(self.queue.get_nowait())
+            except queue.Empty:
+                return calls
+
+    def drain(self) -> int:
+        """Forward the queued calls to the target sink.
+
+        Must be called on the UI thread.
+
+        Returns:
+            Number of calls forwarded after coalescing
+        """
+        calls = self._take()
+        messages = [args for name, args in calls if name == "write_message"]
+        statuses = [args for args in messages if args[1] == "normal"]
+        last_status = statuses[-1] if statuses else None
+
+        forwarded = []
+        previous = None
+        for name, args in calls:
+            if name == "write_message":
+                if args[1] == "normal" and args is not last_status:
+                    continue
+                if args == previous:
+                    continue
+                previous = args
+            elif (name, args) in forwarded:
+                continue
+            forwarded.append((name, args))
+
+        for name, args in forwarded:
+            try:
+                getattr(self.target, name)(*args)
+            except Exception as e:
+                logger.error("UI Sink Error (%s): %s", name, e, exc_info=True)
+        return len(forwarded)
@@ -0,0 +1,241 @@
+"""Event loop and task health monitor for the Alert Agent.
+
+The agent runs its loops as forever-tasks on one event loop. An exception
+ends such a task silently and a blocking call stalls all of them.
+``TaskWatchdog`` runs as another task on the same loop and:
+
+- measures the event loop lag (how late it wakes up)
+- restarts watched tasks that crashed, up to a limit
+- reports watched tasks that stopped ticking (``beat()``)
+
+Stalls and restarts go to the log, the sink and the metrics.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Callable, Coroutine, Deque, Dict, Optional
+
+from evealert.constants import (
+    WATCHDOG_INTERVAL,
+    WATCHDOG_LAG_WARNING,
+    WATCHDOG_MAX_RESTARTS,
+    WATCHDOG_RESTART_WINDOW,
+)
+from evealert.manager.sink import AlertSink
+from evealert.metrics import AgentMetrics
+
+logger = logging.getLogger("alert")
+
+TaskFactory = Callable[[], Coroutine]
+
+
+@dataclass
+class WatchedTask:
+    """A task supervised by the watchdog.
+
+    Attributes:
+        name: Task name used in messages and metrics
+        factory: Creates the coroutine of the task
+        stall_after: Seconds without a beat before the task is stalled
+        restart: Restart the task when it crashed
+        task: Current asyncio task
+        last_beat: Monotonic time of the last beat
+        stalled: The task is currently reported as stalled
+        restarts: Monotonic times of the recent restarts
+    """
+
+    name: str
+    factory: TaskFactory
+    stall_after: float
+    restart: bool = True
+    task: Optional[asyncio.Task] = None
+    last_beat: float = field(default_factory=time.monotonic)
+    stalled: bool = False
+    restarts: Deque[float] = field(default_factory=deque)
+
+
+class TaskWatchdog:
+    """Supervises the tasks of an event loop.
+
+    The tasks are created on the running event loop, so one watchdog can
+    supervise the tasks of consecutive runs.
+
+    Attributes:
+        sink: Receiver of the stall and restart messages
+        tasks: Watched tasks by name
+        lag: Last measured event loop lag in seconds
+    """
+
+    def __init__(
+        self,
+        sink: AlertSink,
+        metrics: Callable[[], Optional[AgentMetrics]] = lambda: None,
+        on_give_up: Optional[Callable[[str], None]] = None,
+        interval: float = WATCHDOG_INTERVAL,
+        lag_warning: float = WATCHDOG_LAG_WARNING,
+        max_restarts: int = WATCHDOG_MAX_RESTARTS,
+        restart_window: float = WATCHDOG_RESTART_WINDOW,
+    ) -> None:
+        """Initialize the watchdog.
+
+        Args:
+            sink: Receiver of the stall and restart messages
+            metrics: Returns the current metrics, None if disabled
+            on_give_up: Called with the task name when a task crashed more
+                than max_restarts times within restart_window seconds
+            interval: Seconds between two checks
+            lag_warning: Loop lag in seconds that is logged as a stall
+            max_restarts: Restarts allowed within restart_window
+            restart_window: Seconds the restarts are counted over
+        """
+        self.sink = sink
+        self.metrics = metrics
+        self.on_give_up = on_give_up
+        self.interval = interval
+        self.lag_warning = lag_warning
+        self.max_restarts = max_restarts
+        self.restart_window = restart_window
+        self.tasks: Dict[str, WatchedTask] = {}
+        self.lag = 0.0
+
+    def watch(
+        self,
+        name: str,
+        factory: TaskFactory,
+        stall_after: float,
+        restart: bool = True,
+    ) -> asyncio.Task:
+        """Start a task on the running loop and supervise it.
+
+        Args:
+            name: Task name used in messages and metrics
+            factory: Creates the coroutine of the task
+            stall_after: Seconds without a beat before the task is stalled
+            restart: Restart the task when it crashed
+
+        Returns:
+            The started task
+        """
+        previous = self.tasks.get(name)
+        if previous is not None and previous.task is not None:
+            previous.restart = False
+            previous.task.cancel()
+        watched = WatchedTask(name, factory, stall_after, restart)
+        self.tasks[name] = watched
+        self._start(watched)
+        return watched.task
+
+    def beat(self, name: str) -> None:
+        """Record that a task made progress.
+
+        Args:
+            name: Task name
+        """
+        watched = self.tasks.get(name)
+        if watched is not None:
+            watched.last_beat = time.monotonic()
+
+    def cancel(self) -> None:
+        """Cancel all watched tasks without restarting them."""
+        for watched in self.tasks.values():
+            watched.restart = False
+            if watched.task is not None:
+                watched.task.cancel()
+
+    def _start(self, watched: WatchedTask) -> None:
+        """Create the task and restart it when it crashes."""
+        watched.last_beat = time.monotonic()
+        watched.task = asyncio.create_task(watched.factory(), name=watched.name)
+        watched.task.add_done_callback(
+            lambda task, watched=watched: self._on_done(watched, task)
+        )
+
+    def _on_done(self, watched: WatchedTask, task: asyncio.Task) -> None:
+        """Restart a crashed task."""
+        if task is not watched.task or task.cancelled():
+            return
+        error = task.exception()
+        if error is None:
+            logger.debug("Task %s finished", watched.name)
+            return
+        logger.error(
+            "Task %s crashed: %s",
+            watched.name,
+            error,
+            exc_info=(type(error), error, error.__traceback__),
+        )
+        if not watched.restart:
+            return
+
+        now = time.monotonic()
+        while watched.restarts and now - watched.restarts[0] > self.restart_window:
+            watched.restarts.popleft()
+        if len(watched.restarts) >= self.max_restarts:
+            self.sink.write_message(
+                f"System: {watched.name} task keeps crashing, check the logs.", "red"
+            )
+            if self.on_give_up is not None:
+                self.on_give_up(watched.name)
+            return
+        watched.restarts.append(now)
+        metrics = self.metrics()
+        if metrics is not None:
+            metrics.task_restarts.inc(task=watched.name)
+        self.sink.write_message(
+            f"System: {watched.name} task crashed and was restarted.", "yellow"
+        )
+        self._start(watched)
+
+    def check(self) -> None:
+        """Report tasks without a recent beat and their recovery."""
+        now = time.monotonic()
+        metrics = self.metrics()
+        for watched in self.tasks.values():
+            if watched.task is None or watched.task.done():
+                continue
+            age = now - watched.last_beat
+            if metrics is not None:
+                metrics.task_tick_age.set(age, task=watched.name)
+            if age > watched.stall_after:
+                if not watched.stalled:
+                    watched.stalled = True
+                    logger.warning(
+                        "Task %s stalled, no tick for %.1f seconds", watched.name, age
+                    )
+                    self.sink.write_message(
+                        f"System: {watched.name} task stalled for {age:.0f} seconds.",
+                        "yellow",
+                    )
+                    if metrics is not None:
+                        metrics.task_stalls.inc(task=watched.name)
+            elif watched.stalled:
+                watched.stalled = False
+                logger.info("Task %s recovered", watched.name)
+
+    def record_lag(self, lag: float) -> None:
+        """Record a measured event loop lag.
+
+        Args:
+            lag: Seconds the loop woke up late
+        """
+        self.lag = lag
+        metrics = self.metrics()
+        if metrics is not None:
+            metrics.loop_lag_seconds.observe(lag)
+            metrics.loop_lag.set(lag)
+        if lag > self.lag_warning:
+            logger.warning("Event loop blocked for %.2f seconds", lag)
+            if metrics is not None:
+                metrics.loop_stalls.inc()
+
+    async def run(self) -> None:
+        """Measure the loop lag and check the tasks every interval."""
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            self.record_lag(max(loop.time() - expected, 0.0))
+            self.check()
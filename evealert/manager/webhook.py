@@ -0,0 +1,57 @@
+"""Discord webhook creation for the Alert Agent."""
+
+import logging
+from typing import TYPE_CHECKING, Optional
+
+from evealert.constants import (
+    WEBHOOK_AVATAR_URL,
+    WEBHOOK_PLACEHOLDER,
+    WEBHOOK_URL_PREFIX,
+    WEBHOOK_USERNAME,
+)
+from evealert.settings.helper import lazy_import
+
+if TYPE_CHECKING:
+    from dhooks_lite import Webhook
+
+# The webhook client is only loaded when a webhook is activated
+dhooks_lite = lazy_import("dhooks_lite")
+
+logger = logging.getLogger("alert")
+
+
+def is_webhook_configured(url: Optional[str]) -> bool:
+    """Check if a webhook URL was entered.
+
+    Args:
+        url: Webhook URL from the settings
+
+    Returns:
+        False for an empty URL or the input placeholder
+    """
+    return bool(url) and url != WEBHOOK_PLACEHOLDER
+
+
+def create_webhook(url: Optional[str]) -> Optional["Webhook"]:
+    """Create a Discord webhook client.
+
+    Args:
+        url: Webhook URL from the settings
+
+    Returns:
+        Webhook client, or None if no valid URL is configured
+    """
+    if not is_webhook_configured(url):
+        return None
+    if not url.startswith(WEBHOOK_URL_PREFIX):
+        logger.error(
+            "Invalid webhook URL: It must start with '%s'.", WEBHOOK_URL_PREFIX
+        )
+        return None
+    try:
+        return dhooks_lite.Webhook(
+            url, username=WEBHOOK_USERNAME, avatar_url=WEBHOOK_AVATAR_URL
+        )
+    except Exception as e:
+        logger.error("Error activating webhook: %s", e)
+        return None
@@ -89,6 +89,7 @@ class ConfigModeMenu:
             )
             # hide the description window
             self.description_window.withdraw()
+            self.main.stop_mouse_tracking()
 
     def open_menu(self) -> None:
         """Open or close the configuration mode guide window.
@@ -124,5 +125,6 @@ class ConfigModeMenu:
 
             # show the description window
             self.description_window.deiconify()
+            self.main.start_mouse_tracking()
         else:
             self.clean_up()
@@ -0,0 +1,114 @@
+"""Bounded log view for the main window.
+
+Messages are collected in a queue and written to the text widget in
+batches on a Tk timer, instead of one insert per message. The widget and
+the in-memory history keep at most ``max_lines`` lines, the oldest lines
+are trimmed, so long sessions don't slow down the UI or grow the memory.
+"""
+
+import logging
+from collections import deque
+from datetime import datetime
+from itertools import groupby
+from typing import Deque, List, Optional, Tuple
+
+from evealert.constants import LOG_VIEW_FLUSH_INTERVAL, LOG_VIEW_MAX_LINES
+
+logger = logging.getLogger("menu")
+
+
+class LogView:
+    """Capped, batched message log in a Tk text widget.
+
+    ``write()`` may be called from any thread, the widget is only touched
+    by ``flush()`` on the Tk thread. Like the old log field, the newest
+    message is shown at the top.
+
+    Attributes:
+        widget: Text widget showing the log
+        max_lines: Maximum number of lines kept
+        flush_interval: Time between two batch flushes in ms
+        lines: Ring buffer of the shown (line, color) entries, oldest first
+    """
+
+    def __init__(
+        self,
+        widget,
+        max_lines: int = LOG_VIEW_MAX_LINES,
+        flush_interval: int = LOG_VIEW_FLUSH_INTERVAL,
+    ) -> None:
+        """Initialize the log view.
+
+        Args:
+            widget: Text widget showing the log (CTkTextbox or tk.Text)
+            max_lines: Maximum number of lines kept
+            flush_interval: Time between two batch flushes in ms
+        """
+        self.widget = widget
+        self.max_lines = max_lines
+        self.flush_interval = flush_interval
+        self.lines: Deque[Tuple[str, str]] = deque(maxlen=max_lines)
+        # deque append and popleft are thread-safe
+        self._pending: Deque[Tuple[str, str]] = deque()
+        self._after_id: Optional[str] = None
+
+    def write(self, text: str, color: str = "normal") -> None:
+        """Queue a timestamped message for the next flush.
+
+        Args:
+            text: Message text to display
+            color: Text color tag (normal, green, red)
+        """
+        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self._pending.append((f"[{now}] {text}\n", color))
+
+    def start(self) -> None:
+        """Start flushing the queued messages on the Tk timer."""
+        if self._after_id is None:
+            self._after_id = self.widget.after(self.flush_interval, self._tick)
+
+    def stop(self) -> None:
+        """Stop the flush timer."""
+        if self._after_id is not None:
+            self.widget.after_cancel(self._after_id)
+            self._after_id = None
+
+    def _tick(self) -> None:
+        """Flush and schedule the next flush."""
+        self.flush()
+        self._after_id = self.widget.after(self.flush_interval, self._tick)
+
+    def _take_pending(self) -> List[Tuple[str, str]]:
+        """Remove the queued messages, keeping only the last max_lines."""
+        batch: Deque[Tuple[str, str]] = deque(maxlen=self.max_lines)
+        while True:
+            try:
+                batch.append(self._pending.popleft())
+            except IndexError:
+                return list(batch)
+
+    def flush(self) -> int:
+        """Write the queued messages to the widget and trim old lines.
+
+        Returns:
+            Number of messages written
+        """
+        batch = self._take_pending()
+        if not batch:
+            return 0
+        self.lines.extend(batch)
+
+        try:
+            # Insert oldest first at the top, so the newest ends up first;
+            # consecutive lines of the same color are inserted at once
+            for color, entries in groupby(batch, key=lambda entry: entry[1]):
+                text = "".join(line for line, _ in reversed(list(entries)))
+                self.widget.insert("1.0", text, color)
+
+            # Every line ends with a newline, so "end-1c" is one line below
+            last_line = int(self.widget.index("end-1c").split(".")[0])
+            if last_line > self.max_lines + 1:
+                self.widget.delete(f"{self.max_lines + 1}.0", "end")
+        except Exception as e:
+            logger.error("Log View Error: %s", e, exc_info=True)
+        return len(batch)
@@ -1,29 +1,32 @@
 import os
-from datetime import datetime
 from threading import Thread
 
 import customtkinter
-import pyautogui
-from CTkMessagebox import CTkMessagebox as messagebox
 from PIL import Image
-from pynput import keyboard
-from screeninfo import get_monitors
 
 from evealert import __version__
 from evealert.constants import (
+    DISPLAY_CHECK_INTERVAL,
     STATUS_CHECK_INTERVAL,
+    UI_QUEUE_INTERVAL,
     UI_UPDATE_INTERVAL,
     WINDOW_HEIGHT,
     WINDOW_WIDTH,
 )
 from evealert.manager.alertmanager import AlertAgent
+from evealert.manager.sink import QueueSink
 from evealert.menu.config import ConfigModeMenu
+from evealert.menu.logview import LogView
 from evealert.menu.setting import SettingMenu
 from evealert.menu.statistics import StatisticsWindow
-from evealert.settings.helper import ICON, get_resource_path
+from evealert.settings.helper import ICON, get_resource_path, lazy_import
 from evealert.settings.logger import logging
+from evealert.tools.monitors import MonitorCache
 from evealert.tools.overlay import OverlaySystem
 
+# Input library is only loaded on first use
+pyautogui = lazy_import("pyautogui")
+
 log_alert = logging.getLogger("alert")
 log_menu = logging.getLogger("menu")
 log_main = logging.getLogger("main")
@@ -162,19 +165,28 @@ class MainMenu(customtkinter.CTk):
     - Status updates and logging
     - Keyboard hotkeys (F1/F2 for region selection)
 
+    The window is the AlertSink of the AlertAgent. The agent's calls are
+    queued by a QueueSink and drained on the Tk thread, so the agent
+    thread never touches the widgets.
+
     Attributes:
         mainmenu_buttons: Button management component
         menu: Menu system manager (config and settings)
         overlay_system: Screen overlay for region visualization
         alert: Alert monitoring agent
-        webhook: Optional Discord webhook integration
+        ui_queue: Queue of the Alert Agent calls to the window
         current_status: Current running status of alert system
+        monitors: Cached monitor topology
     """
 
     def __init__(self) -> None:
         """Initialize the main menu window and all subsystems."""
         super().__init__()
         self.title(f"Alert - {__version__}")
+        self.monitors = MonitorCache()
+        self.display_signature = None
+        self.mouse_position = None
+        self.mouse_tracking = None
         self.mainmenu_buttons = MainMenuButtons(self)
         self.init_widgets()
         self.init_menu()
@@ -184,9 +196,9 @@ class MainMenu(customtkinter.CTk):
         # Overlay System
         self.overlay_system = OverlaySystem(self)
         # Alert System
-        self.alert = AlertAgent(self)
-        # Webhook System
-        self.webhook = None
+        self.ui_queue = QueueSink(self)
+        self.alert = AlertAgent(self.ui_queue, self.menu.setting.store)
+        self.after(UI_QUEUE_INTERVAL, self.drain_ui_queue)
         # Status System
         self.current_status = False
         self.check_status()
@@ -196,6 +208,7 @@ class MainMenu(customtkinter.CTk):
         self.overlay_system.clean_up()
         self.menu.config.clean_up()
         self.alert.clean_up()
+        self.log_view.stop()
         self.destroy()
 
     def init_widgets(self) -> None:
@@ -208,6 +221,7 @@ class MainMenu(customtkinter.CTk):
         self.log_field.tag_config("normal", foreground="white")
         self.log_field.tag_config("green", foreground="lightgreen")
         self.log_field.tag_config("red", foreground="orange")
+        self.log_view = LogView(self.log_field)
 
         # Create mouse position label
         self.mouse_position_label = customtkinter.CTkLabel(
@@ -257,7 +271,7 @@ class MainMenu(customtkinter.CTk):
         """Initialize and layout the main menu interface.
 
         Sets up:
-        - Mouse position tracking
+        - Display change detection
         - Button frames and layout
         - Status indicators
         - Keyboard listener for hotkeys
@@ -278,6 +292,7 @@ class MainMenu(customtkinter.CTk):
         self.empty_label3.pack()
         # Log Field Label
         self.log_field.pack()
+        self.log_view.start()
         # Status Label
         self.mainmenu_buttons.show_status_label.configure(image=self.offline)
         self.mainmenu_buttons.show_status_label.image = self.offline
@@ -286,10 +301,21 @@ class MainMenu(customtkinter.CTk):
         self.stop_button.grid(row=0, column=1, padx=(0, 10))
         self.exit_button.grid(row=0, column=2)
 
-        keyboard_listener = keyboard.Listener(on_release=self.on_key_release)
-        keyboard_listener.start()
+        # Start input tracking once the window is shown
+        self.after_idle(self.start_keyboard_listener)
+        self.after(DISPLAY_CHECK_INTERVAL, self.check_display_change)
 
-        self.update_mouse_position_label()
+    def start_keyboard_listener(self) -> None:
+        """Start the global keyboard listener for the region hotkeys."""
+        try:
+            # pylint: disable=import-outside-toplevel
+            from pynput import keyboard
+
+            keyboard_listener = keyboard.Listener(on_release=self.on_key_release)
+            keyboard_listener.start()
+        except Exception as e:
+            log_main.exception("Keyboard Listener Error: %s", e)
+            self.write_message("System: Hotkeys are not available.", "red")
 
     def set_icon(self, icon: str) -> None:
         """Set the icon for the main window.
@@ -314,27 +340,66 @@ class MainMenu(customtkinter.CTk):
         Args:
             message: Error message to display
         """
+        # pylint: disable=import-outside-toplevel
+        from CTkMessagebox import CTkMessagebox as messagebox
+
         messagebox(title="Error", message=message, icon="cancel")
 
     def write_message(self, text: str, color: str = "normal") -> None:
         """Write a timestamped message to the log field.
 
+        The message is shown with the next batch of the log view.
+
         Args:
             text: Message text to display
             color: Text color (normal, green, red)
         """
-        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        try:
-            self.log_field.insert("1.0", f"[{now}] {text}\n", color)
-        except Exception as e:
-            log_main.error("Write Message Error: %s", e, exc_info=True)
+        self.log_view.write(text, color)
+
+    def drain_ui_queue(self) -> None:
+        """Forward the queued Alert Agent calls to the window."""
+        self.ui_queue.drain()
+        self.after(UI_QUEUE_INTERVAL, self.drain_ui_queue)
 
     # Mouse Functions
+    def start_mouse_tracking(self) -> None:
+        """Show the mouse position, used while the config mode is open."""
+        if self.mouse_tracking is None:
+            self.update_mouse_position_label()
+
+    def stop_mouse_tracking(self) -> None:
+        """Stop showing the mouse position."""
+        if self.mouse_tracking is not None:
+            self.after_cancel(self.mouse_tracking)
+            self.mouse_tracking = None
+        self.mouse_position = None
+        self.mouse_position_label.configure(text="")
+
     def update_mouse_position_label(self) -> None:
-        """Update the mouse position label with current coordinates."""
-        x, y = pyautogui.position()
-        self.mouse_position_label.configure(text=f"Mausposition: X={x}, Y={y}")
-        self.after(UI_UPDATE_INTERVAL, self.update_mouse_position_label)
+        """Update the mouse position label when the mouse has moved."""
+        position = tuple(pyautogui.position())
+        if position != self.mouse_position:
+            self.mouse_position = position
+            x, y = position
+            self.mouse_position_label.configure(text=f"Mausposition: X={x}, Y={y}")
+        self.mouse_tracking = self.after(
+            UI_UPDATE_INTERVAL, self.update_mouse_position_label
+        )
+
+    def check_display_change(self) -> None:
+        """Invalidate the monitor cache when the screen size changes."""
+        signature = (
+            self.winfo_screenwidth(),
+            self.winfo_screenheight(),
+            self.winfo_vrootwidth(),
+            self.winfo_vrootheight(),
+        )
+        if signature != self.display_signature:
+            if self.display_signature is not None:
+                log_main.info("Display change detected")
+            self.display_signature = signature
+            self.monitors.invalidate()
+        self.after(DISPLAY_CHECK_INTERVAL, self.check_display_change)
 
     def start_overlay(self) -> None:
         """Start the screen overlay on the current monitor."""
@@ -349,13 +414,7 @@ class MainMenu(customtkinter.CTk):
             Monitor object or None if not found
         """
         mouse_x, mouse_y = pyautogui.position()
-        for monitor in get_monitors():
-            if (
-                monitor.x <= mouse_x <= monitor.x + monitor.width
-                and monitor.y <= mouse_y <= monitor.y + monitor.height
-            ):
-                return monitor
-        return None
+        return self.monitors.monitor_at(mouse_x, mouse_y)
 
     def check_status(self) -> None:
         """Check and update the alert system status indicator.
@@ -423,7 +482,15 @@ class MainMenu(customtkinter.CTk):
             F1: Activate alert region selection
             F2: Activate faction region selection
             ESC: Cancel region selection
+            F12: Profile the next vision ticks
         """
+        # pylint: disable=import-outside-toplevel
+        from pynput import keyboard
+
+        if key == keyboard.Key.f12:
+            self.alert.request_profile()
+            return
+
         if self.menu.config.is_open:
             if key == keyboard.Key.f1:
                 if (
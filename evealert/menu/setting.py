@@ -1,34 +1,22 @@
-import json
 from typing import TYPE_CHECKING
 
 import customtkinter
-from dhooks_lite import Webhook
 
+from evealert.constants import LEGACY_ALERT_REGION, LEGACY_FACTION_REGION
 from evealert.settings.helper import get_resource_path
 from evealert.settings.logger import logging
+from evealert.settings.store import (
+    DEFAULT_SETTINGS,
+    SOURCE_FILE,
+    SettingsChangedEvent,
+    SettingsStore,
+)
 
 if TYPE_CHECKING:
     from evealert.menu.main import MainMenu
 
 logger = logging.getLogger("menu")
 
-DEFAULT_SETTINGS = {
-    "logging": "INFO",
-    "alert_region_1": {"x": 0, "y": 0},
-    "alert_region_2": {"x": 0, "y": 0},
-    "faction_region_1": {"x": 0, "y": 0},
-    "faction_region_2": {"x": 0, "y": 0},
-    "detectionscale": {"value": 90},
-    "faction_scale": {"value": 90},
-    "cooldown_timer": {"value": 30},
-    "volume": {"value": 100},
-    "server": {
-        "name": "Enter a Webhook URL",
-        "system": "Enter a System Name",
-        "mute": False,
-    },
-}
-
 
 class SettingMenu:
     """Setting menu for the Alert System."""
@@ -37,7 +25,9 @@ class SettingMenu:
         self.main = main
         self.open = False
         self.default = DEFAULT_SETTINGS
-        self.changed = False
+
+        self.store = SettingsStore(get_resource_path("settings.json"))
+        self.store.subscribe(self.on_settings_changed)
 
         self.setting_window = customtkinter.CTkToplevel(self.main)
         self.setting_window.title("Settings")
@@ -46,11 +36,7 @@ class SettingMenu:
         self.play_alarm = customtkinter.BooleanVar()
 
         self.create_menu()
-
-    @property
-    def is_changed(self):
-        """Returns True if the settings have been changed."""
-        return self.changed
+        self.apply_settings(self.store.load())
 
     @property
     def is_open(self):
@@ -58,61 +44,17 @@ class SettingMenu:
         return self.open
 
     def load_settings(self):
-        config_path = get_resource_path("settings.json")
-        try:
-            with open(config_path, encoding="utf-8") as config_file:
-                settings = json.load(config_file)
-                settings = self.merge_settings_with_defaults(settings)
-        except (FileNotFoundError, json.JSONDecodeError):
-            logger.debug(
-                "Setting Menu: Error reading settings file. Using default settings."
-            )
-            settings = self.default
-        self.save_settings(settings)
-        self.apply_settings(settings)
-        return settings
-
-    def merge_settings_with_defaults(self, settings, defaults=None):
-        """Merge the loaded settings with the default settings recursively."""
-        if defaults is None:
-            defaults = self.default
-
-        merged_settings = defaults.copy()
-        for key, value in defaults.items():
-            if key in settings:
-                if isinstance(value, dict) and isinstance(settings[key], dict):
-                    # Recursively merge nested dictionaries
-                    merged_settings[key] = self.merge_settings_with_defaults(
-                        settings[key], value
-                    )
-                else:
-                    merged_settings[key] = settings[key]
-            else:
-                # Fill missing keys with default values
-                merged_settings[key] = value
+        """Return the current settings from the settings store.
 
-        return merged_settings
+        The settings file is only read once, later calls return the cached
+        settings. The widgets are refreshed when the settings change.
+        """
+        return self.store.load()
 
-    def _activate_webhook(self, webhookurl):
-        """Activate the webhook URL."""
-        try:
-            required_prefix = "https://discord.com/api/webhooks/"
-            if not webhookurl.startswith(required_prefix):
-                raise ValueError(f"It must start with '{required_prefix}'.")
-            self.main.webhook = Webhook(
-                webhookurl,
-                username="Gneuten",
-                avatar_url="https://cdn.discordapp.com/avatars/990582360103870495/410d536127874481b9771b9eb9aa8104.png",
-            )
-            return True
-        except ValueError as e:
-            logger.error("Invalid webhook URL: %s", e)
-            self.main.webhook = None
-            return False
-        except Exception as e:
-            logger.error("Error activating webhook: %s", e)
-            self.main.webhook = None
-            return False
+    def on_settings_changed(self, event: SettingsChangedEvent):
+        """Refresh the widgets when settings.json was edited on disk."""
+        if event.source == SOURCE_FILE:
+            self.main.after(0, self.apply_settings, event.settings)
 
     def apply_settings(self, settings):
         try:
@@ -155,14 +97,6 @@ class SettingMenu:
             self.system_name.insert(0, settings["server"]["system"])
 
             self.webhook.delete(0, customtkinter.END)
-
-            # Check if the webhook URL is valid
-            if (
-                settings["server"]["name"] != "Enter a Webhook URL"
-                and settings["server"]["name"] != ""
-            ):
-                self._activate_webhook(settings["server"]["name"])
-
             self.webhook.insert(0, settings["server"]["name"])
             self.play_alarm.set(settings["server"]["mute"])
 
@@ -174,21 +108,22 @@ class SettingMenu:
             )
 
     def save_settings(self, settings=None):
-        if settings is None:
-            settings = self.default
+        """Save settings and refresh the widgets if anything changed.
 
-        config_path = get_resource_path("settings.json")
-        with open(config_path, encoding="utf-8", mode="w") as config_file:
-            json.dump(settings, config_file, indent=4)
+        Returns:
+            True if the settings changed and were written to disk
+        """
+        if not self.store.save(settings):
+            return False
 
-        self.apply_settings(settings)
-        # Set the changed flag to True
-        self.changed = True
+        self.apply_settings(self.store.load())
+        return True
 
     def save(self):
         """Save settings to disk only (does not apply to running system)."""
         try:
-            settings = DEFAULT_SETTINGS.copy()
+            # Keep settings without widgets (e.g. the regions list)
+            settings = self.store.load()
             settings.update(
                 {
                     "logging": self.logging.get(),
@@ -259,18 +194,19 @@ class SettingMenu:
 
             # Apply to AlertAgent if running
             if self.main.alert:
-                self.main.alert.detection = detection_scale
-                self.main.alert.detection_faction = faction_scale
+                system_name = self.system_name.get()
+                alert_region = self.main.alert.get_region(LEGACY_ALERT_REGION)
+                alert_region.detection = detection_scale
+                alert_region.system = system_name
+                faction_region = self.main.alert.get_region(LEGACY_FACTION_REGION)
+                faction_region.detection = faction_scale
+                faction_region.system = system_name
                 self.main.alert.cooldowntimer = cooldown
                 self.main.alert.volume = volume / 100.0  # Convert to 0.0-1.0
                 self.main.alert.mute = mute
-
-                # Update webhook if changed
-                webhook_url = self.webhook.get()
-                if webhook_url and webhook_url != "Enter a Webhook URL":
-                    self._activate_webhook(webhook_url)
-                else:
-                    self.main.webhook = None
+                self.main.alert.system_name = system_name
+                self.main.alert.set_webhook(self.webhook.get())
+                self.main.alert.configure_vision()
 
                 self.main.write_message("Settings: Applied to running system.", "green")
                 logger.info(
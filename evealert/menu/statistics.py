@@ -5,15 +5,33 @@ Displays alarm statistics including:
 - Alarm type breakdown
 - Recent alarm history
 - Session duration
+- Alarms in the last hour and busiest hour of day
+- History export filtered by time range and alarm type
 """
 
-import csv
-import json
+import time
 from tkinter import filedialog
+from typing import Dict, List, Optional, Tuple
 
 import customtkinter
 
-from evealert.constants import STATUS_CHECK_INTERVAL
+from evealert.constants import (
+    EXPORT_POLL_INTERVAL,
+    HISTORY_VIEW_LINES,
+    STATUS_CHECK_INTERVAL,
+)
+from evealert.export import HistoryExporter
+from evealert.statistics import AlarmEvent, AlarmStatistics
+
+# Export time ranges in seconds, None for the whole history
+EXPORT_RANGES = {
+    "All time": None,
+    "Last hour": 3600,
+    "Last 24 hours": 86400,
+    "Last 7 days": 7 * 86400,
+    "Last 30 days": 30 * 86400,
+}
+EXPORT_ALL_TYPES = "All types"
 
 
 class StatisticsWindow(customtkinter.CTkToplevel):
@@ -36,9 +54,16 @@ class StatisticsWindow(customtkinter.CTkToplevel):
         super().__init__(main)
         self.main = main
         self.is_open = True
+        # Last shown values, only changed widgets are updated
+        self.label_texts: Dict[customtkinter.CTkLabel, str] = {}
+        self.shown_version: Optional[int] = None
+        self.last_history_event: Optional[AlarmEvent] = None
+        self.history_lines = 0
+        self.history_placeholder = False
+        self.exporter: Optional[HistoryExporter] = None
 
         self.title("EVE Alert - Statistics")
-        self.geometry("500x550")
+        self.geometry("500x700")
         self.protocol("WM_DELETE_WINDOW", self.close_window)
 
         self.init_widgets()
@@ -74,6 +99,18 @@ class StatisticsWindow(customtkinter.CTkToplevel):
         )
         self.session_duration_label.pack(pady=5)
 
+        self.last_hour_label = customtkinter.CTkLabel(
+            self.session_frame, text="Last hour: 0", font=customtkinter.CTkFont(size=14)
+        )
+        self.last_hour_label.pack(pady=5)
+
+        self.busiest_hour_label = customtkinter.CTkLabel(
+            self.session_frame,
+            text="Busiest hour: -",
+            font=customtkinter.CTkFont(size=14),
+        )
+        self.busiest_hour_label.pack(pady=5)
+
         # Totals Frame
         self.totals_frame = customtkinter.CTkFrame(self.main_frame)
         self.totals_frame.pack(fill="x", pady=(0, 15))
@@ -138,7 +175,7 @@ class StatisticsWindow(customtkinter.CTkToplevel):
 
         history_title = customtkinter.CTkLabel(
             self.history_frame,
-            text="Recent History (Last 10)",
+            text=f"Recent History (Last {HISTORY_VIEW_LINES})",
             font=customtkinter.CTkFont(size=16, weight="bold"),
         )
         history_title.pack(pady=10)
@@ -148,6 +185,33 @@ class StatisticsWindow(customtkinter.CTkToplevel):
         )
         self.history_textbox.pack(pady=(0, 10), padx=10)
 
+        # Export Frame
+        self.export_frame = customtkinter.CTkFrame(self.main_frame)
+        self.export_frame.pack(fill="x", pady=(10, 0))
+
+        self.export_range_menu = customtkinter.CTkOptionMenu(
+            self.export_frame, values=list(EXPORT_RANGES), width=130
+        )
+        self.export_range_menu.grid(row=0, column=0, padx=5, pady=5)
+
+        self.export_type_menu = customtkinter.CTkOptionMenu(
+            self.export_frame,
+            values=[EXPORT_ALL_TYPES, "Enemy", "Faction"],
+            width=110,
+        )
+        self.export_type_menu.grid(row=0, column=1, padx=5, pady=5)
+
+        self.export_status_label = customtkinter.CTkLabel(
+            self.export_frame, text="", font=customtkinter.CTkFont(size=12)
+        )
+        self.export_status_label.grid(row=0, column=2, padx=5, pady=5)
+
+        self.export_progress = customtkinter.CTkProgressBar(self.export_frame)
+        self.export_progress.set(0)
+        self.export_progress.grid(
+            row=1, column=0, columnspan=3, sticky="ew", padx=5, pady=(0, 5)
+        )
+
         # Buttons Frame
         self.buttons_frame = customtkinter.CTkFrame(self.main_frame)
         self.buttons_frame.pack(fill="x", pady=(10, 0))
@@ -176,44 +240,98 @@ class StatisticsWindow(customtkinter.CTkToplevel):
         )
         self.export_button.pack(side="left", padx=5)
 
-    def update_statistics(self) -> None:
-        """Update all statistics displays with current data."""
-        if not self.is_open:
+    def set_text(self, label: customtkinter.CTkLabel, text: str) -> None:
+        """Set the text of a label if it changed.
+
+        Args:
+            label: Label to update
+            text: New text
+        """
+        if self.label_texts.get(label) != text:
+            self.label_texts[label] = text
+            label.configure(text=text)
+
+    def update_history(self, stats: AlarmStatistics) -> None:
+        """Add new alarms to the top of the history, redraw it if needed.
+
+        Args:
+            stats: Alarm statistics
+        """
+        new_events = stats.get_events_after(self.last_history_event)
+        if new_events is None:
+            # The shown events left the history (cleared), redraw it
+            self.history_textbox.delete("1.0", "end")
+            self.history_lines = 0
+            self.last_history_event = None
+            new_events = stats.get_events_after(None)
+        elif not new_events and self.history_lines:
             return
 
+        new_events = new_events[-HISTORY_VIEW_LINES:]
+        if new_events:
+            if not self.history_lines:
+                # Remove the placeholder
+                self.history_textbox.delete("1.0", "end")
+            for event in new_events:
+                self.history_textbox.insert(
+                    "1.0", f"[{event.formatted_time()}] {event.alarm_type}\n"
+                )
+            self.history_lines = min(
+                self.history_lines + len(new_events), HISTORY_VIEW_LINES
+            )
+            self.history_textbox.delete(f"{HISTORY_VIEW_LINES + 1}.0", "end")
+            self.last_history_event = new_events[-1]
+        elif not self.history_placeholder:
+            self.history_textbox.delete("1.0", "end")
+            self.history_textbox.insert("end", "No alarms yet in this session.")
+        self.history_placeholder = not self.history_lines
+
+    def refresh(self) -> None:
+        """Update the displays whose values changed."""
         stats = self.main.alert.get_statistics()
 
-        # Update session duration
-        self.session_duration_label.configure(
-            text=f"Duration: {stats.get_session_duration()}"
+        # Time based values
+        self.set_text(
+            self.session_duration_label,
+            f"Duration: {stats.get_session_duration()}",
+        )
+        self.set_text(
+            self.last_hour_label, f"Last hour: {stats.aggregates.last_hour()}"
         )
 
+        if stats.version == self.shown_version:
+            return
+        self.shown_version = stats.version
+
+        busiest = stats.aggregates.busiest_hour()
+        busiest_text = "-" if busiest is None else f"{busiest:02d}:00"
+        self.set_text(self.busiest_hour_label, f"Busiest hour: {busiest_text}")
+
         # Update total statistics
-        self.total_alarms_label.configure(text=f"Total: {stats.total_alarms}")
-        self.total_enemy_label.configure(text=f"Enemy: {stats.total_by_type['Enemy']}")
-        self.total_faction_label.configure(
-            text=f"Faction: {stats.total_by_type['Faction']}"
+        self.set_text(self.total_alarms_label, f"Total: {stats.total_alarms}")
+        self.set_text(self.total_enemy_label, f"Enemy: {stats.total_by_type['Enemy']}")
+        self.set_text(
+            self.total_faction_label, f"Faction: {stats.total_by_type['Faction']}"
         )
 
         # Update session statistics
-        self.session_alarms_label.configure(text=f"Total: {stats.session_alarms}")
-        self.session_enemy_label.configure(
-            text=f"Enemy: {stats.session_by_type['Enemy']}"
+        self.set_text(self.session_alarms_label, f"Total: {stats.session_alarms}")
+        self.set_text(
+            self.session_enemy_label, f"Enemy: {stats.session_by_type['Enemy']}"
         )
-        self.session_faction_label.configure(
-            text=f"Faction: {stats.session_by_type['Faction']}"
+        self.set_text(
+            self.session_faction_label,
+            f"Faction: {stats.session_by_type['Faction']}",
         )
 
-        # Update history
-        self.history_textbox.delete("1.0", "end")
-        recent = stats.get_recent_history(10)
-        if recent:
-            for event in recent:
-                self.history_textbox.insert(
-                    "end", f"[{event.formatted_time()}] {event.alarm_type}\n"
-                )
-        else:
-            self.history_textbox.insert("end", "No alarms yet in this session.")
+        self.update_history(stats)
+
+    def update_statistics(self) -> None:
+        """Refresh the statistics displays and schedule the next refresh."""
+        if not self.is_open:
+            return
+
+        self.refresh()
 
         # Schedule next update
         self.after(STATUS_CHECK_INTERVAL, self.update_statistics)
@@ -223,21 +341,31 @@ class StatisticsWindow(customtkinter.CTkToplevel):
         stats = self.main.alert.get_statistics()
         stats.reset_session()
         self.main.write_message("Statistics: Session reset.", "green")
-        self.update_statistics()
+        self.refresh()
 
     def clear_history(self) -> None:
         """Clear alarm history."""
         stats = self.main.alert.get_statistics()
         stats.clear_history()
         self.main.write_message("Statistics: History cleared.", "green")
-        self.update_statistics()
+        self.refresh()
 
-    def export_history(self) -> None:
-        """Export alarm history to CSV or JSON file."""
-        stats = self.main.alert.get_statistics()
+    def export_filter(self) -> Tuple[Optional[float], Optional[List[str]]]:
+        """Get the time range start and alarm types selected for the export.
 
-        if len(stats.alarm_history) == 0:
-            self.main.write_message("Statistics: No history to export.", "yellow")
+        Returns:
+            Tuple of (start Unix timestamp, alarm types), None for all
+        """
+        seconds = EXPORT_RANGES[self.export_range_menu.get()]
+        start = None if seconds is None else time.time() - seconds
+        alarm_type = self.export_type_menu.get()
+        types = None if alarm_type == EXPORT_ALL_TYPES else [alarm_type]
+        return start, types
+
+    def export_history(self) -> None:
+        """Export the alarm history in the background, or cancel the export."""
+        if self.exporter is not None:
+            self.exporter.cancel()
             return
 
         # Ask user for file format and location
@@ -245,6 +373,8 @@ class StatisticsWindow(customtkinter.CTkToplevel):
             defaultextension=".csv",
             filetypes=[
                 ("CSV files", "*.csv"),
+                ("NDJSON files", "*.ndjson"),
+                ("Columnar NDJSON files", "*.columns.jsonl"),
                 ("JSON files", "*.json"),
                 ("All files", "*.*"),
             ],
@@ -254,48 +384,47 @@ class StatisticsWindow(customtkinter.CTkToplevel):
         if not file_path:
             return  # User cancelled
 
-        try:
-            if file_path.endswith(".json"):
-                self._export_json(file_path, stats)
-            else:
-                self._export_csv(file_path, stats)
+        start, types = self.export_filter()
+        self.exporter = HistoryExporter(
+            self.main.alert.get_statistics(), file_path, start=start, types=types
+        )
+        self.exporter.start_export()
+        self.export_button.configure(text="Cancel Export")
+        self.export_progress.set(0)
+        self.poll_export()
+
+    def poll_export(self) -> None:
+        """Show the export progress until the export thread is done."""
+        exporter = self.exporter
+        if exporter is None or not self.is_open:
+            return
+        self.export_progress.set(exporter.progress)
+        self.set_text(
+            self.export_status_label, f"{exporter.written} / {exporter.total} alarms"
+        )
+        if exporter.is_running:
+            self.after(EXPORT_POLL_INTERVAL, self.poll_export)
+            return
 
+        self.exporter = None
+        self.export_button.configure(text="Export History")
+        if exporter.error:
             self.main.write_message(
-                f"Statistics: History exported to {file_path}", "green"
+                f"Statistics: Export failed. {exporter.error}", "red"
+            )
+        elif exporter.cancelled:
+            self.main.write_message("Statistics: Export cancelled.", "yellow")
+        elif exporter.written == 0:
+            self.main.write_message("Statistics: No history to export.", "yellow")
+        else:
+            self.main.write_message(
+                f"Statistics: {exporter.written} alarms exported to {exporter.path}",
+                "green",
             )
-        except Exception as e:
-            self.main.write_message(f"Statistics: Export failed. {str(e)}", "red")
-
-    def _export_csv(self, file_path: str, stats) -> None:
-        """Export history to CSV file."""
-        with open(file_path, "w", newline="", encoding="utf-8") as csvfile:
-            writer = csv.writer(csvfile)
-            # Write header
-            writer.writerow(["Timestamp", "Alarm Type"])
-            # Write data
-            for event in stats.alarm_history:
-                writer.writerow([event.formatted_time(), event.alarm_type])
-
-    def _export_json(self, file_path: str, stats) -> None:
-        """Export history to JSON file."""
-        data = {
-            "export_info": {
-                "total_alarms": stats.total_alarms,
-                "session_alarms": stats.session_alarms,
-                "session_duration": stats.get_session_duration(),
-                "total_by_type": stats.total_by_type,
-                "session_by_type": stats.session_by_type,
-            },
-            "history": [
-                {"timestamp": event.formatted_time(), "alarm_type": event.alarm_type}
-                for event in stats.alarm_history
-            ],
-        }
-
-        with open(file_path, "w", encoding="utf-8") as jsonfile:
-            json.dump(data, jsonfile, indent=2)
 
     def close_window(self) -> None:
         """Close the statistics window."""
         self.is_open = False
+        if self.exporter is not None:
+            self.exporter.cancel()
         self.destroy()
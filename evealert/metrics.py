@@ -0,0 +1,509 @@
+"""Prometheus metrics for EVE Alert.
+
+``AgentMetrics`` holds the detection and alarm metrics of an Alert Agent
+and ``MetricsServer`` serves them in the Prometheus text format on a
+localhost port (``metrics`` setting)::
+
+    scrape_configs:
+      - job_name: evealert
+        static_configs:
+          - targets: ["127.0.0.1:9464"]
+
+The metrics are plain counters and histograms without a client library.
+Alarm counts are read from ``AlarmStatistics`` when the endpoint is
+scraped. When the endpoint is disabled the agent has no ``AgentMetrics``
+and its hot paths only check for ``None``.
+"""
+
+import abc
+import logging
+import math
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from evealert.constants import (
+    AUDIO_LATENCY_BUCKETS,
+    LOOP_LAG_BUCKETS,
+    MATCH_TIME_BUCKETS,
+    METRICS_HOST,
+    WEBHOOK_LATENCY_BUCKETS,
+)
+
+logger = logging.getLogger("alert")
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+METRICS_PATH = "/metrics"
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    """Escape a label value."""
+    return value.replace("\\", r"\\").replace("\n", r"\n").replace('"', r"\"")
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    """Format label names and values as {name="value",...}."""
+    if not names:
+        return ""
+    pairs = ",".join(
+        f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)
+    )
+    return "{" + pairs + "}"
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value."""
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class Metric(abc.ABC):
+    """Base class of the metric types.
+
+    Attributes:
+        name: Metric name
+        help: Description shown in the HELP line
+        labelnames: Names of the labels
+    """
+
+    kind = "untyped"
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = ()):
+        """Initialize the metric.
+
+        Args:
+            name: Metric name
+            help_text: Description shown in the HELP line
+            labelnames: Names of the labels
+        """
+        self.name = name
+        self.help = help_text
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        """Label values in the order of the label names."""
+        if set(labels) != set(self.labelnames):
+            raise ValueError(
+                f"{self.name} expects the labels {', '.join(self.labelnames)}"
+            )
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    @abc.abstractmethod
+    def samples(self) -> List[str]:
+        """Sample lines of the metric."""
+
+    def render(self) -> str:
+        """The metric in the Prometheus text format."""
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        lines += self.samples()
+        return "\n".join(lines) + "\n"
+
+
+class Counter(Metric):
+    """Monotonically increasing value per label set."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, help_text, labelnames)
+        self.values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        """Increase the counter.
+
+        Args:
+            amount: Increase, must not be negative
+            labels: Label values
+        """
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        key = self._key(labels)
+        with self._lock:
+            self.values[key] = self.values.get(key, 0) + amount
+
+    def set_all(self, values: Dict[LabelValues, float]) -> None:
+        """Replace all values, for counts kept somewhere else.
+
+        Args:
+            values: Value by label values
+        """
+        with self._lock:
+            self.values = dict(values)
+
+    def get(self, **labels: str) -> float:
+        """Current value of a label set."""
+        return self.values.get(self._key(labels), 0)
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            values = sorted(self.values.items())
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+            for key, value in values
+        ]
+
+
+class Gauge(Counter):
+    """Value per label set that can go up and down."""
+
+    kind = "gauge"
+
+    def set(self, value: float, **labels: str) -> None:
+        """Set the gauge.
+
+        Args:
+            value: New value
+            labels: Label values
+        """
+        key = self._key(labels)
+        with self._lock:
+            self.values[key] = value
+
+
+class Histogram(Metric):
+    """Distribution of observed values in cumulative buckets."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        buckets: Sequence[float],
+        labelnames: Sequence[str] = (),
+    ):
+        """Initialize the histogram.
+
+        Args:
+            name: Metric name
+            help_text: Description shown in the HELP line
+            buckets: Upper bounds of the buckets, +Inf is added
+            labelnames: Names of the labels
+        """
+        super().__init__(name, help_text, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+        # Label values -> (bucket counts, sum)
+        self.values: Dict[LabelValues, Tuple[List[int], float]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        """Record a value.
+
+        Args:
+            value: Observed value
+            labels: Label values
+        """
+        key = self._key(labels)
+        with self._lock:
+            counts, total = self.values.get(key) or ([0] * len(self.buckets), 0.0)
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[index] += 1
+                    break
+            self.values[key] = (counts, total + value)
+
+    def count(self, **labels: str) -> int:
+        """Number of observed values of a label set."""
+        counts, _ = self.values.get(self._key(labels), ([], 0.0))
+        return sum(counts)
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            values = sorted(
+                (key, (list(counts), total))
+                for key, (counts, total) in self.values.items()
+            )
+        lines = []
+        names = self.labelnames + ("le",)
+        for key, (counts, total) in values:
+            cumulative = 0
+            for bound, count in zip(self.buckets, counts):
+                cumulative += count
+                labels = _format_labels(names, key + (_format_value(bound),))
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """Renders registered metrics and collectors in the Prometheus format."""
+
+    def __init__(self) -> None:
+        self.metrics: List[Metric] = []
+        # Called on every scrape to refresh metrics read from elsewhere
+        self.collectors: List[Callable[[], None]] = []
+
+    def register(self, metric: Metric) -> Metric:
+        """Add a metric.
+
+        Args:
+            metric: Metric to render
+
+        Returns:
+            The metric
+        """
+        self.metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text format."""
+        for collect in self.collectors:
+            try:
+                collect()
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                logger.error("Metrics collector failed: %s", e)
+        return "".join(metric.render() for metric in self.metrics)
+
+
+class AgentMetrics(MetricsRegistry):
+    """Detection and alarm metrics of an Alert Agent.
+
+    Attributes:
+        frames_processed: Region frames captured and matched
+        frames_skipped: Region frames not matched, by reason
+        capture_failures: Failed screen captures
+        match_seconds: Matching time per region frame
+        alarms: Alarms by type (from the alarm statistics)
+        session_alarms: Alarms of the current session by type
+        webhook_seconds: Webhook request time
+        webhook_failures: Failed webhook requests
+        audio_start_seconds: Time from the alarm to the start of its sound
+        loop_lag_seconds: Event loop lag distribution
+        loop_lag: Last measured event loop lag
+        loop_stalls: Event loop lags above the watchdog warning
+        task_restarts: Restarts of crashed agent tasks
+        task_stalls: Agent tasks that stopped ticking
+        task_tick_age: Seconds since the last tick of the agent tasks
+    """
+
+    def __init__(self, statistics=None) -> None:
+        """Create the metrics.
+
+        Args:
+            statistics: AlarmStatistics the alarm counts are read from
+        """
+        super().__init__()
+        self.statistics = statistics
+        self.frames_processed = self.register(
+            Counter(
+                "evealert_frames_processed_total",
+                "Region frames captured and matched.",
+                ("region",),
+            )
+        )
+        self.frames_skipped = self.register(
+            Counter(
+                "evealert_frames_skipped_total",
+                "Region frames that were not matched.",
+                ("region", "reason"),
+            )
+        )
+        self.capture_failures = self.register(
+            Counter(
+                "evealert_capture_failures_total",
+                "Screen captures that returned no frame.",
+                ("region",),
+            )
+        )
+        self.match_seconds = self.register(
+            Histogram(
+                "evealert_match_seconds",
+                "Template matching time per region frame.",
+                MATCH_TIME_BUCKETS,
+                ("region",),
+            )
+        )
+        self.alarms = self.register(
+            Counter("evealert_alarms_total", "Alarms by type.", ("type",))
+        )
+        self.session_alarms = self.register(
+            Gauge(
+                "evealert_session_alarms",
+                "Alarms of the current session by type.",
+                ("type",),
+            )
+        )
+        self.webhook_seconds = self.register(
+            Histogram(
+                "evealert_webhook_seconds",
+                "Webhook request time.",
+                WEBHOOK_LATENCY_BUCKETS,
+            )
+        )
+        self.webhook_failures = self.register(
+            Counter("evealert_webhook_failures_total", "Failed webhook requests.")
+        )
+        self.audio_start_seconds = self.register(
+            Histogram(
+                "evealert_audio_start_seconds",
+                "Time from an alarm to the start of its sound.",
+                AUDIO_LATENCY_BUCKETS,
+            )
+        )
+        self.loop_lag_seconds = self.register(
+            Histogram(
+                "evealert_loop_lag_seconds",
+                "Delay of the event loop beyond the scheduled wake up.",
+                LOOP_LAG_BUCKETS,
+            )
+        )
+        self.loop_lag = self.register(
+            Gauge("evealert_loop_lag_last_seconds", "Last measured event loop lag.")
+        )
+        self.loop_stalls = self.register(
+            Counter(
+                "evealert_loop_stalls_total",
+                "Event loop lags above the watchdog warning.",
+            )
+        )
+        self.task_restarts = self.register(
+            Counter(
+                "evealert_task_restarts_total",
+                "Restarts of crashed agent tasks.",
+                ("task",),
+            )
+        )
+        self.task_stalls = self.register(
+            Counter(
+                "evealert_task_stalls_total",
+                "Agent tasks that stopped ticking.",
+                ("task",),
+            )
+        )
+        self.task_tick_age = self.register(
+            Gauge(
+                "evealert_task_tick_age_seconds",
+                "Seconds since the last tick of an agent task.",
+                ("task",),
+            )
+        )
+        self.collectors.append(self.collect_alarms)
+
+    def collect_alarms(self) -> None:
+        """Copy the alarm counts from the statistics."""
+        if self.statistics is None:
+            return
+        totals = dict(self.statistics.total_by_type)
+        session = dict(self.statistics.session_by_type)
+        self.alarms.set_all({(name,): count for name, count in totals.items()})
+        self.session_alarms.set_all({(name,): count for name, count in session.items()})
+
+    def frame(self, region: str, seconds: float) -> None:
+        """Record a matched region frame.
+
+        Args:
+            region: Region name
+            seconds: Matching time
+        """
+        self.frames_processed.inc(region=region)
+        self.match_seconds.observe(seconds, region=region)
+
+    def frame_skipped(self, region: str, reason: str) -> None:
+        """Record a region frame that was not matched.
+
+        Args:
+            region: Region name
+            reason: "capture" if the capture failed, "error" if the check
+                raised an exception
+        """
+        self.frames_skipped.inc(region=region, reason=reason)
+        if reason == "capture":
+            self.capture_failures.inc(region=region)
+
+    def webhook(self, seconds: float, failed: bool = False) -> None:
+        """Record a webhook request.
+
+        Args:
+            seconds: Request time
+            failed: True if the request raised an error
+        """
+        self.webhook_seconds.observe(seconds)
+        if failed:
+            self.webhook_failures.inc()
+
+
+class MetricsServer:
+    """Serves a registry on a localhost HTTP port in a background thread."""
+
+    def __init__(
+        self, registry: MetricsRegistry, port: int, host: str = METRICS_HOST
+    ) -> None:
+        """Initialize the server.
+
+        Args:
+            registry: Metrics to serve
+            port: TCP port, 0 picks a free one
+            host: Interface to listen on
+        """
+        self.registry = registry
+        self.host = host
+        self.requested_port = port
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def is_running(self) -> bool:
+        """Returns True while the server thread is running."""
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def port(self) -> int:
+        """Port the server listens on."""
+        if self._server is not None:
+            return self._server.server_address[1]
+        return self.requested_port
+
+    def start(self) -> None:
+        """Bind the port and serve in a background thread.
+
+        Raises:
+            OSError: If the port can't be bound
+        """
+        if self.is_running:
+            return
+        registry = self.registry
+
+        class Handler(BaseHTTPRequestHandler):
+            """Answers GET /metrics."""
+
+            def do_GET(self):  # pylint: disable=invalid-name
+                if self.path.split("?", 1)[0] not in (METRICS_PATH, "/"):
+                    self.send_error(404)
+                    return
+                body = registry.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):  # pylint: disable=W0622
+                logger.debug("Metrics %s - %s", self.address_string(), format % args)
+
+        self._server = ThreadingHTTPServer((self.host, self.requested_port), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="metrics", daemon=True
+        )
+        self._thread.start()
+        logger.info(
+            "Metrics endpoint on http://%s:%d%s", self.host, self.port, METRICS_PATH
+        )
+
+    def stop(self) -> None:
+        """Stop serving and close the port."""
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+        self._server = None
+        self._thread = None
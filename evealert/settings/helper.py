@@ -1,10 +1,12 @@
 """Helper utilities for EVE Alert application.
 
-Provides resource path resolution and constants.
+Provides resource path resolution, lazy module imports and constants.
 """
 
+import importlib.util
 import sys
 from pathlib import Path
+from types import ModuleType
 
 # Path to application icon
 ICON = "img/eve.ico"
@@ -60,3 +62,34 @@ def get_resource_path(relative_path: str) -> str:
         resource_path = (EXEC_ROOT / relative_stripped).resolve()
     
     return str(resource_path)
+
+
+def lazy_import(name: str) -> ModuleType:
+    """Import a module lazily.
+
+    The module is registered in ``sys.modules`` right away, but its code
+    only runs on the first attribute access. Used for heavy dependencies
+    (OpenCV, audio, screen capture, ...) so they don't slow down startup.
+
+    Args:
+        name: Absolute module name like "cv2"
+
+    Returns:
+        The (not yet executed) module
+
+    Raises:
+        ModuleNotFoundError: If the module is not installed
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+
+    spec = importlib.util.find_spec(name)
+    if spec is None or spec.loader is None:
+        raise ModuleNotFoundError(f"No module named '{name}'", name=name)
+
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
@@ -1,16 +1,27 @@
-"""Logging configuration for EVE Alert application."""
+"""Logging configuration for EVE Alert application.
 
+The loggers only put their records into a queue (``QueueHandler``). A
+single ``QueueListener`` thread writes them to the rotating log files and
+the console, so logging never blocks the detection and alarm paths on
+file I/O. ``flush_logs()`` waits until the queued records are written,
+``stop_logging()`` writes the rest and stops the listener.
+"""
+
+import atexit
 import json
 import logging
+import queue
 import sys
-from logging.handlers import RotatingFileHandler
+import threading
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional
 
 from evealert.constants import (
     LOG_BACKUP_COUNT,
     LOG_DATE_FORMAT,
     LOG_DEFAULT_LEVEL,
+    LOG_FLUSH_TIMEOUT,
     LOG_FORMAT_STRING,
     LOG_MAX_BYTES,
 )
@@ -27,6 +38,101 @@ LOG_FORMAT = logging.Formatter(
 )
 
 
+class _FlushMarker:
+    """Queue entry that makes the listener flush its handlers."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+
+
+class LogListener(QueueListener):
+    """QueueListener that flushes its handlers when it reaches a marker.
+
+    Attributes:
+        running: The listener thread is started
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.running = False
+
+    def start(self) -> None:
+        super().start()
+        self.running = True
+
+    def stop(self) -> None:
+        self.running = False
+        super().stop()
+
+    def handle(self, record) -> None:
+        if isinstance(record, _FlushMarker):
+            for handler in self.handlers:
+                handler.flush()
+            record.done.set()
+            return
+        super().handle(record)
+
+    def prepare(self, record):
+        if isinstance(record, _FlushMarker):
+            return record
+        return super().prepare(record)
+
+
+# Records of all loggers, written by one listener thread
+LOG_QUEUE: "queue.SimpleQueue" = queue.SimpleQueue()
+_listener: Optional[LogListener] = None
+_handlers: Dict[str, List[logging.Handler]] = {}
+_lock = threading.Lock()
+
+
+def _set_handlers(name: str, handlers: List[logging.Handler]) -> None:
+    """Replace the output handlers of a logger and start the listener."""
+    # pylint: disable=global-statement
+    global _listener
+    with _lock:
+        for handler in _handlers.pop(name, []):
+            handler.close()
+        _handlers[name] = handlers
+        all_handlers = tuple(h for group in _handlers.values() for h in group)
+        if _listener is None:
+            _listener = LogListener(
+                LOG_QUEUE, *all_handlers, respect_handler_level=True
+            )
+            _listener.start()
+        else:
+            _listener.handlers = all_handlers
+
+
+def flush_logs(timeout: float = LOG_FLUSH_TIMEOUT) -> bool:
+    """Wait until the queued log records are written.
+
+    Args:
+        timeout: Maximum seconds to wait
+
+    Returns:
+        True if all records were written in time
+    """
+    listener = _listener
+    if listener is None or not listener.running:
+        return True
+    marker = _FlushMarker()
+    LOG_QUEUE.put_nowait(marker)
+    return marker.done.wait(timeout)
+
+
+def stop_logging() -> None:
+    """Write the queued log records, stop the listener and close the files."""
+    # pylint: disable=global-statement
+    global _listener
+    with _lock:
+        listener, _listener = _listener, None
+        if listener is not None and listener.running:
+            listener.stop()
+        for handlers in _handlers.values():
+            for handler in handlers:
+                handler.flush()
+
+
 def create_fh(name: str, level: Optional[int] = None) -> RotatingFileHandler:
     """
     Create a rotating file handler for logging.
@@ -102,12 +208,16 @@ def setup_logger(
     # Remove existing handlers to avoid duplicates
     logger.handlers.clear()
 
-    # Add file handler
-    logger.addHandler(create_fh(name))
-
-    # Add console handler if requested
+    # File handler and console handler if requested, written by the
+    # listener thread and only for the records of this logger
+    handlers: List[logging.Handler] = [create_fh(name)]
     if console_output:
-        logger.addHandler(create_console_handler())
+        handlers.append(create_console_handler())
+    for handler in handlers:
+        handler.addFilter(logging.Filter(name))
+    _set_handlers(name, handlers)
+
+    logger.addHandler(QueueHandler(LOG_QUEUE))
 
     return logger
 
@@ -121,6 +231,9 @@ tools_log = setup_logger("tools")
 test_log = setup_logger("test")
 validator_log = setup_logger("validator")
 
+# Write the queued records when the interpreter exits
+atexit.register(stop_logging)
+
 # Root logger configuration
 logging.basicConfig(
     level=logging.WARNING,  # Only show warnings and errors from third-party libraries
@@ -130,6 +243,8 @@ logging.basicConfig(
 
 __all__ = [
     "setup_logger",
+    "flush_logs",
+    "stop_logging",
     "main_log",
     "alert_log",
     "menu_log",
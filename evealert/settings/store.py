@@ -0,0 +1,333 @@
+"""Settings store for EVE Alert.
+
+Keeps the parsed ``settings.json`` in memory and only touches the disk when
+it has to:
+
+- The file is re-read only when its mtime/size changed, and re-parsed only
+  when its content hash changed
+- Settings are written atomically (temp file + rename) and only when the
+  new settings actually differ from the cached ones
+- Subscribers receive a typed ``SettingsChangedEvent`` for every real change
+"""
+
+import copy
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple, Union
+
+from evealert.constants import (
+    DEBUG_RENDER_FPS,
+    DETECTION_CLEAR_DELAY,
+    DETECTION_CONFIRM_FRAMES,
+    DETECTION_HYSTERESIS,
+    DETECTION_WINDOW_FRAMES,
+    METRICS_ENABLED,
+    METRICS_PORT,
+    VISION_BACKEND_THREAD,
+    VISION_LOG_INTERVAL,
+)
+
+logger = logging.getLogger("main")
+
+DEFAULT_SETTINGS = {
+    "logging": "INFO",
+    "alert_region_1": {"x": 0, "y": 0},
+    "alert_region_2": {"x": 0, "y": 0},
+    "faction_region_1": {"x": 0, "y": 0},
+    "faction_region_2": {"x": 0, "y": 0},
+    "detectionscale": {"value": 90},
+    "faction_scale": {"value": 90},
+    "cooldown_timer": {"value": 30},
+    "volume": {"value": 100},
+    "server": {
+        "name": "Enter a Webhook URL",
+        "system": "Enter a System Name",
+        "mute": False,
+    },
+    "regions": [],
+    "vision_backend": {"value": VISION_BACKEND_THREAD},
+    "debug_fps": {"value": DEBUG_RENDER_FPS},
+    "vision_log_interval": {"value": VISION_LOG_INTERVAL},
+    "detection_filter": {
+        "confirm_frames": DETECTION_CONFIRM_FRAMES,
+        "window_frames": DETECTION_WINDOW_FRAMES,
+        "clear_delay": DETECTION_CLEAR_DELAY,
+        "hysteresis": DETECTION_HYSTERESIS,
+    },
+    # 0: nothing is profiled on start, a request profiles PROFILE_TICKS ticks
+    "profiling": {"ticks": 0},
+    "metrics": {"enabled": METRICS_ENABLED, "port": METRICS_PORT},
+}
+
+# Event sources
+SOURCE_FILE = "file"  # settings.json was modified on disk
+SOURCE_SAVE = "save"  # settings were saved through the store
+
+
+@dataclass(frozen=True)
+class SettingsChangedEvent:
+    """Published by ``SettingsStore`` whenever the settings change.
+
+    Attributes:
+        settings: Copy of the complete settings after the change
+        changed_keys: Top-level settings keys whose value changed
+        source: Where the change came from (``"file"`` or ``"save"``)
+    """
+
+    settings: Dict[str, Any]
+    changed_keys: FrozenSet[str]
+    source: str
+
+    def affects(self, *keys: str) -> bool:
+        """Check whether any of the given top-level keys changed.
+
+        Args:
+            keys: Top-level settings keys
+
+        Returns:
+            True if at least one of the keys changed
+        """
+        return any(key in self.changed_keys for key in keys)
+
+
+SettingsListener = Callable[[SettingsChangedEvent], None]
+
+
+def merge_settings_with_defaults(
+    settings: Dict[str, Any], defaults: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Merge the loaded settings with the default settings recursively.
+
+    Missing keys are filled with default values, unknown keys are dropped.
+
+    Args:
+        settings: Settings as read from disk
+        defaults: Default settings
+
+    Returns:
+        New merged settings dictionary
+    """
+    merged_settings = {}
+    for key, value in defaults.items():
+        if key in settings:
+            if isinstance(value, dict) and isinstance(settings[key], dict):
+                # Recursively merge nested dictionaries
+                merged_settings[key] = merge_settings_with_defaults(
+                    settings[key], value
+                )
+            else:
+                merged_settings[key] = copy.deepcopy(settings[key])
+        else:
+            # Fill missing keys with default values
+            merged_settings[key] = copy.deepcopy(value)
+    return merged_settings
+
+
+class SettingsStore:
+    """In-memory cache of ``settings.json`` with change notifications.
+
+    The store is thread-safe: the GUI thread saves settings while the alert
+    thread polls the file for external edits.
+
+    Attributes:
+        path: Path to the settings file
+        defaults: Default settings used for missing keys
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        defaults: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Initialize the settings store.
+
+        Args:
+            path: Path to the settings file
+            defaults: Default settings (default: DEFAULT_SETTINGS)
+        """
+        self.path = Path(path)
+        self.defaults = defaults if defaults is not None else DEFAULT_SETTINGS
+        self._settings: Optional[Dict[str, Any]] = None
+        self._stat: Optional[Tuple[int, int]] = None
+        self._digest: Optional[str] = None
+        self._listeners: List[SettingsListener] = []
+        self._lock = threading.RLock()
+
+    @property
+    def is_loaded(self) -> bool:
+        """Returns True if the settings have been read at least once."""
+        return self._settings is not None
+
+    def subscribe(self, listener: SettingsListener) -> None:
+        """Register a listener for settings change events.
+
+        Listeners are called on the thread that caused the change.
+
+        Args:
+            listener: Callable receiving a SettingsChangedEvent
+        """
+        with self._lock:
+            if listener not in self._listeners:
+                self._listeners.append(listener)
+
+    def unsubscribe(self, listener: SettingsListener) -> None:
+        """Remove a previously registered listener.
+
+        Args:
+            listener: Listener passed to subscribe()
+        """
+        with self._lock:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+    def load(self) -> Dict[str, Any]:
+        """Get the current settings.
+
+        Reads the file on first use; afterwards the cached settings are
+        returned without touching the disk. Use ``reload_if_changed()`` to
+        pick up external edits.
+
+        Returns:
+            Copy of the current settings
+        """
+        with self._lock:
+            if self._settings is None:
+                self.reload_if_changed()
+            return copy.deepcopy(self._settings)
+
+    def reload_if_changed(self) -> bool:
+        """Re-read the settings file if it changed on disk.
+
+        Only a ``stat()`` call is made when the file is unchanged.
+
+        Returns:
+            True if the settings changed and an event was published
+        """
+        with self._lock:
+            try:
+                stat = os.stat(self.path)
+            except FileNotFoundError:
+                if self._settings is None:
+                    logger.debug("Settings file not found. Using default settings.")
+                    self._write(merge_settings_with_defaults({}, self.defaults))
+                return False
+
+            file_stat = (stat.st_mtime_ns, stat.st_size)
+            if self._settings is not None and file_stat == self._stat:
+                return False
+
+            try:
+                raw = self.path.read_bytes()
+            except OSError as e:
+                logger.error("Error reading settings file: %s", e)
+                return False
+
+            self._stat = file_stat
+            digest = hashlib.sha256(raw).hexdigest()
+            if self._settings is not None and digest == self._digest:
+                return False
+            self._digest = digest
+
+            try:
+                loaded = json.loads(raw.decode("utf-8"))
+                if not isinstance(loaded, dict):
+                    raise ValueError("settings must be a JSON object")
+            except (UnicodeDecodeError, ValueError) as e:
+                logger.debug("Error reading settings file: %s", e)
+                if self._settings is not None:
+                    # Keep the last good settings until the file is fixed
+                    return False
+                loaded = {}
+
+            settings = merge_settings_with_defaults(loaded, self.defaults)
+            event = self._replace(settings, SOURCE_FILE)
+        return self._publish(event)
+
+    def save(self, settings: Optional[Dict[str, Any]] = None) -> bool:
+        """Save settings to disk if they differ from the cached settings.
+
+        Args:
+            settings: New settings (default: defaults)
+
+        Returns:
+            True if the settings changed and were written
+        """
+        if settings is None:
+            settings = self.defaults
+
+        with self._lock:
+            if self._settings is None:
+                self.reload_if_changed()
+            merged = merge_settings_with_defaults(settings, self.defaults)
+            if merged == self._settings:
+                return False
+            self._write(merged)
+            event = self._replace(merged, SOURCE_SAVE)
+        return self._publish(event)
+
+    def _replace(
+        self, settings: Dict[str, Any], source: str
+    ) -> Optional[SettingsChangedEvent]:
+        """Swap in new settings and build the matching change event."""
+        previous = self._settings
+        self._settings = settings
+        if previous is None:
+            return None
+
+        keys = set(previous) | set(settings)
+        changed = frozenset(
+            key for key in keys if previous.get(key) != settings.get(key)
+        )
+        if not changed:
+            return None
+        return SettingsChangedEvent(copy.deepcopy(settings), changed, source)
+
+    def _publish(self, event: Optional[SettingsChangedEvent]) -> bool:
+        """Notify all listeners about a change event."""
+        if event is None:
+            return False
+
+        with self._lock:
+            listeners = list(self._listeners)
+        for listener in listeners:
+            try:
+                listener(event)
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                logger.exception("Settings listener error: %s", e)
+        return True
+
+    def _write(self, settings: Dict[str, Any]) -> None:
+        """Write settings atomically and remember the written file state."""
+        raw = json.dumps(settings, indent=4).encode("utf-8")
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        fd, tmp_path = tempfile.mkstemp(
+            dir=self.path.parent, prefix=f".{self.path.name}.", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "wb") as tmp_file:
+                tmp_file.write(raw)
+                tmp_file.flush()
+                os.fsync(tmp_file.fileno())
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.error("Error writing settings file: %s", e)
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            if self._settings is None:
+                self._settings = settings
+            return
+
+        stat = os.stat(self.path)
+        self._stat = (stat.st_mtime_ns, stat.st_size)
+        self._digest = hashlib.sha256(raw).hexdigest()
+        if self._settings is None:
+            self._settings = settings
@@ -4,7 +4,17 @@ import logging
 import os
 from typing import Any, Dict, Optional, Tuple
 
-from evealert.constants import DETECTION_SCALE_MAX, DETECTION_SCALE_MIN
+from evealert.constants import (
+    DEBUG_RENDER_FPS_MAX,
+    DETECTION_SCALE_MAX,
+    DETECTION_SCALE_MIN,
+    DETECTION_WINDOW_FRAMES_MAX,
+    PROFILE_TICKS_MAX,
+    REGION_ALERT,
+    REGION_FACTION,
+    VISION_BACKEND_PROCESS,
+    VISION_BACKEND_THREAD,
+)
 
 logger = logging.getLogger("validator")
 
@@ -165,6 +175,46 @@ class ConfigValidator:
 
         return True, None
 
+    @staticmethod
+    def validate_region_entry(region: Any, index: int = 0) -> list:
+        """
+        Validate an entry of the ``regions`` settings list.
+
+        Args:
+            region: Region settings entry
+            index: Position in the list, used if the entry has no name
+
+        Returns:
+            List of errors (empty if the entry is valid)
+        """
+        if not isinstance(region, dict):
+            return [f"Region {index + 1}: Must be an object"]
+
+        region_name = f"Region {region.get('name') or index + 1}"
+        errors = []
+        if region.get("kind", REGION_ALERT) not in (REGION_ALERT, REGION_FACTION):
+            errors.append(
+                f"{region_name}: Kind must be '{REGION_ALERT}' or '{REGION_FACTION}'"
+            )
+        try:
+            valid, error = ConfigValidator.validate_region_coordinates(
+                int(region.get("x1", 0)),
+                int(region.get("y1", 0)),
+                int(region.get("x2", 0)),
+                int(region.get("y2", 0)),
+                region_name,
+            )
+            if not valid:
+                errors.append(error)
+            valid, error = ConfigValidator.validate_detection_scale(
+                int(region.get("detection", 90)), f"{region_name} Detection Scale"
+            )
+            if not valid:
+                errors.append(error)
+        except (ValueError, TypeError) as e:
+            errors.append(f"{region_name}: Invalid format - {str(e)}")
+        return errors
+
     @staticmethod
     def validate_settings_dict(settings: Dict[str, Any]) -> Tuple[bool, list]:
         """
@@ -242,6 +292,97 @@ class ConfigValidator:
             except (KeyError, ValueError, TypeError) as e:
                 errors.append(f"Cooldown Timer: Invalid format - {str(e)}")
 
+        # Validate named regions
+        if "regions" in settings:
+            regions = settings["regions"]
+            if isinstance(regions, list):
+                for index, region in enumerate(regions):
+                    errors.extend(ConfigValidator.validate_region_entry(region, index))
+            else:
+                errors.append("Regions: Must be a list")
+
+        # Validate vision backend
+        if "vision_backend" in settings:
+            try:
+                backend = settings["vision_backend"]["value"]
+                if backend not in (VISION_BACKEND_THREAD, VISION_BACKEND_PROCESS):
+                    errors.append(
+                        f"Vision Backend: Must be '{VISION_BACKEND_THREAD}' "
+                        f"or '{VISION_BACKEND_PROCESS}'"
+                    )
+            except (KeyError, TypeError) as e:
+                errors.append(f"Vision Backend: Invalid format - {str(e)}")
+
+        # Validate debug window FPS
+        if "debug_fps" in settings:
+            try:
+                fps = int(settings["debug_fps"]["value"])
+                if not 1 <= fps <= DEBUG_RENDER_FPS_MAX:
+                    errors.append(
+                        f"Debug FPS: Must be between 1 and {DEBUG_RENDER_FPS_MAX}"
+                    )
+            except (KeyError, TypeError, ValueError) as e:
+                errors.append(f"Debug FPS: Invalid format - {str(e)}")
+
+        # Validate vision debug log interval
+        if "vision_log_interval" in settings:
+            try:
+                interval = float(settings["vision_log_interval"]["value"])
+                if interval < 0:
+                    errors.append("Vision Log Interval: Must be 0 or more seconds")
+            except (KeyError, TypeError, ValueError) as e:
+                errors.append(f"Vision Log Interval: Invalid format - {str(e)}")
+
+        # Validate profiled ticks
+        if "profiling" in settings:
+            try:
+                ticks = int(settings["profiling"]["ticks"])
+                if not 0 <= ticks <= PROFILE_TICKS_MAX:
+                    errors.append(
+                        f"Profiling: Ticks must be between 0 and {PROFILE_TICKS_MAX}"
+                    )
+            except (KeyError, TypeError, ValueError) as e:
+                errors.append(f"Profiling: Invalid format - {str(e)}")
+
+        # Validate detection filter
+        if "detection_filter" in settings:
+            try:
+                detection = settings["detection_filter"]
+                window = int(detection["window_frames"])
+                confirm = int(detection["confirm_frames"])
+                if not 1 <= window <= DETECTION_WINDOW_FRAMES_MAX:
+                    errors.append(
+                        "Detection Filter: Window frames must be between 1 "
+                        f"and {DETECTION_WINDOW_FRAMES_MAX}"
+                    )
+                if not 1 <= confirm <= window:
+                    errors.append(
+                        "Detection Filter: Confirm frames must be between 1 "
+                        "and the window frames"
+                    )
+                if float(detection["clear_delay"]) < 0:
+                    errors.append(
+                        "Detection Filter: Clear delay must be 0 or more seconds"
+                    )
+                if not 0 <= float(detection["hysteresis"]) <= DETECTION_SCALE_MAX:
+                    errors.append(
+                        "Detection Filter: Hysteresis must be between 0 and "
+                        f"{DETECTION_SCALE_MAX}"
+                    )
+            except (KeyError, TypeError, ValueError) as e:
+                errors.append(f"Detection Filter: Invalid format - {str(e)}")
+
+        # Validate metrics endpoint
+        if "metrics" in settings:
+            try:
+                if not isinstance(settings["metrics"]["enabled"], bool):
+                    errors.append("Metrics: Enabled must be true or false")
+                port = int(settings["metrics"]["port"])
+                if not 1 <= port <= 65535:
+                    errors.append("Metrics: Port must be between 1 and 65535")
+            except (KeyError, TypeError, ValueError) as e:
+                errors.append(f"Metrics: Invalid format - {str(e)}")
+
         # Validate webhook URL
         if "server" in settings and "webhook" in settings["server"]:
             try:
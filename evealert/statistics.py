@@ -5,12 +5,21 @@ This module provides statistics tracking for alarm events including:
 - Session-based alarm counts
 - Recent alarm history with timestamps
 - Session start time tracking
+
+With an ``AlarmHistoryStore`` the events and totals are also written to
+disk, so the totals and the recent history survive a restart.
 """
 
 import time
 from collections import deque
 from dataclasses import dataclass, field
-from typing import Deque, Dict
+from typing import TYPE_CHECKING, Deque, Dict, Optional
+
+from evealert.aggregates import AlarmAggregates
+from evealert.constants import HISTORY_RECENT_EVENTS
+
+if TYPE_CHECKING:
+    from evealert.history import AlarmHistoryStore
 
 
 @dataclass
@@ -48,11 +57,16 @@ class AlarmStatistics:
         session_start_time: Unix timestamp when current session started
         total_by_type: Total alarm count per alarm type
         session_by_type: Session alarm count per alarm type
+        aggregates: Rolling per-minute, per-hour and per-day alarm counts
+        version: Increased on every change, to find out if anything changed
+        store: Optional persistent history the events are written to
     """
 
     total_alarms: int = 0
     session_alarms: int = 0
-    alarm_history: Deque[AlarmEvent] = field(default_factory=lambda: deque(maxlen=50))
+    alarm_history: Deque[AlarmEvent] = field(
+        default_factory=lambda: deque(maxlen=HISTORY_RECENT_EVENTS)
+    )
     session_start_time: float = field(default_factory=time.time)
     total_by_type: Dict[str, int] = field(
         default_factory=lambda: {"Enemy": 0, "Faction": 0}
@@ -60,6 +74,23 @@ class AlarmStatistics:
     session_by_type: Dict[str, int] = field(
         default_factory=lambda: {"Enemy": 0, "Faction": 0}
     )
+    aggregates: AlarmAggregates = field(
+        default_factory=AlarmAggregates, repr=False, compare=False
+    )
+    version: int = field(default=0, compare=False)
+    store: Optional["AlarmHistoryStore"] = field(
+        default=None, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        """Load the totals, recent history and aggregates from the store."""
+        if self.store is None:
+            return
+        for alarm_type, count in self.store.totals().items():
+            self.total_by_type[alarm_type] = count
+        self.total_alarms = sum(self.total_by_type.values())
+        self.alarm_history.extend(self.store.recent(self.alarm_history.maxlen))
+        self.aggregates.load(self.store)
 
     def add_alarm(self, alarm_type: str) -> None:
         """Record a new alarm event.
@@ -80,7 +111,32 @@ class AlarmStatistics:
             self.session_by_type[alarm_type] += 1
 
         # Add to history
-        self.alarm_history.append(AlarmEvent(alarm_type, timestamp))
+        event = AlarmEvent(alarm_type, timestamp)
+        self.alarm_history.append(event)
+        self.aggregates.add(alarm_type, timestamp)
+        if self.store is not None:
+            self.store.append(event)
+        self.version += 1
+
+    def get_events_after(
+        self, event: Optional[AlarmEvent]
+    ) -> Optional[list[AlarmEvent]]:
+        """Get the alarm events recorded after an event in the history.
+
+        Args:
+            event: Last event seen before, or None for the whole history
+
+        Returns:
+            Newer AlarmEvent objects, oldest first, or None if the event is
+            no longer in the history
+        """
+        history = list(self.alarm_history)
+        if event is None:
+            return history
+        for index in range(len(history) - 1, -1, -1):
+            if history[index] is event:
+                return history[index + 1 :]
+        return None
 
     def get_recent_history(self, count: int = 10) -> list[AlarmEvent]:
         """Get most recent alarm events.
@@ -119,13 +175,26 @@ class AlarmStatistics:
         self.session_alarms = 0
         self.session_by_type = {"Enemy": 0, "Faction": 0}
         self.session_start_time = time.time()
+        self.version += 1
 
     def clear_history(self) -> None:
-        """Clear alarm history.
+        """Clear the recent alarm history.
 
-        Removes all historical alarm events but preserves counters.
+        Only the events shown in the statistics window are removed, the
+        stored history, counters and aggregates are kept.
         """
         self.alarm_history.clear()
+        self.version += 1
+
+    def flush(self) -> None:
+        """Write the queued events to the store."""
+        if self.store is not None:
+            self.store.flush()
+
+    def close(self) -> None:
+        """Write the queued events and close the store."""
+        if self.store is not None:
+            self.store.close()
 
     def to_dict(self) -> dict:
         """Convert statistics to dictionary format.
@@ -139,6 +208,8 @@ class AlarmStatistics:
             "session_duration": self.get_session_duration(),
             "total_by_type": self.total_by_type.copy(),
             "session_by_type": self.session_by_type.copy(),
+            "last_hour": self.aggregates.last_hour(),
+            "busiest_hour": self.aggregates.busiest_hour(),
             "recent_history": [
                 {"type": event.alarm_type, "time": event.formatted_time()}
                 for event in self.get_recent_history(10)
@@ -0,0 +1,431 @@
+"""Detection accuracy harness for labeled frame corpora.
+
+Runs detector configurations over frames with ground truth labels and
+reports precision, recall and latency side by side, so a faster detector
+configuration (downsampling, grayscale, region of interest, another
+threshold or matching method) can be checked against the baseline before
+it is used.
+
+A corpus is a list of ``SyntheticFrame`` objects, generated with
+``LocalListGenerator`` (``synthetic_corpus``) or read from a folder of
+recorded frames with a ``labels.json`` file (``load_corpus``)::
+
+    {"frame_001.png": [{"kind": "enemy", "box": [4, 22, 16, 16]}]}
+
+Frames without an entry have no labels. Labels that are mostly hidden
+(``visible`` below ``min_visible``) are neither required nor counted as
+false positives when matched.
+
+Detections are scored twice:
+
+- per object: a detection is a true positive if its center lies in the box
+  of a label that was not matched yet; further detections of the same
+  label are counted as duplicates, all others as false positives
+- per frame: whether the frame raises an alarm (any detection) and should
+  (any required label), as the alert agent decides; frames with only
+  optional labels are not scored per frame
+"""
+
+import json
+import os
+import statistics
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from evealert.constants import ALERT_IMAGE_PREFIX, CV_MATCH_METHOD, IMG_FOLDER
+from evealert.settings.helper import get_resource_path, lazy_import
+from evealert.tools.synthetic import (
+    LABEL_ENEMY,
+    Label,
+    LocalListConfig,
+    LocalListGenerator,
+    SyntheticFrame,
+    template_paths,
+)
+from evealert.tools.vision import Vision, load_template
+
+cv = lazy_import("cv2")
+
+LABELS_FILE = "labels.json"
+MIN_VISIBLE = 0.5  # Labels less visible than this are optional
+
+Rectangle = Tuple[int, int, int, int]
+Detector = Callable[[np.ndarray], List[Rectangle]]
+
+
+@dataclass
+class DetectorConfig:
+    """A detector configuration to evaluate.
+
+    Attributes:
+        name: Name in the report
+        threshold: Detection threshold in percent
+        method: OpenCV template matching method
+        templates: Template paths (default: bundled image_* templates)
+        downsample: Factor frames and templates are resized by (1.0: off)
+        grayscale: Match grayscale frames and templates
+        roi: Part of the frame that is searched as (x, y, width, height)
+    """
+
+    name: str = "baseline"
+    threshold: float = 90
+    method: int = CV_MATCH_METHOD
+    templates: Optional[List[str]] = None
+    downsample: float = 1.0
+    grayscale: bool = False
+    roi: Optional[Rectangle] = None
+
+
+class VisionDetector:
+    """Runs Vision.vision_process with a detector configuration.
+
+    The frame is cut to the region of interest, resized and converted
+    before matching, the templates when they are loaded. The rectangles
+    are returned in frame coordinates.
+    """
+
+    def __init__(self, config: DetectorConfig) -> None:
+        """Load the templates.
+
+        Args:
+            config: Detector configuration
+        """
+        self.config = config
+        paths = config.templates
+        if paths is None:
+            paths = template_paths(get_resource_path(IMG_FOLDER), ALERT_IMAGE_PREFIX)
+        self.vision = Vision(
+            paths,
+            method=config.method,
+            threshold=config.threshold,
+            loader=self._load_template,
+        )
+
+    def _transform(self, image: np.ndarray) -> np.ndarray:
+        """Resize and convert an image like the configuration says."""
+        if self.config.downsample != 1.0:
+            size = (
+                max(int(round(image.shape[1] * self.config.downsample)), 1),
+                max(int(round(image.shape[0] * self.config.downsample)), 1),
+            )
+            image = cv.resize(image, size, interpolation=cv.INTER_AREA)
+        if self.config.grayscale and image.ndim == 3:
+            image = cv.cvtColor(image, cv.COLOR_BGR2GRAY)
+        return image
+
+    def _load_template(self, path: str) -> np.ndarray:
+        """Load a template and convert it like the frames."""
+        image = self._transform(load_template(path))
+        if image.ndim == 2:
+            # Vision matches BGR images
+            image = cv.cvtColor(image, cv.COLOR_GRAY2BGR)
+        return image
+
+    def __call__(self, image: np.ndarray) -> List[Rectangle]:
+        """Detect the templates in a frame.
+
+        Args:
+            image: BGR frame
+
+        Returns:
+            Match rectangles as (x, y, w, h) in frame coordinates
+        """
+        offset_x = offset_y = 0
+        if self.config.roi is not None:
+            offset_x, offset_y, width, height = self.config.roi
+            image = image[offset_y : offset_y + height, offset_x : offset_x + width]
+        _, rectangles = self.vision.vision_process(
+            self._transform(image), self.config.threshold
+        )
+        scale = 1 / self.config.downsample
+        return [
+            (
+                int(round(x * scale)) + offset_x,
+                int(round(y * scale)) + offset_y,
+                int(round(w * scale)),
+                int(round(h * scale)),
+            )
+            for x, y, w, h in rectangles
+        ]
+
+
+@dataclass
+class AccuracyResult:
+    """Accuracy and latency of a detector over a corpus.
+
+    Attributes:
+        name: Detector name
+        frames: Frames evaluated
+        true_positives: Detections of a required label
+        false_positives: Detections outside of every label
+        false_negatives: Required labels without a detection
+        duplicates: Further detections of an already detected label
+        frame_counts: Frames per alarm outcome ("tp", "fp", "fn", "tn"),
+            without the frames that only have optional labels
+        latencies: Seconds per frame
+    """
+
+    name: str
+    frames: int = 0
+    true_positives: int = 0
+    false_positives: int = 0
+    false_negatives: int = 0
+    duplicates: int = 0
+    frame_counts: Dict[str, int] = field(
+        default_factory=lambda: {"tp": 0, "fp": 0, "fn": 0, "tn": 0}
+    )
+    latencies: List[float] = field(default_factory=list, repr=False)
+
+    @property
+    def precision(self) -> float:
+        """Share of the detections that hit a label."""
+        found = self.true_positives + self.false_positives
+        return self.true_positives / found if found else 1.0
+
+    @property
+    def recall(self) -> float:
+        """Share of the required labels that were detected."""
+        required = self.true_positives + self.false_negatives
+        return self.true_positives / required if required else 1.0
+
+    @property
+    def frame_precision(self) -> float:
+        """Share of the alarms raised on frames that should raise one."""
+        alarms = self.frame_counts["tp"] + self.frame_counts["fp"]
+        return self.frame_counts["tp"] / alarms if alarms else 1.0
+
+    @property
+    def frame_recall(self) -> float:
+        """Share of the frames that should raise an alarm and did."""
+        required = self.frame_counts["tp"] + self.frame_counts["fn"]
+        return self.frame_counts["tp"] / required if required else 1.0
+
+    def latency_ms(self) -> Dict[str, float]:
+        """Latency percentiles in milliseconds."""
+        values = sorted(latency * 1000 for latency in self.latencies)
+        if not values:
+            return {}
+        return {
+            "mean": round(statistics.fmean(values), 3),
+            "p50": round(values[len(values) // 2], 3),
+            "p95": round(values[min(int(len(values) * 0.95), len(values) - 1)], 3),
+            "max": round(values[-1], 3),
+        }
+
+    def to_dict(self) -> dict:
+        """Convert the result to a JSON serializable dictionary."""
+        return {
+            "name": self.name,
+            "frames": self.frames,
+            "true_positives": self.true_positives,
+            "false_positives": self.false_positives,
+            "false_negatives": self.false_negatives,
+            "duplicates": self.duplicates,
+            "precision": round(self.precision, 4),
+            "recall": round(self.recall, 4),
+            "frame_counts": dict(self.frame_counts),
+            "frame_precision": round(self.frame_precision, 4),
+            "frame_recall": round(self.frame_recall, 4),
+            "latency_ms": self.latency_ms(),
+        }
+
+
+def score_frame(
+    result: AccuracyResult,
+    rectangles: Iterable[Rectangle],
+    labels: Sequence[Label],
+    min_visible: float = MIN_VISIBLE,
+) -> None:
+    """Add the detections of a frame to a result.
+
+    Args:
+        result: Result to update
+        rectangles: Detected rectangles as (x, y, w, h)
+        labels: Ground truth labels of the frame
+        min_visible: Labels less visible than this are optional
+    """
+    matched = [False] * len(labels)
+    detections = 0
+    for x, y, w, h in rectangles:
+        detections += 1
+        center_x, center_y = x + w / 2, y + h / 2
+        hits = [
+            number
+            for number, label in enumerate(labels)
+            if label.box[0] <= center_x < label.box[0] + label.box[2]
+            and label.box[1] <= center_y < label.box[1] + label.box[3]
+        ]
+        new = [
+            number
+            for number in hits
+            if not matched[number] and labels[number].visible >= min_visible
+        ]
+        if new:
+            matched[new[0]] = True
+            result.true_positives += 1
+        elif not hits:
+            result.false_positives += 1
+        elif any(labels[number].visible >= min_visible for number in hits):
+            result.duplicates += 1
+
+    required = [label.visible >= min_visible for label in labels]
+    result.false_negatives += sum(
+        1 for needed, found in zip(required, matched) if needed and not found
+    )
+    result.frames += 1
+    alarm = detections > 0
+    if any(required):
+        result.frame_counts["tp" if alarm else "fn"] += 1
+    elif not labels:
+        result.frame_counts["fp" if alarm else "tn"] += 1
+    # Frames with only optional labels may or may not raise an alarm
+
+
+def evaluate(
+    detector: Detector,
+    corpus: Iterable[SyntheticFrame],
+    name: str = "baseline",
+    kinds: Sequence[str] = (LABEL_ENEMY,),
+    min_visible: float = MIN_VISIBLE,
+) -> AccuracyResult:
+    """Run a detector over a corpus.
+
+    Args:
+        detector: Returns the match rectangles of a frame
+        corpus: Frames with their labels
+        name: Detector name in the result
+        kinds: Label kinds the detector should find, other labels are
+            treated as background
+        min_visible: Labels less visible than this are optional
+
+    Returns:
+        AccuracyResult of the detector
+    """
+    result = AccuracyResult(name)
+    for frame in corpus:
+        labels = [label for label in frame.labels if label.kind in kinds]
+        start = time.perf_counter()
+        rectangles = detector(frame.image)
+        result.latencies.append(time.perf_counter() - start)
+        score_frame(result, rectangles, labels, min_visible)
+    return result
+
+
+def compare(
+    configs: Iterable[DetectorConfig],
+    corpus: Sequence[SyntheticFrame],
+    kinds: Sequence[str] = (LABEL_ENEMY,),
+    min_visible: float = MIN_VISIBLE,
+) -> List[AccuracyResult]:
+    """Evaluate detector configurations on the same corpus.
+
+    Args:
+        configs: Detector configurations
+        corpus: Frames with their labels
+        kinds: Label kinds the detectors should find
+        min_visible: Labels less visible than this are optional
+
+    Returns:
+        AccuracyResult per configuration, in the given order
+    """
+    results = []
+    for config in configs:
+        detector = VisionDetector(config)
+        try:
+            results.append(evaluate(detector, corpus, config.name, kinds, min_visible))
+        finally:
+            detector.vision.clean_up()
+    return results
+
+
+def synthetic_corpus(
+    configs: Iterable[LocalListConfig],
+    frames_per_config: int = 1,
+    generator: Optional[LocalListGenerator] = None,
+) -> List[SyntheticFrame]:
+    """Generate a labeled corpus of synthetic local member lists.
+
+    Args:
+        configs: List appearances, each is scrolled by its scroll_step
+        frames_per_config: Frames generated per appearance
+        generator: Generator to use (default: bundled templates)
+
+    Returns:
+        Generated frames
+    """
+    generator = generator or LocalListGenerator()
+    return [
+        frame
+        for config in configs
+        for frame in generator.frames(config, frames_per_config)
+    ]
+
+
+def save_corpus(corpus: Iterable[SyntheticFrame], folder: str) -> None:
+    """Write a corpus as PNG frames and a labels file.
+
+    Args:
+        corpus: Frames with their labels
+        folder: Target folder, created if missing
+    """
+    os.makedirs(folder, exist_ok=True)
+    labels = {}
+    for number, frame in enumerate(corpus):
+        name = f"frame_{number:05d}.png"
+        if not cv.imwrite(os.path.join(folder, name), frame.image):
+            raise OSError(f"Frame could not be written: {name}")
+        labels[name] = [
+            {
+                "kind": label.kind,
+                "template": label.template,
+                "box": list(label.box),
+                "visible": label.visible,
+            }
+            for label in frame.labels
+        ]
+    with open(os.path.join(folder, LABELS_FILE), "w", encoding="utf-8") as file:
+        json.dump(labels, file, indent=2)
+
+
+def load_corpus(folder: str) -> List[SyntheticFrame]:
+    """Read recorded frames and their labels from a folder.
+
+    Args:
+        folder: Folder with the frames and a labels.json file
+
+    Returns:
+        Frames in file name order
+
+    Raises:
+        FileNotFoundError: If the folder has no labels file
+        ValueError: If a labeled frame could not be read
+    """
+    with open(os.path.join(folder, LABELS_FILE), encoding="utf-8") as file:
+        entries = json.load(file)
+    names = sorted(
+        set(entries)
+        | {
+            name
+            for name in os.listdir(folder)
+            if name.lower().endswith((".png", ".jpg", ".jpeg", ".bmp"))
+        }
+    )
+    corpus = []
+    for name in names:
+        image = cv.imread(os.path.join(folder, name), cv.IMREAD_COLOR)
+        if image is None:
+            raise ValueError(f"Frame could not be read: {name}")
+        labels = [
+            Label(
+                entry.get("kind", LABEL_ENEMY),
+                entry.get("template", ""),
+                tuple(int(value) for value in entry["box"]),
+                float(entry.get("visible", 1.0)),
+            )
+            for entry in entries.get(name, [])
+        ]
+        corpus.append(SyntheticFrame(image, labels))
+    return corpus
@@ -0,0 +1,222 @@
+"""Debug visualization renderer for the Vision handlers.
+
+Drawing the detection boxes and showing the OpenCV windows used to happen
+in the detection path. ``DebugRenderer`` moves it to its own thread:
+
+- ``submit()`` only stores the latest frame and boxes of a window, older
+  frames that were not shown yet are dropped
+- The renderer thread draws all boxes on one copy of the frame and shows
+  it at most ``fps`` times per second
+- All HighGUI calls (imshow, waitKey, destroyWindow) are made on the
+  renderer thread
+"""
+
+import logging
+import threading
+import time
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+from evealert.constants import (
+    CV_DETECTION_COLOR,
+    CV_LINE_TYPE,
+    CV_RECTANGLE_THICKNESS,
+    DEBUG_RENDER_FPS,
+)
+from evealert.settings.helper import lazy_import
+
+cv = lazy_import("cv2")
+np = lazy_import("numpy")
+
+logger = logging.getLogger("tools")
+
+# (x, y, width, height) boxes of a frame
+Rectangles = Iterable[Tuple[int, int, int, int]]
+
+
+def draw_rectangles(haystack_img: "np.ndarray", rectangles: Rectangles) -> "np.ndarray":
+    """Draw detection boxes on one copy of a frame.
+
+    Args:
+        haystack_img: Captured frame (BGR or grayscale)
+        rectangles: Boxes as (x, y, width, height)
+
+    Returns:
+        New BGR image with the boxes
+    """
+    if len(haystack_img.shape) == 2:
+        image = cv.cvtColor(haystack_img, cv.COLOR_GRAY2BGR)
+    else:
+        image = np.ascontiguousarray(haystack_img).copy()
+    for x, y, w, h in rectangles:
+        cv.rectangle(
+            image,
+            (int(x), int(y)),
+            (int(x + w), int(y + h)),
+            color=CV_DETECTION_COLOR,
+            lineType=CV_LINE_TYPE,
+            thickness=CV_RECTANGLE_THICKNESS,
+        )
+    return image
+
+
+class DebugRenderer:
+    """Shows the debug windows of the Vision handlers on its own thread.
+
+    The thread starts with the first submitted frame and stops with
+    ``stop()``.
+
+    Attributes:
+        fps: Maximum frames shown per second and window
+    """
+
+    def __init__(self, fps: float = DEBUG_RENDER_FPS) -> None:
+        """Initialize the renderer.
+
+        Args:
+            fps: Maximum frames shown per second and window
+        """
+        self.fps = fps
+        # Latest frame per window, None once it was shown
+        self._frames: Dict[str, Optional[Tuple[np.ndarray, list]]] = {}
+        self._closing: Set[str] = set()
+        self._open: Set[str] = set()
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def interval(self) -> float:
+        """Seconds between two shown frames."""
+        return 1.0 / max(self.fps, 0.1)
+
+    @property
+    def is_running(self) -> bool:
+        """Returns True if the renderer thread is running."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def submit(
+        self, window: str, haystack_img: "np.ndarray", rectangles: Rectangles
+    ) -> None:
+        """Queue a frame for a window, replacing a frame not shown yet.
+
+        The frame is not copied, it must not be changed afterwards.
+
+        Args:
+            window: Window name
+            haystack_img: Captured frame
+            rectangles: Detection boxes as (x, y, width, height)
+        """
+        with self._lock:
+            self._closing.discard(window)
+            self._frames[window] = (haystack_img, list(rectangles))
+            if self._thread is None:
+                self._stopped.clear()
+                self._thread = threading.Thread(
+                    target=self._run, name="debug-renderer", daemon=True
+                )
+                self._thread.start()
+        self._wake.set()
+
+    def close(self, window: str) -> None:
+        """Close a window.
+
+        Args:
+            window: Window name
+        """
+        with self._lock:
+            if window not in self._frames and window not in self._open:
+                return
+            self._frames.pop(window, None)
+            self._closing.add(window)
+        self._wake.set()
+
+    def stop(self, timeout: float = 1.0) -> None:
+        """Close all windows and stop the renderer thread.
+
+        Args:
+            timeout: Seconds to wait for the thread
+        """
+        with self._lock:
+            self._closing.update(self._open, self._frames)
+            self._frames.clear()
+            thread, self._thread = self._thread, None
+        self._stopped.set()
+        self._wake.set()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+
+    def _take(self) -> Tuple[Dict[str, Tuple["np.ndarray", list]], Set[str]]:
+        """Take the frames to show and the windows to close."""
+        with self._lock:
+            frames = {
+                window: frame
+                for window, frame in self._frames.items()
+                if frame is not None
+            }
+            for window in frames:
+                self._frames[window] = None
+            closing = self._closing
+            self._closing = set()
+        return frames, closing
+
+    def _run(self) -> None:
+        """Renderer thread: show the latest frames at the configured FPS."""
+        while True:
+            started = time.monotonic()
+            frames, closing = self._take()
+
+            for window in closing:
+                self._destroy(window)
+            for window, (haystack_img, rectangles) in frames.items():
+                try:
+                    cv.imshow(window, draw_rectangles(haystack_img, rectangles))
+                    with self._lock:
+                        self._open.add(window)
+                except Exception as e:
+                    logger.error("Debug Window Error (%s): %s", window, e)
+            if self._open:
+                try:
+                    cv.waitKey(1)
+                except Exception as e:
+                    logger.error("Debug Window Error: %s", e)
+
+            with self._lock:
+                if self._thread is not threading.current_thread():
+                    leftover = self._closing | self._open
+                    self._closing = set()
+                    break
+                idle = not self._open
+
+            # Throttle to the FPS, open windows still get their events
+            # pumped by waitKey on every round
+            self._stopped.wait(max(started + self.interval - time.monotonic(), 0))
+            if idle:
+                self._wake.wait()
+            self._wake.clear()
+
+        for window in leftover:
+            self._destroy(window)
+
+    def _destroy(self, window: str) -> None:
+        """Destroy a window on the renderer thread."""
+        with self._lock:
+            self._open.discard(window)
+        try:
+            cv.destroyWindow(window)
+        except Exception as e:
+            logger.debug("Debug Window %s already closed: %s", window, e)
+
+
+_default_renderer: Optional[DebugRenderer] = None
+_default_lock = threading.Lock()
+
+
+def default_renderer() -> DebugRenderer:
+    """Get the renderer shared by Vision handlers without their own."""
+    # pylint: disable=global-statement
+    global _default_renderer
+    with _default_lock:
+        if _default_renderer is None:
+            _default_renderer = DebugRenderer()
+        return _default_renderer
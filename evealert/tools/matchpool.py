@@ -0,0 +1,249 @@
+"""Process pool backend for template matching.
+
+With many regions a single process saturates one core, even with the
+matching spread over threads. ``ProcessMatcher`` runs the matching in a
+pool of worker processes instead:
+
+- Frames are copied into one ``multiprocessing.shared_memory`` block per
+  region, only the block name and a few parameters are sent to a worker,
+  so no image data is pickled
+- Every worker preloads the templates once when it starts (from the
+  on-disk template cache) and reloads them only when the template set
+  changes
+- The worker returns the match center points and the best match score
+  of the region
+"""
+
+import logging
+import os
+import threading
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context, shared_memory
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from evealert.constants import CV_MATCH_METHOD, MATCH_POOL_TIMEOUT
+from evealert.exceptions import RegionSizeError
+from evealert.settings.helper import lazy_import
+from evealert.tools.templates import TemplateIndex
+from evealert.tools.vision import (
+    match_template_scored,
+    normalize_haystack,
+    rectangle_centers,
+)
+
+np = lazy_import("numpy")
+
+logger = logging.getLogger("tools")
+
+# Template paths by prefix
+TemplateSets = Dict[str, List[str]]
+
+# Worker process state
+_worker_index: Optional[TemplateIndex] = None
+_worker_templates: Dict[str, Tuple[int, List["np.ndarray"]]] = {}
+# Attached frame blocks by region key
+_worker_frames: Dict[str, shared_memory.SharedMemory] = {}
+
+
+def _load_worker_templates(template_sets: TemplateSets, version: int) -> None:
+    """Load the templates of a worker process."""
+    for prefix, paths in template_sets.items():
+        arrays = []
+        for path in paths:
+            try:
+                arrays.append(_worker_index.load(path))
+            except Exception as e:
+                logger.error("Worker could not load template %s: %s", path, e)
+        _worker_templates[prefix] = (version, arrays)
+
+
+def _init_worker(
+    folder: str, cache_dir: Optional[str], template_sets: TemplateSets
+) -> None:
+    """Preload the templates when a worker process starts."""
+    # pylint: disable=global-statement
+    global _worker_index
+    _worker_index = TemplateIndex(folder, prefixes=template_sets, cache_dir=cache_dir)
+    _worker_index.scan()
+    _load_worker_templates(template_sets, 0)
+
+
+def _attach_frame(key: str, name: str) -> shared_memory.SharedMemory:
+    """Attach the frame block of a region (cached per worker).
+
+    The parent replaces the block of a region when a frame outgrows it,
+    the previous block of the region is closed then.
+    """
+    block = _worker_frames.get(key)
+    if block is not None and block.name != name:
+        block.close()
+        block = None
+    if block is None:
+        block = shared_memory.SharedMemory(name=name)
+        _worker_frames[key] = block
+    return block
+
+
+def _match_worker(
+    key: str,
+    frame_name: str,
+    shape: Tuple[int, ...],
+    dtype: str,
+    prefix: str,
+    template_set: Tuple[int, Sequence[str]],
+    method: int,
+    threshold: float,
+) -> Tuple[List[Tuple[int, int]], float]:
+    """Match the templates of a prefix in a shared memory frame."""
+    version, paths = template_set
+    cached = _worker_templates.get(prefix)
+    if cached is None or cached[0] != version:
+        _worker_index.scan()
+        _load_worker_templates({prefix: list(paths)}, version)
+    templates = _worker_templates[prefix][1]
+
+    block = _attach_frame(key, frame_name)
+    haystack = np.ndarray(shape, dtype=np.dtype(dtype), buffer=block.buf)
+    haystack_norm = normalize_haystack(haystack)
+
+    points = []
+    best_score = 0.0
+    for template in templates:
+        if (
+            haystack_norm.shape[0] < template.shape[0]
+            or haystack_norm.shape[1] < template.shape[1]
+        ):
+            raise RegionSizeError(
+                f"Detection {key} Error: Region is smaller than Detection Region please make a larger Area."
+            )
+        rectangles, score = match_template_scored(
+            haystack_norm, template, method, threshold
+        )
+        best_score = max(best_score, score)
+        points.extend(rectangle_centers(rectangles))
+    return points, best_score
+
+
+class ProcessMatcher:
+    """Runs template matching for the regions in worker processes.
+
+    ``match()`` blocks until the worker finished, so it is meant to be
+    called from the vision worker threads of the Alert Agent.
+
+    Attributes:
+        workers: Number of worker processes
+        method: OpenCV template matching method
+        scores: Best match score in percent of the last frame per key
+    """
+
+    def __init__(
+        self,
+        folder: str,
+        template_sets: TemplateSets,
+        cache_dir: Optional[str] = None,
+        workers: int = 0,
+        method: int = CV_MATCH_METHOD,
+    ) -> None:
+        """Start the worker processes.
+
+        Args:
+            folder: Template image folder
+            template_sets: Template paths by prefix, preloaded by every worker
+            cache_dir: On-disk template cache shared with the workers
+            workers: Number of worker processes (0 = number of CPUs)
+            method: OpenCV template matching method
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.method = method
+        self.scores: Dict[str, float] = {}
+        self._template_sets = {
+            prefix: (0, tuple(paths)) for prefix, paths in template_sets.items()
+        }
+        self._version = 0
+        self._frames: Dict[str, shared_memory.SharedMemory] = {}
+        self._lock = threading.Lock()
+        # Spawned workers don't inherit the GUI and capture threads
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(str(folder), cache_dir and str(cache_dir), template_sets),
+        )
+
+    def set_templates(self, template_sets: TemplateSets) -> None:
+        """Replace the template sets, workers reload them on their next match.
+
+        Args:
+            template_sets: Template paths by prefix
+        """
+        with self._lock:
+            self._version += 1
+            for prefix, paths in template_sets.items():
+                self._template_sets[prefix] = (self._version, tuple(paths))
+
+    def _frame_block(self, key: str, nbytes: int) -> shared_memory.SharedMemory:
+        """Get the shared memory block of a region, sized for a frame."""
+        with self._lock:
+            block = self._frames.get(key)
+            if block is not None and block.size >= nbytes:
+                return block
+            if block is not None:
+                block.close()
+                block.unlink()
+            block = shared_memory.SharedMemory(
+                name=f"evealert_{os.getpid()}_{uuid.uuid4().hex[:12]}",
+                create=True,
+                size=nbytes,
+            )
+            self._frames[key] = block
+            return block
+
+    def match(
+        self, key: str, frame: "np.ndarray", prefix: str, threshold: float
+    ) -> List[Tuple[int, int]]:
+        """Match the templates of a prefix in a frame.
+
+        Frames of the same key must not be matched concurrently.
+
+        Args:
+            key: Region name, each region gets its own shared memory block
+            frame: Screenshot of the region
+            prefix: Template prefix to match
+            threshold: Detection threshold in percent
+
+        Returns:
+            Center points of the matches
+
+        Raises:
+            RegionSizeError: The frame is smaller than a template
+        """
+        frame = np.ascontiguousarray(frame)
+        block = self._frame_block(key, frame.nbytes)
+        np.ndarray(frame.shape, dtype=frame.dtype, buffer=block.buf)[:] = frame
+
+        future = self._executor.submit(
+            _match_worker,
+            key,
+            block.name,
+            frame.shape,
+            frame.dtype.str,
+            prefix,
+            self._template_sets[prefix],
+            self.method,
+            threshold,
+        )
+        points, self.scores[key] = future.result(timeout=MATCH_POOL_TIMEOUT)
+        return points
+
+    def close(self) -> None:
+        """Stop the workers and release the shared memory blocks."""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        with self._lock:
+            for block in self._frames.values():
+                block.close()
+                try:
+                    block.unlink()
+                except FileNotFoundError:
+                    pass
+            self._frames.clear()
@@ -0,0 +1,97 @@
+"""Cached monitor topology.
+
+``screeninfo.get_monitors()`` enumerates the displays on every call. The
+monitor layout rarely changes, so ``MonitorCache`` keeps the last result
+until it is invalidated (e.g. on a display change) or older than
+``max_age`` seconds.
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Callable, List, Optional
+
+from evealert.constants import MONITOR_CACHE_MAX_AGE
+from evealert.settings.helper import lazy_import
+
+screeninfo = lazy_import("screeninfo")
+
+logger = logging.getLogger("tools")
+
+
+def _get_monitors() -> List[Any]:
+    """Enumerate the monitors with screeninfo."""
+    return screeninfo.get_monitors()
+
+
+class MonitorCache:
+    """Caches the monitor list between display changes.
+
+    Attributes:
+        max_age: Seconds after which the monitors are enumerated again
+        refreshes: Number of times the monitors were enumerated
+    """
+
+    def __init__(
+        self,
+        max_age: float = MONITOR_CACHE_MAX_AGE,
+        provider: Callable[[], List[Any]] = _get_monitors,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the monitor cache.
+
+        Args:
+            max_age: Seconds after which the monitors are enumerated again
+            provider: Returns the current monitors (screeninfo by default)
+            clock: Time source in seconds
+        """
+        self.max_age = max_age
+        self.provider = provider
+        self.clock = clock
+        self.refreshes = 0
+        self._monitors: Optional[List[Any]] = None
+        self._updated = 0.0
+        self._stale = True
+        self._lock = threading.Lock()
+
+    def invalidate(self) -> None:
+        """Enumerate the monitors again on the next lookup."""
+        with self._lock:
+            self._stale = True
+
+    def monitors(self) -> List[Any]:
+        """Get the monitors, enumerating them only when the cache is stale.
+
+        Returns:
+            List of monitors with x, y, width and height
+        """
+        with self._lock:
+            now = self.clock()
+            if self._stale or now - self._updated >= self.max_age:
+                try:
+                    self._monitors = list(self.provider())
+                except Exception as e:
+                    logger.error("Monitor Enumeration Error: %s", e)
+                    self._monitors = self._monitors or []
+                self._updated = now
+                self._stale = False
+                self.refreshes += 1
+            return self._monitors
+
+    def monitor_at(self, x: int, y: int) -> Optional[Any]:
+        """Get the monitor containing a screen position.
+
+        Args:
+            x: Screen x coordinate
+            y: Screen y coordinate
+
+        Returns:
+            Monitor object or None if not found
+        """
+        for monitor in self.monitors():
+            if (
+                monitor.x <= x <= monitor.x + monitor.width
+                and monitor.y <= y <= monitor.y + monitor.height
+            ):
+                return monitor
+        return None
@@ -0,0 +1,185 @@
+"""Startup profiler for EVE Alert.
+
+Records how long each module import takes and when the main startup
+phases are reached, to find what delays the first window. Enabled with
+``--profile-startup`` or the ``EVEALERT_PROFILE_STARTUP`` environment
+variable.
+"""
+
+import builtins
+import importlib.util
+import os
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence, TextIO, Tuple
+
+PROFILE_STARTUP_FLAG = "--profile-startup"
+PROFILE_STARTUP_ENV = "EVEALERT_PROFILE_STARTUP"
+
+
+def profile_startup_requested(argv: Optional[Sequence[str]] = None) -> bool:
+    """Check if the startup profile mode was requested.
+
+    Args:
+        argv: Command line arguments (defaults to sys.argv)
+
+    Returns:
+        True if the flag or the environment variable is set
+    """
+    argv = sys.argv if argv is None else argv
+    if PROFILE_STARTUP_FLAG in argv:
+        return True
+    return os.environ.get(PROFILE_STARTUP_ENV, "") not in ("", "0")
+
+
+@dataclass
+class ImportTiming:
+    """Import time of a single module.
+
+    Attributes:
+        name: Module name
+        cumulative: Seconds including the imports it triggered
+        self_time: Seconds spent in the module itself
+    """
+
+    name: str
+    cumulative: float
+    self_time: float
+
+
+class StartupProfiler:
+    """Measures import times and startup phases.
+
+    Wraps ``builtins.__import__`` while running and records every module
+    that is loaded for the first time. Only imports made from the thread
+    that started the profiler are measured.
+
+    Attributes:
+        imports: Import timings by module name
+        marks: Startup phases as (label, seconds since start)
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter) -> None:
+        """Initialize the profiler.
+
+        Args:
+            clock: Monotonic clock returning seconds
+        """
+        self.clock = clock
+        self.started = clock()
+        self.imports: Dict[str, ImportTiming] = {}
+        self.marks: List[Tuple[str, float]] = []
+        # Time spent in nested imports, one entry per active import
+        self._stack: List[float] = []
+        self._original_import = None
+        self._thread_id: Optional[int] = None
+
+    @property
+    def is_running(self) -> bool:
+        """Check if the import hook is installed."""
+        return self._original_import is not None
+
+    def start(self) -> None:
+        """Install the import hook."""
+        if self.is_running:
+            return
+        self.started = self.clock()
+        self._thread_id = threading.get_ident()
+        self._original_import = builtins.__import__
+        builtins.__import__ = self._import
+
+    def stop(self) -> None:
+        """Remove the import hook."""
+        if not self.is_running:
+            return
+        builtins.__import__ = self._original_import
+        self._original_import = None
+
+    def mark(self, label: str) -> float:
+        """Record a startup phase.
+
+        Args:
+            label: Name of the phase (e.g. "first window")
+
+        Returns:
+            Seconds since the profiler was started
+        """
+        elapsed = self.clock() - self.started
+        self.marks.append((label, elapsed))
+        return elapsed
+
+    def _import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        """Measure an import if it loads a new module."""
+        # pylint: disable=redefined-builtin
+        original = self._original_import
+        if threading.get_ident() != self._thread_id:
+            return original(name, globals, locals, fromlist, level)
+
+        module_name = name
+        if level:
+            package = (globals or {}).get("__package__") or ""
+            try:
+                module_name = importlib.util.resolve_name("." * level + name, package)
+            except (ImportError, ValueError):
+                return original(name, globals, locals, fromlist, level)
+        if module_name in sys.modules:
+            return original(name, globals, locals, fromlist, level)
+
+        self._stack.append(0.0)
+        start = self.clock()
+        try:
+            return original(name, globals, locals, fromlist, level)
+        finally:
+            elapsed = self.clock() - start
+            nested = self._stack.pop()
+            if self._stack:
+                self._stack[-1] += elapsed
+            self.imports.setdefault(
+                module_name, ImportTiming(module_name, elapsed, elapsed - nested)
+            )
+
+    def top_imports(self, limit: int = 20) -> List[ImportTiming]:
+        """Get the slowest imports by cumulative time.
+
+        Args:
+            limit: Maximum number of entries
+
+        Returns:
+            Import timings sorted by cumulative time
+        """
+        timings = sorted(
+            self.imports.values(), key=lambda timing: timing.cumulative, reverse=True
+        )
+        return timings[:limit]
+
+    def report(self, limit: int = 20) -> str:
+        """Format the startup phases and the slowest imports.
+
+        Args:
+            limit: Maximum number of imports to list
+
+        Returns:
+            Human readable report
+        """
+        lines = ["Startup profile", "", "Phases:"]
+        for label, elapsed in self.marks:
+            lines.append(f"  {elapsed * 1000:9.1f} ms  {label}")
+        lines += ["", f"Imports (top {limit} of {len(self.imports)}):"]
+        lines.append(f"  {'cumulative':>12}  {'self':>10}  module")
+        for timing in self.top_imports(limit):
+            lines.append(
+                f"  {timing.cumulative * 1000:9.1f} ms"
+                f"  {timing.self_time * 1000:7.1f} ms  {timing.name}"
+            )
+        return "\n".join(lines)
+
+    def print_report(self, limit: int = 20, file: Optional[TextIO] = None) -> None:
+        """Print the report.
+
+        Args:
+            limit: Maximum number of imports to list
+            file: Output stream (defaults to sys.stderr)
+        """
+        print(self.report(limit), file=file or sys.stderr)
@@ -0,0 +1,314 @@
+"""Synthetic EVE local member lists for tests and benchmarks.
+
+``LocalListGenerator`` composes local member list frames from the bundled
+``image_*`` (standing icons) and ``faction_*`` (NPC names) templates,
+without a game client. Every frame comes with the boxes of the pasted
+templates as ground truth labels.
+
+A frame is rendered in these steps, each controlled by ``LocalListConfig``:
+
+1. Rows of pilot names (bands of light noise); hostile rows get a standing
+   icon in front of the name, faction rows a faction template
+2. Icons are partly covered (``occlusion``)
+3. The visible part of the list is cut out at the scroll position
+   (``visible_rows``, ``scroll``)
+4. The frame is resized to the UI scale (``scale``)
+5. Sensor noise (``noise``) and JPEG artefacts (``jpeg_quality``) are added
+"""
+
+import os
+from dataclasses import dataclass, field, replace
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from evealert.constants import (
+    ALERT_IMAGE_PREFIX,
+    FACTION_IMAGE_PREFIX,
+    IMG_FOLDER,
+    TEMPLATE_EXTENSIONS,
+)
+from evealert.settings.helper import get_resource_path, lazy_import
+
+cv = lazy_import("cv2")
+
+LABEL_ENEMY = "enemy"
+LABEL_FACTION = "faction"
+
+BACKGROUND = 24  # Gray value of the list background
+ROW_STRIPE = 4  # Brightness difference of every second row
+NAME_OFFSET = 24  # X position of the pilot names
+ICON_OFFSET = 4  # X position of the icons
+
+
+@dataclass
+class LocalListConfig:
+    """Appearance of a synthetic local member list.
+
+    Attributes:
+        rows: Pilots in the list
+        hostiles: Rows with an enemy standing icon
+        factions: Rows with a faction template
+        width: List width in pixels (at scale 1.0)
+        row_height: Row height in pixels (at scale 1.0)
+        visible_rows: Rows shown in the frame (None shows the whole list)
+        scroll: Scroll position of the list in pixels (at scale 1.0)
+        scroll_step: Pixels scrolled per frame by LocalListGenerator.frames()
+        scale: UI scale the frame is resized to
+        noise: Standard deviation of the added Gaussian noise
+        jpeg_quality: JPEG quality for compression artefacts (None: lossless)
+        occlusion: Share of every icon's width that is covered (0.0 - 1.0)
+        seed: Random seed of the list layout
+    """
+
+    rows: int = 25
+    hostiles: int = 3
+    factions: int = 0
+    width: int = 250
+    row_height: int = 20
+    visible_rows: Optional[int] = None
+    scroll: int = 0
+    scroll_step: int = 0
+    scale: float = 1.0
+    noise: float = 0.0
+    jpeg_quality: Optional[int] = None
+    occlusion: float = 0.0
+    seed: int = 0
+
+
+@dataclass
+class Label:
+    """Ground truth of a template pasted into a frame.
+
+    Attributes:
+        kind: LABEL_ENEMY or LABEL_FACTION
+        template: File name of the template
+        box: Box in the frame as (x, y, width, height)
+        visible: Share of the template that is visible (0.0 - 1.0)
+    """
+
+    kind: str
+    template: str
+    box: Tuple[int, int, int, int]
+    visible: float = 1.0
+
+    @property
+    def center(self) -> Tuple[float, float]:
+        """Center of the box as (x, y)."""
+        x, y, w, h = self.box
+        return x + w / 2, y + h / 2
+
+
+@dataclass
+class SyntheticFrame:
+    """A generated frame and its labels.
+
+    Attributes:
+        image: BGR frame
+        labels: Pasted templates that are at least partly visible
+        config: Configuration the frame was generated with
+    """
+
+    image: np.ndarray
+    labels: List[Label] = field(default_factory=list)
+    config: Optional[LocalListConfig] = None
+
+
+def _read_templates(paths: Sequence[str]) -> List[Tuple[str, np.ndarray]]:
+    """Read template images as BGR without the alpha channel."""
+    templates = []
+    for path in paths:
+        image = cv.imread(path, cv.IMREAD_COLOR)
+        if image is None:
+            raise ValueError(f"Template image could not be read: {path}")
+        templates.append((os.path.basename(path), image))
+    return templates
+
+
+def template_paths(folder: str, prefix: str) -> List[str]:
+    """Get the sorted template images of a prefix in a folder.
+
+    Args:
+        folder: Template folder
+        prefix: File name prefix (e.g. ALERT_IMAGE_PREFIX)
+
+    Returns:
+        Template paths
+    """
+    return sorted(
+        os.path.join(folder, name)
+        for name in os.listdir(folder)
+        if name.startswith(prefix) and name.lower().endswith(TEMPLATE_EXTENSIONS)
+    )
+
+
+class LocalListGenerator:
+    """Generates synthetic local member list frames.
+
+    Attributes:
+        enemy_templates: (file name, BGR image) of the standing icons
+        faction_templates: (file name, BGR image) of the faction templates
+    """
+
+    def __init__(
+        self,
+        enemy_paths: Optional[Sequence[str]] = None,
+        faction_paths: Optional[Sequence[str]] = None,
+    ) -> None:
+        """Read the templates.
+
+        Args:
+            enemy_paths: Standing icon templates (default: bundled image_*)
+            faction_paths: Faction templates (default: bundled faction_*)
+        """
+        folder = get_resource_path(IMG_FOLDER)
+        if enemy_paths is None:
+            enemy_paths = template_paths(folder, ALERT_IMAGE_PREFIX)
+        if faction_paths is None:
+            faction_paths = template_paths(folder, FACTION_IMAGE_PREFIX)
+        self.enemy_templates = _read_templates(enemy_paths)
+        self.faction_templates = _read_templates(faction_paths)
+
+    def _render_list(self, config: LocalListConfig) -> Tuple[np.ndarray, List[Label]]:
+        """Render the whole list at scale 1.0."""
+        rng = np.random.default_rng(config.seed)
+        rows = config.rows
+        factions = min(config.factions, rows) if self.faction_templates else 0
+        hostiles = min(config.hostiles, rows - factions) if self.enemy_templates else 0
+        special = rng.choice(rows, hostiles + factions, replace=False)
+        kinds = {int(row): LABEL_ENEMY for row in special[:hostiles]}
+        kinds.update({int(row): LABEL_FACTION for row in special[hostiles:]})
+
+        # Faction rows are as high as their template
+        heights = []
+        for row in range(rows):
+            height = config.row_height
+            if kinds.get(row) == LABEL_FACTION:
+                template = self.faction_templates[row % len(self.faction_templates)]
+                height = max(height, template[1].shape[0] + 4)
+            heights.append(height)
+
+        canvas = np.full((sum(heights), config.width, 3), BACKGROUND, dtype=np.uint8)
+        labels = []
+        top = 0
+        for row, height in enumerate(heights):
+            if row % 2:
+                canvas[top : top + height] += ROW_STRIPE
+            kind = kinds.get(row)
+            if kind == LABEL_FACTION:
+                name, image = self.faction_templates[row % len(self.faction_templates)]
+            else:
+                name_width = int(rng.integers(60, max(config.width - 40, 61)))
+                name_width = min(name_width, config.width - NAME_OFFSET)
+                band = min(10, height - 2)
+                y = top + (height - band) // 2
+                canvas[y : y + band, NAME_OFFSET : NAME_OFFSET + name_width] = (
+                    rng.integers(80, 200, (band, name_width, 3), dtype=np.uint8)
+                )
+                if kind != LABEL_ENEMY:
+                    top += height
+                    continue
+                name, image = self.enemy_templates[
+                    int(rng.integers(len(self.enemy_templates)))
+                ]
+            icon_h, icon_w = image.shape[:2]
+            icon_w = min(icon_w, config.width - ICON_OFFSET)
+            y = top + (height - icon_h) // 2
+            canvas[y : y + icon_h, ICON_OFFSET : ICON_OFFSET + icon_w] = image[
+                :, :icon_w
+            ]
+            covered = int(round(icon_w * min(max(config.occlusion, 0.0), 1.0)))
+            if covered:
+                canvas[
+                    y : y + icon_h,
+                    ICON_OFFSET + icon_w - covered : ICON_OFFSET + icon_w,
+                ] = BACKGROUND
+            labels.append(
+                Label(
+                    kind, name, (ICON_OFFSET, y, icon_w, icon_h), 1 - covered / icon_w
+                )
+            )
+            top += height
+        return canvas, labels
+
+    def frame(
+        self, config: Optional[LocalListConfig] = None, index: int = 0
+    ) -> SyntheticFrame:
+        """Generate a frame.
+
+        Args:
+            config: List appearance (default: LocalListConfig())
+            index: Frame number, seeds the noise of the frame
+
+        Returns:
+            SyntheticFrame with the frame and its labels
+        """
+        config = config or LocalListConfig()
+        canvas, labels = self._render_list(config)
+
+        # Cut out the visible rows at the scroll position
+        if config.visible_rows is not None:
+            view = min(config.visible_rows * config.row_height, canvas.shape[0])
+            top = min(max(config.scroll, 0), canvas.shape[0] - view)
+            canvas = canvas[top : top + view]
+            labels = _clip_labels(labels, top, view)
+
+        image = canvas
+        if config.scale != 1.0:
+            size = (
+                max(int(round(canvas.shape[1] * config.scale)), 1),
+                max(int(round(canvas.shape[0] * config.scale)), 1),
+            )
+            interpolation = cv.INTER_AREA if config.scale < 1.0 else cv.INTER_LINEAR
+            image = cv.resize(canvas, size, interpolation=interpolation)
+            labels = [
+                replace(
+                    label,
+                    box=tuple(int(round(value * config.scale)) for value in label.box),
+                )
+                for label in labels
+            ]
+
+        if config.noise > 0:
+            rng = np.random.default_rng((config.seed, index))
+            noisy = image.astype(np.float32) + rng.normal(0, config.noise, image.shape)
+            image = np.clip(noisy, 0, 255).astype(np.uint8)
+        if config.jpeg_quality is not None:
+            _, encoded = cv.imencode(
+                ".jpg", image, [cv.IMWRITE_JPEG_QUALITY, int(config.jpeg_quality)]
+            )
+            image = cv.imdecode(encoded, cv.IMREAD_COLOR)
+        return SyntheticFrame(np.ascontiguousarray(image), labels, config)
+
+    def frames(
+        self, config: Optional[LocalListConfig] = None, count: int = 1
+    ) -> Iterator[SyntheticFrame]:
+        """Generate frames of a list scrolling by config.scroll_step.
+
+        Args:
+            config: List appearance (default: LocalListConfig())
+            count: Number of frames
+
+        Yields:
+            SyntheticFrame per frame
+        """
+        config = config or LocalListConfig()
+        for index in range(count):
+            scrolled = replace(
+                config, scroll=config.scroll + index * config.scroll_step
+            )
+            yield self.frame(scrolled, index)
+
+
+def _clip_labels(labels: List[Label], top: int, height: int) -> List[Label]:
+    """Move labels into a cut out view, dropping the invisible ones."""
+    clipped = []
+    for label in labels:
+        x, y, w, h = label.box
+        y1 = max(y - top, 0)
+        y2 = min(y - top + h, height)
+        if y2 <= y1:
+            continue
+        visible = label.visible * (y2 - y1) / h
+        clipped.append(replace(label, box=(x, y1, w, y2 - y1), visible=visible))
+    return clipped
@@ -0,0 +1,285 @@
+"""Template index for the EVE Alert image folder.
+
+Tracks the template images in the ``img/`` folder by prefix, mtime and
+content hash and keeps their preprocessed arrays in a persistent on-disk
+cache, so a restart doesn't need to decode the PNG/JPG files again. The
+folder is polled at runtime to pick up added, modified or removed templates.
+"""
+
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Union
+
+from evealert.constants import (
+    ALERT_IMAGE_PREFIX,
+    FACTION_IMAGE_PREFIX,
+    TEMPLATE_CACHE_VERSION,
+    TEMPLATE_EXTENSIONS,
+    TEMPLATE_POLL_INTERVAL,
+)
+from evealert.settings.helper import lazy_import
+from evealert.tools.vision import load_template
+
+np = lazy_import("numpy")
+
+logger = logging.getLogger("tools")
+
+
+def file_digest(path: Union[str, Path]) -> str:
+    """Calculate the SHA-256 digest of a file.
+
+    Args:
+        path: Path to the file
+
+    Returns:
+        Hex digest of the file content
+    """
+    sha = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(65536), b""):
+            sha.update(chunk)
+    return sha.hexdigest()
+
+
+@dataclass
+class TemplateEntry:
+    """A template image tracked by the index.
+
+    Attributes:
+        path: Absolute path to the image
+        prefix: Template prefix the file name starts with
+        mtime_ns: Modification time in nanoseconds
+        size: File size in bytes
+        digest: SHA-256 digest of the file content
+    """
+
+    path: str
+    prefix: str
+    mtime_ns: int
+    size: int
+    digest: str
+
+
+@dataclass
+class TemplateChanges:
+    """Result of a template folder scan.
+
+    Attributes:
+        added: Paths of new templates
+        modified: Paths of templates whose content changed
+        removed: Paths of templates that were deleted
+    """
+
+    added: List[str] = field(default_factory=list)
+    modified: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.modified or self.removed)
+
+
+class TemplateIndex:
+    """Incremental index of the template images in a folder.
+
+    Attributes:
+        folder: Folder containing the template images
+        prefixes: Tracked template prefixes
+        cache_dir: Folder for the preprocessed template cache (None disables it)
+        poll_interval: Minimum time between two scans in poll()
+    """
+
+    def __init__(
+        self,
+        folder: Union[str, Path],
+        prefixes: Iterable[str] = (ALERT_IMAGE_PREFIX, FACTION_IMAGE_PREFIX),
+        cache_dir: Optional[Union[str, Path]] = None,
+        poll_interval: float = TEMPLATE_POLL_INTERVAL,
+    ) -> None:
+        """Initialize the template index.
+
+        Args:
+            folder: Folder containing the template images
+            prefixes: Tracked template prefixes
+            cache_dir: Folder for the preprocessed template cache
+            poll_interval: Minimum time between two scans in poll()
+        """
+        self.folder = Path(folder)
+        self.prefixes = tuple(prefixes)
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.poll_interval = poll_interval
+        self.entries: Dict[str, TemplateEntry] = {}
+        # Preprocessed templates by content digest
+        self._arrays: Dict[str, np.ndarray] = {}
+        self._last_scan = 0.0
+        self._lock = threading.RLock()
+
+    def files(self, prefix: str) -> List[str]:
+        """Get the template paths for a prefix.
+
+        Args:
+            prefix: Template prefix (e.g. ALERT_IMAGE_PREFIX)
+
+        Returns:
+            Sorted list of template paths
+        """
+        with self._lock:
+            return sorted(
+                entry.path for entry in self.entries.values() if entry.prefix == prefix
+            )
+
+    def _match_prefix(self, filename: str) -> Optional[str]:
+        """Get the tracked prefix of a file name, if any."""
+        if not filename.lower().endswith(TEMPLATE_EXTENSIONS):
+            return None
+        for prefix in self.prefixes:
+            if filename.startswith(prefix):
+                return prefix
+        return None
+
+    def scan(self) -> TemplateChanges:
+        """Scan the folder and update the index.
+
+        Files are only hashed when their mtime or size changed.
+
+        Returns:
+            Added, modified and removed templates
+        """
+        changes = TemplateChanges()
+        with self._lock:
+            self._last_scan = time.monotonic()
+            seen = set()
+            try:
+                dir_entries = list(os.scandir(self.folder))
+            except OSError as e:
+                logger.error("Template folder scan failed: %s", e)
+                return changes
+
+            for dir_entry in dir_entries:
+                prefix = self._match_prefix(dir_entry.name)
+                if prefix is None or not dir_entry.is_file():
+                    continue
+                path = os.path.join(self.folder, dir_entry.name)
+                seen.add(path)
+                try:
+                    stat = dir_entry.stat()
+                    entry = self.entries.get(path)
+                    if (
+                        entry is not None
+                        and entry.mtime_ns == stat.st_mtime_ns
+                        and entry.size == stat.st_size
+                    ):
+                        continue
+                    digest = file_digest(path)
+                except OSError as e:
+                    logger.warning("Template %s can't be read: %s", path, e)
+                    continue
+
+                self.entries[path] = TemplateEntry(
+                    path, prefix, stat.st_mtime_ns, stat.st_size, digest
+                )
+                if entry is None:
+                    changes.added.append(path)
+                elif entry.digest != digest:
+                    changes.modified.append(path)
+
+            for path in list(self.entries):
+                if path not in seen:
+                    del self.entries[path]
+                    changes.removed.append(path)
+
+            # Drop arrays of templates that are no longer indexed
+            digests = {entry.digest for entry in self.entries.values()}
+            for digest in list(self._arrays):
+                if digest not in digests:
+                    del self._arrays[digest]
+
+        if changes:
+            logger.info(
+                "Templates changed: %d added, %d modified, %d removed",
+                len(changes.added),
+                len(changes.modified),
+                len(changes.removed),
+            )
+        return changes
+
+    def poll(self) -> TemplateChanges:
+        """Scan the folder if the poll interval has passed.
+
+        Returns:
+            Changes since the last scan (empty if no scan was due)
+        """
+        if time.monotonic() - self._last_scan < self.poll_interval:
+            return TemplateChanges()
+        return self.scan()
+
+    def load(self, path: str) -> "np.ndarray":
+        """Get the preprocessed template for a path.
+
+        Looks in the memory cache, then in the on-disk cache and only
+        decodes the image file if neither has it.
+
+        Args:
+            path: Path to the template image
+
+        Returns:
+            Preprocessed BGR template image
+        """
+        with self._lock:
+            entry = self.entries.get(path)
+            digest = entry.digest if entry is not None else file_digest(path)
+
+            template = self._arrays.get(digest)
+            if template is not None:
+                return template
+
+            template = self._read_cache(digest)
+            if template is None:
+                template = load_template(path)
+                self._write_cache(digest, template)
+            self._arrays[digest] = template
+            return template
+
+    def _cache_file(self, digest: str) -> Optional[Path]:
+        """Get the on-disk cache file for a template digest."""
+        if self.cache_dir is None:
+            return None
+        return self.cache_dir / f"{digest}-v{TEMPLATE_CACHE_VERSION}.npy"
+
+    def _read_cache(self, digest: str) -> Optional["np.ndarray"]:
+        """Read a preprocessed template from the on-disk cache."""
+        cache_file = self._cache_file(digest)
+        if cache_file is None or not cache_file.exists():
+            return None
+        try:
+            return np.load(cache_file, allow_pickle=False)
+        except (OSError, ValueError) as e:
+            logger.warning("Template cache %s is invalid: %s", cache_file.name, e)
+            return None
+
+    def _write_cache(self, digest: str, template: "np.ndarray") -> None:
+        """Write a preprocessed template to the on-disk cache."""
+        cache_file = self._cache_file(digest)
+        if cache_file is None:
+            return
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=cache_file.parent, suffix=".tmp")
+        except OSError as e:
+            logger.warning("Template cache could not be written: %s", e)
+            return
+        try:
+            with os.fdopen(fd, "wb") as tmp_file:
+                np.save(tmp_file, template, allow_pickle=False)
+            os.replace(tmp_path, cache_file)
+        except OSError as e:
+            logger.warning("Template cache could not be written: %s", e)
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
@@ -0,0 +1,286 @@
+"""On-demand profiling of the Alert Agent ticks.
+
+``TickProfiler`` profiles a number of vision ticks of a running agent
+with cProfile and tracemalloc, without restarting it. A capture is
+requested with ``request()`` (hotkey or ``profiling`` setting), starts
+with the next tick and covers everything the event loop runs until the
+last requested tick ended, including the alert loop. Region checks on the
+vision workers are profiled through ``wrap()``.
+
+Once the capture is complete, three files are written on a background
+thread:
+
+- ``profile-<time>.prof``: cProfile statistics (``python -m pstats`` or
+  snakeviz)
+- ``profile-<time>.snapshot``: tracemalloc snapshot
+  (``tracemalloc.Snapshot.load``)
+- ``profile-<time>.txt``: tick times, stage times and the top functions
+  and allocations
+
+Without a requested capture ``tick()`` and ``wrap()`` only check a flag.
+"""
+
+import cProfile
+import io
+import logging
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, TypeVar, Union
+
+from evealert.constants import PROFILE_FRAMES, PROFILE_PREFIX, PROFILE_TOP
+
+logger = logging.getLogger("tools")
+
+T = TypeVar("T")
+
+# From Python 3.12 on cProfile uses sys.monitoring, which sees every thread
+# and allows only one active profiler
+PROFILES_ALL_THREADS = sys.version_info >= (3, 12)
+
+# Stages in the summary, by the module and function measuring them
+PROFILE_STAGES = {
+    "capture": ("windowscapture.py", "get_screenshot_value"),
+    "match": ("vision.py", "vision_process"),
+    "process match": ("matchpool.py", "match"),
+    "region check": ("alertmanager.py", "check_region"),
+    "alarm": ("alertmanager.py", "alarm_detection"),
+    "sound": ("alertmanager.py", "play_sound"),
+    "webhook": ("alertmanager.py", "send_webhook_message"),
+}
+
+
+class _Capture:
+    """State of a running capture."""
+
+    def __init__(self, ticks: int) -> None:
+        self.ticks = ticks
+        self.tick_times: List[float] = []
+        self.profiles: List[cProfile.Profile] = []
+        self.main = cProfile.Profile()
+        self.started = time.time()
+        # tracemalloc is only stopped again if the capture started it
+        self.owns_tracing = not tracemalloc.is_tracing()
+        self.lock = threading.Lock()
+
+
+class TickProfiler:
+    """Profiles a requested number of ticks with cProfile and tracemalloc.
+
+    Attributes:
+        folder: Folder the profiles are written to
+        top: Functions and allocations listed in the summary
+        frames: Traceback frames stored per allocation
+        on_done: Called with the summary path when a profile was written
+    """
+
+    def __init__(
+        self,
+        folder: Union[str, Path],
+        top: int = PROFILE_TOP,
+        frames: int = PROFILE_FRAMES,
+        on_done: Optional[Callable[[Path], None]] = None,
+    ) -> None:
+        """Initialize the profiler.
+
+        Args:
+            folder: Folder the profiles are written to
+            top: Functions and allocations listed in the summary
+            frames: Traceback frames stored per allocation
+            on_done: Called with the summary path when a profile was written
+        """
+        self.folder = Path(folder)
+        self.top = top
+        self.frames = frames
+        self.on_done = on_done
+        self._requested = 0
+        self._capture: Optional[_Capture] = None
+        self._writer: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_active(self) -> bool:
+        """Returns True while a capture is requested or running."""
+        return bool(self._requested) or self._capture is not None
+
+    def request(self, ticks: int) -> bool:
+        """Request a capture of the next ticks.
+
+        Args:
+            ticks: Number of ticks to profile
+
+        Returns:
+            False if a capture is already requested or running
+        """
+        if ticks <= 0:
+            return False
+        with self._lock:
+            if self.is_active:
+                return False
+            self._requested = ticks
+        logger.info("Profiling the next %d ticks", ticks)
+        return True
+
+    @contextmanager
+    def tick(self) -> Iterator[None]:
+        """Profile a tick if a capture is requested or running."""
+        if not self.is_active:
+            yield
+            return
+        capture = self._capture
+        if capture is None:
+            capture = self._start()
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            capture.tick_times.append(time.perf_counter() - started)
+            # A cancelled capture is no longer the current one
+            if len(capture.tick_times) >= capture.ticks and capture is self._capture:
+                self._finish(capture)
+
+    def wrap(self, func: Callable[..., T]) -> Callable[..., T]:
+        """Profile a function run on another thread while capturing.
+
+        Args:
+            func: Function to run, e.g. on a worker pool
+
+        Returns:
+            The function itself, or a profiling wrapper during a capture
+        """
+        capture = self._capture
+        if capture is None or PROFILES_ALL_THREADS:
+            return func
+
+        def profiled(*args, **kwargs):
+            profile = cProfile.Profile()
+            try:
+                return profile.runcall(func, *args, **kwargs)
+            finally:
+                with capture.lock:
+                    capture.profiles.append(profile)
+
+        return profiled
+
+    def cancel(self) -> None:
+        """Drop a requested or running capture without writing it."""
+        with self._lock:
+            self._requested = 0
+            capture, self._capture = self._capture, None
+        if capture is not None:
+            capture.main.disable()
+            if capture.owns_tracing:
+                tracemalloc.stop()
+            logger.info("Profiling cancelled")
+
+    def join(self, timeout: Optional[float] = None) -> None:
+        """Wait until the last profile is written.
+
+        Args:
+            timeout: Maximum seconds to wait
+        """
+        if self._writer is not None:
+            self._writer.join(timeout)
+
+    def _start(self) -> _Capture:
+        """Start cProfile and tracemalloc for the requested ticks."""
+        with self._lock:
+            capture = _Capture(self._requested)
+            self._requested = 0
+            self._capture = capture
+        if capture.owns_tracing:
+            tracemalloc.start(self.frames)
+        capture.main.enable()
+        return capture
+
+    def _finish(self, capture: _Capture) -> None:
+        """Stop the capture and write its files on a background thread."""
+        capture.main.disable()
+        snapshot = tracemalloc.take_snapshot()
+        if capture.owns_tracing:
+            tracemalloc.stop()
+        with self._lock:
+            self._capture = None
+        self._writer = threading.Thread(
+            target=self._write,
+            args=(capture, snapshot),
+            name="tick-profile",
+            daemon=True,
+        )
+        self._writer.start()
+
+    def _write(self, capture: _Capture, snapshot: tracemalloc.Snapshot) -> None:
+        """Write the profile, the snapshot and the summary."""
+        try:
+            self.folder.mkdir(parents=True, exist_ok=True)
+            stamp = time.strftime("%Y%m%d-%H%M%S", time.localtime(capture.started))
+            base = self.folder / f"{PROFILE_PREFIX}-{stamp}"
+            with capture.lock:
+                profiles = [capture.main, *capture.profiles]
+            stats = pstats.Stats(profiles[0], stream=io.StringIO())
+            for profile in profiles[1:]:
+                stats.add(profile)
+            stats.dump_stats(f"{base}.prof")
+            snapshot.dump(f"{base}.snapshot")
+            summary = Path(f"{base}.txt")
+            summary.write_text(self.summary(capture, stats, snapshot), encoding="utf-8")
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.error("Profile could not be written: %s", e, exc_info=True)
+            return
+        logger.info("Profile written to %s", summary)
+        if self.on_done is not None:
+            self.on_done(summary)
+
+    def summary(
+        self, capture: _Capture, stats: pstats.Stats, snapshot: tracemalloc.Snapshot
+    ) -> str:
+        """Summarize the tick times, stages, functions and allocations."""
+        ticks = [value * 1000 for value in capture.tick_times]
+        lines = [
+            f"Profile of {len(ticks)} ticks, started "
+            f"{time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(capture.started))}",
+            f"Tick: mean {sum(ticks) / len(ticks):.1f} ms, max {max(ticks):.1f} ms",
+            "",
+            "Stages (cumulative ms, calls):",
+        ]
+        for stage, (seconds, calls) in self.stage_times(stats).items():
+            lines.append(f"  {stage:<14}{seconds * 1000:>10.1f}{calls:>8}")
+
+        stream = io.StringIO()
+        stats.stream = stream
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(self.top)
+        lines += ["", f"Top {self.top} functions by cumulative time:"]
+        lines += stream.getvalue().strip("\n").splitlines()
+
+        lines += ["", f"Top {self.top} allocations:"]
+        lines += [
+            f"  {statistic}" for statistic in snapshot.statistics("lineno")[: self.top]
+        ]
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def stage_times(stats: pstats.Stats) -> Dict[str, tuple]:
+        """Cumulative seconds and calls of the PROFILE_STAGES functions.
+
+        Args:
+            stats: Profile statistics
+
+        Returns:
+            (seconds, calls) by stage, only stages that were called
+        """
+        totals: Dict[str, List[float]] = {}
+        stages = {function: stage for stage, function in PROFILE_STAGES.items()}
+        # pylint: disable=no-member
+        for (path, _, func), (_, calls, _, cumulative, _) in stats.stats.items():
+            stage = stages.get((Path(path).name, func))
+            if stage is not None:
+                total = totals.setdefault(stage, [0.0, 0])
+                total[0] += cumulative
+                total[1] += calls
+        return {
+            stage: tuple(totals[stage]) for stage in PROFILE_STAGES if stage in totals
+        }
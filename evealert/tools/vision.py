@@ -1,24 +1,168 @@
 import logging
+import os
+import time
 from datetime import datetime
-
-import cv2 as cv
-import numpy as np
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 
 from evealert.constants import (
-    CV_DETECTION_COLOR,
-    CV_LINE_TYPE,
-    CV_RECTANGLE_THICKNESS,
+    CV_MATCH_METHOD,
     DETECTION_THRESHOLD_MAX,
     DETECTION_THRESHOLD_MIN,
     GROUP_RECTANGLES_EPS,
     GROUP_RECTANGLES_THRESHOLD,
+    VISION_LOG_INTERVAL,
 )
-from evealert.exceptions import RegionSizeError, ScreenshotError
+from evealert.exceptions import RegionSizeError, ScreenshotError, WrongImageType
+from evealert.settings.helper import lazy_import
+from evealert.tools.debugview import DebugRenderer, default_renderer
+
+# OpenCV is only loaded when the first template is decoded or matched
+cv = lazy_import("cv2")
+np = lazy_import("numpy")
 
 logger = logging.getLogger("tools")
 now = datetime.now()
 
 
+def preprocess_template(needle_img: "np.ndarray") -> "np.ndarray":
+    """Prepare a template image for matching.
+
+    Removes the alpha channel, converts grayscale to BGR and normalizes
+    the image, so this work is done once instead of on every frame.
+
+    Args:
+        needle_img: Template image as read by OpenCV
+
+    Returns:
+        Preprocessed BGR template image
+    """
+    # Remove alpha channel if present (convert BGRA to BGR)
+    if needle_img.ndim == 3 and needle_img.shape[-1] == 4:
+        needle_img = cv.cvtColor(needle_img, cv.COLOR_BGRA2BGR)
+    # Ensure the image is in BGR format
+    if needle_img.ndim == 2:
+        needle_img = cv.cvtColor(needle_img, cv.COLOR_GRAY2BGR)
+    # Normalize image to improve matching
+    return cv.normalize(needle_img, None, 0, 255, cv.NORM_MINMAX)
+
+
+def load_template(path: str) -> "np.ndarray":
+    """Read and preprocess a template image from disk.
+
+    Args:
+        path: Path to the template image
+
+    Returns:
+        Preprocessed BGR template image
+
+    Raises:
+        WrongImageType: If the file can't be decoded as an image
+    """
+    needle_img = cv.imread(path, cv.IMREAD_UNCHANGED)
+    if needle_img is None:
+        raise WrongImageType(f"Template image could not be read: {path}")
+    return preprocess_template(needle_img)
+
+
+def normalize_haystack(haystack_img: "np.ndarray") -> "np.ndarray":
+    """Prepare a screenshot for matching.
+
+    Args:
+        haystack_img: Screenshot as BGR or grayscale image
+
+    Returns:
+        Normalized BGR image
+    """
+    if haystack_img.ndim == 2:
+        haystack_img = cv.cvtColor(haystack_img, cv.COLOR_GRAY2BGR)
+    return cv.normalize(haystack_img, None, 0, 255, cv.NORM_MINMAX)
+
+
+def match_template(
+    haystack_img_norm: "np.ndarray",
+    needle_img_norm: "np.ndarray",
+    method: int,
+    threshold: float,
+) -> "np.ndarray":
+    """Find all matches of a template in a normalized screenshot.
+
+    Args:
+        haystack_img_norm: Normalized screenshot
+        needle_img_norm: Preprocessed template
+        method: OpenCV template matching method
+        threshold: Detection threshold in percent
+
+    Returns:
+        Grouped match rectangles as (x, y, w, h) rows
+    """
+    rectangles, _ = match_template_scored(
+        haystack_img_norm, needle_img_norm, method, threshold
+    )
+    return rectangles
+
+
+def match_template_scored(
+    haystack_img_norm: "np.ndarray",
+    needle_img_norm: "np.ndarray",
+    method: int,
+    threshold: float,
+) -> Tuple["np.ndarray", float]:
+    """Find all matches of a template and the best match score.
+
+    Args:
+        haystack_img_norm: Normalized screenshot
+        needle_img_norm: Preprocessed template
+        method: OpenCV template matching method
+        threshold: Detection threshold in percent
+
+    Returns:
+        Tuple of (grouped match rectangles as (x, y, w, h) rows, best match
+        score in percent)
+    """
+    # Convert images to same type if necessary
+    if haystack_img_norm.dtype != needle_img_norm.dtype:
+        needle_img_norm = needle_img_norm.astype(haystack_img_norm.dtype)
+
+    result = cv.matchTemplate(haystack_img_norm, needle_img_norm, method)
+    detection_treshhold = max(
+        min(threshold / 100, DETECTION_THRESHOLD_MAX),
+        DETECTION_THRESHOLD_MIN,
+    )  # Ensures value between 0.1 and 1.0
+
+    # Get the positions from the match result that exceed our threshold
+    locations = np.where(result >= detection_treshhold)
+    locations = list(zip(*locations[::-1]))
+
+    # You'll notice a lot of overlapping rectangles get drawn.
+    needle_w, needle_h = needle_img_norm.shape[1], needle_img_norm.shape[0]
+    rectangles = []
+    for loc in locations:
+        rect = [int(loc[0]), int(loc[1]), needle_w, needle_h]
+        # Add every box to the list twice to retain single (non-overlapping) boxes
+        rectangles.append(rect)
+        rectangles.append(rect)
+
+    # Apply group rectangles.
+    rectangles, _ = cv.groupRectangles(
+        rectangles,
+        groupThreshold=GROUP_RECTANGLES_THRESHOLD,
+        eps=GROUP_RECTANGLES_EPS,
+    )
+    return rectangles, float(result.max()) * 100
+
+
+def rectangle_centers(rectangles: Iterable) -> List[Tuple[int, int]]:
+    """Get the center points of match rectangles.
+
+    Args:
+        rectangles: Match rectangles as (x, y, w, h)
+
+    Returns:
+        Center point of each rectangle
+    """
+    return [(x + int(w / 2), y + int(h / 2)) for x, y, w, h in rectangles]
+
+
 class Vision:
     """Computer vision handler for EVE Online UI element detection.
 
@@ -26,12 +170,32 @@ class Vision:
     in EVE Online screenshots. Supports multiple template images and various
     UI scaling factors.
 
+    Templates are loaded and preprocessed once and cached per path. The
+    threshold, region, template set and method can be changed in place with
+    ``configure()`` without reloading unchanged templates or closing the
+    debug windows.
+
+    The debug windows are drawn and shown by a DebugRenderer on its own
+    thread, so matching takes the same time with open debug windows.
+
+    With DEBUG logging a one-line summary of a frame (template names and
+    shapes, match counts and matching time) is logged at most once per
+    ``log_interval`` seconds, the other frames are only counted.
+
     Attributes:
-        needle_imgs: List of template images to match
+        needle_imgs: List of preprocessed template images to match
         needle_dims: Dimensions of each template image
         method: OpenCV template matching method
+        threshold: Detection threshold in percent used by find()
+        region: Screen region (x1, y1, x2, y2) monitored by this handler
         debug_mode: Show enemy detection visualization
         debug_mode_faction: Show faction detection visualization
+        renderer: Renderer showing the debug windows
+        name: Region name used in the log
+        log_interval: Seconds between two debug log summaries (0 logs
+            every frame)
+        last_score: Best match score of the last frame in percent, None
+            before the first frame
     """
 
     needle_img = None
@@ -41,26 +205,50 @@ class Vision:
 
     # There are 6 methods to choose from:
     # TM_CCOEFF, TM_CCOEFF_NORMED, TM_CCORR, TM_CCORR_NORMED, TM_SQDIFF, TM_SQDIFF_NORMED
-    def __init__(self, needle_img_paths, method=cv.TM_CCOEFF_NORMED):
+    def __init__(
+        self,
+        needle_img_paths: Iterable[str],
+        method: int = CV_MATCH_METHOD,
+        threshold: float = 0.5,
+        region: Optional[Tuple[int, int, int, int]] = None,
+        loader: Callable[[str], "np.ndarray"] = load_template,
+        renderer: Optional[DebugRenderer] = None,
+    ):
         """Initialize the Vision handler.
 
         Args:
             needle_img_paths: List of paths to template images
             method: OpenCV template matching method (default: TM_CCOEFF_NORMED)
+            threshold: Detection threshold in percent used by find()
+            region: Screen region (x1, y1, x2, y2) monitored by this handler
+            loader: Returns the preprocessed template for a path
+                (e.g. TemplateIndex.load)
+            renderer: Renderer for the debug windows (defaults to the
+                shared renderer)
         """
-        # Load the images we're trying to match
-        self.needle_imgs = [
-            cv.imread(path, cv.IMREAD_UNCHANGED) for path in needle_img_paths
-        ]
-
-        # Save the dimensions of the needle images
-        self.needle_dims = [(img.shape[1], img.shape[0]) for img in self.needle_imgs]
+        self.loader = loader
+        self.renderer = renderer or default_renderer()
+        # Template cache: path -> (mtime_ns, preprocessed image)
+        self.templates: Dict[str, Tuple[int, np.ndarray]] = {}
+        self.needle_img_paths: List[str] = []
+        self.needle_imgs: List[np.ndarray] = []
+        self.needle_dims: List[Tuple[int, int]] = []
 
         self.method = method
+        self.threshold = threshold
+        self.region = region
         self.debug_mode = False
         self.debug_mode_faction = False
         self.enemy = None
         self.faction = None
+        self.name = ""
+        self.log_interval = VISION_LOG_INTERVAL
+        self.last_score: Optional[float] = None
+        self._log_frames = 0
+        self._last_log: Optional[float] = None
+
+        # Load the images we're trying to match
+        self.set_templates(needle_img_paths)
 
     @property
     def is_vision_open(self):
@@ -72,42 +260,157 @@ class Vision:
         """Returns True if the faction vision window is open."""
         return self.debug_mode_faction
 
-    def vision_process(
-        self, haystack_img, threshold: float = 0.5, vision_mode: str = "Enemy"
-    ) -> tuple:
-        all_points = []
-        color = CV_DETECTION_COLOR
+    def configure(
+        self,
+        threshold: Optional[float] = None,
+        region: Optional[Tuple[int, int, int, int]] = None,
+        needle_img_paths: Optional[Iterable[str]] = None,
+        method: Optional[int] = None,
+        name: Optional[str] = None,
+        log_interval: Optional[float] = None,
+    ) -> None:
+        """Reconfigure the handler in place.
+
+        Only the given values are changed. Cached templates and the debug
+        window state are kept.
+
+        Args:
+            threshold: Detection threshold in percent used by find()
+            region: Screen region (x1, y1, x2, y2)
+            needle_img_paths: New template set, only new or modified files
+                are read from disk
+            method: OpenCV template matching method
+            name: Region name used in the log
+            log_interval: Seconds between two debug log summaries
+        """
+        if name is not None:
+            self.name = name
+        if log_interval is not None:
+            self.log_interval = log_interval
+        if threshold is not None:
+            self.threshold = threshold
+        if region is not None:
+            self.region = tuple(region)
+        if method is not None:
+            self.method = method
+        if needle_img_paths is not None:
+            self.set_templates(needle_img_paths)
+
+    def set_templates(self, needle_img_paths: Iterable[str]) -> bool:
+        """Set the template images to match.
+
+        Templates that are already cached and unchanged on disk are reused,
+        only new or modified files are read. Templates that are no longer
+        part of the set are dropped from the cache.
+
+        Args:
+            needle_img_paths: List of paths to template images
 
-        for idx, (needle_img, needle_dim) in enumerate(
-            zip(self.needle_imgs, self.needle_dims)
-        ):
+        Returns:
+            True if the template set changed
+        """
+        paths = list(needle_img_paths)
+        changed = paths != self.needle_img_paths
 
-            logger.debug("Detecting %s %s", vision_mode, idx)
+        templates = {}
+        for path in paths:
+            try:
+                mtime = os.stat(path).st_mtime_ns
+            except OSError:
+                mtime = None
+            cached = self.templates.get(path)
+            if cached is not None and cached[0] == mtime:
+                templates[path] = cached
+                continue
+            templates[path] = (mtime, self.loader(path))
+            changed = True
+            logger.debug("Loaded template %s", os.path.basename(path))
+
+        self.templates = templates
+        self.needle_img_paths = paths
+        self.needle_imgs = [templates[path][1] for path in paths]
+        # Save the dimensions of the needle images
+        self.needle_dims = [(img.shape[1], img.shape[0]) for img in self.needle_imgs]
+        return changed
 
-            # Remove alpha channel if present (convert BGRA to BGR)
-            if needle_img.shape[-1] == 4:
-                needle_img = cv.cvtColor(needle_img, cv.COLOR_BGRA2BGR)
+    def reload_templates(self) -> bool:
+        """Reload templates that were modified on disk.
 
-            logger.debug("%s: %s %s", vision_mode, needle_img, needle_dim)
+        Returns:
+            True if at least one template was reloaded
+        """
+        return self.set_templates(self.needle_img_paths)
+
+    def _sample_log(self) -> bool:
+        """Count a frame and decide whether to log its summary."""
+        self._log_frames += 1
+        if not logger.isEnabledFor(logging.DEBUG):
+            return False
+        now = time.monotonic()
+        if self._last_log is not None and now - self._last_log < self.log_interval:
+            return False
+        self._last_log = now
+        return True
+
+    def _log_frame(
+        self, vision_mode: str, shape: tuple, matches: List[int], elapsed: float
+    ) -> None:
+        """Log the summary of a frame and the frames since the last one."""
+        templates = " ".join(
+            f"{os.path.basename(path)}({width}x{height})={count}"
+            for path, (width, height), count in zip(
+                self.needle_img_paths, self.needle_dims, matches
+            )
+        )
+        logger.debug(
+            "vision=%s mode=%s frames=%d shape=%s matches=%d time=%.1fms "
+            "templates=[%s]",
+            self.name or "-",
+            vision_mode,
+            self._log_frames,
+            "x".join(str(size) for size in shape),
+            sum(matches),
+            elapsed * 1000,
+            templates,
+        )
+        self._log_frames = 0
 
-            # Convert images to same type if necessary
-            if haystack_img.dtype != needle_img.dtype:
-                needle_img = needle_img.astype(haystack_img.dtype)
+    def vision_process(
+        self, haystack_img, threshold: float = 0.5, vision_mode: str = "Enemy"
+    ) -> tuple:
+        """Match all templates in a screenshot.
 
-            # Ensure both images are in BGR format
-            if len(haystack_img.shape) == 2:
-                haystack_img = cv.cvtColor(haystack_img, cv.COLOR_GRAY2BGR)
-            if len(needle_img.shape) == 2:
-                needle_img = cv.cvtColor(needle_img, cv.COLOR_GRAY2BGR)
+        The best match score of the frame is kept in ``last_score``.
 
-            # Normalize images to improve matching
-            haystack_img_norm = cv.normalize(haystack_img, None, 0, 255, cv.NORM_MINMAX)
-            needle_img_norm = cv.normalize(needle_img, None, 0, 255, cv.NORM_MINMAX)
+        Args:
+            haystack_img: Screenshot to search
+            threshold: Detection threshold in percent
+            vision_mode: Detection name used in errors ("Enemy" or "Faction")
 
+        Returns:
+            Tuple of (center points, match rectangles as (x, y, w, h))
+        """
+        all_points = []
+        all_rectangles = []
+        best_score = 0.0
+        self.last_score = None
+        # Per template match counts of a sampled frame
+        sample = self._sample_log()
+        matches: List[int] = []
+        started = time.perf_counter()
+
+        # Ensure the haystack is in BGR format
+        if len(haystack_img.shape) == 2:
+            haystack_img = cv.cvtColor(haystack_img, cv.COLOR_GRAY2BGR)
+
+        # Normalize the haystack once per frame to improve matching
+        haystack_img_norm = normalize_haystack(haystack_img)
+
+        for needle_img_norm in self.needle_imgs:
             # Check if the haystack image is larger than the needle image
             if (
-                haystack_img.shape[0] < needle_img.shape[0]
-                or haystack_img.shape[1] < needle_img.shape[1]
+                haystack_img.shape[0] < needle_img_norm.shape[0]
+                or haystack_img.shape[1] < needle_img_norm.shape[1]
             ):
                 raise RegionSizeError(
                     f"Detection {vision_mode} Error: Region is smaller than Detection Region please make a larger Area."
@@ -115,14 +418,9 @@ class Vision:
 
             # Run the OpenCV algorithm with normalized images
             try:
-                result = cv.matchTemplate(
-                    haystack_img_norm, needle_img_norm, self.method
+                rectangles, score = match_template_scored(
+                    haystack_img_norm, needle_img_norm, self.method, threshold
                 )
-                detection_treshhold = max(
-                    min(threshold / 100, DETECTION_THRESHOLD_MAX),
-                    DETECTION_THRESHOLD_MIN,
-                )  # Ensures value between 0.1 and 1.0
-
             except Exception as e:
                 logger.error("Detection %s Error: %s", vision_mode, e)
                 # pylint: disable=raise-missing-from
@@ -130,106 +428,88 @@ class Vision:
                     f"Detection {vision_mode} Error: Something went wrong"
                 )
 
-            # Get the positions from the match result that exceed our threshold
-            locations = np.where(result >= detection_treshhold)
-            locations = list(zip(*locations[::-1]))
-
-            # You'll notice a lot of overlapping rectangles get drawn.
-            rectangles = []
-            for loc in locations:
-                rect = [int(loc[0]), int(loc[1]), needle_dim[0], needle_dim[1]]
-                # Add every box to the list twice to retain single (non-overlapping) boxes
-                rectangles.append(rect)
-                rectangles.append(rect)
-
-            # Apply group rectangles.
-            rectangles, _ = cv.groupRectangles(
-                rectangles,
-                groupThreshold=GROUP_RECTANGLES_THRESHOLD,
-                eps=GROUP_RECTANGLES_EPS,
-            )
-
-            points = []
+            best_score = max(best_score, score)
+            if sample:
+                matches.append(len(rectangles))
             if len(rectangles):
-                # Loop over all the rectangles
-                for x, y, w, h in rectangles:
-                    # Determine the center position
-                    center_x = x + int(w / 2)
-                    center_y = y + int(h / 2)
-                    # Save the points
-                    points.append((center_x, center_y))
-                    if self.debug_mode or self.debug_mode_faction:
-                        # Ensure the image is writable
-                        haystack_img = haystack_img.copy()
-                        # Determine the box position
-                        top_left = (x, y)
-                        bottom_right = (x + w, y + h)
-                        # Draw the box
-                        try:
-                            cv.rectangle(
-                                haystack_img,
-                                top_left,
-                                bottom_right,
-                                color=color,
-                                lineType=CV_LINE_TYPE,
-                                thickness=CV_RECTANGLE_THICKNESS,
-                            )
-                        except Exception as e:
-                            logger.error("Rectangle Error: %s", e)
-
-            all_points.extend(points)
-        return all_points, haystack_img
+                all_points.extend(rectangle_centers(rectangles))
+                all_rectangles.extend(
+                    tuple(int(value) for value in rect) for rect in rectangles
+                )
+
+        if sample:
+            self._log_frame(
+                vision_mode,
+                haystack_img.shape,
+                matches,
+                time.perf_counter() - started,
+            )
+        self.last_score = best_score
+        return all_points, all_rectangles
 
     def clean_up(self) -> None:
         """Close all open windows."""
-        cv.destroyAllWindows()
-        self.debug_mode = False
-        self.debug_mode_faction = False
+        self.destroy_vision("Enemy")
+        self.destroy_vision("Faction")
 
     def destroy_vision(self, vision_mode: str = "Enemy") -> None:
         """Close the vision window."""
         if vision_mode == "Enemy":
             self.debug_mode = False
+            self.enemy = None
         elif vision_mode == "Faction":
             self.debug_mode_faction = False
-        cv.destroyWindow(vision_mode)
+            self.faction = None
+        self.renderer.close(f"{vision_mode} Vision")
 
-    def find(self, haystack_img, threshold: float = 0.5) -> list:
+    def show_debug(
+        self, vision_mode: str, haystack_img, rectangles: Iterable
+    ) -> Optional[bool]:
+        """Pass a frame to the debug window or close the window.
+
+        Args:
+            vision_mode: "Enemy" or "Faction"
+            haystack_img: Screenshot that was searched
+            rectangles: Match rectangles as (x, y, w, h)
+
+        Returns:
+            True if the window is shown, None if it is closed
+        """
+        window = f"{vision_mode} Vision"
+        enabled = self.debug_mode if vision_mode == "Enemy" else self.debug_mode_faction
+        if enabled:
+            self.renderer.submit(window, haystack_img, rectangles)
+            return True
+        if (self.enemy if vision_mode == "Enemy" else self.faction) is not None:
+            self.renderer.close(window)
+        return None
+
+    def find(self, haystack_img, threshold: Optional[float] = None) -> list:
+        if threshold is None:
+            threshold = self.threshold
         try:
-            all_points, detection_image = self.vision_process(
+            all_points, rectangles = self.vision_process(
                 haystack_img, threshold, "Enemy"
             )
         except Exception as e:
             logger.exception("Enemy Detection Error: %s", e)
             self.destroy_vision("Enemy")
-            all_points = []
-
-        if self.debug_mode:
-            cv.imshow("Enemy Vision", detection_image)
-            self.enemy = True
-            cv.waitKey(1)
-        else:
-            if self.enemy:
-                cv.destroyWindow("Enemy Vision")
-                self.enemy = None
+            return []
+
+        self.enemy = self.show_debug("Enemy", haystack_img, rectangles)
         return all_points
 
-    def find_faction(self, haystack_img, threshold: float = 0.5) -> list:
+    def find_faction(self, haystack_img, threshold: Optional[float] = None) -> list:
+        if threshold is None:
+            threshold = self.threshold
         try:
-            all_points, detection_image = self.vision_process(
+            all_points, rectangles = self.vision_process(
                 haystack_img, threshold, "Faction"
             )
         except Exception as e:
             logger.exception("Faction Detection Error: %s", e)
             self.destroy_vision("Faction")
-            all_points = []
-
-        if self.debug_mode_faction:
-            cv.imshow("Faction Vision", detection_image)
-            self.faction = True
-            cv.waitKey(1)
-        else:
-            if self.faction:
-                cv.destroyWindow("Faction Vision")
-                self.faction = None
+            return []
+
+        self.faction = self.show_debug("Faction", haystack_img, rectangles)
         return all_points
@@ -1,12 +1,15 @@
-from typing import TYPE_CHECKING, Optional, Tuple
-
-import mss
-import numpy as np
+import os
+import threading
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
 
+from evealert.settings.helper import lazy_import
 from evealert.settings.logger import logging
 
-if TYPE_CHECKING:
-    from evealert.menu.main import MainMenu
+mss = lazy_import("mss")
+np = lazy_import("numpy")
+cv = lazy_import("cv2")
+
+REPLAY_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp")
 
 logger = logging.getLogger("tools")
 
@@ -14,12 +17,9 @@ logger = logging.getLogger("tools")
 class WindowCapture:
     """Handles screen capture for specified regions."""
 
-    def __init__(self, mainmenu: "MainMenu"):
-        self.main = mainmenu
-
     def get_screenshot_value(
         self, y1: int, x1: int, x2: int, y2: int
-    ) -> Tuple[Optional[np.ndarray], Optional[mss.screenshot.ScreenShot]]:
+    ) -> Tuple[Optional["np.ndarray"], Optional["mss.screenshot.ScreenShot"]]:
         """
         Capture a screenshot of the specified region.
 
@@ -45,3 +45,114 @@ class WindowCapture:
         img_array = np.array(screenshot)[:, :, :3]  # Drop alpha channel
 
         return img_array, screenshot
+
+
+Region = Tuple[int, int, int, int]
+
+
+class ReplayCapture:
+    """Replays prepared frames instead of capturing the screen.
+
+    Drop-in replacement for WindowCapture in tests, benchmarks and accuracy
+    runs. Frames are either shared by all regions or given per region as
+    (x1, y1, x2, y2). Every call returns the next frame of the region.
+    """
+
+    def __init__(
+        self,
+        frames: Union[Sequence["np.ndarray"], Dict[Region, Sequence["np.ndarray"]]],
+        loop: bool = True,
+    ) -> None:
+        """Initialize the replay.
+
+        Args:
+            frames: BGR frames, or BGR frames per region (x1, y1, x2, y2)
+            loop: Start over after the last frame, otherwise return (None, None)
+        """
+        if isinstance(frames, dict):
+            self.frames: Dict[Optional[Region], Sequence[np.ndarray]] = dict(frames)
+        else:
+            self.frames = {None: frames}
+        self.loop = loop
+        self.positions: Dict[Optional[Region], int] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_folder(cls, folder: str, loop: bool = True) -> "ReplayCapture":
+        """Replay the images of a folder in file name order.
+
+        Images are read when they are replayed, so long recordings are not
+        kept in memory.
+
+        Args:
+            folder: Folder with recorded frames
+            loop: Start over after the last frame
+
+        Returns:
+            ReplayCapture of the folder
+        """
+        paths = sorted(
+            os.path.join(folder, name)
+            for name in os.listdir(folder)
+            if name.lower().endswith(REPLAY_EXTENSIONS)
+        )
+        return cls(_LazyFrames(paths), loop=loop)
+
+    def reset(self) -> None:
+        """Replay all regions from the first frame."""
+        with self._lock:
+            self.positions.clear()
+
+    def get_screenshot_value(
+        self, y1: int, x1: int, x2: int, y2: int
+    ) -> Tuple[Optional["np.ndarray"], None]:
+        """
+        Return the next frame of the region.
+
+        Args:
+            y1: Top coordinate
+            x1: Left coordinate
+            x2: Right coordinate (exclusive)
+            y2: Bottom coordinate (exclusive)
+
+        Returns:
+            Tuple of (numpy_array, None) or (None, None) if no frame is left
+        """
+        region = (x1, y1, x2, y2)
+        key = region if region in self.frames else None
+        frames = self.frames.get(key)
+        if not frames:
+            logger.error("No replay frames for region %s", region)
+            return None, None
+        with self._lock:
+            position = self.positions.get(key, 0)
+            if position >= len(frames):
+                if not self.loop:
+                    return None, None
+                position = 0
+            self.positions[key] = position + 1
+        frame = frames[position]
+        if frame is None:
+            return None, None
+        # Like a new screenshot, the caller may modify the frame
+        return frame.copy(), None
+
+
+class _LazyFrames:
+    """Image files read on access."""
+
+    def __init__(self, paths: List[str]) -> None:
+        self.paths = paths
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+    def __getitem__(self, index):
+        image = cv.imread(self.paths[index], cv.IMREAD_COLOR)
+        if image is None:
+            logger.error("Replay frame could not be read: %s", self.paths[index])
+        return image
+
+    def __iter__(self) -> Iterator[Optional["np.ndarray"]]:
+        for index in range(len(self)):
+            yield self[index]
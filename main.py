@@ -1,13 +1,8 @@
-import customtkinter
+import multiprocessing
 
-from evealert import __version__
-from evealert.menu.main import MainMenu
+from evealert.tools.startup import StartupProfiler, profile_startup_requested
 
-customtkinter.set_appearance_mode("dark")
-customtkinter.set_default_color_theme("dark-blue")
-
-print(
-    f"""
+BANNER = """
 ░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░
 ░▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓████▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓░
 ░▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓██▓▓█████▓▓▓▓███████████▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓░
@@ -45,10 +40,55 @@ print(
 ░▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓██▓████████▓████▒░░░░░░░░▒█▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓░
 ░▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓█░░░░░░░░░░░▓█░░░▒▓▓▓▓▓▒▒██▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓░
 ░▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓███████████████████████████▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓▓░
-░░░░░░░░░░░░░░░░░ Geuthur - EVE Alert v{__version__} ░░░░░░░░░░░░░░░░░
+░░░░░░░░░░░░░░░░░ Geuthur - EVE Alert v{version} ░░░░░░░░░░░░░░░░░
 """
-)
 
-# Start the application
-app = MainMenu()
-app.mainloop()
+
+def main() -> None:
+    """Start the EVE Alert application."""
+    # Start profiling before the heavy imports to measure them
+    profiler = StartupProfiler() if profile_startup_requested() else None
+    if profiler:
+        profiler.start()
+
+    # pylint: disable=import-outside-toplevel
+    import customtkinter
+
+    from evealert import __version__
+    from evealert.menu.main import MainMenu
+    from evealert.settings.logger import stop_logging
+
+    if profiler:
+        profiler.mark("imports")
+
+    customtkinter.set_appearance_mode("dark")
+    customtkinter.set_default_color_theme("dark-blue")
+
+    print(BANNER.format(version=__version__))
+
+    # Start the application
+    app = MainMenu()
+
+    if profiler:
+        profiler.mark("window created")
+
+        def report_startup() -> None:
+            """Print the startup profile once the main loop is running."""
+            profiler.mark("first window")
+            profiler.stop()
+            profiler.print_report()
+
+        app.after_idle(report_startup)
+
+    try:
+        app.mainloop()
+    finally:
+        # Write the queued log records before exiting
+        stop_logging()
+
+
+# Worker processes of the matching pool import this module, so the
+# application must only start when it is run as a script
+if __name__ == "__main__":
+    multiprocessing.freeze_support()
+    main()
@@ -0,0 +1,135 @@
+"""Unit tests for the detection accuracy harness."""
+
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+
+from evealert.tools.accuracy import (
+    AccuracyResult,
+    DetectorConfig,
+    VisionDetector,
+    compare,
+    evaluate,
+    load_corpus,
+    save_corpus,
+    score_frame,
+    synthetic_corpus,
+)
+from evealert.tools.synthetic import (
+    LABEL_ENEMY,
+    LABEL_FACTION,
+    Label,
+    LocalListConfig,
+    SyntheticFrame,
+)
+
+
+class TestScoring(unittest.TestCase):
+    """Test cases for the detection scoring."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.labels = [
+            Label(LABEL_ENEMY, "a.png", (0, 0, 10, 10)),
+            Label(LABEL_ENEMY, "b.png", (0, 20, 10, 10)),
+            Label(LABEL_ENEMY, "c.png", (0, 40, 10, 10), visible=0.2),
+        ]
+
+    def test_object_counts(self):
+        """Test true positives, duplicates, false positives and misses."""
+        result = AccuracyResult("test")
+
+        score_frame(
+            result,
+            [(0, 0, 10, 10), (1, 1, 10, 10), (50, 50, 10, 10), (0, 40, 10, 10)],
+            self.labels,
+        )
+
+        self.assertEqual(result.true_positives, 1)
+        self.assertEqual(result.duplicates, 1)
+        self.assertEqual(result.false_positives, 1)
+        # The hidden label is optional
+        self.assertEqual(result.false_negatives, 1)
+        self.assertEqual(result.precision, 0.5)
+        self.assertEqual(result.recall, 0.5)
+
+    def test_frame_counts(self):
+        """Test the alarm outcome of every frame."""
+        result = AccuracyResult("test")
+        hidden = self.labels[2:]
+
+        score_frame(result, [(0, 0, 10, 10)], self.labels)
+        score_frame(result, [], self.labels)
+        score_frame(result, [(0, 0, 10, 10)], [])
+        score_frame(result, [], [])
+        score_frame(result, [(0, 40, 10, 10)], hidden)
+
+        self.assertEqual(result.frames, 5)
+        self.assertEqual(result.frame_counts, {"tp": 1, "fp": 1, "fn": 1, "tn": 1})
+        self.assertEqual(result.frame_precision, 0.5)
+        self.assertEqual(result.frame_recall, 0.5)
+
+    def test_evaluate_filters_kinds(self):
+        """Test labels of other kinds are background and latency is recorded."""
+        labels = [
+            Label(LABEL_ENEMY, "a.png", (0, 0, 10, 10)),
+            Label(LABEL_FACTION, "f.png", (0, 20, 10, 10)),
+        ]
+        corpus = [SyntheticFrame(np.zeros((40, 40, 3), np.uint8), labels)]
+
+        result = evaluate(lambda image: [(0, 0, 10, 10), (0, 20, 10, 10)], corpus)
+
+        self.assertEqual((result.true_positives, result.false_positives), (1, 1))
+        self.assertEqual(len(result.latencies), 1)
+        self.assertIn("p50", result.to_dict()["latency_ms"])
+
+
+class TestVisionDetector(unittest.TestCase):
+    """Test cases for VisionDetector and the corpus helpers."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Generate a small corpus once."""
+        cls.corpus = synthetic_corpus(
+            [LocalListConfig(rows=12, hostiles=3, seed=seed) for seed in range(2)]
+        )
+
+    def test_baseline_finds_all_icons(self):
+        """Test the baseline detector finds every icon of a clean list."""
+        result = compare([DetectorConfig()], self.corpus)[0]
+
+        self.assertEqual(result.false_positives, 0)
+        self.assertEqual(result.frame_counts["tp"], 2)
+        self.assertGreater(result.recall, 0.5)
+
+    def test_roi_and_downsample_map_to_frame(self):
+        """Test rectangles of a cut and resized frame are in frame coordinates."""
+        frame = self.corpus[0]
+        detector = VisionDetector(DetectorConfig(roi=(0, 0, 40, 1000)))
+        self.addCleanup(detector.vision.clean_up)
+        baseline = VisionDetector(DetectorConfig())
+        self.addCleanup(baseline.vision.clean_up)
+
+        self.assertEqual(sorted(detector(frame.image)), sorted(baseline(frame.image)))
+
+        result = compare([DetectorConfig(downsample=0.5)], self.corpus[:1])[0]
+        self.assertEqual(result.false_positives, 0)
+
+    def test_corpus_round_trip(self):
+        """Test a saved corpus is read back with its labels."""
+        folder = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, folder, ignore_errors=True)
+
+        save_corpus(self.corpus, folder)
+        corpus = load_corpus(folder)
+
+        self.assertEqual(len(corpus), len(self.corpus))
+        for loaded, frame in zip(corpus, self.corpus):
+            np.testing.assert_array_equal(loaded.image, frame.image)
+            self.assertEqual(loaded.labels, frame.labels)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+"""Unit tests for the time bucketed alarm counters."""
+
+import shutil
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from evealert.aggregates import DAY, HOUR, MINUTE, AlarmAggregates, RollingCounter
+from evealert.history import AlarmHistoryStore
+from evealert.statistics import AlarmEvent
+
+# Noon of an arbitrary day, aligned to the day buckets
+NOW = 20000 * DAY + 12 * HOUR
+
+
+class TestRollingCounter(unittest.TestCase):
+    """Test cases for RollingCounter class."""
+
+    def test_window_expires(self):
+        """Test buckets leaving the window are dropped from the total."""
+        counter = RollingCounter(MINUTE, 60)
+        counter.add(NOW)
+        counter.add(NOW + 30 * MINUTE, 2)
+
+        self.assertEqual(counter.sum(NOW + 30 * MINUTE), 3)
+        self.assertEqual(counter.sum(NOW + 61 * MINUTE), 2)
+        self.assertEqual(counter.sum(NOW + 200 * MINUTE), 0)
+
+    def test_partial_sum(self):
+        """Test counting only the newest buckets."""
+        counter = RollingCounter(MINUTE, 60)
+        for minute in range(10):
+            counter.add(NOW + minute * MINUTE)
+
+        self.assertEqual(counter.sum(NOW + 9 * MINUTE, 3), 3)
+
+    def test_old_events_ignored(self):
+        """Test events older than the window are not counted."""
+        counter = RollingCounter(MINUTE, 60)
+        counter.add(NOW)
+        counter.add(NOW - 2 * HOUR)
+
+        self.assertEqual(counter.sum(NOW), 1)
+
+
+class TestAlarmAggregates(unittest.TestCase):
+    """Test cases for AlarmAggregates class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.aggregates = AlarmAggregates(days=7)
+
+    def test_windows(self):
+        """Test the last hour, day and days counts per type."""
+        self.aggregates.add("Enemy", NOW - 3 * DAY)
+        self.aggregates.add("Enemy", NOW - 5 * HOUR)
+        self.aggregates.add("Enemy", NOW - 10 * MINUTE)
+        self.aggregates.add("Faction", NOW - 10 * MINUTE)
+
+        self.assertEqual(self.aggregates.last_hour("Enemy", now=NOW), 1)
+        self.assertEqual(self.aggregates.last_hour(now=NOW), 2)
+        self.assertEqual(self.aggregates.last_day("Enemy", now=NOW), 2)
+        self.assertEqual(self.aggregates.last_days("Enemy", now=NOW), 3)
+        self.assertEqual(self.aggregates.last_hour("Unknown", now=NOW), 0)
+
+    def test_busiest_hour(self):
+        """Test the busiest local hour of day is found."""
+        self.assertIsNone(self.aggregates.busiest_hour())
+
+        busy = NOW - 2 * HOUR
+        for _ in range(3):
+            self.aggregates.add("Enemy", busy)
+        self.aggregates.add("Faction", NOW)
+
+        self.assertEqual(self.aggregates.busiest_hour(), time.localtime(busy).tm_hour)
+        self.assertEqual(
+            self.aggregates.busiest_hour("Faction"), time.localtime(NOW).tm_hour
+        )
+
+    def test_spike(self):
+        """Test a burst of alarms is a spike, a steady rate is not."""
+        for hour in range(1, 24):
+            self.aggregates.add("Enemy", NOW - hour * HOUR)
+
+        self.assertFalse(self.aggregates.spike("Enemy", now=NOW)[0])
+
+        for second in range(5):
+            self.aggregates.add("Enemy", NOW - second)
+
+        spike, recent, expected = self.aggregates.spike("Enemy", now=NOW)
+        self.assertTrue(spike)
+        self.assertEqual(recent, 5)
+        self.assertLess(expected, 1)
+
+    def test_load_from_store(self):
+        """Test the counters are filled from the stored history."""
+        temp_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, temp_dir, ignore_errors=True)
+        store = AlarmHistoryStore(temp_dir / "history.db")
+        self.addCleanup(store.close)
+        for timestamp in (NOW - 30 * DAY, NOW - 2 * DAY, NOW - 5 * MINUTE):
+            store.append(AlarmEvent("Enemy", timestamp))
+        store.flush()
+
+        self.aggregates.load(store, now=NOW)
+
+        self.assertEqual(self.aggregates.last_hour("Enemy", now=NOW), 1)
+        self.assertEqual(self.aggregates.last_days("Enemy", now=NOW), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,14 +1,30 @@
 """Unit tests for AlertManager core functionality."""
 
+import asyncio
+import gc
 import json
+import os
+import shutil
 import tempfile
+import threading
 import time
+import tracemalloc
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, call, patch
 
+import numpy as np
+
+from evealert.constants import VISION_MAX_WORKERS
 from evealert.manager.alertmanager import AlertAgent
+from evealert.manager.sink import NullSink
+from evealert.settings.store import SettingsStore
 from evealert.statistics import AlarmStatistics
+from evealert.tools.windowscapture import ReplayCapture
+
+# Opt-in for the slow start/stop stress test
+STRESS_TESTS_ENV = "EVEALERT_STRESS_TESTS"
 
 
 class TestAlertAgent(unittest.TestCase):
@@ -16,12 +32,8 @@ class TestAlertAgent(unittest.TestCase):
 
     def setUp(self):
         """Set up test fixtures."""
-        # Create mock MainMenu
-        self.mock_main = MagicMock()
-        self.mock_main.write_message = MagicMock()
-        self.mock_main.getdata = MagicMock()
-        self.mock_main.menu = MagicMock()
-        self.mock_main.menu.setting = MagicMock()
+        # Create mock sink
+        self.mock_sink = MagicMock()
 
         # Create temporary settings file
         self.temp_dir = tempfile.mkdtemp()
@@ -43,20 +55,18 @@ class TestAlertAgent(unittest.TestCase):
         with open(self.settings_path, "w") as f:
             json.dump(self.test_settings, f)
 
-        self.mock_main.menu.setting.load_settings.return_value = self.test_settings
-        self.mock_main.menu.setting.is_changed = False
+        self.store = SettingsStore(self.settings_path)
 
         # Patch audio file validation and event loop
         with patch(
             "evealert.manager.alertmanager.AlertAgent._validate_audio_files"
         ), patch("asyncio.get_event_loop") as mock_loop:
             mock_loop.return_value = MagicMock()
-            self.agent = AlertAgent(self.mock_main)
+            self.agent = AlertAgent(self.mock_sink, self.store)
 
     def tearDown(self):
         """Clean up test fixtures."""
-        import shutil
-
+        self.agent.statistics.close()
         shutil.rmtree(self.temp_dir, ignore_errors=True)
 
     def test_agent_initialization(self):
@@ -79,7 +89,7 @@ class TestAlertAgent(unittest.TestCase):
         """Test loading custom volume setting."""
         # Update settings with 50% volume
         self.test_settings["volume"]["value"] = 50
-        self.mock_main.menu.setting.load_settings.return_value = self.test_settings
+        self.store.save(self.test_settings)
 
         self.agent.load_settings()
         self.assertEqual(self.agent.volume, 0.5)
@@ -141,6 +151,70 @@ class TestAlertAgent(unittest.TestCase):
         # Should be within webhook cooldown period
         self.assertLess(time_diff, WEBHOOK_COOLDOWN + 1)
 
+    @patch("evealert.manager.webhook.dhooks_lite.Webhook")
+    def test_webhook_from_settings(self, mock_webhook):
+        """Test the agent builds its webhook from the settings."""
+        url = "https://discord.com/api/webhooks/1/token"
+        self.test_settings["server"] = {"name": url, "system": "Jita", "mute": False}
+        self.store.save(self.test_settings)
+
+        self.agent.load_settings()
+
+        mock_webhook.assert_called_once()
+        self.assertEqual(mock_webhook.call_args[0][0], url)
+        self.assertIs(self.agent.webhook, mock_webhook.return_value)
+        self.assertEqual(self.agent.system_name, "Jita")
+
+        # An unchanged URL keeps the webhook
+        self.agent.load_settings()
+        mock_webhook.assert_called_once()
+
+    def test_invalid_webhook_is_disabled(self):
+        """Test an invalid webhook URL disables the webhook."""
+        self.agent.set_webhook("https://example.com/hook")
+
+        self.assertIsNone(self.agent.webhook)
+
+    async def _send_webhook(self):
+        await self.agent.send_webhook_message("Enemy")
+
+    def test_send_webhook_uses_system_name(self):
+        """Test webhook messages use the configured system name."""
+        self.agent.webhook = MagicMock()
+        self.agent.system_name = "Jita"
+
+        asyncio.run(self._send_webhook())
+
+        self.agent.webhook.execute.assert_called_once_with("Enemy Appears in Jita!")
+        self.assertTrue(self.agent.webhook_sent)
+
+    def test_messages_go_to_sink(self):
+        """Test the agent reports through its sink."""
+        self.agent.clean_up()
+
+        self.mock_sink.write_message.assert_called_with(
+            "System: EVE Alert stopped.", "green"
+        )
+        self.mock_sink.update_alert_button.assert_called_once()
+        self.mock_sink.update_faction_button.assert_called_once()
+
+    def test_shutdown(self):
+        """Test shutdown releases the resources without a message."""
+        self.agent.set_metrics(True, 0)
+        self.agent.statistics.close = MagicMock()
+        self.agent.renderer.stop = MagicMock()
+        matcher = MagicMock()
+        self.agent.matcher = matcher
+
+        self.agent.shutdown()
+
+        self.assertIsNone(self.agent.metrics_server)
+        self.assertIsNone(self.agent.matcher)
+        matcher.close.assert_called_once()
+        self.agent.renderer.stop.assert_called_once()
+        self.agent.statistics.close.assert_called_once()
+        self.mock_sink.write_message.assert_not_called()
+
     def test_alarm_trigger_count_tracking(self):
         """Test alarm trigger count management."""
         self.assertEqual(len(self.agent.alarm_trigger_counts), 0)
@@ -167,8 +241,6 @@ class TestAlertAgent(unittest.TestCase):
     @patch("evealert.manager.alertmanager.sf.read")
     def test_play_sound_with_volume(self, mock_sf_read, mock_sd_play):
         """Test playing sound with volume control."""
-        import numpy as np
-
         # Mock audio data
         mock_audio_data = np.array([[100, 100], [200, 200]], dtype="int16")
         mock_sf_read.return_value = (mock_audio_data, 44100)
@@ -191,6 +263,69 @@ class TestAlertAgent(unittest.TestCase):
         self.assertEqual(self.agent.statistics.total_alarms, 1)
         self.assertEqual(self.agent.statistics.session_alarms, 1)
 
+    def test_alarm_spike_reported_once(self):
+        """Test an alarm spike is reported once until the rate drops."""
+        for _ in range(5):
+            self.agent.statistics.add_alarm("Enemy")
+            self.agent.check_alarm_spike("Enemy")
+
+        spike_messages = [
+            call
+            for call in self.mock_sink.write_message.call_args_list
+            if "alarm spike" in call.args[0]
+        ]
+        self.assertEqual(len(spike_messages), 1)
+        self.assertTrue(self.agent.alarm_spikes["Enemy"])
+
+    def test_statistics_history_stored(self):
+        """Test the alarm history is stored next to the settings file."""
+        self.agent.statistics.add_alarm("Enemy")
+        self.agent.statistics.flush()
+
+        store = self.agent.statistics.store
+        self.assertEqual(store.path.parent, self.settings_path.parent)
+        self.assertEqual(store.totals(), {"Enemy": 1})
+
+    def test_profile_requires_running_agent(self):
+        """Test profiling is only requested while the agent runs."""
+        self.assertFalse(self.agent.request_profile())
+        self.assertFalse(self.agent.profiler.is_active)
+        self.mock_sink.write_message.assert_called_with(
+            "System: EVE Alert is not running."
+        )
+
+    def test_metrics_endpoint(self):
+        """Test the metrics endpoint follows the settings."""
+        self.assertIsNone(self.agent.metrics)
+
+        self.agent.set_metrics(True, 0)
+        self.addCleanup(self.agent.set_metrics, False)
+        self.assertTrue(self.agent.metrics_server.is_running)
+
+        region = self.agent.get_region("Alert")
+        self.agent.wincap.get_screenshot_value = MagicMock(return_value=(None, None))
+        self.assertIsNone(self.agent.check_region(region))
+
+        self.agent.set_metrics(False)
+        self.assertIsNone(self.agent.metrics)
+        self.assertIsNone(self.agent.metrics_server)
+
+    def test_metrics_record_region_checks(self):
+        """Test matched frames are counted with their matching time."""
+        self.agent.set_metrics(True, 0)
+        self.addCleanup(self.agent.set_metrics, False)
+        region = self.agent.get_region("Alert")
+        self.agent.wincap.get_screenshot_value = MagicMock(
+            return_value=(np.zeros((200, 200, 3), dtype=np.uint8), None)
+        )
+        region.vision.find = MagicMock(return_value=[(10, 10)])
+
+        self.assertTrue(self.agent.check_region(region))
+
+        metrics = self.agent.metrics
+        self.assertEqual(metrics.frames_processed.get(region="Alert"), 1)
+        self.assertEqual(metrics.match_seconds.count(region="Alert"), 1)
+
     def test_vision_debug_mode_sync(self):
         """Test vision debug mode synchronization."""
         # Enable enemy vision debug
@@ -201,6 +336,106 @@ class TestAlertAgent(unittest.TestCase):
         self.agent.alert_vision_faction.debug_mode_faction = True
         self.assertTrue(self.agent.alert_vision_faction.is_faction_vision_open)
 
+    def test_named_regions(self):
+        """Test extra regions get their own Vision and keep the legacy ones."""
+        alert_vision = self.agent.alert_vision
+        self.test_settings["regions"] = [
+            {
+                "name": "Client 2",
+                "x1": 0,
+                "y1": 0,
+                "x2": 200,
+                "y2": 200,
+                "detection": 70,
+                "system": "Amarr",
+            },
+        ]
+        self.store.save(self.test_settings)
+
+        self.agent.load_settings()
+
+        self.assertEqual(len(self.agent.regions), 3)
+        self.assertIs(self.agent.alert_vision, alert_vision)
+        region = self.agent.get_region("Client 2")
+        self.assertEqual(region.vision.threshold, 70)
+        self.assertEqual(region.vision.region, (0, 0, 200, 200))
+        self.assertEqual(region.vision.needle_img_paths, alert_vision.needle_img_paths)
+
+    def test_alarm_text_and_systems(self):
+        """Test alarms name the detected regions and their systems."""
+        self.test_settings["regions"] = [
+            {"name": "Client 2", "x2": 200, "y2": 200, "system": "Amarr"},
+        ]
+        self.store.save(self.test_settings)
+        self.agent.load_settings()
+        self.agent.get_region("Client 2").detected = True
+
+        self.assertEqual(
+            self.agent.alarm_text("Enemy Appears!"), "Enemy Appears! (Client 2)"
+        )
+        self.assertEqual(
+            self.agent.alarm_text("Faction Spawn!", faction=True), "Faction Spawn!"
+        )
+        self.assertEqual(self.agent.alarm_systems(), "Amarr")
+
+    def test_process_backend(self):
+        """Test the process backend matches in the pool unless debugging."""
+        self.test_settings["vision_backend"] = {"value": "process"}
+        self.store.save(self.test_settings)
+        self.agent.load_settings()
+        self.agent.matcher = MagicMock()
+        self.agent.matcher.match.return_value = [(10, 10)]
+        self.agent.wincap.get_screenshot_value = MagicMock(
+            return_value=(np.zeros((200, 200, 3), dtype=np.uint8), None)
+        )
+        region = self.agent.get_region("Alert")
+        region.vision.find = MagicMock(return_value=[])
+
+        self.assertTrue(self.agent.check_region(region))
+        self.agent.matcher.match.assert_called_once()
+        self.assertEqual(self.agent.matcher.match.call_args.args[0], "Alert")
+
+        region.vision.debug_mode = True
+        self.assertFalse(self.agent.check_region(region))
+        region.vision.find.assert_called_once()
+
+        matcher = self.agent.matcher
+        self.agent.close_matcher()
+        matcher.close.assert_called_once()
+        self.assertIsNone(self.agent.matcher)
+
+    def test_thread_backend_closes_matcher(self):
+        """Test switching back to the thread backend stops the matcher."""
+        self.test_settings["vision_backend"] = {"value": "process"}
+        self.store.save(self.test_settings)
+        self.agent.load_settings()
+        matcher = self.agent.matcher = MagicMock()
+
+        self.test_settings["vision_backend"] = {"value": "thread"}
+        self.store.save(self.test_settings)
+        self.agent.load_settings()
+
+        matcher.close.assert_called_once()
+        self.assertIsNone(self.agent.matcher)
+
+    def test_matcher_started_once(self):
+        """Test concurrent vision workers start a single matcher."""
+        barrier = threading.Barrier(4)
+
+        def get_matcher():
+            barrier.wait()
+            return self.agent.get_matcher()
+
+        with patch("evealert.manager.alertmanager.ProcessMatcher") as matcher_class:
+            matcher_class.side_effect = lambda *args, **kwargs: (
+                time.sleep(0.05) or MagicMock(workers=1)
+            )
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                matchers = list(pool.map(lambda _: get_matcher(), range(4)))
+
+        matcher_class.assert_called_once()
+        self.assertTrue(all(matcher is matchers[0] for matcher in matchers))
+
     def test_configuration_validation_on_load(self):
         """Test configuration validation when loading settings."""
         # Create invalid settings
@@ -225,9 +460,7 @@ class TestAlertAgentAsync(unittest.IsolatedAsyncioTestCase):
 
     async def asyncSetUp(self):
         """Set up async test fixtures."""
-        self.mock_main = MagicMock()
-        self.mock_main.write_message = MagicMock()
-        self.mock_main.getdata = MagicMock()
+        self.mock_sink = MagicMock()
 
         # Create temporary settings
         self.temp_dir = tempfile.mkdtemp()
@@ -248,17 +481,165 @@ class TestAlertAgentAsync(unittest.IsolatedAsyncioTestCase):
         with open(self.settings_path, "w") as f:
             json.dump(test_settings, f)
 
-        self.mock_main.getdata.return_value = self.settings_path
+        self.store = SettingsStore(self.settings_path)
 
         with patch("evealert.manager.alertmanager.AlertAgent._validate_audio_files"):
-            self.agent = AlertAgent(self.mock_main)
+            self.agent = AlertAgent(self.mock_sink, self.store)
 
     async def asyncTearDown(self):
         """Clean up async test fixtures."""
-        import shutil
-
+        self.agent.statistics.close()
         shutil.rmtree(self.temp_dir, ignore_errors=True)
 
+    async def test_vision_thread_checks_all_regions(self):
+        """Test all regions are checked on the worker pool."""
+        self.agent.wincap.get_screenshot_value = MagicMock(
+            return_value=(np.zeros((200, 200, 3), dtype=np.uint8), None)
+        )
+        self.agent.alert_vision.find = MagicMock(return_value=[(10, 10)])
+        self.agent.alert_vision_faction.find_faction = MagicMock(return_value=[])
+
+        task = asyncio.create_task(self.agent.vision_thread())
+        for _ in range(50):
+            await asyncio.sleep(0.05)
+            if self.agent.enemy:
+                break
+        task.cancel()
+
+        self.assertTrue(self.agent.enemy)
+        self.assertFalse(self.agent.faction)
+        # The detection is confirmed by the second matching frame
+        self.assertGreaterEqual(self.agent.wincap.get_screenshot_value.call_count, 4)
+        self.assertEqual(
+            [region.name for region in self.agent.detected_regions()], ["Alert"]
+        )
+
+    async def test_detection_is_debounced(self):
+        """Test single noisy or missed frames don't change the detection."""
+        self.agent.wincap.get_screenshot_value = MagicMock(
+            return_value=(np.zeros((200, 200, 3), dtype=np.uint8), None)
+        )
+        self.agent.alert_vision_faction.find_faction = MagicMock(return_value=[])
+        region = self.agent.get_region("Alert")
+        frames = iter([[(10, 10)], [], [], [(10, 10)], [(10, 10)], []])
+
+        def find(_image):
+            region.vision.last_score = 50.0
+            return next(frames)
+
+        region.vision.find = find
+
+        # A single noisy frame isn't confirmed
+        await self.agent.check_regions()
+        await self.agent.check_regions()
+        await self.agent.check_regions()
+        self.assertFalse(self.agent.enemy)
+
+        # Two of three frames confirm the detection
+        await self.agent.check_regions()
+        await self.agent.check_regions()
+        self.assertTrue(self.agent.enemy)
+        self.assertEqual(region.score, 50.0)
+
+        # A missed frame within the clear delay keeps it
+        await self.agent.check_regions()
+        self.assertTrue(self.agent.enemy)
+        self.assertEqual(region.state.state, "clearing")
+
+    async def test_watchdog_restarts_vision_task(self):
+        """Test a crashed vision task is restarted and keeps ticking."""
+        calls = []
+
+        async def check_regions():
+            calls.append(1)
+            if len(calls) == 1:
+                raise RuntimeError("crash")
+
+        self.agent.check_regions = check_regions
+        task = self.agent.watchdog.watch("vision", self.agent.vision_thread, 10)
+        await asyncio.sleep(0.05)
+        self.agent.watchdog.cancel()
+
+        self.assertTrue(task.done())
+        self.assertGreater(len(calls), 1)
+        self.assertFalse(self.agent.watchdog.tasks["vision"].stalled)
+        self.mock_sink.write_message.assert_any_call(
+            "System: vision task crashed and was restarted.", "yellow"
+        )
+
+    async def test_profile_vision_ticks(self):
+        """Test a requested profile covers the next ticks and is written."""
+        self.agent.wincap.get_screenshot_value = MagicMock(
+            return_value=(np.zeros((200, 200, 3), dtype=np.uint8), None)
+        )
+        self.agent.alert_vision.find = MagicMock(return_value=[])
+        self.agent.alert_vision_faction.find_faction = MagicMock(return_value=[])
+        self.agent.profiler.folder = Path(self.temp_dir) / "logs"
+        self.agent.running = True
+        self.assertTrue(self.agent.request_profile(2))
+        self.assertFalse(self.agent.request_profile(2))
+
+        task = asyncio.create_task(self.agent.vision_thread())
+        for _ in range(50):
+            await asyncio.sleep(0.05)
+            if not self.agent.profiler.is_active:
+                break
+        task.cancel()
+        self.agent.profiler.join(10)
+
+        summaries = list(self.agent.profiler.folder.glob("profile-*.txt"))
+        self.assertEqual(len(summaries), 1)
+        self.assertTrue(summaries[0].with_suffix(".prof").exists())
+        self.assertTrue(summaries[0].with_suffix(".snapshot").exists())
+        text = summaries[0].read_text(encoding="utf-8")
+        self.assertIn("Profile of 2 ticks", text)
+        self.assertIn("region check", text)
+        self.mock_sink.write_message.assert_any_call(
+            f"System: Profile written to {summaries[0]}.", "green"
+        )
+
+    async def test_metrics_skipped_frames(self):
+        """Test failed captures and checks are counted as skipped frames."""
+        self.agent.set_metrics(True, 0)
+        self.addCleanup(self.agent.set_metrics, False)
+        frame = np.zeros((200, 200, 3), dtype=np.uint8)
+        # The alert region is captured, the faction region is not
+        self.agent.wincap.get_screenshot_value = MagicMock(
+            side_effect=lambda y1, x1, x2, y2: (frame if x1 == 100 else None, None)
+        )
+        self.agent.alert_vision.find = MagicMock(side_effect=RuntimeError("boom"))
+
+        await self.agent.check_regions()
+
+        metrics = self.agent.metrics
+        self.assertEqual(metrics.frames_skipped.get(region="Alert", reason="error"), 1)
+        self.assertEqual(metrics.capture_failures.get(region="Faction"), 1)
+        self.assertEqual(metrics.frames_processed.values, {})
+
+    async def test_capture_failure_stops_run_only(self):
+        """Test a failing alert region stops the run but keeps the metrics."""
+        self.agent.set_metrics(True, 0)
+        self.addCleanup(self.agent.set_metrics, False)
+        self.agent.wincap.get_screenshot_value = MagicMock(return_value=(None, None))
+
+        with patch.object(self.agent, "clean_up") as clean_up:
+            await self.agent.check_regions()
+
+        clean_up.assert_not_called()
+        self.assertFalse(self.agent.is_running)
+        self.assertFalse(self.agent.enemy)
+        self.assertTrue(self.agent.metrics_server.is_running)
+        self.assertEqual(self.agent.metrics.capture_failures.get(region="Alert"), 1)
+        self.mock_sink.write_message.assert_any_call(
+            "Wrong Alert Settings (Alert).", "red"
+        )
+        self.assertEqual(
+            self.mock_sink.write_message.call_args_list.count(
+                call("Wrong Alert Settings (Alert).", "red")
+            ),
+            1,
+        )
+
     async def test_lock_mechanism(self):
         """Test async lock for alarm processing."""
         self.assertFalse(self.agent.lock.locked())
@@ -269,5 +650,155 @@ class TestAlertAgentAsync(unittest.IsolatedAsyncioTestCase):
         self.assertFalse(self.agent.lock.locked())
 
 
+class TestAlertAgentLifecycle(unittest.TestCase):
+    """Test cases for starting and stopping the AlertAgent."""
+
+    def setUp(self):
+        """Set up an agent capturing replayed frames."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.settings_path = Path(self.temp_dir) / "settings.json"
+        with open(self.settings_path, "w") as f:
+            json.dump(
+                {
+                    "alert_region_1": {"x": 100, "y": 100},
+                    "alert_region_2": {"x": 300, "y": 300},
+                    "faction_region_1": {"x": 400, "y": 100},
+                    "faction_region_2": {"x": 600, "y": 300},
+                    "server": {"webhook": "", "mute": True},
+                },
+                f,
+            )
+
+        patchers = [
+            patch("evealert.manager.alertmanager.AlertAgent._validate_audio_files"),
+            # Plain functions, mocks would keep every frame in their calls
+            patch("evealert.tools.vision.Vision.find", lambda self, image: []),
+            patch("evealert.tools.vision.Vision.find_faction", lambda self, image: []),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        self.agent = AlertAgent(NullSink(), SettingsStore(self.settings_path))
+        self.agent.wincap = ReplayCapture([np.zeros((200, 200, 3), dtype=np.uint8)])
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.agent.clean_up()
+        self.agent.executor.shutdown()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def run_once(self, ticks: int = 1) -> None:
+        """Start the agent on a thread, wait for vision ticks and stop it."""
+        calls = []
+        check_regions = self.agent.check_regions
+
+        async def counted():
+            await check_regions()
+            calls.append(1)
+
+        self.agent.check_regions = counted
+        thread = threading.Thread(target=self.agent.start)
+        thread.start()
+        deadline = time.monotonic() + 10
+        while len(calls) < ticks and time.monotonic() < deadline:
+            time.sleep(0.001)
+        self.agent.stop()
+        thread.join(10)
+        self.agent.check_regions = check_regions
+
+        self.assertFalse(thread.is_alive())
+        self.assertGreaterEqual(len(calls), ticks)
+
+    def test_stop_cancels_tasks_and_closes_loop(self):
+        """Test a stop from another thread ends the run and its tasks."""
+        self.run_once()
+
+        self.assertFalse(self.agent.is_running)
+        self.assertTrue(self.agent.loop.is_closed())
+        for task in (self.agent.vision_t, self.agent.alert_t, self.agent.watchdog_t):
+            self.assertTrue(task.cancelled())
+        self.assertFalse(self.agent.lock.locked())
+
+    def test_run_flushes_on_agent_thread(self):
+        """Test the logs and history are flushed by the run, not by stop()."""
+        threads = []
+        with patch(
+            "evealert.manager.alertmanager.flush_logs",
+            side_effect=lambda: threads.append(threading.current_thread()),
+        ), patch.object(self.agent.statistics, "flush") as flush:
+            self.agent.stop()
+            self.assertEqual(threads, [])
+            flush.assert_not_called()
+
+            self.run_once()
+
+        self.assertEqual(len(threads), 1)
+        self.assertIsNot(threads[0], threading.current_thread())
+        flush.assert_called_once()
+
+    def test_every_run_has_its_own_loop(self):
+        """Test a restarted agent runs on a new event loop."""
+        self.run_once()
+        first = self.agent.loop
+        self.run_once()
+
+        self.assertIsNot(self.agent.loop, first)
+
+    def test_stop_before_start_completed(self):
+        """Test a stop during the region check doesn't start the tasks."""
+        vision_check = self.agent.vision_check
+
+        async def stopped_check():
+            await vision_check()
+            self.agent.stop()
+            await asyncio.sleep(0)
+
+        self.agent.vision_check = stopped_check
+
+        self.assertFalse(self.agent.start())
+        self.assertTrue(self.agent.loop.is_closed())
+
+    def warm_up(self) -> None:
+        """Start all vision pool threads and run the agent a few times."""
+        # The vision pool is kept between runs, start all its threads first
+        barrier = threading.Barrier(VISION_MAX_WORKERS, timeout=10)
+        workers = [
+            self.agent.executor.submit(barrier.wait) for _ in range(VISION_MAX_WORKERS)
+        ]
+        for worker in workers:
+            worker.result()
+        for _ in range(5):
+            self.run_once()
+        gc.collect()
+
+    def test_start_stop_cycles(self):
+        """Test repeated start/stop cycles leak no threads."""
+        self.warm_up()
+        threads = set(threading.enumerate())
+
+        for _ in range(30):
+            self.run_once()
+
+        self.assertEqual(set(threading.enumerate()) - threads, set())
+
+    @unittest.skipUnless(os.environ.get(STRESS_TESTS_ENV), f"set {STRESS_TESTS_ENV}=1")
+    def test_start_stop_stress(self):
+        """Test 1000 start/stop cycles leak no threads or memory."""
+        self.warm_up()
+        threads = set(threading.enumerate())
+        tracemalloc.start()
+        try:
+            before, _ = tracemalloc.get_traced_memory()
+            for _ in range(1000):
+                self.run_once()
+            gc.collect()
+            after, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        self.assertEqual(set(threading.enumerate()) - threads, set())
+        self.assertLess(after - before, 256 * 1024)
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,91 @@
+"""Unit tests for the headless daemon."""
+
+import io
+import json
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from evealert import daemon
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+class TestDaemon(unittest.TestCase):
+    """Test cases for the daemon entry point."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.settings_path = Path(self.temp_dir) / "settings.json"
+        with open(self.settings_path, "w", encoding="utf-8") as f:
+            json.dump({"server": {"system": "Jita", "mute": True}}, f)
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_no_gui_imports(self):
+        """Test the daemon doesn't import customtkinter."""
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys, evealert.daemon; "
+                "print('customtkinter' in sys.modules or 'tkinter' in sys.modules)",
+            ],
+            cwd=PROJECT_ROOT,
+            capture_output=True,
+            text=True,
+            timeout=120,
+            check=True,
+        )
+
+        self.assertEqual(result.stdout.strip().splitlines()[-1], "False")
+
+    def test_parse_args(self):
+        """Test command line arguments."""
+        args = daemon.parse_args(["--settings", str(self.settings_path), "-v"])
+
+        self.assertEqual(args.settings, str(self.settings_path))
+        self.assertTrue(args.verbose)
+
+    @patch("evealert.manager.alertmanager.AlertAgent._validate_audio_files")
+    @patch("evealert.manager.alertmanager.AlertAgent.start", return_value=False)
+    def test_start_failure(self, mock_start, _mock_validate):
+        """Test the exit code when the agent couldn't start."""
+        with patch("sys.stdout", new_callable=io.StringIO):
+            exit_code = daemon.main(["--settings", str(self.settings_path)])
+
+        self.assertEqual(exit_code, 1)
+        mock_start.assert_called_once()
+
+    @patch("evealert.manager.alertmanager.AlertAgent._validate_audio_files")
+    @patch("evealert.manager.alertmanager.AlertAgent.shutdown")
+    @patch("evealert.manager.alertmanager.AlertAgent.start", return_value=True)
+    def test_shutdown_on_exit(self, _mock_start, mock_shutdown, _mock_validate):
+        """Test the agent resources are released when the daemon exits."""
+        with patch("sys.stdout", new_callable=io.StringIO):
+            daemon.main(["--settings", str(self.settings_path)])
+
+        mock_shutdown.assert_called_once()
+
+    @patch("evealert.manager.alertmanager.AlertAgent._validate_audio_files")
+    @patch("evealert.manager.alertmanager.AlertAgent.start", return_value=True)
+    def test_agent_uses_settings_file(self, _mock_start, _mock_validate):
+        """Test the agent reads the settings file passed on the command line."""
+        with patch("evealert.daemon.AlertAgent", wraps=daemon.AlertAgent) as agent:
+            with patch("sys.stdout", new_callable=io.StringIO):
+                exit_code = daemon.main(["--settings", str(self.settings_path)])
+
+        self.assertEqual(exit_code, 0)
+        store = agent.call_args[0][1]
+        self.assertEqual(store.load()["server"]["system"], "Jita")
+
+
+if __name__ == "__main__":
+    unittest.main()
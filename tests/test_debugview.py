@@ -0,0 +1,108 @@
+"""Unit tests for the debug visualization renderer."""
+
+import time
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+
+from evealert.constants import CV_DETECTION_COLOR
+from evealert.tools.debugview import DebugRenderer, draw_rectangles
+
+
+def wait_for(condition, timeout=2.0):
+    """Wait until a condition is true."""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+class TestDrawRectangles(unittest.TestCase):
+    """Test cases for draw_rectangles function."""
+
+    def test_draws_on_one_copy(self):
+        """Test all boxes are drawn on a copy of the frame."""
+        frame = np.zeros((100, 100, 3), dtype=np.uint8)
+
+        image = draw_rectangles(frame, [(10, 10, 20, 20), (50, 50, 30, 30)])
+
+        self.assertFalse(frame.any())
+        self.assertEqual(tuple(image[10, 15]), CV_DETECTION_COLOR)
+        self.assertEqual(tuple(image[50, 60]), CV_DETECTION_COLOR)
+
+    def test_grayscale_frame(self):
+        """Test grayscale frames are converted to BGR."""
+        image = draw_rectangles(np.zeros((40, 40), dtype=np.uint8), [])
+
+        self.assertEqual(image.shape, (40, 40, 3))
+
+
+class TestDebugRenderer(unittest.TestCase):
+    """Test cases for DebugRenderer class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.shown = []
+        patches = [
+            patch("cv2.imshow", side_effect=self.imshow),
+            patch("cv2.waitKey"),
+            patch("cv2.destroyWindow"),
+        ]
+        self.mock_imshow, self.mock_wait_key, self.mock_destroy = [
+            p.start() for p in patches
+        ]
+        for p in patches:
+            self.addCleanup(p.stop)
+        self.renderer = DebugRenderer(fps=5)
+        self.addCleanup(self.renderer.stop)
+
+    def imshow(self, window, image):
+        """Record the shown frames by their first pixel value."""
+        self.shown.append((window, int(image[0, 0, 0])))
+
+    @staticmethod
+    def frame(value):
+        """Create a frame filled with a value."""
+        return np.full((20, 20, 3), value, dtype=np.uint8)
+
+    def test_latest_frame_at_fps(self):
+        """Test frames are throttled and only the latest one is shown."""
+        self.renderer.submit("Enemy Vision", self.frame(1), [])
+        self.assertTrue(wait_for(lambda: self.shown))
+        for value in range(2, 12):
+            self.renderer.submit("Enemy Vision", self.frame(value), [])
+
+        self.assertTrue(wait_for(lambda: self.shown[-1][1] == 11))
+        time.sleep(self.renderer.interval)
+
+        self.assertLessEqual(len(self.shown), 3)
+        self.assertTrue(self.mock_wait_key.called)
+
+    def test_close_and_stop(self):
+        """Test windows are destroyed on close and stop."""
+        self.renderer.submit("Enemy Vision", self.frame(1), [])
+        self.renderer.submit("Faction Vision", self.frame(2), [])
+        self.assertTrue(wait_for(lambda: len(self.shown) == 2))
+
+        self.renderer.close("Enemy Vision")
+        self.assertTrue(wait_for(lambda: self.mock_destroy.call_count == 1))
+        self.mock_destroy.assert_called_with("Enemy Vision")
+
+        self.renderer.stop()
+
+        self.assertFalse(self.renderer.is_running)
+        self.mock_destroy.assert_called_with("Faction Vision")
+
+    def test_close_unknown_window(self):
+        """Test closing a window that was never shown does nothing."""
+        self.renderer.close("Enemy Vision")
+
+        self.assertFalse(self.renderer.is_running)
+        self.mock_destroy.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
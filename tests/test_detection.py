@@ -0,0 +1,110 @@
+"""Unit tests for the debounced detection state."""
+
+import copy
+import unittest
+
+from evealert.manager.detection import (
+    STATE_CLEAR,
+    STATE_CLEARING,
+    STATE_DETECTED,
+    STATE_PENDING,
+    DetectionFilter,
+    DetectionState,
+)
+from evealert.settings.store import DEFAULT_SETTINGS
+from evealert.settings.validator import ConfigValidator
+
+
+class TestDetectionState(unittest.TestCase):
+    """Test cases for the DetectionState class."""
+
+    def setUp(self):
+        """Set up a 2-of-3 state with a 1 second clear delay."""
+        self.state = DetectionState(
+            DetectionFilter(
+                confirm_frames=2, window_frames=3, clear_delay=1.0, hysteresis=5
+            )
+        )
+
+    def feed(self, frames, start=0.0, step=0.1):
+        """Feed (matched, score) frames and return the detections."""
+        return [
+            self.state.update(matched, score, 90, now=start + index * step)
+            for index, (matched, score) in enumerate(frames)
+        ]
+
+    def test_confirmation(self):
+        """Test a detection needs 2 matching frames within 3 frames."""
+        self.assertEqual(
+            self.feed([(True, 95), (False, 40), (False, 40), (True, 95)]),
+            [False, False, False, False],
+        )
+        self.assertEqual(self.state.state, STATE_PENDING)
+
+        self.assertTrue(self.state.update(True, 95, 90, now=0.5))
+        self.assertEqual(self.state.state, STATE_DETECTED)
+
+    def test_clear_delay(self):
+        """Test a detection clears after 1 second without a matching frame."""
+        self.feed([(True, 95), (True, 95)])
+
+        self.assertTrue(self.state.update(False, 40, 90, now=0.5))
+        self.assertEqual(self.state.state, STATE_CLEARING)
+        self.assertTrue(self.state.update(False, 40, 90, now=1.0))
+        self.assertFalse(self.state.update(False, 40, 90, now=1.1))
+        self.assertEqual(self.state.state, STATE_CLEAR)
+
+        # A cleared detection needs a new confirmation
+        self.assertFalse(self.state.update(True, 95, 90, now=1.2))
+
+    def test_hysteresis(self):
+        """Test a detected region keeps matching 5 percent below threshold."""
+        # Below the threshold a region isn't detected
+        self.assertEqual(self.feed([(False, 88), (False, 88)]), [False, False])
+
+        self.feed([(True, 95), (True, 95)], start=1.0)
+        self.assertTrue(self.state.update(False, 86, 90, now=5.0))
+        self.assertEqual(self.state.state, STATE_DETECTED)
+        self.assertTrue(self.state.update(False, 84, 90, now=5.5))
+        self.assertFalse(self.state.update(False, None, 90, now=6.1))
+
+    def test_unfiltered(self):
+        """Test 1-of-1 without delay and hysteresis follows every frame."""
+        self.state.configure(DetectionFilter(1, 1, 0.0, 0.0))
+
+        self.assertEqual(
+            self.feed([(True, 95), (False, 89), (True, 95)]), [True, False, True]
+        )
+
+    def test_configure_and_reset(self):
+        """Test new settings keep the detection and reset clears it."""
+        self.feed([(True, 95), (True, 95)])
+
+        self.state.configure(DetectionFilter(3, 5, 1.0, 5))
+        self.assertTrue(self.state.detected)
+
+        self.state.reset()
+        self.assertFalse(self.state.detected)
+        self.assertEqual(self.state.state, STATE_CLEAR)
+
+    def test_validation(self):
+        """Test the detection_filter setting is validated."""
+        settings = {
+            "detection_filter": copy.deepcopy(DEFAULT_SETTINGS["detection_filter"])
+        }
+        self.assertEqual(
+            DetectionFilter.from_settings(settings["detection_filter"]),
+            DetectionFilter(),
+        )
+        self.assertEqual(ConfigValidator.validate_settings_dict(settings), (True, []))
+
+        settings["detection_filter"]["confirm_frames"] = 4
+        settings["detection_filter"]["clear_delay"] = -1
+        valid, errors = ConfigValidator.validate_settings_dict(settings)
+
+        self.assertFalse(valid)
+        self.assertEqual(len(errors), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+"""Unit tests for the streaming history export."""
+
+import csv
+import json
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from evealert.export import (
+    FORMAT_COLUMNS,
+    FORMAT_CSV,
+    FORMAT_JSON,
+    FORMAT_NDJSON,
+    HistoryExporter,
+    format_from_path,
+)
+from evealert.history import AlarmHistoryStore
+from evealert.statistics import AlarmEvent, AlarmStatistics
+
+
+class TestHistoryExporter(unittest.TestCase):
+    """Test cases for HistoryExporter class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        store = AlarmHistoryStore(self.temp_dir / "history.db")
+        for number in range(25):
+            alarm_type = "Enemy" if number % 5 else "Faction"
+            store.append(AlarmEvent(alarm_type, 1000.0 + number))
+        store.flush()
+        self.stats = AlarmStatistics(store=store)
+        self.addCleanup(self.stats.close)
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def export(self, name, **kwargs):
+        """Export the history in the background and wait for it."""
+        exporter = HistoryExporter(
+            self.stats, self.temp_dir / name, chunk_size=4, **kwargs
+        )
+        exporter.start_export()
+        exporter.join(10)
+        self.assertFalse(exporter.is_running)
+        self.assertIsNone(exporter.error)
+        return exporter
+
+    def test_format_from_path(self):
+        """Test the export format follows the file extension."""
+        self.assertEqual(format_from_path("a.csv"), FORMAT_CSV)
+        self.assertEqual(format_from_path("a.ndjson"), FORMAT_NDJSON)
+        self.assertEqual(format_from_path("a.columns.jsonl"), FORMAT_COLUMNS)
+        self.assertEqual(format_from_path("a.json"), FORMAT_JSON)
+        self.assertEqual(format_from_path("a.txt"), FORMAT_CSV)
+
+    def test_csv(self):
+        """Test the CSV export contains all alarms and reports progress."""
+        exporter = self.export("history.csv")
+
+        with open(exporter.path, newline="", encoding="utf-8") as file:
+            rows = list(csv.reader(file))
+        self.assertEqual(rows[0], ["Timestamp", "Alarm Type"])
+        self.assertEqual(len(rows), 26)
+        self.assertEqual((exporter.written, exporter.total), (25, 25))
+        self.assertEqual(exporter.progress, 1.0)
+
+    def test_ndjson_filtered(self):
+        """Test the time range and type filters."""
+        exporter = self.export("history.ndjson", start=1005, end=1015, types=["Enemy"])
+
+        lines = exporter.path.read_text(encoding="utf-8").splitlines()
+        records = [json.loads(line) for line in lines]
+        self.assertEqual(len(records), 8)
+        self.assertEqual({record["alarm_type"] for record in records}, {"Enemy"})
+        self.assertEqual(records[0]["unix_time"], 1006.0)
+
+    def test_columns(self):
+        """Test the columnar export writes one row group per chunk."""
+        exporter = self.export("history.columns.jsonl")
+
+        groups = [
+            json.loads(line)
+            for line in exporter.path.read_text(encoding="utf-8").splitlines()
+        ]
+        self.assertEqual([group["rows"] for group in groups], [4] * 6 + [1])
+        self.assertEqual(groups[0]["unix_time"], [1000.0, 1001.0, 1002.0, 1003.0])
+        self.assertEqual(groups[0]["alarm_type"][0], "Faction")
+
+    def test_json(self):
+        """Test the JSON export is one valid document with the summary."""
+        exporter = self.export("history.json")
+
+        data = json.loads(exporter.path.read_text(encoding="utf-8"))
+        self.assertEqual(data["export_info"]["total_alarms"], 25)
+        self.assertEqual(len(data["history"]), 25)
+
+    def test_cancel_keeps_target(self):
+        """Test a cancelled export leaves the target file untouched."""
+        target = self.temp_dir / "history.csv"
+        target.write_text("old", encoding="utf-8")
+        exporter = HistoryExporter(self.stats, target, chunk_size=4)
+        exporter.cancel()
+
+        self.assertFalse(exporter.run())
+
+        self.assertEqual(target.read_text(encoding="utf-8"), "old")
+        self.assertEqual(list(self.temp_dir.glob(".history.csv.*")), [])
+
+    def test_without_store(self):
+        """Test statistics without a store export the in-memory history."""
+        self.stats = AlarmStatistics()
+        self.stats.add_alarm("Enemy")
+
+        exporter = self.export("memory.ndjson")
+
+        self.assertEqual(exporter.written, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,143 @@
+"""Unit tests for the persistent alarm history."""
+
+import shutil
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from evealert.history import AlarmHistoryStore
+from evealert.statistics import AlarmEvent, AlarmStatistics
+
+
+class TestAlarmHistoryStore(unittest.TestCase):
+    """Test cases for AlarmHistoryStore class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.path = self.temp_dir / "history.db"
+        self.store = AlarmHistoryStore(self.path, flush_interval=60)
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.store.close()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def add(self, *events):
+        """Append (alarm_type, timestamp) events and write them."""
+        for alarm_type, timestamp in events:
+            self.store.append(AlarmEvent(alarm_type, timestamp))
+        self.assertTrue(self.store.flush())
+
+    def test_writes_are_batched(self):
+        """Test appended events are only written with the next batch."""
+        self.store.append(AlarmEvent("Enemy", 1.0))
+
+        self.assertEqual(self.store.count(), 0)
+        self.assertTrue(self.store.flush())
+        self.assertEqual(self.store.count(), 1)
+
+    def test_batch_size(self):
+        """Test a full batch is written without waiting for the interval."""
+        self.store.batch_size = 10
+        for number in range(10):
+            self.store.append(AlarmEvent("Enemy", float(number)))
+
+        deadline = time.monotonic() + 2.0
+        while self.store.count() < 10 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(self.store.count(), 10)
+
+    def test_totals_persist(self):
+        """Test the totals survive reopening the database."""
+        self.add(("Enemy", 1.0), ("Enemy", 2.0), ("Faction", 3.0))
+        self.store.close()
+
+        reopened = AlarmHistoryStore(self.path)
+        self.addCleanup(reopened.close)
+
+        self.assertEqual(reopened.totals(), {"Enemy": 2, "Faction": 1})
+
+    def test_recent(self):
+        """Test the most recent events are returned oldest first."""
+        self.add(*[("Enemy", float(number)) for number in range(5)])
+
+        recent = self.store.recent(3)
+
+        self.assertEqual([event.timestamp for event in recent], [2.0, 3.0, 4.0])
+
+    def test_iter_events_filters(self):
+        """Test streaming filters by time range and alarm type."""
+        self.add(
+            *[("Enemy" if n % 2 else "Faction", float(n)) for n in range(10)],
+        )
+
+        chunks = list(
+            self.store.iter_events(start=2, end=8, types=["Enemy"], chunk_size=2)
+        )
+
+        self.assertEqual([len(chunk) for chunk in chunks], [2, 1])
+        self.assertEqual(
+            [event.timestamp for chunk in chunks for event in chunk], [3.0, 5.0, 7.0]
+        )
+        self.assertEqual(self.store.count(start=2, end=8, types=["Enemy"]), 3)
+
+
+class TestPersistentStatistics(unittest.TestCase):
+    """Test cases for AlarmStatistics with a history store."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.path = self.temp_dir / "history.db"
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_statistics_restored(self):
+        """Test totals and history are restored, the session starts empty."""
+        stats = AlarmStatistics(store=AlarmHistoryStore(self.path))
+        stats.add_alarm("Enemy")
+        stats.add_alarm("Faction")
+        stats.add_alarm("Enemy")
+        stats.close()
+
+        restored = AlarmStatistics(store=AlarmHistoryStore(self.path))
+        self.addCleanup(restored.close)
+
+        self.assertEqual(restored.total_alarms, 3)
+        self.assertEqual(restored.total_by_type, {"Enemy": 2, "Faction": 1})
+        self.assertEqual(restored.session_alarms, 0)
+        self.assertEqual(
+            [event.alarm_type for event in restored.get_recent_history()],
+            ["Enemy", "Faction", "Enemy"],
+        )
+
+    def test_clear_history_keeps_store(self):
+        """Test clearing the history only clears the recent events."""
+        stats = AlarmStatistics(store=AlarmHistoryStore(self.path))
+        self.addCleanup(stats.close)
+        stats.add_alarm("Enemy")
+        stats.add_alarm("Faction")
+
+        stats.clear_history()
+        stats.flush()
+
+        self.assertEqual(stats.get_recent_history(), [])
+        self.assertEqual(stats.total_alarms, 2)
+        self.assertEqual(stats.store.count(), 2)
+
+    def test_without_store(self):
+        """Test statistics without a store stay in memory."""
+        stats = AlarmStatistics()
+        stats.add_alarm("Enemy")
+        stats.flush()
+        stats.close()
+
+        self.assertEqual(stats.total_alarms, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
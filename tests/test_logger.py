@@ -0,0 +1,89 @@
+"""Unit tests for the queue based logging setup."""
+
+import logging
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from logging.handlers import QueueHandler
+from pathlib import Path
+from unittest.mock import patch
+
+from evealert.settings import logger as log_setup
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+class TestQueueLogging(unittest.TestCase):
+    """Test cases for the QueueHandler/QueueListener logging setup."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        patcher = patch.object(log_setup, "LOG_PATH", self.temp_dir)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.names = ["queue_test_a", "queue_test_b"]
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        for name in self.names:
+            log_setup._set_handlers(name, [])
+            logging.getLogger(name).handlers.clear()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def read(self, name):
+        """Read the log file of a logger."""
+        return (self.temp_dir / f"{name}.log").read_text(encoding="utf-8")
+
+    def test_loggers_only_enqueue(self):
+        """Test loggers hand their records to the queue."""
+        logger = log_setup.setup_logger(self.names[0], level="DEBUG")
+
+        self.assertEqual(len(logger.handlers), 1)
+        self.assertIsInstance(logger.handlers[0], QueueHandler)
+
+    def test_records_written_to_own_file(self):
+        """Test the listener writes each record to its logger's file."""
+        log_a = log_setup.setup_logger(self.names[0], level="DEBUG")
+        log_b = log_setup.setup_logger(self.names[1], level="DEBUG")
+
+        log_a.info("first %s", "a")
+        log_b.warning("second")
+        try:
+            raise ValueError("broken")
+        except ValueError:
+            log_a.exception("failed")
+
+        self.assertTrue(log_setup.flush_logs())
+        content_a = self.read(self.names[0])
+        self.assertIn("first a", content_a)
+        self.assertEqual(content_a.count("ValueError: broken"), 1)
+        self.assertNotIn("second", content_a)
+        self.assertIn("second", self.read(self.names[1]))
+
+    def test_stop_writes_pending_records(self):
+        """Test stopping the logging writes the queued records on exit."""
+        code = (
+            "import logging, sys\n"
+            "from pathlib import Path\n"
+            "from evealert.settings import logger as log_setup\n"
+            "log_setup.LOG_PATH = Path(sys.argv[1])\n"
+            "log = log_setup.setup_logger('queue_test_exit', level='INFO')\n"
+            "for number in range(1000):\n"
+            "    log.info('record %d', number)\n"
+            "log_setup.stop_logging()\n"
+        )
+        subprocess.run(
+            [sys.executable, "-c", code, str(self.temp_dir)],
+            cwd=PROJECT_ROOT,
+            timeout=60,
+            check=True,
+        )
+
+        self.assertIn("record 999", self.read("queue_test_exit"))
+
+
+if __name__ == "__main__":
+    unittest.main()
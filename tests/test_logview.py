@@ -0,0 +1,88 @@
+"""Unit tests for the main window log view."""
+
+import unittest
+from unittest.mock import MagicMock
+
+from evealert.menu.logview import LogView
+
+
+class FakeText:
+    """Minimal stand-in for a Tk text widget, inserting only at the top."""
+
+    def __init__(self):
+        self.content = ""
+        self.inserts = []
+        self.after = MagicMock(return_value="after#1")
+        self.after_cancel = MagicMock()
+
+    def insert(self, index, text, tag):
+        assert index == "1.0"
+        self.inserts.append((text, tag))
+        self.content = text + self.content
+
+    def index(self, index):
+        assert index == "end-1c"
+        return f"{self.content.count(chr(10)) + 1}.0"
+
+    def delete(self, start, end):
+        assert end == "end"
+        line = int(start.split(".")[0])
+        self.content = "".join(self.content.splitlines(True)[: line - 1])
+
+    def lines(self):
+        return [line.split("] ", 1)[1] for line in self.content.splitlines()]
+
+
+class TestLogView(unittest.TestCase):
+    """Test cases for LogView class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.widget = FakeText()
+        self.view = LogView(self.widget, max_lines=3, flush_interval=100)
+
+    def test_batched_newest_first(self):
+        """Test messages are written in one batch with the newest on top."""
+        self.view.write("one")
+        self.view.write("two")
+        self.view.write("three", "red")
+
+        self.assertEqual(self.widget.content, "")
+        self.assertEqual(self.view.flush(), 3)
+
+        self.assertEqual(self.widget.lines(), ["three", "two", "one"])
+        self.assertEqual([tag for _, tag in self.widget.inserts], ["normal", "red"])
+        self.assertEqual(self.view.flush(), 0)
+
+    def test_lines_are_capped(self):
+        """Test the widget and history keep only the newest lines."""
+        for number in range(5):
+            self.view.write(f"message {number}")
+            self.view.flush()
+        for number in range(5, 105):
+            self.view.write(f"message {number}")
+        self.view.flush()
+
+        self.assertEqual(
+            self.widget.lines(), ["message 104", "message 103", "message 102"]
+        )
+        self.assertEqual(len(self.view.lines), 3)
+        self.assertEqual(len(self.widget.inserts), 6)
+
+    def test_timer(self):
+        """Test the flush timer is scheduled, rescheduled and cancelled."""
+        self.view.start()
+        self.view.start()
+        self.widget.after.assert_called_once_with(100, self.view._tick)
+
+        self.view.write("tick")
+        self.view._tick()
+        self.assertEqual(self.widget.lines(), ["tick"])
+        self.assertEqual(self.widget.after.call_count, 2)
+
+        self.view.stop()
+        self.widget.after_cancel.assert_called_once_with("after#1")
+
+
+if __name__ == "__main__":
+    unittest.main()
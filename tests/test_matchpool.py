@@ -0,0 +1,167 @@
+"""Unit tests for the process pool matching backend."""
+
+import shutil
+import tempfile
+import unittest
+from multiprocessing import shared_memory
+from pathlib import Path
+
+import cv2 as cv
+import numpy as np
+
+from evealert.exceptions import RegionSizeError
+from evealert.tools import matchpool
+from evealert.tools.matchpool import ProcessMatcher
+from evealert.tools.vision import (
+    match_template,
+    match_template_scored,
+    normalize_haystack,
+    rectangle_centers,
+)
+
+
+def make_template(seed, size=24):
+    """Create a template image with a random pattern."""
+    rng = np.random.default_rng(seed)
+    return rng.integers(0, 255, (size, size, 3), dtype=np.uint8)
+
+
+def make_frame(template, x, y, shape=(120, 160, 3)):
+    """Create a noisy frame with the template pasted at x, y."""
+    rng = np.random.default_rng(42)
+    frame = rng.integers(100, 110, shape, dtype=np.uint8)
+    height, width = template.shape[:2]
+    frame[y : y + height, x : x + width] = template
+    return frame
+
+
+class TestMatchTemplate(unittest.TestCase):
+    """Test cases for the shared matching functions."""
+
+    def test_match_template_centers(self):
+        """Test a pasted template is found at its center."""
+        template = make_template(1)
+        frame = make_frame(template, 30, 40)
+
+        rectangles = match_template(
+            normalize_haystack(frame),
+            normalize_haystack(template),
+            cv.TM_CCOEFF_NORMED,
+            90,
+        )
+
+        self.assertEqual(rectangle_centers(rectangles), [(42, 52)])
+
+    def test_match_template_score(self):
+        """Test the best match score is returned without a match as well."""
+        template = make_template(1)
+        frame = make_frame(template, 30, 40)
+
+        rectangles, score = match_template_scored(
+            normalize_haystack(frame),
+            normalize_haystack(template),
+            cv.TM_CCOEFF_NORMED,
+            90,
+        )
+        self.assertEqual(len(rectangles), 1)
+        self.assertGreater(score, 99)
+
+        rectangles, score = match_template_scored(
+            normalize_haystack(frame),
+            normalize_haystack(make_template(2)),
+            cv.TM_CCOEFF_NORMED,
+            90,
+        )
+        self.assertEqual(len(rectangles), 0)
+        self.assertLess(score, 90)
+
+
+class TestProcessMatcher(unittest.TestCase):
+    """Test cases for ProcessMatcher class."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Start one matcher for all tests, spawning workers is slow."""
+        cls.temp_dir = tempfile.mkdtemp()
+        cls.img_dir = Path(cls.temp_dir) / "img"
+        cls.img_dir.mkdir()
+        cls.template = make_template(1)
+        cls.other = make_template(2)
+        cv.imwrite(str(cls.img_dir / "image_1.png"), cls.template)
+        cv.imwrite(str(cls.img_dir / "image_2.png"), cls.other)
+
+        cls.matcher = ProcessMatcher(
+            cls.img_dir,
+            {"image_": [str(cls.img_dir / "image_1.png")]},
+            cache_dir=Path(cls.temp_dir) / "cache",
+            workers=1,
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up test fixtures."""
+        cls.matcher.close()
+        shutil.rmtree(cls.temp_dir, ignore_errors=True)
+
+    def test_match_and_reload(self):
+        """Test matches are found and template changes reach the worker."""
+        frame = make_frame(self.other, 80, 20)
+        self.assertEqual(self.matcher.match("Client 2", frame, "image_", 90), [])
+
+        self.matcher.set_templates({"image_": [str(self.img_dir / "image_2.png")]})
+        points = self.matcher.match("Client 2", frame, "image_", 90)
+
+        self.assertEqual(points, [(92, 32)])
+        self.assertGreater(self.matcher.scores["Client 2"], 99)
+
+    def test_region_smaller_than_template(self):
+        """Test a frame smaller than a template raises RegionSizeError."""
+        frame = np.zeros((24, 16, 3), dtype=np.uint8)
+
+        with self.assertRaises(RegionSizeError):
+            self.matcher.match("Small", frame, "image_", 90)
+
+    def test_frame_blocks_per_region(self):
+        """Test each region gets one reused shared memory block."""
+        frame = make_frame(self.template, 10, 10)
+        self.matcher.match("Alert", frame, "image_", 90)
+        block = self.matcher._frames["Alert"]
+        self.matcher.match("Alert", frame, "image_", 90)
+
+        self.assertIs(self.matcher._frames["Alert"], block)
+        self.assertGreaterEqual(block.size, frame.nbytes)
+
+    def test_worker_closes_replaced_blocks(self):
+        """Test a worker closes the previous block of a resized region."""
+        blocks = [
+            shared_memory.SharedMemory(create=True, size=size) for size in (64, 128)
+        ]
+        self.addCleanup(matchpool._worker_frames.clear)
+        for block in blocks:
+            self.addCleanup(block.unlink)
+            self.addCleanup(block.close)
+
+        first = matchpool._attach_frame("Alert", blocks[0].name)
+        self.assertIs(matchpool._attach_frame("Alert", blocks[0].name), first)
+        second = matchpool._attach_frame("Alert", blocks[1].name)
+
+        self.assertIsNone(first.buf)
+        self.assertEqual(second.name, blocks[1].name)
+        self.assertEqual(list(matchpool._worker_frames), ["Alert"])
+        second.close()
+
+    def test_close_releases_blocks(self):
+        """Test closing a matcher unlinks its shared memory blocks."""
+        matcher = ProcessMatcher(self.img_dir, {"image_": []}, workers=1)
+        block = matcher._frame_block("Alert", 1024)
+        name = block.name
+
+        matcher.close()
+
+        self.assertEqual(matcher._frames, {})
+        with self.assertRaises(FileNotFoundError):
+            shared_memory.SharedMemory(name=name)
+
+
+if __name__ == "__main__":
+    unittest.main()
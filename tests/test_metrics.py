@@ -0,0 +1,146 @@
+"""Unit tests for the Prometheus metrics."""
+
+import unittest
+import urllib.error
+import urllib.request
+
+from evealert.metrics import (
+    AgentMetrics,
+    Counter,
+    Gauge,
+    Histogram,
+    Metric,
+    MetricsRegistry,
+    MetricsServer,
+)
+from evealert.statistics import AlarmStatistics
+
+
+class TestMetrics(unittest.TestCase):
+    """Test cases for the metric types."""
+
+    def test_counter(self):
+        """Test counters add up per label set and escape label values."""
+        counter = Counter("test_total", "Test counter.", ("region",))
+        counter.inc(region="Alert")
+        counter.inc(2, region='Client "2"')
+
+        self.assertEqual(counter.get(region="Alert"), 1)
+        self.assertEqual(
+            counter.render(),
+            "# HELP test_total Test counter.\n"
+            "# TYPE test_total counter\n"
+            'test_total{region="Alert"} 1\n'
+            'test_total{region="Client \\"2\\""} 2\n',
+        )
+        with self.assertRaises(ValueError):
+            counter.inc(-1, region="Alert")
+        with self.assertRaises(ValueError):
+            counter.inc(kind="Alert")
+
+    def test_gauge(self):
+        """Test gauges keep the last value."""
+        gauge = Gauge("test_seconds", "Test gauge.")
+        gauge.set(0.5)
+        gauge.set(0.25)
+
+        self.assertIn("test_seconds 0.25\n", gauge.render())
+
+    def test_histogram(self):
+        """Test histograms render cumulative buckets, sum and count."""
+        histogram = Histogram("test_seconds", "Test histogram.", (0.1, 1))
+        for value in (0.05, 0.5, 0.5, 3):
+            histogram.observe(value)
+
+        lines = histogram.render().splitlines()[2:]
+        self.assertEqual(
+            lines,
+            [
+                'test_seconds_bucket{le="0.1"} 1',
+                'test_seconds_bucket{le="1"} 3',
+                'test_seconds_bucket{le="+Inf"} 4',
+                "test_seconds_sum 4.05",
+                "test_seconds_count 4",
+            ],
+        )
+        self.assertEqual(histogram.count(), 4)
+
+    def test_incomplete_metric(self):
+        """Test a metric type without samples can't be created."""
+
+        class Summary(Metric):
+            kind = "summary"
+
+        with self.assertRaises(TypeError):
+            Summary("evealert_test", "Test.")
+
+    def test_alarms_from_statistics(self):
+        """Test alarm counts are read from the statistics on every scrape."""
+        stats = AlarmStatistics()
+        metrics = AgentMetrics(stats)
+        stats.add_alarm("Enemy")
+        stats.add_alarm("Enemy")
+
+        text = metrics.render()
+
+        self.assertIn('evealert_alarms_total{type="Enemy"} 2\n', text)
+        self.assertIn('evealert_session_alarms{type="Enemy"} 2\n', text)
+
+    def test_frames(self):
+        """Test matched and skipped frames."""
+        metrics = AgentMetrics()
+        metrics.frame("Alert", 0.004)
+        metrics.frame_skipped("Alert", "capture")
+        metrics.frame_skipped("Alert", "error")
+
+        self.assertEqual(metrics.frames_processed.get(region="Alert"), 1)
+        self.assertEqual(metrics.match_seconds.count(region="Alert"), 1)
+        self.assertEqual(metrics.capture_failures.get(region="Alert"), 1)
+        self.assertEqual(metrics.frames_skipped.get(region="Alert", reason="error"), 1)
+
+
+class TestMetricsServer(unittest.TestCase):
+    """Test cases for MetricsServer class."""
+
+    def setUp(self):
+        """Start a server on a free port."""
+        self.registry = MetricsRegistry()
+        self.counter = self.registry.register(Counter("test_total", "Test."))
+        self.server = MetricsServer(self.registry, 0)
+        self.server.start()
+        self.addCleanup(self.server.stop)
+
+    def get(self, path):
+        """Request a path from the server."""
+        url = f"http://127.0.0.1:{self.server.port}{path}"
+        with urllib.request.urlopen(url, timeout=5) as response:
+            return response.headers["Content-Type"], response.read().decode()
+
+    def test_serves_metrics(self):
+        """Test the metrics are served in the text format."""
+        self.counter.inc()
+
+        content_type, body = self.get("/metrics")
+
+        self.assertTrue(content_type.startswith("text/plain; version=0.0.4"))
+        self.assertIn("test_total 1\n", body)
+
+    def test_unknown_path(self):
+        """Test other paths are not found."""
+        with self.assertRaises(urllib.error.HTTPError) as context:
+            self.get("/other")
+        self.assertEqual(context.exception.code, 404)
+
+    def test_stop(self):
+        """Test the server releases its port."""
+        port = self.server.port
+        self.server.stop()
+
+        self.assertFalse(self.server.is_running)
+        server = MetricsServer(self.registry, port)
+        server.start()
+        server.stop()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+"""Unit tests for the monitor topology cache."""
+
+import unittest
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from evealert.tools.monitors import MonitorCache
+
+LEFT = SimpleNamespace(x=0, y=0, width=1920, height=1080)
+RIGHT = SimpleNamespace(x=1920, y=0, width=2560, height=1440)
+
+
+class TestMonitorCache(unittest.TestCase):
+    """Test cases for MonitorCache class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.now = 0.0
+        self.provider = MagicMock(return_value=[LEFT, RIGHT])
+        self.cache = MonitorCache(
+            max_age=60, provider=self.provider, clock=lambda: self.now
+        )
+
+    def test_monitors_are_cached(self):
+        """Test the monitors are only enumerated once within max_age."""
+        for _ in range(10):
+            self.assertEqual(self.cache.monitors(), [LEFT, RIGHT])
+
+        self.assertEqual(self.provider.call_count, 1)
+
+        self.now = 60
+        self.cache.monitors()
+        self.assertEqual(self.provider.call_count, 2)
+
+    def test_invalidate(self):
+        """Test a display change enumerates the monitors again."""
+        self.cache.monitors()
+        self.provider.return_value = [LEFT]
+
+        self.cache.invalidate()
+
+        self.assertEqual(self.cache.monitors(), [LEFT])
+        self.assertEqual(self.cache.refreshes, 2)
+
+    def test_monitor_at(self):
+        """Test the monitor containing a position is found."""
+        self.assertIs(self.cache.monitor_at(100, 100), LEFT)
+        self.assertIs(self.cache.monitor_at(3000, 1200), RIGHT)
+        self.assertIsNone(self.cache.monitor_at(-5, 100))
+
+    def test_provider_error_keeps_last_monitors(self):
+        """Test a failing enumeration keeps the last known monitors."""
+        self.cache.monitors()
+        self.provider.side_effect = RuntimeError("no display")
+        self.cache.invalidate()
+
+        with self.assertLogs("tools", "ERROR"):
+            self.assertEqual(self.cache.monitors(), [LEFT, RIGHT])
+
+
+if __name__ == "__main__":
+    unittest.main()
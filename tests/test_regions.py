@@ -0,0 +1,92 @@
+"""Unit tests for the named monitoring regions."""
+
+import copy
+import unittest
+
+from evealert.constants import (
+    ALERT_IMAGE_PREFIX,
+    FACTION_IMAGE_PREFIX,
+    LEGACY_ALERT_REGION,
+    LEGACY_FACTION_REGION,
+    REGION_FACTION,
+)
+from evealert.manager.regions import AlertRegion, regions_from_settings
+from evealert.settings.store import DEFAULT_SETTINGS
+from evealert.settings.validator import ConfigValidator
+
+
+class TestAlertRegion(unittest.TestCase):
+    """Test cases for AlertRegion class and the settings conversion."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.settings = copy.deepcopy(DEFAULT_SETTINGS)
+        self.settings["alert_region_2"] = {"x": 200, "y": 300}
+        self.settings["faction_region_1"] = {"x": 300, "y": 0}
+        self.settings["faction_region_2"] = {"x": 500, "y": 200}
+        self.settings["faction_scale"] = {"value": 80}
+        self.settings["server"]["system"] = "Jita"
+
+    def test_legacy_conversion(self):
+        """Test the legacy region settings are converted to named regions."""
+        alert, faction = regions_from_settings(self.settings)
+
+        self.assertEqual(alert.name, LEGACY_ALERT_REGION)
+        self.assertEqual(alert.region, (0, 0, 200, 300))
+        self.assertEqual(alert.detection, 90)
+        self.assertEqual(alert.prefix, ALERT_IMAGE_PREFIX)
+        self.assertEqual(faction.name, LEGACY_FACTION_REGION)
+        self.assertEqual(faction.region, (300, 0, 500, 200))
+        self.assertEqual(faction.detection, 80)
+        self.assertEqual(faction.prefix, FACTION_IMAGE_PREFIX)
+        self.assertEqual(faction.system, "Jita")
+
+    def test_named_regions(self):
+        """Test entries of the regions list follow the legacy regions."""
+        self.settings["regions"] = [
+            {"name": "Client 2", "x2": 100, "y2": 100, "system": "Amarr"},
+            {"kind": "faction", "x1": 10, "x2": 50, "y2": 50, "detection": 70},
+        ]
+
+        regions = regions_from_settings(self.settings)
+
+        self.assertEqual(len(regions), 4)
+        self.assertEqual(regions[2].name, "Client 2")
+        self.assertEqual(regions[2].system, "Amarr")
+        self.assertEqual(regions[3].name, "Region 2")
+        self.assertEqual(regions[3].kind, REGION_FACTION)
+        self.assertEqual(regions[3].detection, 70)
+
+    def test_duplicate_names(self):
+        """Test region names must be unique."""
+        self.settings["regions"] = [{"name": LEGACY_ALERT_REGION}]
+
+        with self.assertRaises(ValueError):
+            regions_from_settings(self.settings)
+
+    def test_unknown_kind(self):
+        """Test unknown region kinds are rejected."""
+        with self.assertRaises(ValueError):
+            AlertRegion.from_dict({"name": "Client 2", "kind": "local"})
+
+    def test_round_trip(self):
+        """Test regions can be written back to the settings."""
+        region = AlertRegion("Client 2", REGION_FACTION, 1, 2, 30, 40, 75, "Amarr")
+
+        self.assertEqual(AlertRegion.from_dict(region.to_dict()), region)
+
+    def test_validate_region_entries(self):
+        """Test the validator checks the regions list."""
+        self.settings["regions"] = [
+            {"name": "Client 2", "x2": 100, "y2": 100},
+            {"name": "Client 3", "kind": "local", "x2": 5, "y2": 5},
+        ]
+
+        _, errors = ConfigValidator.validate_settings_dict(self.settings)
+
+        self.assertEqual(len(errors), 2)
+        self.assertTrue(all(error.startswith("Region Client 3") for error in errors))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,193 @@
+"""Unit tests for the settings store."""
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from evealert.settings.store import (
+    DEFAULT_SETTINGS,
+    SOURCE_FILE,
+    SOURCE_SAVE,
+    SettingsStore,
+    merge_settings_with_defaults,
+)
+
+
+class TestSettingsStore(unittest.TestCase):
+    """Test cases for SettingsStore class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.settings_path = Path(self.temp_dir) / "settings.json"
+        self.store = SettingsStore(self.settings_path)
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def write_file(self, settings):
+        """Write settings.json and bump its mtime."""
+        with open(self.settings_path, "w", encoding="utf-8") as f:
+            json.dump(settings, f)
+        stat = os.stat(self.settings_path)
+        os.utime(
+            self.settings_path,
+            ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000),
+        )
+
+    def test_missing_file_writes_defaults(self):
+        """Test defaults are used and written when the file is missing."""
+        settings = self.store.load()
+
+        self.assertEqual(settings, DEFAULT_SETTINGS)
+        self.assertTrue(self.settings_path.exists())
+
+    def test_load_merges_defaults(self):
+        """Test missing keys are filled with default values."""
+        self.write_file({"cooldown_timer": {"value": 10}})
+
+        settings = self.store.load()
+
+        self.assertEqual(settings["cooldown_timer"]["value"], 10)
+        self.assertEqual(settings["volume"]["value"], 100)
+
+    def test_load_returns_copy(self):
+        """Test callers cannot mutate the cached settings."""
+        settings = self.store.load()
+        settings["alert_region_1"]["x"] = 999
+
+        self.assertEqual(self.store.load()["alert_region_1"]["x"], 0)
+        self.assertEqual(DEFAULT_SETTINGS["alert_region_1"]["x"], 0)
+
+    def test_load_does_not_write(self):
+        """Test loading existing settings never rewrites the file."""
+        self.write_file({"cooldown_timer": {"value": 10}})
+        mtime = os.stat(self.settings_path).st_mtime_ns
+
+        self.store.load()
+        self.store.load()
+
+        self.assertEqual(os.stat(self.settings_path).st_mtime_ns, mtime)
+
+    def test_reload_if_unchanged(self):
+        """Test no event is published when the file did not change."""
+        listener = MagicMock()
+        self.store.load()
+        self.store.subscribe(listener)
+
+        self.assertFalse(self.store.reload_if_changed())
+        listener.assert_not_called()
+
+    def test_reload_same_content(self):
+        """Test touching the file without changing content is ignored."""
+        self.write_file({"cooldown_timer": {"value": 10}})
+        listener = MagicMock()
+        self.store.load()
+        self.store.subscribe(listener)
+
+        self.write_file({"cooldown_timer": {"value": 10}})
+
+        self.assertFalse(self.store.reload_if_changed())
+        listener.assert_not_called()
+
+    def test_reload_publishes_event(self):
+        """Test an external edit publishes a typed change event."""
+        listener = MagicMock()
+        self.store.load()
+        self.store.subscribe(listener)
+
+        self.write_file({"cooldown_timer": {"value": 10}})
+
+        self.assertTrue(self.store.reload_if_changed())
+        listener.assert_called_once()
+        event = listener.call_args[0][0]
+        self.assertEqual(event.source, SOURCE_FILE)
+        self.assertIn("cooldown_timer", event.changed_keys)
+        self.assertTrue(event.affects("cooldown_timer", "volume"))
+        self.assertFalse(event.affects("volume"))
+        self.assertEqual(event.settings["cooldown_timer"]["value"], 10)
+
+    def test_reload_keeps_settings_on_invalid_json(self):
+        """Test a broken file keeps the last good settings."""
+        self.write_file({"cooldown_timer": {"value": 10}})
+        self.store.load()
+
+        with open(self.settings_path, "w", encoding="utf-8") as f:
+            f.write("{ broken")
+
+        self.assertFalse(self.store.reload_if_changed())
+        self.assertEqual(self.store.load()["cooldown_timer"]["value"], 10)
+
+    def test_save_writes_only_on_change(self):
+        """Test saving identical settings does not touch the file."""
+        settings = self.store.load()
+        mtime = os.stat(self.settings_path).st_mtime_ns
+
+        self.assertFalse(self.store.save(settings))
+        self.assertEqual(os.stat(self.settings_path).st_mtime_ns, mtime)
+
+    def test_save_publishes_event(self):
+        """Test saving changed settings writes the file and publishes an event."""
+        listener = MagicMock()
+        self.store.subscribe(listener)
+        settings = self.store.load()
+        settings["volume"]["value"] = 50
+
+        self.assertTrue(self.store.save(settings))
+
+        with open(self.settings_path, encoding="utf-8") as f:
+            self.assertEqual(json.load(f)["volume"]["value"], 50)
+        event = listener.call_args[0][0]
+        self.assertEqual(event.source, SOURCE_SAVE)
+        self.assertEqual(event.changed_keys, frozenset({"volume"}))
+        # The saved file must not be reported as an external change
+        self.assertFalse(self.store.reload_if_changed())
+
+    def test_save_leaves_no_temp_files(self):
+        """Test atomic writes clean up their temporary files."""
+        settings = self.store.load()
+        settings["volume"]["value"] = 50
+        self.store.save(settings)
+
+        self.assertEqual(os.listdir(self.temp_dir), ["settings.json"])
+
+    def test_unsubscribe(self):
+        """Test unsubscribed listeners are no longer notified."""
+        listener = MagicMock()
+        self.store.subscribe(listener)
+        self.store.unsubscribe(listener)
+        settings = self.store.load()
+        settings["volume"]["value"] = 50
+
+        self.store.save(settings)
+        listener.assert_not_called()
+
+    def test_listener_error_is_isolated(self):
+        """Test a failing listener does not break saving."""
+        listener = MagicMock()
+        self.store.subscribe(MagicMock(side_effect=RuntimeError("boom")))
+        self.store.subscribe(listener)
+        settings = self.store.load()
+        settings["volume"]["value"] = 50
+
+        self.assertTrue(self.store.save(settings))
+        listener.assert_called_once()
+
+    def test_merge_drops_unknown_keys(self):
+        """Test merging keeps only known settings keys."""
+        merged = merge_settings_with_defaults(
+            {"unknown": 1, "server": {"mute": True}}, DEFAULT_SETTINGS
+        )
+
+        self.assertNotIn("unknown", merged)
+        self.assertTrue(merged["server"]["mute"])
+        self.assertEqual(merged["server"]["system"], "Enter a System Name")
+
+
+if __name__ == "__main__":
+    unittest.main()
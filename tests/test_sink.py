@@ -0,0 +1,95 @@
+"""Unit tests for the Alert Agent output sinks."""
+
+import io
+import threading
+import unittest
+from unittest.mock import MagicMock, call, patch
+
+from evealert.manager.sink import ConsoleSink, QueueSink
+
+
+class TestConsoleSink(unittest.TestCase):
+    """Test cases for ConsoleSink class."""
+
+    def test_status_messages_only_verbose(self):
+        """Test status messages are only printed in verbose mode."""
+        stream = io.StringIO()
+        sink = ConsoleSink(stream)
+
+        sink.write_message("Next check in 2.00 seconds...")
+        sink.write_message("Enemy Appears!", "red")
+
+        output = stream.getvalue()
+        self.assertNotIn("Next check", output)
+        self.assertIn("Enemy Appears!", output)
+
+        ConsoleSink(stream, verbose=True).write_message("Next check")
+        self.assertIn("Next check", stream.getvalue())
+
+    def test_error_window(self):
+        """Test errors are printed to stderr."""
+        with patch("sys.stderr", new_callable=io.StringIO) as stderr:
+            ConsoleSink(io.StringIO()).open_error_window("Error Playing Sound.")
+
+        self.assertIn("Error Playing Sound.", stderr.getvalue())
+
+
+class TestQueueSink(unittest.TestCase):
+    """Test cases for QueueSink class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.target = MagicMock()
+        self.sink = QueueSink(self.target)
+
+    def test_calls_wait_for_drain(self):
+        """Test calls from another thread only reach the target on drain."""
+        thread = threading.Thread(
+            target=lambda: self.sink.write_message("System: EVE Alert started.")
+        )
+        thread.start()
+        thread.join()
+
+        self.target.write_message.assert_not_called()
+        self.assertEqual(self.sink.drain(), 1)
+        self.target.write_message.assert_called_once_with(
+            "System: EVE Alert started.", "normal"
+        )
+        self.assertEqual(self.sink.drain(), 0)
+
+    def test_coalescing(self):
+        """Test status messages, repeats and button updates are coalesced."""
+        self.sink.write_message("Next check in 2.10 seconds...")
+        self.sink.update_alert_button()
+        self.sink.write_message("Enemy Appears!", "red")
+        self.sink.write_message("Enemy Appears!", "red")
+        self.sink.update_alert_button()
+        self.sink.open_error_window("Error Playing Sound.")
+        self.sink.open_error_window("Error Playing Sound.")
+        self.sink.write_message("Next check in 2.50 seconds...")
+
+        self.assertEqual(self.sink.drain(), 4)
+        self.assertEqual(
+            self.target.method_calls,
+            [
+                call.update_alert_button(),
+                call.write_message("Enemy Appears!", "red"),
+                call.open_error_window("Error Playing Sound."),
+                call.write_message("Next check in 2.50 seconds...", "normal"),
+            ],
+        )
+
+    def test_target_errors_are_logged(self):
+        """Test a failing target call doesn't stop the drain."""
+        self.target.update_faction_button.side_effect = RuntimeError("destroyed")
+        self.sink.update_faction_button()
+        self.sink.write_message("Settings: Loaded.", "green")
+
+        with self.assertLogs("alert", "ERROR"):
+            self.sink.drain()
+
+        self.target.write_message.assert_called_once_with("Settings: Loaded.", "green")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,157 @@
+"""Unit tests for the application startup."""
+
+import json
+import os
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+
+from evealert.tools.startup import (
+    PROFILE_STARTUP_ENV,
+    PROFILE_STARTUP_FLAG,
+    StartupProfiler,
+    profile_startup_requested,
+)
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# Modules that must only be loaded when they are used
+HEAVY_MODULES = [
+    "cv2",
+    "numpy",
+    "sounddevice",
+    "soundfile",
+    "mss",
+    "pyautogui",
+    "pynput",
+    "screeninfo",
+    "dhooks_lite",
+    "CTkMessagebox",
+]
+
+# Budgets in seconds, generous enough for slow CI machines
+IMPORT_BUDGET = 5.0
+FIRST_WINDOW_BUDGET = 8.0
+
+HAS_DISPLAY = sys.platform in ("win32", "darwin") or bool(os.environ.get("DISPLAY"))
+
+
+def run_python(code: str) -> dict:
+    """Run code in a fresh interpreter and return its JSON output."""
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        timeout=120,
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+class TestStartup(unittest.TestCase):
+    """Test cases for the cold start of the application."""
+
+    def test_heavy_modules_not_imported(self):
+        """Test importing the main menu doesn't load heavy dependencies."""
+        output = run_python(
+            "import json, sys, time\n"
+            "start = time.perf_counter()\n"
+            "import evealert.menu.main\n"
+            "elapsed = time.perf_counter() - start\n"
+            "loaded = [name for name in %r\n"
+            "          if name in sys.modules\n"
+            "          and not type(sys.modules[name]).__name__.startswith('_Lazy')]\n"
+            "print(json.dumps({'loaded': loaded, 'elapsed': elapsed}))\n"
+            % HEAVY_MODULES
+        )
+
+        self.assertEqual(output["loaded"], [])
+        self.assertLess(output["elapsed"], IMPORT_BUDGET)
+
+    @unittest.skipUnless(HAS_DISPLAY, "requires a display")
+    def test_time_to_first_window(self):
+        """Test the main window is shown within the startup budget."""
+        output = run_python(
+            "import json\n"
+            "from evealert.tools.startup import StartupProfiler\n"
+            "profiler = StartupProfiler()\n"
+            "profiler.start()\n"
+            "from evealert.menu.main import MainMenu\n"
+            "app = MainMenu()\n"
+            "app.update()\n"
+            "elapsed = profiler.mark('first window')\n"
+            "profiler.stop()\n"
+            "app.clean_up()\n"
+            "print(json.dumps({'elapsed': elapsed}))\n"
+        )
+
+        self.assertLess(output["elapsed"], FIRST_WINDOW_BUDGET)
+
+
+class TestStartupProfiler(unittest.TestCase):
+    """Test cases for StartupProfiler class."""
+
+    def test_records_new_imports(self):
+        """Test only modules loaded for the first time are recorded."""
+        sys.modules.pop("json.tool", None)
+        profiler = StartupProfiler()
+        profiler.start()
+        try:
+            # pylint: disable=import-outside-toplevel,unused-import
+            import json.tool  # noqa: F401
+            import os.path  # noqa: F401
+        finally:
+            profiler.stop()
+
+        self.assertIn("json.tool", profiler.imports)
+        self.assertNotIn("os.path", profiler.imports)
+        timing = profiler.imports["json.tool"]
+        self.assertGreaterEqual(timing.cumulative, timing.self_time)
+        self.assertFalse(profiler.is_running)
+
+    def test_stop_restores_import(self):
+        """Test stopping the profiler removes the import hook."""
+        # pylint: disable=import-outside-toplevel
+        import builtins
+
+        original = builtins.__import__
+        profiler = StartupProfiler()
+        profiler.start()
+        self.assertIsNot(builtins.__import__, original)
+        profiler.stop()
+
+        self.assertIs(builtins.__import__, original)
+
+    def test_marks_and_report(self):
+        """Test phases are measured from the start and reported."""
+        ticks = iter([10.0, 10.0, 10.5, 11.25])
+        profiler = StartupProfiler(clock=lambda: next(ticks))
+        profiler.start()
+        profiler.stop()
+
+        self.assertEqual(profiler.mark("imports"), 0.5)
+        self.assertEqual(profiler.mark("first window"), 1.25)
+        report = profiler.report()
+        self.assertIn("500.0 ms  imports", report)
+        self.assertIn("1250.0 ms  first window", report)
+
+    def test_profile_startup_requested(self):
+        """Test the profile mode is enabled by flag or environment."""
+        env = os.environ.pop(PROFILE_STARTUP_ENV, None)
+        try:
+            self.assertTrue(
+                profile_startup_requested(["main.py", PROFILE_STARTUP_FLAG])
+            )
+            self.assertFalse(profile_startup_requested(["main.py"]))
+            os.environ[PROFILE_STARTUP_ENV] = "1"
+            self.assertTrue(profile_startup_requested(["main.py"]))
+        finally:
+            os.environ.pop(PROFILE_STARTUP_ENV, None)
+            if env is not None:
+                os.environ[PROFILE_STARTUP_ENV] = env
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,139 @@
+"""Unit tests for the statistics window refresh."""
+
+import unittest
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from evealert.menu.statistics import StatisticsWindow
+from evealert.statistics import AlarmStatistics
+
+
+class FakeText:
+    """Minimal stand-in for a Tk text box."""
+
+    def __init__(self):
+        self.content = ""
+        self.inserts = 0
+
+    def insert(self, index, text):
+        self.inserts += 1
+        if index == "1.0":
+            self.content = text + self.content
+        else:
+            self.content += text
+
+    def delete(self, start, end):
+        assert end == "end"
+        line = int(start.split(".")[0])
+        self.content = "".join(self.content.splitlines(True)[: line - 1])
+
+    def lines(self):
+        return [line.split("] ", 1)[-1] for line in self.content.splitlines()]
+
+
+class TestStatisticsWindow(unittest.TestCase):
+    """Test cases for the StatisticsWindow refresh without Tk."""
+
+    LABELS = [
+        "session_duration_label",
+        "last_hour_label",
+        "busiest_hour_label",
+        "total_alarms_label",
+        "total_enemy_label",
+        "total_faction_label",
+        "session_alarms_label",
+        "session_enemy_label",
+        "session_faction_label",
+    ]
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.stats = AlarmStatistics()
+        self.window = StatisticsWindow.__new__(StatisticsWindow)
+        self.window.main = SimpleNamespace(
+            alert=SimpleNamespace(get_statistics=lambda: self.stats)
+        )
+        self.window.label_texts = {}
+        self.window.shown_version = None
+        self.window.last_history_event = None
+        self.window.history_lines = 0
+        self.window.history_placeholder = False
+        for name in self.LABELS:
+            setattr(self.window, name, MagicMock(name=name))
+        self.window.history_textbox = FakeText()
+        self.stats.get_session_duration = lambda: "1s"
+
+    def configured(self):
+        """Get the labels configured since the last call."""
+        names = [
+            name for name in self.LABELS if getattr(self.window, name).configure.called
+        ]
+        for name in self.LABELS:
+            getattr(self.window, name).configure.reset_mock()
+        return names
+
+    def test_unchanged_statistics_not_redrawn(self):
+        """Test nothing is redrawn when the statistics did not change."""
+        self.window.refresh()
+        self.configured()
+        inserts = self.window.history_textbox.inserts
+
+        self.window.refresh()
+
+        self.assertEqual(self.configured(), [])
+        self.assertEqual(self.window.history_textbox.inserts, inserts)
+
+    def test_only_changed_labels(self):
+        """Test only the labels of changed values are updated."""
+        self.window.refresh()
+        self.configured()
+
+        self.stats.add_alarm("Faction")
+        self.window.refresh()
+
+        self.assertEqual(
+            self.configured(),
+            [
+                "last_hour_label",
+                "busiest_hour_label",
+                "total_alarms_label",
+                "total_faction_label",
+                "session_alarms_label",
+                "session_faction_label",
+            ],
+        )
+
+    def test_history_appended(self):
+        """Test new alarms are added on top and the history is capped."""
+        self.window.refresh()
+        self.assertEqual(
+            self.window.history_textbox.lines(), ["No alarms yet in this session."]
+        )
+
+        self.stats.add_alarm("Enemy")
+        self.window.refresh()
+        self.assertEqual(self.window.history_textbox.lines(), ["Enemy"])
+
+        for _ in range(12):
+            self.stats.add_alarm("Faction")
+        self.window.refresh()
+
+        lines = self.window.history_textbox.lines()
+        self.assertEqual(len(lines), 10)
+        self.assertEqual(set(lines), {"Faction"})
+
+    def test_history_cleared(self):
+        """Test clearing the history redraws it."""
+        self.stats.add_alarm("Enemy")
+        self.window.refresh()
+
+        self.stats.clear_history()
+        self.window.refresh()
+
+        self.assertEqual(
+            self.window.history_textbox.lines(), ["No alarms yet in this session."]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,160 @@
+"""Unit tests for the synthetic local list generator and replay capture."""
+
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+import cv2 as cv
+import numpy as np
+
+from evealert.tools.synthetic import (
+    LABEL_ENEMY,
+    LABEL_FACTION,
+    LocalListConfig,
+    LocalListGenerator,
+)
+from evealert.tools.windowscapture import ReplayCapture
+
+
+class TestLocalListGenerator(unittest.TestCase):
+    """Test cases for LocalListGenerator class."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Read the bundled templates once."""
+        cls.generator = LocalListGenerator()
+
+    def test_labels_match_templates(self):
+        """Test every label box contains its pasted template."""
+        frame = self.generator.frame(LocalListConfig(rows=10, hostiles=3, factions=1))
+
+        kinds = [label.kind for label in frame.labels]
+        self.assertEqual(kinds.count(LABEL_ENEMY), 3)
+        self.assertEqual(kinds.count(LABEL_FACTION), 1)
+        self.assertEqual(frame.image.shape[1], 250)
+        templates = dict(
+            self.generator.enemy_templates + self.generator.faction_templates
+        )
+        for label in frame.labels:
+            x, y, w, h = label.box
+            np.testing.assert_array_equal(
+                frame.image[y : y + h, x : x + w], templates[label.template]
+            )
+
+    def test_seed_is_deterministic(self):
+        """Test the same seed gives the same frame and another seed does not."""
+        config = LocalListConfig(rows=10, noise=3.0, seed=7)
+
+        first = self.generator.frame(config)
+        second = self.generator.frame(config)
+        other = self.generator.frame(LocalListConfig(rows=10, noise=3.0, seed=8))
+
+        np.testing.assert_array_equal(first.image, second.image)
+        self.assertEqual(first.labels, second.labels)
+        self.assertFalse(np.array_equal(first.image, other.image))
+
+    def test_scale(self):
+        """Test the frame and labels are resized to the UI scale."""
+        config = LocalListConfig(rows=10, hostiles=2)
+        full = self.generator.frame(config)
+        scaled = self.generator.frame(LocalListConfig(rows=10, hostiles=2, scale=1.5))
+
+        self.assertEqual(scaled.image.shape[:2], (300, 375))
+        for label, scaled_label in zip(full.labels, scaled.labels):
+            self.assertEqual(
+                scaled_label.box, tuple(round(value * 1.5) for value in label.box)
+            )
+
+    def test_occlusion(self):
+        """Test occluded icons report their visible share."""
+        frame = self.generator.frame(LocalListConfig(rows=5, occlusion=0.5))
+
+        self.assertTrue(frame.labels)
+        for label in frame.labels:
+            self.assertAlmostEqual(label.visible, 0.5, delta=0.05)
+
+    def test_scroll_clips_labels(self):
+        """Test scrolling moves the labels and drops the hidden ones."""
+        config = LocalListConfig(rows=20, hostiles=20, visible_rows=5, scroll=30)
+
+        frame = self.generator.frame(config)
+
+        self.assertEqual(frame.image.shape[0], 100)
+        self.assertEqual(len(frame.labels), 6)
+        self.assertLess(frame.labels[0].visible, 1.0)
+        for label in frame.labels:
+            _, y, _, h = label.box
+            self.assertGreaterEqual(y, 0)
+            self.assertLessEqual(y + h, 100)
+
+    def test_frames_scroll(self):
+        """Test frames() scrolls the list by scroll_step per frame."""
+        config = LocalListConfig(rows=20, visible_rows=5, scroll_step=20)
+
+        frames = list(self.generator.frames(config, 3))
+
+        self.assertEqual([frame.config.scroll for frame in frames], [0, 20, 40])
+        np.testing.assert_array_equal(frames[0].image[20:], frames[1].image[:80])
+
+    def test_jpeg_artefacts(self):
+        """Test JPEG compression changes the pixels but keeps the shape."""
+        lossless = self.generator.frame(LocalListConfig(rows=5))
+        jpeg = self.generator.frame(LocalListConfig(rows=5, jpeg_quality=30))
+
+        self.assertEqual(jpeg.image.shape, lossless.image.shape)
+        self.assertFalse(np.array_equal(jpeg.image, lossless.image))
+
+
+class TestReplayCapture(unittest.TestCase):
+    """Test cases for ReplayCapture class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.frames = [np.full((4, 4, 3), value, dtype=np.uint8) for value in (1, 2)]
+
+    def test_loops_and_copies(self):
+        """Test frames are replayed in order, looped and copied."""
+        capture = ReplayCapture(self.frames)
+
+        values = []
+        for _ in range(3):
+            frame, raw = capture.get_screenshot_value(0, 0, 4, 4)
+            values.append(int(frame[0, 0, 0]))
+            frame[:] = 0
+        self.assertIsNone(raw)
+        self.assertEqual(values, [1, 2, 1])
+        self.assertEqual(int(self.frames[0][0, 0, 0]), 1)
+
+    def test_regions_without_loop(self):
+        """Test per region frames and the end of a replay."""
+        capture = ReplayCapture({(0, 0, 4, 4): self.frames[:1]}, loop=False)
+
+        frame, _ = capture.get_screenshot_value(0, 0, 4, 4)
+        self.assertEqual(int(frame[0, 0, 0]), 1)
+        self.assertEqual(capture.get_screenshot_value(0, 0, 4, 4), (None, None))
+        with self.assertLogs("tools", "ERROR"):
+            self.assertEqual(capture.get_screenshot_value(0, 4, 4, 8), (None, None))
+
+        capture.reset()
+        self.assertIsNotNone(capture.get_screenshot_value(0, 0, 4, 4)[0])
+
+    def test_from_folder(self):
+        """Test recorded frames are replayed from a folder by file name."""
+        folder = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, folder, ignore_errors=True)
+        for number, frame in enumerate(reversed(self.frames)):
+            cv.imwrite(str(folder / f"frame_{1 - number}.png"), frame)
+        (folder / "notes.txt").write_text("not a frame", encoding="utf-8")
+
+        capture = ReplayCapture.from_folder(str(folder), loop=False)
+
+        values = [
+            int(capture.get_screenshot_value(0, 0, 4, 4)[0][0, 0, 0]) for _ in range(2)
+        ]
+        self.assertEqual(values, [1, 2])
+        self.assertEqual(capture.get_screenshot_value(0, 0, 4, 4), (None, None))
+
+
+if __name__ == "__main__":
+    unittest.main()
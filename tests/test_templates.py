@@ -0,0 +1,135 @@
+"""Unit tests for the template index."""
+
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import cv2 as cv
+import numpy as np
+
+from evealert.tools.templates import TemplateIndex
+
+
+class TestTemplateIndex(unittest.TestCase):
+    """Test cases for TemplateIndex class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.img_dir = Path(self.temp_dir) / "img"
+        self.cache_dir = Path(self.temp_dir) / "cache"
+        self.img_dir.mkdir()
+
+        self.write_image("image_1.png", (0, 0, 255))
+        self.write_image("faction_1.png", (255, 0, 0))
+        self.write_image("online.png", (0, 255, 0))
+
+        self.index = TemplateIndex(self.img_dir, cache_dir=self.cache_dir)
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def write_image(self, name, color, size=20):
+        """Write a solid color image and bump its mtime."""
+        path = self.img_dir / name
+        image = np.zeros((size, size, 3), dtype=np.uint8)
+        image[:, :] = color
+        cv.imwrite(str(path), image)
+        if path.exists():
+            stat = path.stat()
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        return str(path)
+
+    def test_scan_by_prefix(self):
+        """Test templates are indexed by prefix and other images ignored."""
+        changes = self.index.scan()
+
+        self.assertEqual(len(changes.added), 2)
+        self.assertEqual(
+            self.index.files("image_"), [str(self.img_dir / "image_1.png")]
+        )
+        self.assertEqual(
+            self.index.files("faction_"), [str(self.img_dir / "faction_1.png")]
+        )
+
+    def test_rescan_without_changes(self):
+        """Test unchanged files are not hashed again."""
+        self.index.scan()
+
+        with patch("evealert.tools.templates.file_digest") as mock_digest:
+            changes = self.index.scan()
+            mock_digest.assert_not_called()
+        self.assertFalse(changes)
+
+    def test_scan_detects_changes(self):
+        """Test added, modified and removed templates are reported."""
+        self.index.scan()
+
+        added = self.write_image("image_2.png", (0, 0, 255))
+        modified = self.write_image("image_1.png", (0, 0, 128))
+        removed = str(self.img_dir / "faction_1.png")
+        os.remove(removed)
+
+        changes = self.index.scan()
+
+        self.assertEqual(changes.added, [added])
+        self.assertEqual(changes.modified, [modified])
+        self.assertEqual(changes.removed, [removed])
+        self.assertEqual(self.index.files("faction_"), [])
+
+    def test_touch_is_not_a_modification(self):
+        """Test a new mtime with identical content is not reported."""
+        self.index.scan()
+        path = self.img_dir / "image_1.png"
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        self.assertFalse(self.index.scan())
+
+    def test_poll_interval(self):
+        """Test poll() only scans after the poll interval passed."""
+        self.index.poll_interval = 3600
+        self.index.scan()
+        self.write_image("image_2.png", (0, 0, 255))
+
+        self.assertFalse(self.index.poll())
+
+        self.index.poll_interval = 0
+        self.assertEqual(len(self.index.poll().added), 1)
+
+    def test_load_uses_disk_cache(self):
+        """Test a second index loads templates without decoding the image."""
+        self.index.scan()
+        path = self.index.files("image_")[0]
+        template = self.index.load(path)
+
+        self.assertEqual(len(os.listdir(self.cache_dir)), 1)
+
+        index = TemplateIndex(self.img_dir, cache_dir=self.cache_dir)
+        index.scan()
+        with patch("cv2.imread") as mock_imread:
+            cached = index.load(path)
+            mock_imread.assert_not_called()
+        np.testing.assert_array_equal(cached, template)
+
+    def test_load_invalid_cache(self):
+        """Test a corrupt cache file falls back to decoding the image."""
+        self.index.scan()
+        path = self.index.files("image_")[0]
+        self.index.load(path)
+        cache_file = self.cache_dir / os.listdir(self.cache_dir)[0]
+        cache_file.write_bytes(b"broken")
+
+        index = TemplateIndex(self.img_dir, cache_dir=self.cache_dir)
+        index.scan()
+        template = index.load(path)
+
+        self.assertEqual(template.shape, (20, 20, 3))
+
+
+if __name__ == "__main__":
+    unittest.main()
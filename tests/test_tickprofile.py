@@ -0,0 +1,93 @@
+"""Unit tests for the on-demand tick profiler."""
+
+import shutil
+import tempfile
+import threading
+import tracemalloc
+import unittest
+from pathlib import Path
+
+from evealert.tools.tickprofile import PROFILES_ALL_THREADS, TickProfiler
+
+
+def busy(size=2000):
+    """Allocate and compute a little."""
+    return sum(len(str(number)) for number in range(size))
+
+
+class TestTickProfiler(unittest.TestCase):
+    """Test cases for TickProfiler class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.folder = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.folder, ignore_errors=True)
+        self.written = []
+        self.profiler = TickProfiler(self.folder, top=5, on_done=self.written.append)
+
+    def test_idle_profiler_does_nothing(self):
+        """Test ticks and wrapped functions are untouched without a request."""
+        with self.profiler.tick():
+            busy()
+
+        self.assertIs(self.profiler.wrap(busy), busy)
+        self.assertFalse(self.profiler.is_active)
+        self.assertEqual(list(self.folder.iterdir()), [])
+
+    def test_capture_writes_files(self):
+        """Test the requested ticks are profiled and written with a summary."""
+        self.assertTrue(self.profiler.request(3))
+        self.assertFalse(self.profiler.request(3))
+
+        for _ in range(4):
+            with self.profiler.tick():
+                worker = threading.Thread(target=self.profiler.wrap(busy))
+                worker.start()
+                worker.join()
+                busy()
+        self.profiler.join(10)
+
+        self.assertFalse(self.profiler.is_active)
+        self.assertFalse(tracemalloc.is_tracing())
+        self.assertEqual(len(self.written), 1)
+        summary = self.written[0]
+        self.assertTrue(summary.with_suffix(".prof").exists())
+        snapshot = tracemalloc.Snapshot.load(str(summary.with_suffix(".snapshot")))
+        self.assertTrue(snapshot.traces)
+        text = summary.read_text(encoding="utf-8")
+        self.assertIn("Profile of 3 ticks", text)
+        self.assertIn("Top 5 functions by cumulative time:", text)
+        self.assertIn("Top 5 allocations:", text)
+        self.assertIn("busy", text)
+
+    def test_worker_profiles_merged(self):
+        """Test wrapped calls on other threads are profiled separately."""
+        self.profiler.request(1)
+        with self.profiler.tick():
+            wrapped = self.profiler.wrap(busy)
+            capture = self.profiler._capture
+            worker = threading.Thread(target=wrapped)
+            worker.start()
+            worker.join()
+
+        self.profiler.join(10)
+        self.assertEqual(len(capture.profiles), 0 if PROFILES_ALL_THREADS else 1)
+        self.assertEqual(len(self.written), 1)
+
+    def test_cancel(self):
+        """Test a cancelled capture stops tracing and writes nothing."""
+        self.profiler.request(2)
+        with self.profiler.tick():
+            busy()
+
+        self.profiler.cancel()
+        with self.profiler.tick():
+            busy()
+
+        self.assertFalse(self.profiler.is_active)
+        self.assertFalse(tracemalloc.is_tracing())
+        self.assertEqual(self.written, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
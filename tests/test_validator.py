@@ -184,6 +184,80 @@ class TestConfigValidator(unittest.TestCase):
         self.assertFalse(is_valid)
         self.assertGreater(len(errors), 0)
 
+    def test_validate_settings_dict_regions(self):
+        """Test named regions are validated entry by entry."""
+        settings = {
+            "regions": [
+                {
+                    "name": "Local",
+                    "kind": "alert",
+                    "x1": 0,
+                    "y1": 0,
+                    "x2": 50,
+                    "y2": 50,
+                },
+                {"name": "Spawn", "kind": "npc", "x1": 0, "y1": 0, "x2": 5, "y2": 50},
+                "Client 2",
+            ]
+        }
+        is_valid, errors = ConfigValidator.validate_settings_dict(settings)
+        self.assertFalse(is_valid)
+        self.assertEqual(len(errors), 3)
+        self.assertIn("Region Spawn: Kind", errors[0])
+        self.assertIn("Region Spawn: Region too small", errors[1])
+        self.assertEqual(errors[2], "Region 3: Must be an object")
+
+        del settings["regions"][1:]
+        self.assertEqual(ConfigValidator.validate_settings_dict(settings), (True, []))
+
+    def test_validate_settings_dict_regions_not_a_list(self):
+        """Test a regions value that isn't a list is one error."""
+        for regions in (5, "abc", {"name": "Local"}):
+            is_valid, errors = ConfigValidator.validate_settings_dict(
+                {"regions": regions}
+            )
+            self.assertFalse(is_valid)
+            self.assertEqual(errors, ["Regions: Must be a list"])
+
+    def test_validate_settings_dict_vision(self):
+        """Test the vision backend, debug FPS and log interval settings."""
+        settings = {
+            "vision_backend": {"value": "process"},
+            "debug_fps": {"value": 10},
+            "vision_log_interval": {"value": 5.0},
+            "profiling": {"ticks": 100},
+        }
+        self.assertEqual(ConfigValidator.validate_settings_dict(settings), (True, []))
+
+        settings = {
+            "vision_backend": {"value": "gpu"},
+            "debug_fps": {"value": 0},
+            "vision_log_interval": {"value": -1},
+            "profiling": {"ticks": "many"},
+        }
+        is_valid, errors = ConfigValidator.validate_settings_dict(settings)
+        self.assertFalse(is_valid)
+        self.assertEqual(
+            [error.split(":")[0] for error in errors],
+            ["Vision Backend", "Debug FPS", "Vision Log Interval", "Profiling"],
+        )
+
+    def test_validate_settings_dict_metrics(self):
+        """Test the metrics endpoint settings."""
+        settings = {"metrics": {"enabled": True, "port": 9464}}
+        self.assertEqual(ConfigValidator.validate_settings_dict(settings), (True, []))
+
+        settings = {"metrics": {"enabled": "yes", "port": 70000}}
+        is_valid, errors = ConfigValidator.validate_settings_dict(settings)
+        self.assertFalse(is_valid)
+        self.assertEqual(
+            errors,
+            [
+                "Metrics: Enabled must be true or false",
+                "Metrics: Port must be between 1 and 65535",
+            ],
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,13 +1,17 @@
 """Unit tests for Vision module template matching."""
 
+import os
 import unittest
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import ANY, MagicMock, patch
 
 import cv2 as cv
 import numpy as np
 
+from evealert.constants import IMG_FOLDER
 from evealert.exceptions import RegionSizeError
+from evealert.settings.helper import get_resource_path
+from evealert.tools.synthetic import LocalListConfig, LocalListGenerator
 from evealert.tools.vision import Vision
 
 
@@ -127,18 +131,32 @@ class TestVision(unittest.TestCase):
         self.assertIsInstance(points, list)
 
     def test_debug_mode(self):
-        """Test debug mode activation."""
+        """Test debug frames are passed to the renderer."""
+        self.vision.renderer = MagicMock()
         self.vision.debug_mode = True
         self.assertTrue(self.vision.is_vision_open)
 
         haystack = np.zeros((200, 200, 3), dtype=np.uint8)
 
-        with patch("cv2.imshow"), patch("cv2.waitKey"):
+        with patch("cv2.imshow") as mock_imshow, patch("cv2.waitKey"):
             points = self.vision.find(haystack)
             self.assertIsInstance(points, list)
+            mock_imshow.assert_not_called()
+
+        self.vision.renderer.submit.assert_called_once_with(
+            "Enemy Vision", haystack, ANY
+        )
+        self.assertTrue(self.vision.enemy)
+
+        # Turning debug mode off closes the window
+        self.vision.debug_mode = False
+        self.vision.find(haystack)
+        self.vision.renderer.close.assert_called_once_with("Enemy Vision")
+        self.assertIsNone(self.vision.enemy)
 
     def test_debug_mode_faction(self):
         """Test faction debug mode."""
+        self.vision.renderer = MagicMock()
         self.vision.debug_mode_faction = True
         self.assertTrue(self.vision.is_faction_vision_open)
 
@@ -148,35 +166,40 @@ class TestVision(unittest.TestCase):
             points = self.vision.find_faction(haystack)
             self.assertIsInstance(points, list)
 
+        self.vision.renderer.submit.assert_called_once_with(
+            "Faction Vision", haystack, ANY
+        )
+
     def test_clean_up(self):
         """Test cleanup method."""
+        self.vision.renderer = MagicMock()
         self.vision.debug_mode = True
         self.vision.debug_mode_faction = True
 
-        with patch("cv2.destroyAllWindows") as mock_destroy:
-            self.vision.clean_up()
-            mock_destroy.assert_called_once()
+        self.vision.clean_up()
+
+        self.assertEqual(self.vision.renderer.close.call_count, 2)
 
         self.assertFalse(self.vision.debug_mode)
         self.assertFalse(self.vision.debug_mode_faction)
 
     def test_destroy_vision_enemy(self):
         """Test destroying enemy vision window."""
+        self.vision.renderer = MagicMock()
         self.vision.debug_mode = True
 
-        with patch("cv2.destroyWindow") as mock_destroy:
-            self.vision.destroy_vision("Enemy")
-            mock_destroy.assert_called_once_with("Enemy")
+        self.vision.destroy_vision("Enemy")
+        self.vision.renderer.close.assert_called_once_with("Enemy Vision")
 
         self.assertFalse(self.vision.debug_mode)
 
     def test_destroy_vision_faction(self):
         """Test destroying faction vision window."""
+        self.vision.renderer = MagicMock()
         self.vision.debug_mode_faction = True
 
-        with patch("cv2.destroyWindow") as mock_destroy:
-            self.vision.destroy_vision("Faction")
-            mock_destroy.assert_called_once_with("Faction")
+        self.vision.destroy_vision("Faction")
+        self.vision.renderer.close.assert_called_once_with("Faction Vision")
 
         self.assertFalse(self.vision.debug_mode_faction)
 
@@ -215,6 +238,91 @@ class TestVision(unittest.TestCase):
                 needle_bgra_path.unlink()
             vision_alpha.clean_up()
 
+    def test_configure_in_place(self):
+        """Test reconfiguring threshold, region and method without reloading."""
+        needle_imgs = self.vision.needle_imgs
+        self.vision.debug_mode = True
+
+        with patch("cv2.imread") as mock_imread:
+            self.vision.configure(
+                threshold=80, region=(0, 0, 100, 100), method=cv.TM_CCORR_NORMED
+            )
+            mock_imread.assert_not_called()
+
+        self.assertEqual(self.vision.threshold, 80)
+        self.assertEqual(self.vision.region, (0, 0, 100, 100))
+        self.assertEqual(self.vision.method, cv.TM_CCORR_NORMED)
+        self.assertIs(self.vision.needle_imgs[0], needle_imgs[0])
+        self.assertTrue(self.vision.debug_mode)
+
+    def test_set_templates_incremental(self):
+        """Test only new or modified templates are read from disk."""
+        second_path = Path("tests/fixtures/test_needle_2.png")
+        cv.imwrite(str(second_path), np.zeros((20, 30, 3), dtype=np.uint8))
+
+        try:
+            with patch("cv2.imread", wraps=cv.imread) as mock_imread:
+                changed = self.vision.set_templates(
+                    [str(self.test_needle_path), str(second_path)]
+                )
+                mock_imread.assert_called_once_with(
+                    str(second_path), cv.IMREAD_UNCHANGED
+                )
+
+            self.assertTrue(changed)
+            self.assertEqual(self.vision.needle_dims, [(50, 50), (30, 20)])
+
+            # Unchanged files are not reloaded
+            with patch("cv2.imread") as mock_imread:
+                self.assertFalse(self.vision.reload_templates())
+                mock_imread.assert_not_called()
+
+            # Modified files are reloaded
+            cv.imwrite(str(second_path), np.zeros((25, 30, 3), dtype=np.uint8))
+            stat = second_path.stat()
+            os.utime(second_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+            self.assertTrue(self.vision.reload_templates())
+            self.assertEqual(self.vision.needle_dims[1], (30, 25))
+
+            # Removed templates are dropped from the cache
+            self.vision.set_templates([str(self.test_needle_path)])
+            self.assertEqual(list(self.vision.templates), [str(self.test_needle_path)])
+        finally:
+            if second_path.exists():
+                second_path.unlink()
+
+    def test_find_uses_configured_threshold(self):
+        """Test find() falls back to the configured threshold."""
+        haystack = np.zeros((200, 200, 3), dtype=np.uint8)
+
+        with patch.object(
+            self.vision, "vision_process", return_value=([], haystack)
+        ) as mock_process:
+            self.vision.configure(threshold=75)
+            self.vision.find(haystack)
+            mock_process.assert_called_once_with(haystack, 75, "Enemy")
+
+    def test_sampled_debug_log(self):
+        """Test frames are summarized at the log interval without pixel dumps."""
+        haystack = np.zeros((60, 60, 3), dtype=np.uint8)
+        self.vision.configure(name="Client 2", log_interval=3600)
+
+        with self.assertLogs("tools", "DEBUG") as logs:
+            for _ in range(3):
+                self.vision.find(haystack)
+
+        summaries = [line for line in logs.output if "vision=Client 2" in line]
+        self.assertEqual(len(summaries), 1)
+        self.assertIn("frames=1 shape=60x60x3", summaries[0])
+        self.assertIn("test_needle.png(50x50)=", summaries[0])
+        self.assertNotIn("[[", summaries[0])
+
+        # Skipped frames are counted in the next summary
+        self.vision.configure(log_interval=0)
+        with self.assertLogs("tools", "DEBUG") as logs:
+            self.vision.find(haystack)
+        self.assertIn("frames=3 ", logs.output[-1])
+
     def test_normalization(self):
         """Test image normalization before matching."""
         # Create haystack with varying brightness
@@ -223,6 +331,29 @@ class TestVision(unittest.TestCase):
         points = self.vision.find(haystack, threshold=50)
         self.assertIsInstance(points, list)
 
+    def test_find_in_synthetic_local_list(self):
+        """Test the standing icons are found in a synthetic local list."""
+        folder = get_resource_path(IMG_FOLDER)
+        paths = [
+            os.path.join(folder, name)
+            for name in ("image_1_100%.png", "image_2_100%.png", "image_4_100%.png")
+        ]
+        frame = LocalListGenerator(paths, []).frame(
+            LocalListConfig(rows=15, hostiles=4, noise=2.0, seed=3)
+        )
+        vision = Vision(paths, threshold=90)
+        self.addCleanup(vision.clean_up)
+
+        points = vision.find(frame.image)
+
+        self.assertEqual(len(points), len(frame.labels))
+        for label in frame.labels:
+            x, y, w, h = label.box
+            self.assertTrue(
+                any(x <= px < x + w and y <= py < y + h for px, py in points),
+                label,
+            )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,119 @@
+"""Unit tests for the task watchdog."""
+
+import asyncio
+import time
+import unittest
+from unittest.mock import MagicMock
+
+from evealert.manager.watchdog import TaskWatchdog
+from evealert.metrics import AgentMetrics
+
+
+class TestTaskWatchdog(unittest.IsolatedAsyncioTestCase):
+    """Test cases for the TaskWatchdog class."""
+
+    async def asyncSetUp(self):
+        """Set up a watchdog on the test loop."""
+        self.sink = MagicMock()
+        self.metrics = AgentMetrics()
+        self.on_give_up = MagicMock()
+        self.watchdog = TaskWatchdog(
+            self.sink,
+            metrics=lambda: self.metrics,
+            on_give_up=self.on_give_up,
+            interval=0.01,
+            lag_warning=0.05,
+            max_restarts=2,
+        )
+
+    async def asyncTearDown(self):
+        """Cancel the watched tasks."""
+        self.watchdog.cancel()
+        await asyncio.sleep(0)
+
+    async def test_restart_crashed_task(self):
+        """Test a crashed task is restarted and counted."""
+        runs = []
+
+        async def task():
+            runs.append(1)
+            if len(runs) == 1:
+                raise RuntimeError("crash")
+            await asyncio.sleep(10)
+
+        first = self.watchdog.watch("vision", task, stall_after=10)
+        await asyncio.sleep(0.01)
+
+        self.assertEqual(len(runs), 2)
+        self.assertIsNot(self.watchdog.tasks["vision"].task, first)
+        self.assertFalse(self.watchdog.tasks["vision"].task.done())
+        self.assertEqual(self.metrics.task_restarts.get(task="vision"), 1)
+        self.sink.write_message.assert_called_with(
+            "System: vision task crashed and was restarted.", "yellow"
+        )
+        self.on_give_up.assert_not_called()
+
+    async def test_give_up_after_max_restarts(self):
+        """Test a task that keeps crashing is given up."""
+        runs = []
+
+        async def task():
+            runs.append(1)
+            raise RuntimeError("crash")
+
+        self.watchdog.watch("alert", task, stall_after=10)
+        await asyncio.sleep(0.01)
+
+        self.assertEqual(len(runs), 3)
+        self.on_give_up.assert_called_once_with("alert")
+        self.sink.write_message.assert_called_with(
+            "System: alert task keeps crashing, check the logs.", "red"
+        )
+
+    async def test_cancelled_and_finished_tasks_are_not_restarted(self):
+        """Test only crashed tasks are restarted."""
+        runs = []
+
+        async def task():
+            runs.append(1)
+
+        self.watchdog.watch("done", task, stall_after=10)
+        cancelled = self.watchdog.watch("cancelled", asyncio.Event().wait, 10)
+        cancelled.cancel()
+        await asyncio.sleep(0.01)
+
+        self.assertEqual(len(runs), 1)
+        self.assertTrue(cancelled.cancelled())
+        self.assertEqual(self.metrics.task_restarts.get(task="cancelled"), 0)
+
+    async def test_stall_reported_once(self):
+        """Test a task without beats is reported once until it recovers."""
+        self.watchdog.watch("vision", asyncio.Event().wait, stall_after=5)
+        self.watchdog.tasks["vision"].last_beat = time.monotonic() - 6
+
+        with self.assertLogs("alert", level="WARNING"):
+            self.watchdog.check()
+        self.watchdog.check()
+
+        self.assertEqual(self.metrics.task_stalls.get(task="vision"), 1)
+        self.assertEqual(self.sink.write_message.call_count, 1)
+        self.assertGreater(self.metrics.task_tick_age.get(task="vision"), 5)
+
+        self.watchdog.beat("vision")
+        self.watchdog.check()
+        self.assertFalse(self.watchdog.tasks["vision"].stalled)
+
+    async def test_loop_lag(self):
+        """Test a blocked event loop is measured and counted as a stall."""
+        runner = asyncio.create_task(self.watchdog.run())
+        await asyncio.sleep(0)
+        time.sleep(0.1)
+        await asyncio.sleep(0.05)
+        runner.cancel()
+
+        self.assertGreaterEqual(self.metrics.loop_stalls.get(), 1)
+        self.assertGreater(self.metrics.loop_lag_seconds.count(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()